@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Benchmark the streaming DXF reader on a large synthetic drawing.
+
+Usage:
+    .venv/bin/python scripts/bench_dxf_reader.py --entities 1000000
+    .venv/bin/python scripts/bench_dxf_reader.py --entities 1000000 --full
+
+Writes a synthetic DXF with the requested number of ModelSpace entities
+(mostly LINEs, with TEXT, LWPOLYLINE, DIMENSION and INSERT mixed in), then
+times the read-only ``DXFAdapter`` getters and records their peak Python
+heap via ``tracemalloc``. ``--full`` also measures parsing the whole file
+into a ``DXFDocument`` for comparison — expect that to need several GB
+at one million entities.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from autocad_batch_commander.acad.dxf import DXFDocument, Tag, write_tags
+from autocad_batch_commander.acad.dxf_adapter import DXFAdapter
+
+
+def _entity_tags(index: int, handle: int) -> list[Tag]:
+    head: list[Tag] = [(5, f"{handle:X}"), (100, "AcDbEntity")]
+    kind = index % 100
+    if kind == 0:
+        return [
+            (0, "DIMENSION"),
+            *head,
+            (8, "DIMENSION"),
+            (70, "32"),
+            (13, "0.0"),
+            (23, "0.0"),
+            (14, f"{index}.0"),
+            (24, "0.0"),
+            (42, f"{index}.0"),
+        ]
+    if kind < 10:
+        x = float(index % 1000) * 5000
+        return [
+            (0, "LWPOLYLINE"),
+            *head,
+            (8, "ROOM"),
+            (90, "4"),
+            (70, "1"),
+            *[
+                tag
+                for dx, dy in ((0, 0), (3600, 0), (3600, 3000), (0, 3000))
+                for tag in ((10, str(x + dx)), (20, str(float(dy))))
+            ],
+        ]
+    if kind < 30:
+        return [
+            (0, "TEXT"),
+            *head,
+            (8, "TEXT"),
+            (10, f"{index}.0"),
+            (20, "0.0"),
+            (1, f"ROOM {index}"),
+        ]
+    if kind == 30:
+        return [
+            (0, "INSERT"),
+            *head,
+            (8, "DOOR"),
+            (2, "DOOR_SINGLE"),
+            (10, f"{index}.0"),
+            (20, "0.0"),
+        ]
+    return [
+        (0, "LINE"),
+        *head,
+        (8, "WALL"),
+        (10, f"{index}.0"),
+        (20, "0.0"),
+        (11, f"{index + 1}.0"),
+        (21, "0.0"),
+    ]
+
+
+def write_synthetic_dxf(path: Path, entities: int) -> None:
+    """Stream a synthetic DXF to *path* without holding the entities."""
+    doc = DXFDocument.new()
+    for name in ("WALL", "ROOM", "TEXT", "DIMENSION", "DOOR"):
+        doc.add_table_entry(
+            "LAYER",
+            [(0, "LAYER"), (5, doc.next_handle()), (2, name), (70, "0"), (62, "7")],
+        )
+    doc.add_block("DOOR_SINGLE", "0")
+    first = int(doc.next_handle(), 16)
+    doc.set_header_var("$HANDSEED", [(5, f"{first + entities:X}")])
+
+    def tags() -> Iterator[Tag]:
+        for section in doc.sections:
+            yield 0, "SECTION"
+            yield 2, section.name
+            for record in section.records:
+                yield from record
+            if section.name == "ENTITIES":
+                for i in range(entities):
+                    yield from _entity_tags(i, first + i)
+            yield 0, "ENDSEC"
+        yield 0, "EOF"
+
+    write_tags(path, tags())
+
+
+def measure(label: str, func: Callable[[], object]) -> None:
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    size = len(result) if isinstance(result, (list, dict)) else "-"
+    print(f"{label:<38} {elapsed:>8.2f}s {peak / 2**20:>10.1f} MiB {size!s:>10}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the DXF reader")
+    parser.add_argument("--entities", type=int, default=1_000_000)
+    parser.add_argument("--file", type=Path, help="Reuse/keep the DXF at this path")
+    parser.add_argument(
+        "--full", action="store_true", help="Also time a full document parse"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.file or Path(tmp) / "synthetic.dxf"
+        if not path.exists():
+            start = time.perf_counter()
+            write_synthetic_dxf(path, args.entities)
+            print(f"Wrote {path} in {time.perf_counter() - start:.1f}s")
+        print(f"File size: {path.stat().st_size / 2**20:.1f} MiB\n")
+
+        adapter = DXFAdapter()
+        adapter.open_drawing(str(path))
+        print(f"{'operation':<38} {'time':>9} {'peak heap':>14} {'results':>10}")
+        measure("get_layers (stops after TABLES)", adapter.get_layers)
+        measure("get_dimensions", adapter.get_dimensions)
+        measure(
+            "get_polylines(layers=['ROOM'])",
+            lambda: adapter.get_polylines(layers=["ROOM"]),
+        )
+        measure("get_text_entities", adapter.get_text_entities)
+        measure("get_blocks", adapter.get_blocks)
+        measure("audit_drawing(fix=False)", lambda: adapter.audit_drawing(fix=False))
+        if args.full:
+            measure("DXFDocument.read (full parse)", lambda: DXFDocument.read(path))
+        adapter.close_drawing()
+
+
+if __name__ == "__main__":
+    main()
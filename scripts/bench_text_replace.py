@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Benchmark the single-pass term replacer against one pass per term.
+
+Usage:
+    .venv/bin/python scripts/bench_text_replace.py --terms 500 --texts 20000
+
+Builds a synthetic table of spec-code style terms and a set of drawing
+texts that mention a few of them, then times the old approach (one
+case-insensitive ``re.sub`` per term per text, as ``batch_find_replace``
+run once per mapping did) against :class:`TermReplacer`, and checks that
+both produce the same output.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import time
+
+from autocad_batch_commander.utils.text_replace import TermReplacer
+
+_WORDS = ["WALL", "DOOR", "TIMBER", "FRAME", "FINISH", "SLAB", "GRID", "LEVEL"]
+
+
+def _terms(count: int) -> dict[str, str]:
+    return {f"SPEC-{i:04d}": f"SP/{i:04d}/REV-B" for i in range(count)}
+
+
+def _texts(count: int, terms: list[str], rng: random.Random) -> list[str]:
+    texts = []
+    for _ in range(count):
+        words = rng.choices(_WORDS, k=rng.randint(2, 8))
+        for _ in range(rng.randint(0, 2)):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(terms).lower())
+        texts.append(" ".join(words))
+    return texts
+
+
+def per_term(texts: list[str], mappings: dict[str, str]) -> list[str]:
+    out = []
+    for text in texts:
+        for find, replace in mappings.items():
+            if find.lower() in text.lower():
+                text = re.compile(re.escape(find), re.IGNORECASE).sub(replace, text)
+        out.append(text)
+    return out
+
+
+def single_pass(texts: list[str], mappings: dict[str, str]) -> list[str]:
+    replacer = TermReplacer(mappings)
+    return [replacer.sub(text)[0] for text in texts]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--terms", type=int, default=500)
+    parser.add_argument("--texts", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    mappings = _terms(args.terms)
+    texts = _texts(args.texts, list(mappings), random.Random(args.seed))
+
+    results = {}
+    for label, func in (("per-term re.sub", per_term), ("TermReplacer", single_pass)):
+        start = time.perf_counter()
+        results[label] = func(texts, mappings)
+        print(f"{label:<18} {time.perf_counter() - start:8.3f}s")
+
+    baseline, candidate = results.values()
+    print("outputs match" if baseline == candidate else "OUTPUTS DIFFER")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Write a seeded synthetic project of DXF drawings for load testing.
+
+Usage:
+    .venv/bin/python scripts/make_synthetic_project.py out/ --drawings 200 \\
+        --entities 5000 --standard ubbl --seed 42
+
+The same spec always produces the same files (see ``acad.synthetic``), so
+a project can be regenerated instead of checked in. To drive the mock
+adapter with the same drawings, set ``ACAD_CMD_MOCK_SYNTHETIC_ENTITIES``
+(and optionally ``ACAD_CMD_MOCK_SYNTHETIC_SEED``) and run any command with
+``--mock`` on a folder of ``.dwg`` placeholders.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from autocad_batch_commander.acad.synthetic import ProjectSpec, write_dxf_project
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write a synthetic DXF project")
+    parser.add_argument("folder", type=Path)
+    parser.add_argument("--drawings", type=int, default=10)
+    parser.add_argument("--entities", type=int, default=500, help="Per drawing")
+    parser.add_argument("--standard", default="aia", help="Layer vocabulary")
+    parser.add_argument(
+        "--standard-share",
+        type=float,
+        default=0.5,
+        help="Fraction of layers already named to the standard",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    spec = ProjectSpec(
+        drawings=args.drawings,
+        entities=args.entities,
+        standard=args.standard,
+        standard_share=args.standard_share,
+        seed=args.seed,
+    )
+    start = time.perf_counter()
+    paths = write_dxf_project(spec, args.folder)
+    size = sum(p.stat().st_size for p in paths)
+    print(
+        f"Wrote {len(paths)} drawings ({size / 2**20:.1f} MiB) to {args.folder} "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,574 @@
+"""Persistent extraction cache that lets read-only runs skip opening drawings.
+
+:class:`DrawingCache` is a small SQLite database that stores what the
+adapter getters returned for each drawing, keyed by the drawing's path and
+fingerprint (size, mtime and SHA-256 of the file). :class:`CachedAdapter`
+wraps any :class:`~autocad_batch_commander.acad.port.AutoCADPort` and
+serves getters from that store, only opening the drawing in the real CAD
+application when something is missing or the caller starts editing.
+
+A drawing whose size and mtime are unchanged is trusted without rereading
+it; when only the mtime moved (a copy or ``touch``) the hash decides. New
+drawings are only hashed when a read-only session stores what it fetched,
+so runs that edit drawings never hash them or write to the cache. The
+database is capped at ``settings.cache_max_mb`` and evicts the least
+recently used drawings first. Hit/miss counters and last-used times are
+kept in memory and written with the next stored entry or on
+:meth:`DrawingCache.close`, so reads never commit on their own.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import time
+import zlib
+from collections import Counter
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any, TypeVar
+
+from pydantic import TypeAdapter
+
+from autocad_batch_commander.acad.mock_adapter import MockAutoCADAdapter
+from autocad_batch_commander.acad.port import AutoCADPort
+from autocad_batch_commander.config import settings
+from autocad_batch_commander.models import (
+    AuditIssue,
+    BlockAttribute,
+    BlockReference,
+    CacheStats,
+    DimensionEntity,
+    DrawingExtents,
+    LayerEntity,
+    LayoutInfo,
+    Point3D,
+    PolylineEntity,
+    TextEntity,
+    ViewportInfo,
+    XrefInfo,
+)
+from autocad_batch_commander.utils.file_ops import file_sha256
+
+T = TypeVar("T")
+
+CACHE_FILENAME = "extraction.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS drawings (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    bytes INTEGER NOT NULL DEFAULT 0,
+    last_used REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS items (
+    path TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    PRIMARY KEY (path, kind)
+);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+_TEXTS = TypeAdapter(list[TextEntity])
+_LAYERS = TypeAdapter(list[LayerEntity])
+_DIMENSIONS = TypeAdapter(list[DimensionEntity])
+_POLYLINES = TypeAdapter(list[PolylineEntity])
+_BLOCKS = TypeAdapter(list[BlockReference])
+_ATTRIBUTES = TypeAdapter(list[BlockAttribute])
+_XREFS = TypeAdapter(list[XrefInfo])
+_LAYOUTS = TypeAdapter(list[LayoutInfo])
+_VIEWPORTS = TypeAdapter(list[ViewportInfo])
+_EXTENTS = TypeAdapter(DrawingExtents)
+
+
+class DrawingCache:
+    """SQLite store of extracted drawing data keyed by file fingerprint.
+
+    Safe to share between worker processes: each process opens its own
+    connection and the database runs in WAL mode.
+    """
+
+    def __init__(self, db_path: Path, max_bytes: int) -> None:
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self._conn: sqlite3.Connection | None = None
+        self._counts: Counter[str] = Counter()  # not yet written to counters
+        self._used: dict[str, float] = {}  # last_used not yet written
+
+    @classmethod
+    def from_settings(cls) -> DrawingCache:
+        """Return the cache configured by ``ACAD_CMD_CACHE_*`` settings."""
+        return cls(settings.cache_dir / CACHE_FILENAME, settings.cache_max_mb << 20)
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Write out the batched counters and close the connection."""
+        if self._counts or self._used:
+            with self._db:
+                self._flush()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # ── Entries ────────────────────────────────────────────────────
+
+    def lookup(self, drawing: Path) -> str | None:
+        """Return the cache key for *drawing* if it has a current entry.
+
+        Returns None for drawings without an entry, files that are missing
+        and entries whose fingerprint no longer matches the file, so stale
+        data is never served; :meth:`add` replaces such entries.
+        """
+        try:
+            stat = drawing.stat()
+        except OSError:
+            return None
+        key = str(drawing.resolve())
+        row = self._db.execute(
+            "SELECT size, mtime_ns, sha256 FROM drawings WHERE path = ?", (key,)
+        ).fetchone()
+        if row is None or row[0] != stat.st_size:
+            return None
+        now = time.time()
+
+        if row[1] == stat.st_mtime_ns:
+            self._used[key] = now
+            return key
+        if row[2] != file_sha256(drawing):
+            return None
+        with self._db:
+            self._db.execute(
+                "UPDATE drawings SET mtime_ns = ?, last_used = ? WHERE path = ?",
+                (stat.st_mtime_ns, now, key),
+            )
+        return key
+
+    def get(self, key: str | None, kind: str) -> bytes | None:
+        """Return the stored payload for *kind*, counting a hit or a miss.
+
+        A *key* of None (no current entry) is always a miss.
+        """
+        row = None
+        if key is not None:
+            row = self._db.execute(
+                "SELECT payload FROM items WHERE path = ? AND kind = ?", (key, kind)
+            ).fetchone()
+        self._counts["hits" if row is not None else "misses"] += 1
+        return zlib.decompress(row[0]) if row is not None else None
+
+    def add(
+        self, drawing: Path, payloads: Mapping[str, bytes], seen: os.stat_result
+    ) -> None:
+        """Fingerprint *drawing* and make *payloads* its only cached data.
+
+        *seen* is the drawing's stat from when the payloads were read;
+        nothing is stored if the file has changed since.
+        """
+        try:
+            stat = drawing.stat()
+            if (stat.st_size, stat.st_mtime_ns) != (seen.st_size, seen.st_mtime_ns):
+                return
+            digest = file_sha256(drawing)
+        except OSError:
+            return
+        key = str(drawing.resolve())
+        self._used.pop(key, None)
+        with self._db:
+            self._db.execute("DELETE FROM items WHERE path = ?", (key,))
+            self._db.execute(
+                "INSERT OR REPLACE INTO drawings VALUES (?, ?, ?, ?, 0, ?)",
+                (key, stat.st_size, stat.st_mtime_ns, digest, time.time()),
+            )
+            self._write(key, payloads)
+        self._evict(keep=key)
+
+    def put(self, key: str, payloads: Mapping[str, bytes]) -> None:
+        """Store *payloads* by kind and evict old drawings if over the limit."""
+        with self._db:
+            self._write(key, payloads)
+        self._evict(keep=key)
+
+    def _write(self, key: str, payloads: Mapping[str, bytes]) -> None:
+        """Store *payloads* for an existing entry (in a transaction)."""
+        blobs = [(key, kind, zlib.compress(p)) for kind, p in payloads.items()]
+        self._db.executemany("INSERT OR REPLACE INTO items VALUES (?, ?, ?)", blobs)
+        self._db.execute(
+            "UPDATE drawings SET bytes = (SELECT COALESCE(SUM(LENGTH(payload)), 0)"
+            " FROM items WHERE path = ?) WHERE path = ?",
+            (key, key),
+        )
+        self._flush()
+
+    def invalidate(self, key: str) -> None:
+        """Forget everything stored for the drawing behind *key*."""
+        with self._db:
+            self._db.execute("DELETE FROM items WHERE path = ?", (key,))
+            self._db.execute("DELETE FROM drawings WHERE path = ?", (key,))
+
+    def clear(self) -> None:
+        """Remove every cached drawing and reset the counters."""
+        self._counts.clear()
+        self._used.clear()
+        with self._db:
+            self._db.execute("DELETE FROM items")
+            self._db.execute("DELETE FROM drawings")
+            self._db.execute("DELETE FROM counters")
+        self._db.execute("VACUUM")
+
+    def stats(self) -> CacheStats:
+        if self._counts or self._used:
+            with self._db:
+                self._flush()
+        drawings, size = self._db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM drawings"
+        ).fetchone()
+        counters = dict(self._db.execute("SELECT name, value FROM counters"))
+        return CacheStats(
+            path=str(self.db_path),
+            drawings=drawings,
+            size_bytes=size,
+            max_bytes=self.max_bytes,
+            **counters,
+        )
+
+    def _flush(self) -> None:
+        """Write the batched counters and last-used times (in a transaction)."""
+        self._db.executemany(
+            "INSERT INTO counters VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            self._counts.items(),
+        )
+        self._db.executemany(
+            "UPDATE drawings SET last_used = ? WHERE path = ?",
+            [(used, key) for key, used in self._used.items()],
+        )
+        self._counts.clear()
+        self._used.clear()
+
+    def _evict(self, keep: str) -> None:
+        (total,) = self._db.execute(
+            "SELECT COALESCE(SUM(bytes), 0) FROM drawings"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        evicted = 0
+        for path, size in self._db.execute(
+            "SELECT path, bytes FROM drawings WHERE path != ? ORDER BY last_used",
+            (keep,),
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self.invalidate(path)
+            total -= size
+            evicted += 1
+        if evicted:
+            self._counts["evictions"] += evicted
+
+
+def _on_layers(items: list[T], layers: list[str] | None) -> list[T]:
+    if layers is None:
+        return items
+    return [item for item in items if item.layer in layers]  # type: ignore[attr-defined]
+
+
+class CachedAdapter:
+    """Serve read-only adapter calls from a :class:`DrawingCache`.
+
+    ``open_drawing`` only stats the file; the first getter looks the
+    drawing up, and the wrapped adapter opens it the first time a getter
+    misses the cache or an edit is made. What the misses fetched is stored
+    when the drawing is closed, and only if it was not edited: the first
+    edit drops the drawing's cache entry, and later reads in the same
+    session go straight to the wrapped adapter.
+    Getters fetch the unfiltered data once and apply layer/type filters
+    locally, so every filter combination is served from the same entry;
+    reads that will not be cached pass their filters through instead.
+    """
+
+    def __init__(self, inner: AutoCADPort, cache: DrawingCache) -> None:
+        self.inner = inner
+        self.cache = cache
+        self._path: str | None = None
+        self._stat: os.stat_result | None = None  # None once reads go live
+        self._key: str | None = None
+        self._looked_up = False
+        self._opened = False
+        self._fetched: dict[str, bytes] = {}  # stored on close unless edited
+
+    # ── Drawing lifecycle ──────────────────────────────────────────
+
+    def open_drawing(self, path: str) -> None:
+        self._path = path
+        self._key = None
+        self._looked_up = False
+        self._opened = False
+        try:
+            self._stat = os.stat(path)
+        except OSError:
+            # Not a file on disk — let the wrapped adapter report the error.
+            self._stat = None
+            self._open_inner()
+
+    def close_drawing(self) -> None:
+        if self._stat is not None and self._path is not None and self._fetched:
+            if self._key is not None:
+                self.cache.put(self._key, self._fetched)
+            else:
+                self.cache.add(Path(self._path), self._fetched, self._stat)
+        self._fetched = {}
+        if self._opened:
+            self.inner.close_drawing()
+        self._path = None
+        self._stat = None
+        self._key = None
+        self._looked_up = False
+        self._opened = False
+
+    def save_drawing(self) -> None:
+        if self._opened:
+            self.inner.save_drawing()
+
+    def _open_inner(self) -> None:
+        if self._path is None:
+            raise RuntimeError("No drawing is open")
+        if not self._opened:
+            self.inner.open_drawing(self._path)
+            self._opened = True
+
+    def close(self) -> None:
+        """Write out the cache's batched counters."""
+        self.cache.close()
+
+    def _cached(
+        self, kind: str, adapter: TypeAdapter[Any], fetch: Callable[[], T]
+    ) -> T:
+        if self._stat is not None:
+            payload = self._fetched.get(kind) or self.cache.get(self._lookup(), kind)
+            if payload is not None:
+                return adapter.validate_json(payload)
+        self._open_inner()
+        value = fetch()
+        if self._stat is not None:
+            self._fetched[kind] = adapter.dump_json(value)
+        return value
+
+    def _lookup(self) -> str | None:
+        """The open drawing's cache key, looked up on the first read."""
+        if not self._looked_up and self._path is not None:
+            self._key = self.cache.lookup(Path(self._path))
+            self._looked_up = True
+        return self._key
+
+    def _live(self) -> AutoCADPort | None:
+        """The wrapped adapter, opened, if reads are not being cached."""
+        if self._stat is not None:
+            return None
+        self._open_inner()
+        return self.inner
+
+    def _editing(self) -> AutoCADPort:
+        self._open_inner()
+        if self._stat is not None and self._path is not None:
+            self.cache.invalidate(str(Path(self._path).resolve()))
+        self._key = None
+        self._stat = None
+        self._fetched = {}
+        return self.inner
+
+    # ── Text ───────────────────────────────────────────────────────
+
+    def get_text_entities(
+        self,
+        layers: list[str] | None = None,
+        entity_types: list[str] | None = None,
+    ) -> list[TextEntity]:
+        if (live := self._live()) is not None:
+            return live.get_text_entities(layers=layers, entity_types=entity_types)
+        texts = self._cached("texts", _TEXTS, self.inner.get_text_entities)
+        texts = _on_layers(texts, layers)
+        if entity_types is not None:
+            texts = [t for t in texts if t.entity_type in entity_types]
+        return texts
+
+    def set_text(self, handle: str, new_text: str) -> None:
+        self._editing().set_text(handle, new_text)
+
+    def set_texts(self, texts: dict[str, str]) -> None:
+        self._editing().set_texts(texts)
+
+    # ── Layers ─────────────────────────────────────────────────────
+
+    def get_layers(self) -> list[LayerEntity]:
+        return self._cached("layers", _LAYERS, self.inner.get_layers)
+
+    def rename_layer(self, old_name: str, new_name: str) -> bool:
+        return self._editing().rename_layer(old_name, new_name)
+
+    def rename_layers(self, renames: dict[str, str]) -> list[str]:
+        return self._editing().rename_layers(renames)
+
+    def create_layer(
+        self, name: str, color: int = 7, is_on: bool = True, is_frozen: bool = False
+    ) -> bool:
+        return self._editing().create_layer(name, color, is_on, is_frozen)
+
+    def set_layer_properties(
+        self,
+        name: str,
+        *,
+        color: int | None = None,
+        is_on: bool | None = None,
+        is_frozen: bool | None = None,
+    ) -> bool:
+        return self._editing().set_layer_properties(
+            name, color=color, is_on=is_on, is_frozen=is_frozen
+        )
+
+    def delete_layer(self, name: str) -> bool:
+        return self._editing().delete_layer(name)
+
+    # ── Geometry ───────────────────────────────────────────────────
+
+    def get_dimensions(
+        self,
+        layers: list[str] | None = None,
+        dimension_types: list[str] | None = None,
+    ) -> list[DimensionEntity]:
+        if (live := self._live()) is not None:
+            return live.get_dimensions(layers=layers, dimension_types=dimension_types)
+        dims = self._cached("dimensions", _DIMENSIONS, self.inner.get_dimensions)
+        dims = _on_layers(dims, layers)
+        if dimension_types is not None:
+            dims = [d for d in dims if d.dimension_type in dimension_types]
+        return dims
+
+    def get_polylines(self, layers: list[str] | None = None) -> list[PolylineEntity]:
+        if (live := self._live()) is not None:
+            return live.get_polylines(layers=layers)
+        polys = self._cached("polylines", _POLYLINES, self.inner.get_polylines)
+        return _on_layers(polys, layers)
+
+    def get_drawing_extents(self) -> DrawingExtents:
+        return self._cached("extents", _EXTENTS, self.inner.get_drawing_extents)
+
+    # ── Blocks ─────────────────────────────────────────────────────
+
+    def get_blocks(self, layers: list[str] | None = None) -> list[BlockReference]:
+        if (live := self._live()) is not None:
+            return live.get_blocks(layers=layers)
+        blocks = self._cached("blocks", _BLOCKS, self.inner.get_blocks)
+        return _on_layers(blocks, layers)
+
+    def get_block_attributes(self, handle: str) -> list[BlockAttribute]:
+        return self._cached(
+            f"attributes:{handle}",
+            _ATTRIBUTES,
+            lambda: self.inner.get_block_attributes(handle),
+        )
+
+    def set_block_attribute(self, handle: str, tag: str, value: str) -> bool:
+        return self._editing().set_block_attribute(handle, tag, value)
+
+    def set_block_attributes(self, updates: dict[str, dict[str, str]]) -> int:
+        return self._editing().set_block_attributes(updates)
+
+    def insert_block(
+        self,
+        name: str,
+        insertion_point: Point3D,
+        *,
+        scale_x: float = 1.0,
+        scale_y: float = 1.0,
+        scale_z: float = 1.0,
+        rotation: float = 0.0,
+        layer: str = "0",
+    ) -> str:
+        return self._editing().insert_block(
+            name,
+            insertion_point,
+            scale_x=scale_x,
+            scale_y=scale_y,
+            scale_z=scale_z,
+            rotation=rotation,
+            layer=layer,
+        )
+
+    # ── XREFs ──────────────────────────────────────────────────────
+
+    def get_xrefs(self) -> list[XrefInfo]:
+        return self._cached("xrefs", _XREFS, self.inner.get_xrefs)
+
+    def reload_xref(self, name: str) -> bool:
+        return self._editing().reload_xref(name)
+
+    def attach_xref(self, name: str, path: str, xref_type: str = "attach") -> bool:
+        return self._editing().attach_xref(name, path, xref_type)
+
+    def detach_xref(self, name: str) -> bool:
+        return self._editing().detach_xref(name)
+
+    # ── Layouts / Viewports ────────────────────────────────────────
+
+    def get_layouts(self) -> list[LayoutInfo]:
+        return self._cached("layouts", _LAYOUTS, self.inner.get_layouts)
+
+    def get_viewports(self, layout_name: str | None = None) -> list[ViewportInfo]:
+        return self._cached(
+            f"viewports:{layout_name or ''}",
+            _VIEWPORTS,
+            lambda: self.inner.get_viewports(layout_name),
+        )
+
+    # ── Plot ───────────────────────────────────────────────────────
+
+    def plot_layout(
+        self, layout_name: str, output_path: str, output_format: str = "PDF"
+    ) -> bool:
+        self._open_inner()
+        return self.inner.plot_layout(layout_name, output_path, output_format)
+
+    # ── Utility ────────────────────────────────────────────────────
+
+    def purge(self) -> int:
+        return self._editing().purge()
+
+    def audit_drawing(self, fix: bool = True) -> list[AuditIssue]:
+        if fix:
+            return self._editing().audit_drawing(fix=True)
+        self._open_inner()
+        return self.inner.audit_drawing(fix=False)
+
+
+def close_cache(adapter: AutoCADPort) -> None:
+    """Write out the cache counters of *adapter*, if it is a cached one."""
+    if isinstance(adapter, CachedAdapter):
+        adapter.close()
+
+
+def with_cache(adapter: AutoCADPort, enabled: bool | None = None) -> AutoCADPort:
+    """Wrap *adapter* in a :class:`CachedAdapter` when caching applies.
+
+    *enabled* forces caching on or off; by default it follows
+    ``settings.cache_enabled`` and leaves the mock adapter alone, since its
+    drawings are not read from the files being fingerprinted.
+    """
+    if enabled is None:
+        enabled = settings.cache_enabled and not isinstance(adapter, MockAutoCADAdapter)
+    if not enabled or isinstance(adapter, CachedAdapter):
+        return adapter
+    return CachedAdapter(adapter, DrawingCache.from_settings())
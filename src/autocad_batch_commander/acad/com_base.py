@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 import sys
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
 
 from autocad_batch_commander.models import (
     AuditIssue,
@@ -22,13 +26,76 @@ from autocad_batch_commander.models import (
 if sys.platform != "win32":
     raise ImportError("COM adapters require Windows and pywin32")
 
-import win32com.client  # type: ignore[import-untyped]  # noqa: E402
+import pythoncom  # type: ignore[import-untyped]
+import win32com.client  # type: ignore[import-untyped]
+
+T = TypeVar("T")
+
+_TEXT_TYPES = ("AcDbText", "AcDbMText")
+_DIMENSION_TYPES = {
+    "AcDbRotatedDimension": "linear",
+    "AcDbAlignedDimension": "aligned",
+    "AcDb3PointAngularDimension": "angular",
+    "AcDbRadialDimension": "radial",
+    "AcDbDiametricDimension": "diametric",
+}
+_POLYLINE_TYPES = ("AcDbPolyline", "AcDb2dPolyline")
+_BLOCK_TYPE = "AcDbBlockReference"
+
+# COM ``EntityName`` -> DXF type name used in selection-set filters (code 0).
+_DXF_NAMES = {
+    "AcDbText": "TEXT",
+    "AcDbMText": "MTEXT",
+    **{name: "DIMENSION" for name in _DIMENSION_TYPES},
+    "AcDbPolyline": "LWPOLYLINE",
+    "AcDb2dPolyline": "POLYLINE",
+    "AcDbBlockReference": "INSERT",
+}
+
+_SELECTION_SET_NAME = "ACB_QUERY"
+_AC_SELECTION_SET_ALL = 5
+_WILDCARD_CHARS = "#@.*?~[]-,`"
+
+
+@dataclass
+class _EntityCache:
+    """ModelSpace entities of the open document, materialised in one scan."""
+
+    texts: list[TextEntity] = field(default_factory=list)
+    dimensions: list[DimensionEntity] = field(default_factory=list)
+    polylines: list[PolylineEntity] = field(default_factory=list)
+    blocks: list[BlockReference] = field(default_factory=list)
+
+
+def _filter_layers(entities: list, layers: list[str] | None) -> list:
+    if not layers:
+        return list(entities)
+    return [e for e in entities if e.layer in layers]
+
+
+def _escape_wildcards(name: str) -> str:
+    """Escape AutoCAD wildcard characters so a layer name matches literally."""
+    return "".join(f"`{c}" if c in _WILDCARD_CHARS else c for c in name)
 
 
 class COMAdapterBase:
     """Base class for COM-based CAD adapters (AutoCAD, BricsCAD, ZWCAD).
 
     Subclasses set ``_dispatch_name`` to the appropriate COM ProgID.
+
+    Entity getters are served from a per-document cache that is filled by a
+    single pass over ``ModelSpace`` on first use, so ``get_drawing_info``
+    and multi-stage pipelines walk the document once instead of once per
+    getter. Mutating calls update or drop the cache; ``open_drawing`` and
+    ``close_drawing`` reset it. The scan also keeps the COM objects of text
+    and block entities by handle, so the bulk setters (``set_texts``,
+    ``set_block_attributes``) reuse them instead of resolving every handle
+    with ``HandleToObject``, and run inside a single undo group.
+
+    Filtered queries (``layers=`` / entity types) issued before the cache
+    exists are pushed into the CAD application as a filtered selection set
+    on DXF group codes 0 (type), 8 (layer) and 410 (ModelSpace), so only
+    matching entities cross the COM boundary.
     """
 
     _dispatch_name: str = "AutoCAD.Application"
@@ -37,18 +104,172 @@ class COMAdapterBase:
         self._acad = win32com.client.Dispatch(self._dispatch_name)
         self._acad.Visible = False
         self._doc = None
+        self._cache: _EntityCache | None = None
+        self._objects: dict[str, Any] = {}  # handle -> COM object, from scans
 
     def _require_doc(self):
         if self._doc is None:
             raise RuntimeError("No drawing is open")
         return self._doc
 
+    # ── Entity cache ──────────────────────────────────────────────
+
+    def _entities(self) -> _EntityCache:
+        """Return the entity cache, scanning ModelSpace once if needed."""
+        if self._cache is None:
+            self._cache = self._scan_model_space()
+        return self._cache
+
+    def _invalidate_cache(self) -> None:
+        self._cache = None
+        self._objects = {}
+
+    def _object(self, handle: str):
+        """Return the COM object for *handle*, reusing one seen by a scan."""
+        entity = self._objects.get(handle)
+        if entity is None:
+            entity = self._require_doc().HandleToObject(handle)
+        return entity
+
+    @contextmanager
+    def _undo_group(self) -> Iterator[None]:
+        """Group the edits made inside the block into one undo step."""
+        doc = self._require_doc()
+        doc.StartUndoMark()
+        try:
+            yield
+        finally:
+            doc.EndUndoMark()
+
+    def _scan_model_space(self) -> _EntityCache:
+        """Classify every ModelSpace entity by ``EntityName`` in one pass."""
+        doc = self._require_doc()
+        cache = _EntityCache()
+        for entity in doc.ModelSpace:
+            try:
+                ename = entity.EntityName
+                if ename in _TEXT_TYPES:
+                    cache.texts.append(self._to_text(entity, ename))
+                    self._objects[entity.Handle] = entity
+                elif ename in _DIMENSION_TYPES:
+                    cache.dimensions.append(self._to_dimension(entity, ename))
+                elif ename in _POLYLINE_TYPES:
+                    cache.polylines.append(self._to_polyline(entity))
+                elif ename == _BLOCK_TYPE:
+                    cache.blocks.append(self._to_block(entity))
+                    self._objects[entity.Handle] = entity
+            except Exception:
+                continue
+        return cache
+
+    def _select(
+        self,
+        entity_names: list[str],
+        layers: list[str] | None,
+        convert: Callable[[Any, str], T],
+    ) -> list[T]:
+        """Convert the ModelSpace entities matched by a filtered selection set.
+
+        The type and layer filters are evaluated inside the CAD application;
+        results are then narrowed to *entity_names* because group code 0
+        cannot tell dimension subtypes (or 2D from 3D polylines) apart.
+        """
+        doc = self._require_doc()
+        if not entity_names:
+            return []
+        codes = [0, 410]
+        values = [",".join(sorted({_DXF_NAMES[n] for n in entity_names})), "Model"]
+        if layers:
+            codes.append(8)
+            values.append(",".join(_escape_wildcards(name) for name in layers))
+
+        try:
+            doc.SelectionSets.Item(_SELECTION_SET_NAME).Delete()
+        except Exception:
+            pass
+        sset = doc.SelectionSets.Add(_SELECTION_SET_NAME)
+        try:
+            sset.Select(
+                _AC_SELECTION_SET_ALL,
+                pythoncom.Empty,
+                pythoncom.Empty,
+                win32com.client.VARIANT(pythoncom.VT_ARRAY | pythoncom.VT_I2, codes),
+                win32com.client.VARIANT(
+                    pythoncom.VT_ARRAY | pythoncom.VT_VARIANT, values
+                ),
+            )
+            result: list[T] = []
+            for entity in sset:
+                try:
+                    ename = entity.EntityName
+                    if ename in entity_names:
+                        result.append(convert(entity, ename))
+                        if ename in _TEXT_TYPES or ename == _BLOCK_TYPE:
+                            self._objects[entity.Handle] = entity
+                except Exception:
+                    continue
+            return result
+        finally:
+            sset.Delete()
+
+    @staticmethod
+    def _to_text(entity, ename: str) -> TextEntity:
+        ip = getattr(entity, "InsertionPoint", None)
+        return TextEntity(
+            handle=entity.Handle,
+            text=entity.TextString,
+            layer=entity.Layer,
+            entity_type=ename,
+            position=None if ip is None else Point3D(x=ip[0], y=ip[1], z=ip[2]),
+        )
+
+    @staticmethod
+    def _to_dimension(entity, ename: str) -> DimensionEntity:
+        return DimensionEntity(
+            handle=entity.Handle,
+            dimension_type=_DIMENSION_TYPES[ename],
+            value=entity.Measurement,
+            text_override=getattr(entity, "TextOverride", ""),
+            layer=entity.Layer,
+        )
+
+    @staticmethod
+    def _to_polyline(entity) -> PolylineEntity:
+        coords = list(entity.Coordinates)
+        vertices = [
+            Point3D(x=coords[i], y=coords[i + 1]) for i in range(0, len(coords), 2)
+        ]
+        return PolylineEntity(
+            handle=entity.Handle,
+            vertices=vertices,
+            closed=entity.Closed,
+            area=entity.Area if entity.Closed else 0.0,
+            perimeter=entity.Length,
+            layer=entity.Layer,
+        )
+
+    @staticmethod
+    def _to_block(entity) -> BlockReference:
+        ip = entity.InsertionPoint
+        return BlockReference(
+            handle=entity.Handle,
+            name=entity.Name,
+            insertion_point=Point3D(x=ip[0], y=ip[1], z=ip[2]),
+            layer=entity.Layer,
+            rotation=entity.Rotation,
+            scale_x=entity.XScaleFactor,
+            scale_y=entity.YScaleFactor,
+            scale_z=entity.ZScaleFactor,
+        )
+
     # ── Drawing lifecycle ─────────────────────────────────────────
 
     def open_drawing(self, path: str) -> None:
+        self._invalidate_cache()
         self._doc = self._acad.Documents.Open(path)
 
     def close_drawing(self) -> None:
+        self._invalidate_cache()
         if self._doc is not None:
             self._doc.Close(False)
             self._doc = None
@@ -58,30 +279,35 @@ class COMAdapterBase:
 
     # ── Text ──────────────────────────────────────────────────────
 
-    def get_text_entities(self, layers: list[str] | None = None) -> list[TextEntity]:
-        doc = self._require_doc()
-        entities: list[TextEntity] = []
-        for entity in doc.ModelSpace:
-            try:
-                if entity.EntityName in ("AcDbText", "AcDbMText"):
-                    if layers and entity.Layer not in layers:
-                        continue
-                    entities.append(
-                        TextEntity(
-                            handle=entity.Handle,
-                            text=entity.TextString,
-                            layer=entity.Layer,
-                            entity_type=entity.EntityName,
-                        )
-                    )
-            except Exception:
-                continue
-        return entities
+    def get_text_entities(
+        self,
+        layers: list[str] | None = None,
+        entity_types: list[str] | None = None,
+    ) -> list[TextEntity]:
+        names = [n for n in _TEXT_TYPES if not entity_types or n in entity_types]
+        if self._cache is None and (layers or entity_types):
+            return self._select(names, layers, self._to_text)
+        texts = [t for t in self._entities().texts if t.entity_type in names]
+        return _filter_layers(texts, layers)
 
     def set_text(self, handle: str, new_text: str) -> None:
-        doc = self._require_doc()
-        entity = doc.HandleToObject(handle)
-        entity.TextString = new_text
+        self._object(handle).TextString = new_text
+        if self._cache is not None:
+            for text in self._cache.texts:
+                if text.handle == handle:
+                    text.text = new_text
+                    break
+
+    def set_texts(self, texts: dict[str, str]) -> None:
+        if not texts:
+            return
+        with self._undo_group():
+            for handle, new_text in texts.items():
+                self._object(handle).TextString = new_text
+        if self._cache is not None:
+            for text in self._cache.texts:
+                if text.handle in texts:
+                    text.text = texts[text.handle]
 
     # ── Layers ────────────────────────────────────────────────────
 
@@ -100,13 +326,32 @@ class COMAdapterBase:
         return result
 
     def rename_layer(self, old_name: str, new_name: str) -> bool:
+        return bool(self.rename_layers({old_name: new_name}))
+
+    def rename_layers(self, renames: dict[str, str]) -> list[str]:
         doc = self._require_doc()
-        try:
-            layer = doc.Layers.Item(old_name)
-            layer.Name = new_name
-            return True
-        except Exception:
-            return False
+        renamed: list[str] = []
+        origin: dict[str, str] = {}  # current name -> name before this call
+        for old_name, new_name in renames.items():
+            try:
+                layer = doc.Layers.Item(old_name)
+                layer.Name = new_name
+            except Exception:
+                continue
+            origin[new_name] = origin.pop(old_name, old_name)
+            renamed.append(old_name)
+        moved = {before: after for after, before in origin.items() if before != after}
+        if moved and self._cache is not None:
+            cache = self._cache
+            for entity in (
+                *cache.texts,
+                *cache.dimensions,
+                *cache.polylines,
+                *cache.blocks,
+            ):
+                if entity.layer in moved:
+                    entity.layer = moved[entity.layer]
+        return renamed
 
     def create_layer(
         self, name: str, color: int = 7, is_on: bool = True, is_frozen: bool = False
@@ -155,61 +400,29 @@ class COMAdapterBase:
 
     # ── Geometry ──────────────────────────────────────────────────
 
-    def get_dimensions(self, layers: list[str] | None = None) -> list[DimensionEntity]:
-        doc = self._require_doc()
-        dims: list[DimensionEntity] = []
-        dim_types = {
-            "AcDbRotatedDimension": "linear",
-            "AcDbAlignedDimension": "aligned",
-            "AcDb3PointAngularDimension": "angular",
-            "AcDbRadialDimension": "radial",
-            "AcDbDiametricDimension": "diametric",
-        }
-        for entity in doc.ModelSpace:
-            try:
-                ename = entity.EntityName
-                if ename in dim_types:
-                    if layers and entity.Layer not in layers:
-                        continue
-                    dims.append(
-                        DimensionEntity(
-                            handle=entity.Handle,
-                            dimension_type=dim_types[ename],
-                            value=entity.Measurement,
-                            text_override=getattr(entity, "TextOverride", ""),
-                            layer=entity.Layer,
-                        )
-                    )
-            except Exception:
-                continue
-        return dims
+    def get_dimensions(
+        self,
+        layers: list[str] | None = None,
+        dimension_types: list[str] | None = None,
+    ) -> list[DimensionEntity]:
+        if self._cache is None and (layers or dimension_types):
+            names = [
+                name
+                for name, dim_type in _DIMENSION_TYPES.items()
+                if not dimension_types or dim_type in dimension_types
+            ]
+            return self._select(names, layers, self._to_dimension)
+        dims = self._entities().dimensions
+        if dimension_types:
+            dims = [d for d in dims if d.dimension_type in dimension_types]
+        return _filter_layers(dims, layers)
 
     def get_polylines(self, layers: list[str] | None = None) -> list[PolylineEntity]:
-        doc = self._require_doc()
-        polys: list[PolylineEntity] = []
-        for entity in doc.ModelSpace:
-            try:
-                if entity.EntityName in ("AcDbPolyline", "AcDb2dPolyline"):
-                    if layers and entity.Layer not in layers:
-                        continue
-                    coords = list(entity.Coordinates)
-                    vertices = [
-                        Point3D(x=coords[i], y=coords[i + 1])
-                        for i in range(0, len(coords), 2)
-                    ]
-                    polys.append(
-                        PolylineEntity(
-                            handle=entity.Handle,
-                            vertices=vertices,
-                            closed=entity.Closed,
-                            area=entity.Area if entity.Closed else 0.0,
-                            perimeter=entity.Length,
-                            layer=entity.Layer,
-                        )
-                    )
-            except Exception:
-                continue
-        return polys
+        if self._cache is None and layers:
+            return self._select(
+                list(_POLYLINE_TYPES), layers, lambda e, _: self._to_polyline(e)
+            )
+        return _filter_layers(self._entities().polylines, layers)
 
     def get_drawing_extents(self) -> DrawingExtents:
         doc = self._require_doc()
@@ -223,29 +436,9 @@ class COMAdapterBase:
     # ── Blocks ────────────────────────────────────────────────────
 
     def get_blocks(self, layers: list[str] | None = None) -> list[BlockReference]:
-        doc = self._require_doc()
-        refs: list[BlockReference] = []
-        for entity in doc.ModelSpace:
-            try:
-                if entity.EntityName == "AcDbBlockReference":
-                    if layers and entity.Layer not in layers:
-                        continue
-                    ip = entity.InsertionPoint
-                    refs.append(
-                        BlockReference(
-                            handle=entity.Handle,
-                            name=entity.Name,
-                            insertion_point=Point3D(x=ip[0], y=ip[1], z=ip[2]),
-                            layer=entity.Layer,
-                            rotation=entity.Rotation,
-                            scale_x=entity.XScaleFactor,
-                            scale_y=entity.YScaleFactor,
-                            scale_z=entity.ZScaleFactor,
-                        )
-                    )
-            except Exception:
-                continue
-        return refs
+        if self._cache is None and layers:
+            return self._select([_BLOCK_TYPE], layers, lambda e, _: self._to_block(e))
+        return _filter_layers(self._entities().blocks, layers)
 
     def get_block_attributes(self, handle: str) -> list[BlockAttribute]:
         doc = self._require_doc()
@@ -265,8 +458,7 @@ class COMAdapterBase:
         return attrs
 
     def set_block_attribute(self, handle: str, tag: str, value: str) -> bool:
-        doc = self._require_doc()
-        entity = doc.HandleToObject(handle)
+        entity = self._object(handle)
         try:
             for attr in entity.GetAttributes():
                 if attr.TagString == tag:
@@ -276,6 +468,20 @@ class COMAdapterBase:
             pass
         return False
 
+    def set_block_attributes(self, updates: dict[str, dict[str, str]]) -> int:
+        count = 0
+        with self._undo_group():
+            for handle, values in updates.items():
+                try:
+                    # One GetAttributes call per block, whatever the tag count.
+                    for attr in self._object(handle).GetAttributes():
+                        if attr.TagString in values:
+                            attr.TextString = values[attr.TagString]
+                            count += 1
+                except Exception:
+                    continue
+        return count
+
     def insert_block(
         self,
         name: str,
@@ -291,6 +497,7 @@ class COMAdapterBase:
         pt = (insertion_point.x, insertion_point.y, insertion_point.z)
         ref = doc.ModelSpace.InsertBlock(pt, name, scale_x, scale_y, scale_z, rotation)
         ref.Layer = layer
+        self._invalidate_cache()
         return ref.Handle
 
     # ── XREFs ─────────────────────────────────────────────────────
@@ -333,6 +540,7 @@ class COMAdapterBase:
                 doc.ModelSpace.AttachExternalReference(
                     path, name, pt, 1.0, 1.0, 1.0, 0.0, overlay
                 )
+                self._invalidate_cache()
                 return True
             except Exception:
                 return False
@@ -342,6 +550,7 @@ class COMAdapterBase:
         try:
             block = doc.Blocks.Item(name)
             block.Detach()
+            self._invalidate_cache()
             return True
         except Exception:
             return False
@@ -398,6 +607,7 @@ class COMAdapterBase:
 
     def purge(self) -> int:
         doc = self._require_doc()
+        self._invalidate_cache()
         try:
             doc.PurgeAll()
             return 1  # COM PurgeAll doesn't return count
@@ -406,6 +616,8 @@ class COMAdapterBase:
 
     def audit_drawing(self, fix: bool = True) -> list[AuditIssue]:
         doc = self._require_doc()
+        if fix:
+            self._invalidate_cache()
         try:
             doc.AuditInfo(fix)
         except Exception:
@@ -0,0 +1,449 @@
+"""Minimal pure-Python reader/writer for ASCII DXF files.
+
+A DXF file is a flat sequence of *group code* / *value* line pairs. This
+module keeps that representation: a :class:`DXFDocument` is a list of
+sections, and each section is a list of *records* — the run of tags that
+starts at a group code 0 (an entity, table entry, block marker or object).
+Content the adapter does not understand is carried through untouched, so
+a drawing that is read and written back only changes where it was edited.
+
+For read-only access, :func:`iter_records` and friends stream records
+straight from the file without building a document, holding one record
+in memory at a time.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection, Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+Tag = tuple[int, str]
+Record = list[Tag]
+
+BINARY_SENTINEL = b"AutoCAD Binary DXF"
+
+
+def iter_tags(path: str | Path) -> Iterator[Tag]:
+    """Yield ``(group_code, value)`` pairs from an ASCII DXF file.
+
+    Values keep their leading whitespace (it is significant in text) and
+    bytes that are not valid UTF-8 round-trip through surrogate escapes.
+    """
+    with open(path, "rb") as fh:
+        if fh.read(len(BINARY_SENTINEL)) == BINARY_SENTINEL:
+            raise ValueError(f"Binary DXF is not supported: {path}")
+
+    with open(path, encoding="utf-8", errors="surrogateescape") as fh:
+        for code_line in fh:
+            code = code_line.strip()
+            if not code:
+                continue
+            value = fh.readline().rstrip("\r\n")
+            yield int(code), value
+
+
+def write_tags(path: str | Path, tags: Iterable[Tag]) -> None:
+    """Write ``(group_code, value)`` pairs as an ASCII DXF file."""
+    with open(
+        path, "w", encoding="utf-8", errors="surrogateescape", newline="\r\n"
+    ) as fh:
+        for code, value in tags:
+            fh.write(f"{code:>3}\n{value}\n")
+
+
+def iter_records(
+    path: str | Path,
+    sections: Collection[str],
+    types: Collection[str] | None = None,
+) -> Iterator[Record]:
+    """Stream the records of *sections*, keeping only those of *types*.
+
+    Records of other types are skipped tag by tag without being buffered,
+    and reading stops as soon as every requested section has been seen,
+    so header and table lookups never touch the ENTITIES section.
+    """
+    remaining = set(sections)
+    in_section = False
+    expect_name = False
+    record: Record | None = None
+    for code, value in iter_tags(path):
+        if code == 0:
+            if record is not None:
+                yield record
+                record = None
+            if value == "SECTION":
+                expect_name = True
+            elif value == "ENDSEC":
+                if in_section and not remaining:
+                    return
+                in_section = False
+            elif value == "EOF":
+                return
+            elif in_section and (types is None or value in types):
+                record = [(code, value)]
+        elif expect_name:
+            expect_name = False
+            in_section = value in remaining
+            remaining.discard(value)
+        elif record is not None:
+            record.append((code, value))
+        elif in_section and types is None:
+            record = [(code, value)]  # HEADER content has no leading code 0
+    if record is not None:
+        yield record
+
+
+def iter_table_entries(path: str | Path, table: str) -> Iterator[Record]:
+    """Stream the entries of one symbol table (``LAYER``, ``BLOCK_RECORD``…)."""
+    inside = False
+    for record in iter_records(path, ("TABLES",)):
+        rtype = record_type(record)
+        if rtype == "TABLE":
+            inside = get_value(record, 2) == table
+        elif rtype == "ENDTAB":
+            if inside:
+                return
+        elif inside:
+            yield record
+
+
+def read_header(path: str | Path) -> Record:
+    """Return the HEADER section's tags without reading the rest of the file."""
+    for record in iter_records(path, ("HEADER",)):
+        return record
+    return []
+
+
+def find_header_var(header: Record, name: str) -> Record | None:
+    """Return the value tags of header variable *name* (e.g. ``$EXTMIN``)."""
+    for i, (code, value) in enumerate(header):
+        if code == 9 and value == name:
+            end = i + 1
+            while end < len(header) and header[end][0] != 9:
+                end += 1
+            return header[i + 1 : end]
+    return None
+
+
+# ── Record helpers ────────────────────────────────────────────────
+
+
+def record_type(record: Record) -> str:
+    """Return the type of a record (``TEXT``, ``LAYER``, ``BLOCK``…)."""
+    return record[0][1] if record and record[0][0] == 0 else ""
+
+
+def get_value(record: Record, code: int, default: str | None = None) -> str | None:
+    """Return the first value with group *code* in *record*."""
+    for tag_code, value in record:
+        if tag_code == code:
+            return value
+    return default
+
+
+def get_float(record: Record, code: int, default: float = 0.0) -> float:
+    value = get_value(record, code)
+    return float(value) if value is not None else default
+
+
+def get_int(record: Record, code: int, default: int = 0) -> int:
+    value = get_value(record, code)
+    return int(value) if value is not None else default
+
+
+def set_value(record: Record, code: int, value: str) -> None:
+    """Replace the first tag with group *code*, appending it if missing."""
+    for i, (tag_code, _) in enumerate(record):
+        if tag_code == code:
+            record[i] = (code, value)
+            return
+    record.append((code, value))
+
+
+def subclass_tags(record: Record, marker: str) -> Record:
+    """Return the tags that follow the ``100 <marker>`` subclass marker."""
+    tags: Record = []
+    inside = False
+    for code, value in record:
+        if code == 100:
+            inside = value == marker
+        elif inside:
+            tags.append((code, value))
+    return tags
+
+
+def format_float(value: float) -> str:
+    return repr(float(value))
+
+
+# ── Document ──────────────────────────────────────────────────────
+
+
+@dataclass
+class DXFSection:
+    """One ``SECTION`` of a DXF file (HEADER, TABLES, BLOCKS, ENTITIES…)."""
+
+    name: str
+    records: list[Record] = field(default_factory=list)
+
+
+@dataclass
+class DXFDocument:
+    """An ASCII DXF file held as sections of tag records."""
+
+    sections: list[DXFSection] = field(default_factory=list)
+
+    @classmethod
+    def read(cls, path: str | Path) -> DXFDocument:
+        return cls.from_tags(iter_tags(path))
+
+    @classmethod
+    def from_tags(cls, tags: Iterable[Tag]) -> DXFDocument:
+        doc = cls()
+        section: DXFSection | None = None
+        stream = iter(tags)
+        for code, value in stream:
+            if code == 0 and value == "SECTION":
+                _, name = next(stream)
+                section = DXFSection(name=name)
+                doc.sections.append(section)
+            elif code == 0 and value == "ENDSEC":
+                section = None
+            elif code == 0 and value == "EOF":
+                break
+            elif section is not None:
+                if code == 0 or not section.records:
+                    section.records.append([(code, value)])
+                else:
+                    section.records[-1].append((code, value))
+        return doc
+
+    @classmethod
+    def new(cls) -> DXFDocument:
+        """Return a minimal R2000 document with layer 0 and both layouts.
+
+        The skeleton carries only what this module and the DXF adapter rely
+        on; it is meant for tests and synthetic data, not as a CAD template.
+        """
+        doc = cls(
+            sections=[
+                DXFSection("HEADER", [[(9, "$ACADVER"), (1, "AC1015")]]),
+                DXFSection("TABLES"),
+                DXFSection("BLOCKS"),
+                DXFSection("ENTITIES"),
+                DXFSection("OBJECTS"),
+            ]
+        )
+        doc.set_header_var("$HANDSEED", [(5, "1")])
+        doc.set_header_var("$CLAYER", [(8, "0")])
+
+        tables = doc.section("TABLES")
+        for table in ("LAYER", "BLOCK_RECORD"):
+            tables.records.append(
+                [(0, "TABLE"), (2, table), (5, doc.next_handle()), (70, "0")]
+            )
+            tables.records.append([(0, "ENDTAB")])
+        doc.add_table_entry(
+            "LAYER",
+            [
+                (0, "LAYER"),
+                (5, doc.next_handle()),
+                (100, "AcDbSymbolTableRecord"),
+                (100, "AcDbLayerTableRecord"),
+                (2, "0"),
+                (70, "0"),
+                (62, "7"),
+                (6, "Continuous"),
+            ],
+        )
+
+        for block, layout, tab in (
+            ("*Model_Space", "Model", 0),
+            ("*Paper_Space", "Layout1", 1),
+        ):
+            owner = doc.next_handle()
+            doc.add_table_entry(
+                "BLOCK_RECORD",
+                [
+                    (0, "BLOCK_RECORD"),
+                    (5, owner),
+                    (100, "AcDbSymbolTableRecord"),
+                    (100, "AcDbBlockTableRecord"),
+                    (2, block),
+                ],
+            )
+            doc.add_block(block, owner)
+            doc.section("OBJECTS").records.append(
+                [
+                    (0, "LAYOUT"),
+                    (5, doc.next_handle()),
+                    (100, "AcDbPlotSettings"),
+                    (1, ""),
+                    (2, "none_device"),
+                    (4, ""),
+                    (100, "AcDbLayout"),
+                    (1, layout),
+                    (70, "1"),
+                    (71, str(tab)),
+                    (330, owner),
+                ]
+            )
+        return doc
+
+    def write(self, path: str | Path) -> None:
+        write_tags(path, self.tags())
+
+    def tags(self) -> Iterator[Tag]:
+        for section in self.sections:
+            yield 0, "SECTION"
+            yield 2, section.name
+            for record in section.records:
+                yield from record
+            yield 0, "ENDSEC"
+        yield 0, "EOF"
+
+    def section(self, name: str) -> DXFSection:
+        """Return the named section, creating an empty one if it is missing."""
+        for section in self.sections:
+            if section.name == name:
+                return section
+        section = DXFSection(name=name)
+        self.sections.append(section)
+        return section
+
+    # ── Header variables ─────────────────────────────────────────
+
+    def _header(self) -> Record:
+        header = self.section("HEADER")
+        if not header.records:
+            header.records.append([])
+        return header.records[0]
+
+    def header_var(self, name: str) -> Record | None:
+        return find_header_var(self._header(), name)
+
+    def set_header_var(self, name: str, tags: Record) -> None:
+        header = self._header()
+        for i, (code, value) in enumerate(header):
+            if code == 9 and value == name:
+                end = i + 1
+                while end < len(header) and header[end][0] != 9:
+                    end += 1
+                header[i + 1 : end] = tags
+                return
+        header.extend([(9, name), *tags])
+
+    def next_handle(self) -> str:
+        """Allocate a new entity handle from ``$HANDSEED``."""
+        seed = self.header_var("$HANDSEED")
+        if seed:
+            handle = int(seed[0][1], 16)
+        else:
+            handle = self._max_handle() + 1
+        self.set_header_var("$HANDSEED", [(5, f"{handle + 1:X}")])
+        return f"{handle:X}"
+
+    def _max_handle(self) -> int:
+        highest = 0
+        for section in self.sections:
+            for record in section.records:
+                for code, value in record:
+                    if code in (5, 105):
+                        try:
+                            highest = max(highest, int(value, 16))
+                        except ValueError:
+                            continue
+        return highest
+
+    # ── Tables ───────────────────────────────────────────────────
+
+    def _table_bounds(self, table: str) -> tuple[int, int] | None:
+        """Return ``(head, endtab)`` record indices of *table* in TABLES."""
+        records = self.section("TABLES").records
+        for i, record in enumerate(records):
+            if record_type(record) == "TABLE" and get_value(record, 2) == table:
+                for j in range(i + 1, len(records)):
+                    if record_type(records[j]) == "ENDTAB":
+                        return i, j
+        return None
+
+    def table_head(self, table: str) -> Record | None:
+        bounds = self._table_bounds(table)
+        return self.section("TABLES").records[bounds[0]] if bounds else None
+
+    def table_entries(self, table: str) -> list[Record]:
+        bounds = self._table_bounds(table)
+        if bounds is None:
+            return []
+        return self.section("TABLES").records[bounds[0] + 1 : bounds[1]]
+
+    def add_table_entry(self, table: str, record: Record) -> None:
+        bounds = self._table_bounds(table)
+        if bounds is None:
+            raise KeyError(f"DXF has no {table} table")
+        records = self.section("TABLES").records
+        head = records[bounds[0]]
+        set_value(head, 70, str(get_int(head, 70) + 1))
+        records.insert(bounds[1], record)
+
+    def remove_table_entry(self, table: str, record: Record) -> None:
+        records = self.section("TABLES").records
+        for i, candidate in enumerate(records):
+            if candidate is record:
+                del records[i]
+                head = self.table_head(table)
+                if head is not None:
+                    set_value(head, 70, str(max(0, get_int(head, 70) - 1)))
+                return
+
+    # ── Blocks ───────────────────────────────────────────────────
+
+    def block_definitions(self) -> dict[str, tuple[int, int]]:
+        """Map block names to ``(BLOCK, ENDBLK)`` record indices in BLOCKS."""
+        records = self.section("BLOCKS").records
+        blocks: dict[str, tuple[int, int]] = {}
+        start: int | None = None
+        for i, record in enumerate(records):
+            rtype = record_type(record)
+            if rtype == "BLOCK":
+                start = i
+            elif rtype == "ENDBLK" and start is not None:
+                blocks[get_value(records[start], 2, "")] = (start, i)
+                start = None
+        return blocks
+
+    def add_block(
+        self,
+        name: str,
+        owner: str,
+        entities: list[Record] | None = None,
+        *,
+        flags: int = 0,
+        xref_path: str = "",
+    ) -> None:
+        """Append a ``BLOCK … ENDBLK`` definition to the BLOCKS section."""
+        begin: Record = [
+            (0, "BLOCK"),
+            (5, self.next_handle()),
+            (330, owner),
+            (100, "AcDbEntity"),
+            (8, "0"),
+            (100, "AcDbBlockBegin"),
+            (2, name),
+            (70, str(flags)),
+            (10, "0.0"),
+            (20, "0.0"),
+            (30, "0.0"),
+            (3, name),
+            (1, xref_path),
+        ]
+        end: Record = [
+            (0, "ENDBLK"),
+            (5, self.next_handle()),
+            (330, owner),
+            (100, "AcDbEntity"),
+            (8, "0"),
+            (100, "AcDbBlockEnd"),
+        ]
+        self.section("BLOCKS").records.extend([begin, *(entities or []), end])
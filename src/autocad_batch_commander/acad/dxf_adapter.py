@@ -0,0 +1,898 @@
+"""Offline adapter that reads and writes ASCII DXF files in pure Python.
+
+Unlike the COM adapters this needs no running CAD application, so it works
+on Linux workers and can be sharded across processes without a licence
+per session. It operates on ``.dxf`` files only; DWG files must be
+converted first.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from autocad_batch_commander.acad.dxf import (
+    BINARY_SENTINEL,
+    DXFDocument,
+    Record,
+    find_header_var,
+    format_float,
+    get_float,
+    get_int,
+    get_value,
+    iter_records,
+    iter_table_entries,
+    read_header,
+    record_type,
+    set_value,
+    subclass_tags,
+)
+from autocad_batch_commander.models import (
+    AuditIssue,
+    BlockAttribute,
+    BlockReference,
+    DimensionEntity,
+    DrawingExtents,
+    LayerEntity,
+    LayoutInfo,
+    Point2D,
+    Point3D,
+    PolylineEntity,
+    TextEntity,
+    ViewportInfo,
+    XrefInfo,
+)
+from autocad_batch_commander.utils.geometry import measure_polylines
+
+_TEXT_TYPES = {"TEXT": "AcDbText", "MTEXT": "AcDbMText"}
+_DIMENSION_TYPES = {
+    0: "linear",
+    1: "aligned",
+    2: "angular",
+    3: "diametric",
+    4: "radial",
+    5: "angular",
+    6: "ordinate",
+}
+_XREF_FLAG = 4
+_OVERLAY_FLAG = 8
+_MTEXT_CHUNK = 250
+_PROTECTED_LAYERS = {"0", "DEFPOINTS"}
+# Group codes of handles pointing at other objects without owning them
+# (330 is each record's owner, so it would keep every block alive).
+_POINTER_CODES = range(331, 370)
+# Header variables naming the default dimension arrowhead blocks.
+_ARROWHEAD_VARS = ("$DIMBLK", "$DIMBLK1", "$DIMBLK2", "$DIMLDRBLK")
+
+
+def _point(record: Record, code: int = 10) -> Point3D:
+    return Point3D(
+        x=get_float(record, code),
+        y=get_float(record, code + 10),
+        z=get_float(record, code + 20),
+    )
+
+
+def _lwpolyline_vertices(record: Record) -> tuple[list[Point3D], list[float]]:
+    """Return the vertices and per-vertex bulges of an LWPOLYLINE record."""
+    elevation = get_float(record, 38)
+    vertices: list[Point3D] = []
+    bulges: list[float] = []
+    x = 0.0
+    for code, value in record:
+        if code == 10:
+            x = float(value)
+        elif code == 20:
+            vertices.append(Point3D(x=x, y=float(value), z=elevation))
+            bulges.append(0.0)
+        elif code == 42 and bulges:
+            bulges[-1] = float(value)
+    return vertices, bulges
+
+
+def _index_attribs(records: Iterable[Record]) -> dict[str, list[Record]]:
+    """Map INSERT handles to the ATTRIB records that follow them."""
+    attribs: dict[str, list[Record]] = {}
+    owner: str | None = None
+    for record in records:
+        rtype = record_type(record)
+        if rtype == "INSERT":
+            handle = get_value(record, 5)
+            owner = handle if handle is not None and get_int(record, 66) == 1 else None
+            if handle is not None:
+                attribs[handle] = []
+        elif rtype == "ATTRIB" and owner is not None:
+            attribs[owner].append(record)
+        elif rtype != "ATTRIB":
+            owner = None
+    return attribs
+
+
+def _set_text(record: Record, new_text: str) -> None:
+    if record_type(record) == "TEXT":
+        set_value(record, 1, new_text)
+        return
+    # MTEXT stores long strings as 250-character code 3 chunks + code 1
+    chunks = [
+        new_text[i : i + _MTEXT_CHUNK] for i in range(0, len(new_text), _MTEXT_CHUNK)
+    ] or [""]
+    position = next(i for i, (code, _) in enumerate(record) if code in (3, 1))
+    record[:] = [tag for tag in record if tag[0] not in (3, 1)]
+    record[position:position] = [(3, c) for c in chunks[:-1]] + [(1, chunks[-1])]
+
+
+class DXFAdapter:
+    """Implements :class:`AutoCADPort` directly on ASCII DXF files.
+
+    Opening a drawing only records its path. Getters stream the sections
+    they need straight from the file, keeping just the requested entity
+    types and layers, so read-only operations run in memory proportional
+    to their result rather than to the drawing. The first edit parses the
+    whole file into a :class:`DXFDocument`; from then on getters and edits
+    share that document, and ``save_drawing`` writes it back. Plotting
+    needs a CAD application and always reports failure.
+    """
+
+    def __init__(self) -> None:
+        self._path: str | None = None
+        self._doc: DXFDocument | None = None
+        self._by_handle: dict[str, Record] = {}
+        self._attribs: dict[str, list[Record]] | None = None
+
+    def _require_path(self) -> str:
+        if self._path is None:
+            raise RuntimeError("No drawing is open")
+        return self._path
+
+    def _require_doc(self) -> DXFDocument:
+        """Return the full document, parsing the file on first use."""
+        path = self._require_path()
+        if self._doc is None:
+            self._doc = DXFDocument.read(path)
+            self._reindex()
+        return self._doc
+
+    def _reindex(self) -> None:
+        """Index loaded ENTITIES records by handle and INSERTs by ATTRIBs."""
+        records = self._require_doc().section("ENTITIES").records
+        self._by_handle = {
+            handle: record
+            for record in records
+            if (handle := get_value(record, 5)) is not None
+        }
+        self._attribs = _index_attribs(records)
+
+    def _attrib_index(self) -> dict[str, list[Record]]:
+        if self._attribs is None:
+            self._attribs = _index_attribs(
+                self._records(("ENTITIES",), "INSERT", "ATTRIB", "SEQEND")
+            )
+        return self._attribs
+
+    # ── Record access (streamed until the document is loaded) ─────
+
+    def _records(self, sections: tuple[str, ...], *types: str) -> Iterator[Record]:
+        """Records of *sections*, optionally of *types* only."""
+        if self._doc is None:
+            return iter_records(self._require_path(), sections, types or None)
+        doc = self._doc
+        return (
+            record
+            for name in sections
+            for record in doc.section(name).records
+            if not types or record_type(record) in types
+        )
+
+    def _model_space(self, *types: str) -> Iterator[Record]:
+        """ModelSpace records from ENTITIES, optionally of *types* only."""
+        return (
+            record
+            for record in self._records(("ENTITIES",), *types)
+            if get_int(record, 67) != 1
+        )
+
+    def _all_entities(self, *types: str) -> Iterator[Record]:
+        """Entity records in ENTITIES and inside block definitions."""
+        return self._records(("BLOCKS", "ENTITIES"), *types)
+
+    def _block_names(self, *, xrefs: bool | None = None) -> list[str]:
+        """Names of block definitions; *xrefs* keeps only (or drops) xrefs."""
+        return [
+            get_value(block, 2, "")
+            for block in self._records(("BLOCKS",), "BLOCK")
+            if xrefs is None or bool(get_int(block, 70) & _XREF_FLAG) == xrefs
+        ]
+
+    def _table_entries(self, table: str) -> list[Record]:
+        if self._doc is None:
+            return list(iter_table_entries(self._require_path(), table))
+        return self._doc.table_entries(table)
+
+    def _header_var(self, name: str) -> Record | None:
+        if self._doc is None:
+            return find_header_var(read_header(self._require_path()), name)
+        return self._doc.header_var(name)
+
+    def _owner_handle(self, block: str) -> str:
+        for entry in self._table_entries("BLOCK_RECORD"):
+            if get_value(entry, 2, "").upper() == block.upper():
+                return get_value(entry, 5, "0")
+        return "0"
+
+    def _find_layer(self, name: str) -> Record | None:
+        """Return the LAYER entry named *name*, ignoring case as CAD does."""
+        for entry in self._require_doc().table_entries("LAYER"):
+            if get_value(entry, 2, "").upper() == name.upper():
+                return entry
+        return None
+
+    # ── Drawing lifecycle ─────────────────────────────────────────
+
+    def open_drawing(self, path: str) -> None:
+        if Path(path).suffix.lower() != ".dxf":
+            raise ValueError(f"DXF adapter can only open .dxf files: {path}")
+        if not Path(path).is_file():
+            raise FileNotFoundError(f"Drawing not found: {path}")
+        with open(path, "rb") as fh:
+            if fh.read(len(BINARY_SENTINEL)) == BINARY_SENTINEL:
+                raise ValueError(f"Binary DXF is not supported: {path}")
+        self.close_drawing()
+        self._path = path
+
+    def close_drawing(self) -> None:
+        self._path = None
+        self._doc = None
+        self._by_handle = {}
+        self._attribs = None
+
+    def save_drawing(self) -> None:
+        path = self._require_path()
+        if self._doc is not None:  # nothing to write if nothing was edited
+            self._doc.write(path)
+
+    # ── Text ──────────────────────────────────────────────────────
+
+    def get_text_entities(
+        self,
+        layers: list[str] | None = None,
+        entity_types: list[str] | None = None,
+    ) -> list[TextEntity]:
+        texts: list[TextEntity] = []
+        for record in self._model_space(*_TEXT_TYPES):
+            entity_type = _TEXT_TYPES[record_type(record)]
+            layer = get_value(record, 8, "0")
+            if entity_types is not None and entity_type not in entity_types:
+                continue
+            if layers is not None and layer not in layers:
+                continue
+            text = "".join(value for code, value in record if code in (3, 1))
+            texts.append(
+                TextEntity(
+                    handle=get_value(record, 5, ""),
+                    text=text,
+                    layer=layer,
+                    entity_type=entity_type,
+                    position=_point(record),
+                )
+            )
+        return texts
+
+    def set_text(self, handle: str, new_text: str) -> None:
+        self.set_texts({handle: new_text})
+
+    def set_texts(self, texts: dict[str, str]) -> None:
+        self._require_doc()
+        records = {handle: self._by_handle.get(handle) for handle in texts}
+        for handle, record in records.items():  # check all before editing any
+            if record is None or record_type(record) not in _TEXT_TYPES:
+                raise KeyError(f"Handle not found: {handle}")
+        for handle, new_text in texts.items():
+            _set_text(records[handle], new_text)  # type: ignore[arg-type]
+
+    # ── Layers ────────────────────────────────────────────────────
+
+    def get_layers(self) -> list[LayerEntity]:
+        layers: list[LayerEntity] = []
+        for entry in self._table_entries("LAYER"):
+            color = get_int(entry, 62, 7)
+            layers.append(
+                LayerEntity(
+                    name=get_value(entry, 2, ""),
+                    color=abs(color),
+                    is_on=color >= 0,
+                    is_frozen=bool(get_int(entry, 70) & 1),
+                )
+            )
+        return layers
+
+    def rename_layer(self, old_name: str, new_name: str) -> bool:
+        return bool(self.rename_layers({old_name: new_name}))
+
+    def rename_layers(self, renames: dict[str, str]) -> list[str]:
+        doc = self._require_doc()
+        renamed: list[str] = []
+        entries: dict[str, Record] = {}  # upper-cased name before this call
+        for old_name, new_name in renames.items():
+            entry = self._find_layer(old_name)
+            if entry is None or old_name == "0":
+                continue
+            taken = self._find_layer(new_name)
+            if taken is not None and taken is not entry:
+                continue
+            if all(e is not entry for e in entries.values()):
+                entries[get_value(entry, 2, "").upper()] = entry
+            set_value(entry, 2, new_name)
+            renamed.append(old_name)
+
+        # Re-layer every entity in one pass, whatever the number of renames.
+        moved = {before: get_value(entry, 2, "") for before, entry in entries.items()}
+        if moved:
+            for record in self._all_entities():
+                for i, (code, value) in enumerate(record):
+                    if code == 8 and value.upper() in moved:
+                        record[i] = (8, moved[value.upper()])
+            clayer = doc.header_var("$CLAYER")
+            if clayer and clayer[0][1].upper() in moved:
+                doc.set_header_var("$CLAYER", [(8, moved[clayer[0][1].upper()])])
+        return renamed
+
+    def create_layer(
+        self, name: str, color: int = 7, is_on: bool = True, is_frozen: bool = False
+    ) -> bool:
+        doc = self._require_doc()
+        if self._find_layer(name) is not None:
+            return False
+        head = doc.table_head("LAYER")
+        entry: Record = [(0, "LAYER"), (5, doc.next_handle())]
+        if head is not None and get_value(head, 5):
+            entry.append((330, get_value(head, 5, "0")))
+        entry.extend(
+            [
+                (100, "AcDbSymbolTableRecord"),
+                (100, "AcDbLayerTableRecord"),
+                (2, name),
+                (70, "1" if is_frozen else "0"),
+                (62, str(color if is_on else -color)),
+                (6, "Continuous"),
+            ]
+        )
+        doc.add_table_entry("LAYER", entry)
+        return True
+
+    def set_layer_properties(
+        self,
+        name: str,
+        *,
+        color: int | None = None,
+        is_on: bool | None = None,
+        is_frozen: bool | None = None,
+    ) -> bool:
+        self._require_doc()
+        entry = self._find_layer(name)
+        if entry is None:
+            return False
+        current = get_int(entry, 62, 7)
+        new_color = abs(current) if color is None else abs(color)
+        on = current >= 0 if is_on is None else is_on
+        set_value(entry, 62, str(new_color if on else -new_color))
+        if is_frozen is not None:
+            flags = get_int(entry, 70)
+            set_value(entry, 70, str(flags | 1 if is_frozen else flags & ~1))
+        return True
+
+    def _layer_deletable(self, name: str) -> bool:
+        """Layer 0, DEFPOINTS and the current layer can never be deleted."""
+        if name.upper() in _PROTECTED_LAYERS:
+            return False
+        clayer = self._header_var("$CLAYER")
+        return not (clayer and clayer[0][1].upper() == name.upper())
+
+    def delete_layer(self, name: str) -> bool:
+        doc = self._require_doc()
+        entry = self._find_layer(name)
+        if entry is None or not self._layer_deletable(name):
+            return False
+        if any(
+            get_value(r, 8, "").upper() == name.upper() for r in self._all_entities()
+        ):
+            return False  # layer in use
+        doc.remove_table_entry("LAYER", entry)
+        return True
+
+    # ── Geometry ──────────────────────────────────────────────────
+
+    def get_dimensions(
+        self,
+        layers: list[str] | None = None,
+        dimension_types: list[str] | None = None,
+    ) -> list[DimensionEntity]:
+        dims: list[DimensionEntity] = []
+        for record in self._model_space("DIMENSION"):
+            dim_type = _DIMENSION_TYPES.get(get_int(record, 70) & 7, "linear")
+            layer = get_value(record, 8, "0")
+            if dimension_types is not None and dim_type not in dimension_types:
+                continue
+            if layers is not None and layer not in layers:
+                continue
+            override = get_value(record, 1, "")
+            points = [
+                _point(record, code)
+                for code in (13, 14)
+                if get_value(record, code) is not None
+            ]
+            dims.append(
+                DimensionEntity(
+                    handle=get_value(record, 5, ""),
+                    dimension_type=dim_type,
+                    value=get_float(record, 42),
+                    text_override="" if override == "<>" else override,
+                    layer=layer,
+                    associated_points=points,
+                )
+            )
+        return dims
+
+    def get_polylines(self, layers: list[str] | None = None) -> list[PolylineEntity]:
+        polylines: list[PolylineEntity] = []
+        for record in self._model_space("LWPOLYLINE"):
+            layer = get_value(record, 8, "0")
+            if layers is not None and layer not in layers:
+                continue
+            vertices, bulges = _lwpolyline_vertices(record)
+            polylines.append(
+                PolylineEntity(
+                    handle=get_value(record, 5, ""),
+                    vertices=vertices,
+                    bulges=bulges if any(bulges) else [],
+                    closed=bool(get_int(record, 70) & 1),
+                    layer=layer,
+                )
+            )
+        # Measure the whole drawing in one (vectorised) pass.
+        for polyline, geometry in zip(polylines, measure_polylines(polylines)):
+            polyline.area = geometry.area
+            polyline.perimeter = geometry.perimeter
+        return polylines
+
+    def get_drawing_extents(self) -> DrawingExtents:
+        ext_min = self._header_var("$EXTMIN")
+        ext_max = self._header_var("$EXTMAX")
+        if ext_min and ext_max:
+            low, high = _point(ext_min), _point(ext_max)
+            if low.x <= high.x and low.y <= high.y:
+                return DrawingExtents(min_point=low, max_point=high)
+
+        xs: list[float] = []
+        ys: list[float] = []
+        for record in self._model_space():
+            for code, value in record:
+                if code == 10:
+                    xs.append(float(value))
+                elif code == 20:
+                    ys.append(float(value))
+        if not xs or not ys:
+            return DrawingExtents()
+        return DrawingExtents(
+            min_point=Point3D(x=min(xs), y=min(ys)),
+            max_point=Point3D(x=max(xs), y=max(ys)),
+        )
+
+    # ── Blocks ────────────────────────────────────────────────────
+
+    def get_blocks(self, layers: list[str] | None = None) -> list[BlockReference]:
+        blocks: list[BlockReference] = []
+        for record in self._model_space("INSERT"):
+            layer = get_value(record, 8, "0")
+            if layers is not None and layer not in layers:
+                continue
+            blocks.append(
+                BlockReference(
+                    handle=get_value(record, 5, ""),
+                    name=get_value(record, 2, ""),
+                    insertion_point=_point(record),
+                    layer=layer,
+                    rotation=get_float(record, 50),
+                    scale_x=get_float(record, 41, 1.0),
+                    scale_y=get_float(record, 42, 1.0),
+                    scale_z=get_float(record, 43, 1.0),
+                )
+            )
+        return blocks
+
+    def get_block_attributes(self, handle: str) -> list[BlockAttribute]:
+        return [
+            BlockAttribute(
+                tag=get_value(attrib, 2, ""),
+                value=get_value(attrib, 1, ""),
+                handle=get_value(attrib, 5, ""),
+            )
+            for attrib in self._attrib_index().get(handle, [])
+        ]
+
+    def set_block_attribute(self, handle: str, tag: str, value: str) -> bool:
+        return self.set_block_attributes({handle: {tag: value}}) > 0
+
+    def set_block_attributes(self, updates: dict[str, dict[str, str]]) -> int:
+        self._require_doc()
+        index = self._attrib_index()
+        count = 0
+        for handle, values in updates.items():
+            pending = dict(values)
+            for attrib in index.get(handle, []):
+                tag = get_value(attrib, 2)
+                if tag in pending:
+                    set_value(attrib, 1, pending.pop(tag))
+                    count += 1
+        return count
+
+    def insert_block(
+        self,
+        name: str,
+        insertion_point: Point3D,
+        *,
+        scale_x: float = 1.0,
+        scale_y: float = 1.0,
+        scale_z: float = 1.0,
+        rotation: float = 0.0,
+        layer: str = "0",
+    ) -> str:
+        doc = self._require_doc()
+        definitions = doc.block_definitions()
+        if name not in definitions:
+            raise ValueError(f"Block definition not found: {name}")
+        start, end = definitions[name]
+        block_records = doc.section("BLOCKS").records
+        base = _point(block_records[start])
+        attdefs = [
+            r for r in block_records[start + 1 : end] if record_type(r) == "ATTDEF"
+        ]
+
+        handle = doc.next_handle()
+        insert: Record = [
+            (0, "INSERT"),
+            (5, handle),
+            (330, self._owner_handle("*Model_Space")),
+            (100, "AcDbEntity"),
+            (8, layer),
+            (100, "AcDbBlockReference"),
+        ]
+        if attdefs:
+            insert.append((66, "1"))
+        insert.extend(
+            [
+                (2, name),
+                (10, format_float(insertion_point.x)),
+                (20, format_float(insertion_point.y)),
+                (30, format_float(insertion_point.z)),
+                (41, format_float(scale_x)),
+                (42, format_float(scale_y)),
+                (43, format_float(scale_z)),
+                (50, format_float(rotation)),
+            ]
+        )
+
+        records = [insert]
+        angle = math.radians(rotation)
+        for attdef in attdefs:
+            local = _point(attdef)
+            dx = (local.x - base.x) * scale_x
+            dy = (local.y - base.y) * scale_y
+            records.append(
+                [
+                    (0, "ATTRIB"),
+                    (5, doc.next_handle()),
+                    (330, handle),
+                    (100, "AcDbEntity"),
+                    (8, layer),
+                    (100, "AcDbText"),
+                    (
+                        10,
+                        format_float(
+                            insertion_point.x
+                            + dx * math.cos(angle)
+                            - dy * math.sin(angle)
+                        ),
+                    ),
+                    (
+                        20,
+                        format_float(
+                            insertion_point.y
+                            + dx * math.sin(angle)
+                            + dy * math.cos(angle)
+                        ),
+                    ),
+                    (30, format_float(insertion_point.z)),
+                    (40, get_value(attdef, 40, "2.5")),
+                    (1, get_value(attdef, 1, "")),
+                    (50, format_float(rotation)),
+                    (100, "AcDbAttribute"),
+                    (2, get_value(attdef, 2, "")),
+                    (70, "0"),
+                ]
+            )
+        if attdefs:
+            records.append(
+                [
+                    (0, "SEQEND"),
+                    (5, doc.next_handle()),
+                    (330, handle),
+                    (100, "AcDbEntity"),
+                    (8, layer),
+                ]
+            )
+        doc.section("ENTITIES").records.extend(records)
+        self._reindex()
+        return handle
+
+    # ── XREFs ─────────────────────────────────────────────────────
+
+    def _xref_blocks(self) -> list[Record]:
+        return [
+            block
+            for block in self._records(("BLOCKS",), "BLOCK")
+            if get_int(block, 70) & _XREF_FLAG
+        ]
+
+    def get_xrefs(self) -> list[XrefInfo]:
+        base = Path(self._require_path()).parent
+        xrefs: list[XrefInfo] = []
+        for block in self._xref_blocks():
+            path = get_value(block, 1, "")
+            flags = get_int(block, 70)
+            xrefs.append(
+                XrefInfo(
+                    name=get_value(block, 2, ""),
+                    path=path,
+                    xref_type="overlay" if flags & _OVERLAY_FLAG else "attach",
+                    status="loaded" if (base / path).exists() else "not_found",
+                )
+            )
+        return xrefs
+
+    def reload_xref(self, name: str) -> bool:
+        # Offline there is nothing to reload; report whether the xref exists.
+        return any(get_value(b, 2) == name for b in self._xref_blocks())
+
+    def attach_xref(self, name: str, path: str, xref_type: str = "attach") -> bool:
+        doc = self._require_doc()
+        if name in doc.block_definitions():
+            return False
+        owner = doc.next_handle()
+        if doc.table_head("BLOCK_RECORD") is not None:
+            doc.add_table_entry(
+                "BLOCK_RECORD",
+                [
+                    (0, "BLOCK_RECORD"),
+                    (5, owner),
+                    (100, "AcDbSymbolTableRecord"),
+                    (100, "AcDbBlockTableRecord"),
+                    (2, name),
+                ],
+            )
+        flags = _XREF_FLAG | (_OVERLAY_FLAG if xref_type == "overlay" else 0)
+        doc.add_block(name, owner, flags=flags, xref_path=path)
+        doc.section("ENTITIES").records.append(
+            [
+                (0, "INSERT"),
+                (5, doc.next_handle()),
+                (330, self._owner_handle("*Model_Space")),
+                (100, "AcDbEntity"),
+                (8, "0"),
+                (100, "AcDbBlockReference"),
+                (2, name),
+                (10, "0.0"),
+                (20, "0.0"),
+                (30, "0.0"),
+            ]
+        )
+        self._reindex()
+        return True
+
+    def detach_xref(self, name: str) -> bool:
+        if not any(get_value(b, 2) == name for b in self._xref_blocks()):
+            return False
+        self._remove_block(name)
+        self._remove_inserts(name)
+        return True
+
+    def _remove_block(self, name: str) -> None:
+        """Delete a block definition and its BLOCK_RECORD table entry."""
+        doc = self._require_doc()
+        start, end = doc.block_definitions()[name]
+        del doc.section("BLOCKS").records[start : end + 1]
+        for entry in doc.table_entries("BLOCK_RECORD"):
+            if get_value(entry, 2) == name:
+                doc.remove_table_entry("BLOCK_RECORD", entry)
+                break
+
+    def _remove_inserts(self, name: str) -> None:
+        """Delete ModelSpace INSERTs of *name* with their ATTRIBs/SEQEND."""
+        section = self._require_doc().section("ENTITIES")
+        kept: list[Record] = []
+        dropping = False
+        for record in section.records:
+            rtype = record_type(record)
+            if rtype == "INSERT":
+                dropping = get_value(record, 2) == name
+            elif rtype not in ("ATTRIB", "SEQEND"):
+                dropping = False
+            if not dropping:
+                kept.append(record)
+        section.records = kept
+        self._reindex()
+
+    # ── Layouts / Viewports ───────────────────────────────────────
+
+    def get_layouts(self) -> list[LayoutInfo]:
+        viewport_counts: dict[str, int] = {}
+        for record in self._all_entities("VIEWPORT"):
+            if get_int(record, 69) != 1:
+                name = get_value(record, 410, "")
+                viewport_counts[name] = viewport_counts.get(name, 0) + 1
+
+        layouts: list[tuple[int, LayoutInfo]] = []
+        for record in self._records(("OBJECTS",), "LAYOUT"):
+            settings = subclass_tags(record, "AcDbPlotSettings")
+            layout = subclass_tags(record, "AcDbLayout")
+            name = get_value(layout, 1, "")
+            layouts.append(
+                (
+                    get_int(layout, 71),
+                    LayoutInfo(
+                        name=name,
+                        paper_size=get_value(settings, 4, ""),
+                        plot_device=get_value(settings, 2, ""),
+                        viewport_count=viewport_counts.get(name, 0),
+                    ),
+                )
+            )
+        if not layouts:
+            return [LayoutInfo(name="Model")]
+        return [info for _, info in sorted(layouts, key=lambda item: item[0])]
+
+    def get_viewports(self, layout_name: str | None = None) -> list[ViewportInfo]:
+        layer_names = {
+            get_value(entry, 5): get_value(entry, 2, "")
+            for entry in self._table_entries("LAYER")
+        }
+        viewports: list[ViewportInfo] = []
+        for record in self._all_entities("VIEWPORT"):
+            if get_int(record, 69) == 1:
+                continue  # viewport ID 1 is the paper space view itself
+            if layout_name is not None and get_value(record, 410) != layout_name:
+                continue
+            height = get_float(record, 41)
+            viewports.append(
+                ViewportInfo(
+                    handle=get_value(record, 5, ""),
+                    center=Point2D(x=get_float(record, 10), y=get_float(record, 20)),
+                    width=get_float(record, 40),
+                    height=height,
+                    scale=get_float(record, 45) / height if height else 1.0,
+                    frozen_layers=[
+                        layer_names[value]
+                        for code, value in record
+                        if code == 341 and value in layer_names
+                    ],
+                )
+            )
+        return viewports
+
+    # ── Plot ──────────────────────────────────────────────────────
+
+    def plot_layout(
+        self, layout_name: str, output_path: str, output_format: str = "PDF"
+    ) -> bool:
+        self._require_path()
+        return False  # plotting needs a CAD application
+
+    # ── Utility ───────────────────────────────────────────────────
+
+    def _pointed_handles(self) -> set[str]:
+        """Handles that records point to rather than name.
+
+        DIMSTYLE arrowheads (DIMBLK, 341-344), viewport-frozen layers
+        (VIEWPORT 331/341) and a layout's block record are referenced this
+        way, so purge must keep what these point at.
+        """
+        handles: set[str] = set()
+        for record in self._records(("TABLES", "BLOCKS", "ENTITIES", "OBJECTS")):
+            handles.update(
+                value.upper() for code, value in record if code in _POINTER_CODES
+            )
+            if record_type(record) == "LAYOUT":
+                layout = subclass_tags(record, "AcDbLayout")
+                handles.update(value.upper() for code, value in layout if code == 330)
+        return handles
+
+    def purge(self) -> int:
+        """Remove unreferenced layers and block definitions.
+
+        A block or layer counts as referenced when an entity names it or
+        any record points at its handle (see :meth:`_pointed_handles`).
+        """
+        doc = self._require_doc()
+        arrowheads = {
+            var[0][1].upper()
+            for name in _ARROWHEAD_VARS
+            if (var := doc.header_var(name)) and var[0][1]
+        }
+        purged = 0
+        while True:
+            pointed = self._pointed_handles()
+            referenced = arrowheads | {
+                get_value(r, 2, "").upper() for r in self._all_entities("INSERT")
+            }
+            referenced.update(
+                get_value(entry, 2, "").upper()
+                for entry in doc.table_entries("BLOCK_RECORD")
+                if get_value(entry, 5, "").upper() in pointed
+            )
+            unused = [
+                name
+                for name in self._block_names(xrefs=False)
+                if not name.startswith("*") and name.upper() not in referenced
+            ]
+            if not unused:
+                break
+            for name in unused:
+                self._remove_block(name)
+            purged += len(unused)
+
+        used_layers = {get_value(r, 8, "").upper() for r in self._all_entities()}
+        for entry in list(doc.table_entries("LAYER")):
+            name = get_value(entry, 2, "")
+            if get_value(entry, 5, "").upper() in pointed:
+                continue  # e.g. frozen in a viewport
+            if name.upper() not in used_layers and self._layer_deletable(name):
+                doc.remove_table_entry("LAYER", entry)
+                purged += 1
+        self._reindex()
+        return purged
+
+    def audit_drawing(self, fix: bool = True) -> list[AuditIssue]:
+        """Check layer/block references and handle uniqueness.
+
+        Runs on the streamed file; the document is only loaded when a
+        missing layer has to be created to fix an issue.
+        """
+        issues: list[AuditIssue] = []
+
+        defined_layers = {layer.name for layer in self.get_layers()}
+        missing_layers: dict[str, str] = {}
+        for record in self._all_entities():
+            layer = get_value(record, 8)
+            if layer is not None and layer not in defined_layers:
+                missing_layers.setdefault(layer, get_value(record, 5, "?"))
+        for layer, handle in missing_layers.items():
+            fixed = fix and self.create_layer(layer)
+            issues.append(
+                AuditIssue(
+                    description=f"Entity {handle} references undefined layer '{layer}'",
+                    fixed=fixed,
+                )
+            )
+
+        blocks = set(self._block_names())
+        for record in self._model_space("INSERT"):
+            name = get_value(record, 2, "")
+            if name not in blocks:
+                issues.append(
+                    AuditIssue(
+                        description=(
+                            f"Block reference {get_value(record, 5, '?')} "
+                            f"points to missing block '{name}'"
+                        )
+                    )
+                )
+
+        seen: set[str] = set()
+        for record in self._records(("TABLES", "BLOCKS", "ENTITIES", "OBJECTS")):
+            handle = get_value(record, 5)
+            if not handle or record_type(record) == "DIMSTYLE":
+                continue  # R12 DIMSTYLE uses code 5 for DIMBLK, not a handle
+            if handle in seen:
+                issues.append(AuditIssue(description=f"Duplicate handle {handle}"))
+            seen.add(handle)
+        return issues
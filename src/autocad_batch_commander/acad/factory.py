@@ -7,6 +7,8 @@ from pathlib import Path
 
 from autocad_batch_commander.acad.mock_adapter import MockAutoCADAdapter
 from autocad_batch_commander.acad.port import AutoCADPort
+from autocad_batch_commander.acad.synthetic import ProjectSpec, generate_drawing
+from autocad_batch_commander.config import settings
 from autocad_batch_commander.models import (
     BlockAttribute,
     BlockReference,
@@ -307,11 +309,25 @@ _SAMPLE_DRAWINGS: list[dict] = [
 ]
 
 
-def _populate_mock(adapter: MockAutoCADAdapter, folder: Path) -> None:
-    """Register sample drawing data for each .dwg file found in *folder*."""
+def _populate_mock(
+    adapter: MockAutoCADAdapter, folder: Path, cad_engine: str | None = None
+) -> None:
+    """Register sample drawing data for each drawing file found in *folder*.
+
+    With ``settings.mock_synthetic_entities`` set, each drawing is instead a
+    seeded synthetic drawing of that many entities (see ``acad.synthetic``).
+    """
     from autocad_batch_commander.utils.file_ops import get_dwg_files
 
-    dwg_files = get_dwg_files(folder)
+    dwg_files = get_dwg_files(folder, cad_engine=cad_engine)
+    if settings.mock_synthetic_entities > 0:
+        spec = ProjectSpec(
+            entities=settings.mock_synthetic_entities,
+            seed=settings.mock_synthetic_seed,
+        )
+        for i, dwg in enumerate(dwg_files):
+            adapter.add_drawing(generate_drawing(spec, i, str(dwg)))
+        return
     for i, dwg in enumerate(dwg_files):
         sample = _SAMPLE_DRAWINGS[i % len(_SAMPLE_DRAWINGS)]
         adapter.add_mock_drawing(
@@ -359,18 +375,25 @@ def get_acad_adapter(
 
     When *folder* is provided and the mock adapter is used, it is
     pre-populated with sample architectural drawing data for every
-    .dwg file in that folder.
+    drawing in that folder that *cad_engine* would open.
 
     *cad_engine* selects which CAD application to connect to:
     "auto" (detect running app), "autocad", "bricscad", "zwcad", or "mock".
+    "dxf" selects the offline DXF adapter, which works on any platform and
+    reads/writes ``.dxf`` files directly.
     """
     if cad_engine == "mock":
         use_mock = True
 
+    if cad_engine == "dxf" and not use_mock:
+        from autocad_batch_commander.acad.dxf_adapter import DXFAdapter
+
+        return DXFAdapter()  # type: ignore[return-value]
+
     if use_mock or sys.platform != "win32":
-        adapter = MockAutoCADAdapter()
+        adapter = MockAutoCADAdapter(open_delay=settings.mock_open_delay)
         if folder is not None:
-            _populate_mock(adapter, folder)
+            _populate_mock(adapter, folder, cad_engine)
         return adapter  # type: ignore[return-value]
 
     # Windows — select real adapter
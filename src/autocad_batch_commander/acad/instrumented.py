@@ -0,0 +1,57 @@
+"""Adapter wrapper that times every call into a :class:`Profiler`.
+
+:class:`InstrumentedAdapter` wraps any
+:class:`~autocad_batch_commander.acad.port.AutoCADPort` (including a
+:class:`~autocad_batch_commander.acad.cache.CachedAdapter`, so cache hits
+show up as fast calls) and reports each public method call — its latency,
+what it returned and whether it raised — to a
+:class:`~autocad_batch_commander.utils.profiling.Profiler`. Calls between
+``open_drawing`` and ``close_drawing`` are also attributed to that drawing.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from autocad_batch_commander.utils.profiling import Profiler
+
+
+class InstrumentedAdapter:
+    """Transparent proxy reporting every adapter call to *profiler*."""
+
+    def __init__(self, inner: Any, profiler: Profiler) -> None:
+        self._inner = inner
+        self.profiler = profiler
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._inner, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+        wrapper = self._wrap(name, attr)
+        setattr(self, name, wrapper)  # later lookups skip __getattr__
+        return wrapper
+
+    def _wrap(self, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        profiler = self.profiler
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            if name == "open_drawing":
+                profiler.open_file(str(args[0] if args else kwargs["path"]))
+            start = time.perf_counter()
+            result = None
+            failed = True
+            try:
+                result = method(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                elapsed = time.perf_counter() - start
+                profiler.record(name, elapsed, result, error=failed)
+                if name == "close_drawing":
+                    profiler.close_file()
+
+        call.__name__ = name
+        call.__doc__ = method.__doc__
+        return call
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 import uuid
 from copy import deepcopy
 from dataclasses import dataclass, field
@@ -22,9 +23,20 @@ from autocad_batch_commander.models import (
 )
 
 
+def _remove(items: list, item: object) -> None:
+    # By identity: pydantic models compare equal by value.
+    del items[next(i for i, x in enumerate(items) if x is item)]
+
+
 @dataclass
 class MockDrawing:
-    """In-memory representation of one DWG file."""
+    """In-memory representation of one DWG file.
+
+    The lists keep drawing order; handle and name indexes built alongside
+    them make lookups constant-time, so the mock scales like a real CAD
+    database when driving load tests with very large drawings. Mutate
+    layers and xrefs through the methods below to keep the indexes in step.
+    """
 
     path: str
     texts: list[TextEntity] = field(default_factory=list)
@@ -43,6 +55,60 @@ class MockDrawing:
         )
     )
     saved: bool = False
+    _texts_by_handle: dict[str, TextEntity] = field(init=False, repr=False)
+    _texts_by_layer: dict[str, list[TextEntity]] = field(init=False, repr=False)
+    _layers_by_name: dict[str, LayerEntity] = field(init=False, repr=False)
+    _xrefs_by_name: dict[str, XrefInfo] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # setdefault: with duplicate keys the first entity wins, as in a scan
+        self._texts_by_handle = {}
+        self._texts_by_layer = {}
+        for text in self.texts:
+            self._texts_by_handle.setdefault(text.handle, text)
+            self._texts_by_layer.setdefault(text.layer, []).append(text)
+        self._layers_by_name = {}
+        for layer in self.layers:
+            self._layers_by_name.setdefault(layer.name, layer)
+        self._xrefs_by_name = {}
+        for xref in self.xrefs:
+            self._xrefs_by_name.setdefault(xref.name, xref)
+
+    def text(self, handle: str) -> TextEntity | None:
+        return self._texts_by_handle.get(handle)
+
+    def layer(self, name: str) -> LayerEntity | None:
+        return self._layers_by_name.get(name)
+
+    def xref(self, name: str) -> XrefInfo | None:
+        return self._xrefs_by_name.get(name)
+
+    def add_layer(self, layer: LayerEntity) -> None:
+        self.layers.append(layer)
+        self._layers_by_name.setdefault(layer.name, layer)
+
+    def remove_layer(self, layer: LayerEntity) -> None:
+        _remove(self.layers, layer)
+        del self._layers_by_name[layer.name]
+
+    def rename_layer(self, layer: LayerEntity, new_name: str) -> None:
+        """Rename *layer* and move the texts on it (the target must be free)."""
+        old_name = layer.name
+        del self._layers_by_name[old_name]
+        layer.name = new_name
+        self._layers_by_name[new_name] = layer
+        moved = self._texts_by_layer.pop(old_name, [])
+        for text in moved:
+            text.layer = new_name
+        self._texts_by_layer.setdefault(new_name, []).extend(moved)
+
+    def add_xref(self, xref: XrefInfo) -> None:
+        self.xrefs.append(xref)
+        self._xrefs_by_name.setdefault(xref.name, xref)
+
+    def remove_xref(self, xref: XrefInfo) -> None:
+        _remove(self.xrefs, xref)
+        del self._xrefs_by_name[xref.name]
 
 
 class MockAutoCADAdapter:
@@ -53,11 +119,16 @@ class MockAutoCADAdapter:
         adapter = MockAutoCADAdapter()
         adapter.add_mock_drawing("plan.dwg", texts=[...], layers=[...])
         adapter.open_drawing("plan.dwg")
+
+    *open_delay* makes ``open_drawing`` sleep for that many seconds, which
+    roughly models the cost of opening a DWG over COM when measuring
+    batch throughput.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, open_delay: float = 0.0) -> None:
         self._drawings: dict[str, MockDrawing] = {}
         self._current: MockDrawing | None = None
+        self._open_delay = open_delay
 
     # ── test helpers ──────────────────────────────────────────────
 
@@ -95,6 +166,10 @@ class MockAutoCADAdapter:
             ),
         )
 
+    def add_drawing(self, drawing: MockDrawing) -> None:
+        """Register a prepared drawing under its ``path``, without copying it."""
+        self._drawings[drawing.path] = drawing
+
     def _require_drawing(self) -> MockDrawing:
         if self._current is None:
             raise RuntimeError("No drawing is open")
@@ -105,6 +180,8 @@ class MockAutoCADAdapter:
     def open_drawing(self, path: str) -> None:
         if path not in self._drawings:
             raise FileNotFoundError(f"Mock drawing not found: {path}")
+        if self._open_delay:
+            time.sleep(self._open_delay)
         self._current = self._drawings[path]
 
     def close_drawing(self) -> None:
@@ -115,19 +192,30 @@ class MockAutoCADAdapter:
 
     # ── Text ──────────────────────────────────────────────────────
 
-    def get_text_entities(self, layers: list[str] | None = None) -> list[TextEntity]:
+    def get_text_entities(
+        self,
+        layers: list[str] | None = None,
+        entity_types: list[str] | None = None,
+    ) -> list[TextEntity]:
         dwg = self._require_drawing()
+        texts = dwg.texts
+        if entity_types is not None:
+            texts = [t for t in texts if t.entity_type in entity_types]
         if layers is None:
-            return list(dwg.texts)
-        return [t for t in dwg.texts if t.layer in layers]
+            return list(texts)
+        return [t for t in texts if t.layer in layers]
 
     def set_text(self, handle: str, new_text: str) -> None:
+        self.set_texts({handle: new_text})
+
+    def set_texts(self, texts: dict[str, str]) -> None:
         dwg = self._require_drawing()
-        for t in dwg.texts:
-            if t.handle == handle:
-                t.text = new_text
-                return
-        raise KeyError(f"Handle not found: {handle}")
+        entities = {handle: dwg.text(handle) for handle in texts}
+        for handle, entity in entities.items():
+            if entity is None:
+                raise KeyError(f"Handle not found: {handle}")
+        for handle, new_text in texts.items():
+            entities[handle].text = new_text  # type: ignore[union-attr]
 
     # ── Layers ────────────────────────────────────────────────────
 
@@ -135,23 +223,26 @@ class MockAutoCADAdapter:
         return list(self._require_drawing().layers)
 
     def rename_layer(self, old_name: str, new_name: str) -> bool:
+        return bool(self.rename_layers({old_name: new_name}))
+
+    def rename_layers(self, renames: dict[str, str]) -> list[str]:
         dwg = self._require_drawing()
-        for layer in dwg.layers:
-            if layer.name == old_name:
-                layer.name = new_name
-                for t in dwg.texts:
-                    if t.layer == old_name:
-                        t.layer = new_name
-                return True
-        return False
+        renamed: list[str] = []
+        for old_name, new_name in renames.items():
+            layer = dwg.layer(old_name)
+            if layer is None or dwg.layer(new_name) is not None:
+                continue
+            dwg.rename_layer(layer, new_name)
+            renamed.append(old_name)
+        return renamed
 
     def create_layer(
         self, name: str, color: int = 7, is_on: bool = True, is_frozen: bool = False
     ) -> bool:
         dwg = self._require_drawing()
-        if any(ly.name == name for ly in dwg.layers):
+        if dwg.layer(name) is not None:
             return False
-        dwg.layers.append(
+        dwg.add_layer(
             LayerEntity(name=name, color=color, is_on=is_on, is_frozen=is_frozen)
         )
         return True
@@ -164,35 +255,39 @@ class MockAutoCADAdapter:
         is_on: bool | None = None,
         is_frozen: bool | None = None,
     ) -> bool:
-        dwg = self._require_drawing()
-        for layer in dwg.layers:
-            if layer.name == name:
-                if color is not None:
-                    layer.color = color
-                if is_on is not None:
-                    layer.is_on = is_on
-                if is_frozen is not None:
-                    layer.is_frozen = is_frozen
-                return True
-        return False
+        layer = self._require_drawing().layer(name)
+        if layer is None:
+            return False
+        if color is not None:
+            layer.color = color
+        if is_on is not None:
+            layer.is_on = is_on
+        if is_frozen is not None:
+            layer.is_frozen = is_frozen
+        return True
 
     def delete_layer(self, name: str) -> bool:
         dwg = self._require_drawing()
-        for i, layer in enumerate(dwg.layers):
-            if layer.name == name:
-                if name == "0":
-                    return False  # cannot delete layer 0
-                dwg.layers.pop(i)
-                return True
-        return False
+        layer = dwg.layer(name)
+        if layer is None or name == "0":  # cannot delete layer 0
+            return False
+        dwg.remove_layer(layer)
+        return True
 
     # ── Geometry ──────────────────────────────────────────────────
 
-    def get_dimensions(self, layers: list[str] | None = None) -> list[DimensionEntity]:
+    def get_dimensions(
+        self,
+        layers: list[str] | None = None,
+        dimension_types: list[str] | None = None,
+    ) -> list[DimensionEntity]:
         dwg = self._require_drawing()
+        dims = dwg.dimensions
+        if dimension_types is not None:
+            dims = [d for d in dims if d.dimension_type in dimension_types]
         if layers is None:
-            return list(dwg.dimensions)
-        return [d for d in dwg.dimensions if d.layer in layers]
+            return list(dims)
+        return [d for d in dims if d.layer in layers]
 
     def get_polylines(self, layers: list[str] | None = None) -> list[PolylineEntity]:
         dwg = self._require_drawing()
@@ -224,6 +319,16 @@ class MockAutoCADAdapter:
                 return True
         return False
 
+    def set_block_attributes(self, updates: dict[str, dict[str, str]]) -> int:
+        dwg = self._require_drawing()
+        count = 0
+        for handle, values in updates.items():
+            for attr in dwg.block_attributes.get(handle, []):
+                if attr.tag in values:
+                    attr.value = values[attr.tag]
+                    count += 1
+        return count
+
     def insert_block(
         self,
         name: str,
@@ -256,29 +361,28 @@ class MockAutoCADAdapter:
         return list(self._require_drawing().xrefs)
 
     def reload_xref(self, name: str) -> bool:
-        dwg = self._require_drawing()
-        for xref in dwg.xrefs:
-            if xref.name == name:
-                xref.status = "loaded"
-                return True
-        return False
+        xref = self._require_drawing().xref(name)
+        if xref is None:
+            return False
+        xref.status = "loaded"
+        return True
 
     def attach_xref(self, name: str, path: str, xref_type: str = "attach") -> bool:
         dwg = self._require_drawing()
-        if any(x.name == name for x in dwg.xrefs):
+        if dwg.xref(name) is not None:
             return False
-        dwg.xrefs.append(
+        dwg.add_xref(
             XrefInfo(name=name, path=path, xref_type=xref_type, status="loaded")
         )
         return True
 
     def detach_xref(self, name: str) -> bool:
         dwg = self._require_drawing()
-        for i, xref in enumerate(dwg.xrefs):
-            if xref.name == name:
-                dwg.xrefs.pop(i)
-                return True
-        return False
+        xref = dwg.xref(name)
+        if xref is None:
+            return False
+        dwg.remove_xref(xref)
+        return True
 
     # ── Layouts / Viewports ───────────────────────────────────────
 
@@ -40,14 +40,25 @@ class AutoCADPort(Protocol):
 
     # ── Text ───────────────────────────────────────────────────────
 
-    def get_text_entities(self, layers: list[str] | None = None) -> list[TextEntity]:
-        """Return all text/mtext entities, optionally filtered by layer names."""
+    def get_text_entities(
+        self,
+        layers: list[str] | None = None,
+        entity_types: list[str] | None = None,
+    ) -> list[TextEntity]:
+        """Return all text/mtext entities, optionally filtered by layer names.
+
+        *entity_types* restricts the result to ``AcDbText`` and/or ``AcDbMText``.
+        """
         ...
 
     def set_text(self, handle: str, new_text: str) -> None:
         """Update the text of an entity identified by its handle."""
         ...
 
+    def set_texts(self, texts: dict[str, str]) -> None:
+        """Update several text entities at once (``{handle: new_text}``)."""
+        ...
+
     # ── Layers ─────────────────────────────────────────────────────
 
     def get_layers(self) -> list[LayerEntity]:
@@ -58,6 +69,13 @@ class AutoCADPort(Protocol):
         """Rename a layer. Returns True if the layer existed and was renamed."""
         ...
 
+    def rename_layers(self, renames: dict[str, str]) -> list[str]:
+        """Rename several layers, as if by ``rename_layer`` for each pair in order.
+
+        Returns the old names of the layers that were renamed.
+        """
+        ...
+
     def create_layer(
         self, name: str, color: int = 7, is_on: bool = True, is_frozen: bool = False
     ) -> bool:
@@ -81,8 +99,16 @@ class AutoCADPort(Protocol):
 
     # ── Geometry ───────────────────────────────────────────────────
 
-    def get_dimensions(self, layers: list[str] | None = None) -> list[DimensionEntity]:
-        """Return all dimension entities, optionally filtered by layer."""
+    def get_dimensions(
+        self,
+        layers: list[str] | None = None,
+        dimension_types: list[str] | None = None,
+    ) -> list[DimensionEntity]:
+        """Return all dimension entities, optionally filtered by layer and type.
+
+        *dimension_types* uses the ``DimensionEntity.dimension_type`` names
+        (``linear``, ``aligned``, ``angular``, ``radial``, ``diametric``).
+        """
         ...
 
     def get_polylines(self, layers: list[str] | None = None) -> list[PolylineEntity]:
@@ -107,6 +133,13 @@ class AutoCADPort(Protocol):
         """Set an attribute value on a block reference. Returns True if found."""
         ...
 
+    def set_block_attributes(self, updates: dict[str, dict[str, str]]) -> int:
+        """Set attributes on several blocks (``{handle: {tag: value}}``).
+
+        Returns the number of attributes that were found and set.
+        """
+        ...
+
     def insert_block(
         self,
         name: str,
@@ -0,0 +1,517 @@
+"""Seeded synthetic projects for load and benchmark testing.
+
+:func:`generate_drawing` builds a realistic drawing of a given size from a
+:class:`ProjectSpec`: layer names drawn from a ``standards/*.json``
+vocabulary (a configurable share already renamed to the standard), room
+outlines and wall runs, notes and room labels, dimensions whose values
+follow the distributions of real plans (door leaves, corridor widths,
+log-normal room spans), and door/window/furniture blocks with attributes
+plus one title block per sheet. The same drawing can be registered with
+the mock adapter (:func:`mock_project`) or written as an ASCII DXF file
+(:func:`write_dxf_project`), so benchmarks compare adapters on identical
+content.
+
+Drawing *i* of a project depends only on the seed and *i*, never on how
+many drawings are generated, so projects of different sizes share their
+common prefix and a benchmark run is reproducible bit for bit.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+
+from autocad_batch_commander.acad.dxf import (
+    DXFDocument,
+    Record,
+    Tag,
+    format_float,
+    write_tags,
+)
+from autocad_batch_commander.acad.mock_adapter import MockAutoCADAdapter, MockDrawing
+from autocad_batch_commander.config import settings
+from autocad_batch_commander.models import (
+    BlockAttribute,
+    BlockReference,
+    DimensionEntity,
+    DrawingExtents,
+    LayerEntity,
+    LayoutInfo,
+    Point3D,
+    PolylineEntity,
+    TextEntity,
+)
+from autocad_batch_commander.standards import registry
+
+# Entity handles start above those of the DXF skeleton, tables and blocks.
+_FIRST_HANDLE = 0x1000
+
+# Layer roles used by the generator; each maps to a layer name via the
+# chosen standard when it defines one.
+_ROLES = {
+    "WALL": 1,
+    "DOOR": 2,
+    "WINDOW": 3,
+    "FURNITURE": 4,
+    "TEXT": 7,
+    "DIMENSION": 6,
+    "TITLE": 7,
+    "ROOM": 3,
+    "CORRIDOR": 5,
+    "GRID": 8,
+    "COLUMN": 2,
+    "STAIR": 4,
+}
+
+_ROOM_NAMES = (
+    "BEDROOM",
+    "MASTER BEDROOM",
+    "LIVING ROOM",
+    "DINING",
+    "KITCHEN",
+    "TOILET",
+    "BATHROOM",
+    "STORE",
+    "OFFICE",
+    "MEETING ROOM",
+    "CORRIDOR",
+    "LOBBY",
+)
+_NOTES = (
+    "TIMBER DOOR TYPE {letter}",
+    "TIMBER WINDOW FRAME",
+    "ALUMINIUM CASEMENT WINDOW W{n}",
+    "CONCRETE WALL {thickness}mm",
+    "BRICK WALL {thickness}mm PLASTERED BOTH SIDES",
+    "GYPSUM PARTITION WALL",
+    "FLOOR FINISH: CERAMIC TILE 300x300",
+    "FLOOR FINISH: HOMOGENEOUS TILE 600x600",
+    "CEILING HEIGHT: {height}mm",
+    "FFL +{level}",
+    "SEE DETAIL {n}/A-5{n}",
+)
+_SHEET_TITLES = (
+    "GROUND FLOOR PLAN",
+    "FIRST FLOOR PLAN",
+    "ROOF PLAN",
+    "SECTION A-A",
+    "ELEVATIONS",
+    "SITE PLAN",
+)
+_INITIALS = ("AB", "CK", "LMH", "NR", "SW", "TY")
+
+# (block name, layer role, attribute tags, relative frequency)
+_BLOCKS = (
+    ("DOOR_SINGLE", "DOOR", ("MARK", "WIDTH"), 0.35),
+    ("DOOR_DOUBLE", "DOOR", ("MARK", "WIDTH"), 0.05),
+    ("WINDOW", "WINDOW", ("MARK",), 0.25),
+    ("CHAIR", "FURNITURE", (), 0.2),
+    ("TABLE", "FURNITURE", (), 0.1),
+    ("ROOM_TAG", "TEXT", ("NAME", "NUMBER"), 0.05),
+)
+TITLE_BLOCK = "TITLE_BLOCK"
+
+_DOOR_WIDTHS = (750.0, 800.0, 850.0, 900.0, 1000.0)
+# DXF dimension type codes (group 70, low bits) for the model's types
+_DIMENSION_CODES = {"linear": 0, "aligned": 1, "angular": 2, "radial": 4}
+
+
+@dataclass(frozen=True)
+class ProjectSpec:
+    """Size and make-up of a synthetic project.
+
+    *entities* counts the ModelSpace entities of each drawing besides its
+    title block, split between texts, dimensions, polylines and blocks by
+    the *mix* weights. *standard_share* is the fraction of layers that
+    already carry the names of *standard*.
+    """
+
+    drawings: int = 10
+    entities: int = 500
+    standard: str = "aia"
+    standard_share: float = 0.5
+    seed: int = 0
+    mix: tuple[float, float, float, float] = (0.4, 0.2, 0.25, 0.15)
+
+
+def layer_vocabulary(standard: str) -> dict[str, str]:
+    """Return role → standard layer name from ``standards/<standard>.json``."""
+    mappings: dict[str, str] = registry.layer_standard(standard).get("mappings", {})
+    return {role: mappings.get(role, role) for role in _ROLES}
+
+
+class _Builder:
+    """Accumulates the entities of one drawing."""
+
+    def __init__(self, spec: ProjectSpec, index: int, vocabulary: dict[str, str]):
+        self.rng = random.Random(spec.seed * 1_000_003 + index)
+        self.index = index
+        self.handle = _FIRST_HANDLE
+        # Each role is either still on its legacy name or already renamed.
+        self.layer_names = {
+            role: vocabulary[role] if self.rng.random() < spec.standard_share else role
+            for role in _ROLES
+        }
+        self.texts: list[TextEntity] = []
+        self.dimensions: list[DimensionEntity] = []
+        self.polylines: list[PolylineEntity] = []
+        self.blocks: list[BlockReference] = []
+        self.block_attributes: dict[str, list[BlockAttribute]] = {}
+
+    def next_handle(self) -> str:
+        self.handle += 1
+        return f"{self.handle:X}"
+
+    def point(self, cells: int) -> tuple[float, float]:
+        # Entities are spread over a square grid of 10 m cells.
+        side = max(1, math.isqrt(cells))
+        cell = self.rng.randrange(side * side)
+        return (
+            (cell % side) * 10000.0 + self.rng.randrange(9000),
+            (cell // side) * 10000.0 + self.rng.randrange(9000),
+        )
+
+    # ── Entities ───────────────────────────────────────────────────
+
+    def text(self, cells: int) -> None:
+        rng = self.rng
+        if rng.random() < 0.4:
+            text = f"{rng.choice(_ROOM_NAMES)} {rng.randint(1, 20)}"
+            role = "ROOM" if rng.random() < 0.5 else "TEXT"
+        else:
+            text = rng.choice(_NOTES).format(
+                letter=rng.choice("ABCD"),
+                n=rng.randint(1, 9),
+                thickness=rng.choice((100, 150, 200, 225)),
+                height=rng.choice((2700, 3000, 3200)),
+                level=format_float(rng.choice((0.0, 0.15, 3.6, 7.2))),
+            )
+            role = "TEXT"
+        entity_type = "AcDbMText" if rng.random() < 0.15 else "AcDbText"
+        x, y = self.point(cells)
+        self.texts.append(
+            TextEntity(
+                handle=self.next_handle(),
+                text=text,
+                layer=self.layer_names[role],
+                entity_type=entity_type,
+                position=Point3D(x=x, y=y),
+            )
+        )
+
+    def dimension(self, cells: int) -> None:
+        rng = self.rng
+        kind = rng.random()
+        dim_type = "linear"
+        if kind < 0.2:
+            role, value = "DOOR", rng.choice(_DOOR_WIDTHS)
+        elif kind < 0.3:
+            role, value = "CORRIDOR", round(rng.uniform(900, 2400) / 50) * 50.0
+        elif kind < 0.35:
+            role, dim_type, value = (
+                "DIMENSION",
+                "angular",
+                rng.choice((30.0, 45.0, 90.0)),
+            )
+        else:
+            role = "DIMENSION"
+            dim_type = "aligned" if rng.random() < 0.2 else "linear"
+            value = round(rng.lognormvariate(math.log(3600), 0.6) / 5) * 5.0
+        x, y = self.point(cells)
+        points = (
+            [Point3D(x=x, y=y), Point3D(x=x + value, y=y)]
+            if dim_type != "angular"
+            else []
+        )
+        self.dimensions.append(
+            DimensionEntity(
+                handle=self.next_handle(),
+                dimension_type=dim_type,
+                value=value,
+                layer=self.layer_names[role],
+                associated_points=points,
+            )
+        )
+
+    def polyline(self, cells: int) -> None:
+        rng = self.rng
+        x, y = self.point(cells)
+        if rng.random() < 0.6:  # room outline
+            width = round(rng.uniform(1800, 7200) / 100) * 100.0
+            depth = round(rng.uniform(1500, 6000) / 100) * 100.0
+            corners = ((0, 0), (width, 0), (width, depth), (0, depth))
+            role = "CORRIDOR" if rng.random() < 0.1 else "ROOM"
+            vertices = [Point3D(x=x + dx, y=y + dy) for dx, dy in corners]
+            closed, area, perimeter = True, width * depth, 2 * (width + depth)
+        else:  # wall run
+            vertices = [Point3D(x=x, y=y)]
+            perimeter = 0.0
+            for _ in range(rng.randint(1, 4)):
+                length = round(rng.uniform(600, 6000) / 50) * 50.0
+                last = vertices[-1]
+                if len(vertices) % 2:
+                    vertices.append(Point3D(x=last.x + length, y=last.y))
+                else:
+                    vertices.append(Point3D(x=last.x, y=last.y + length))
+                perimeter += length
+            role, closed, area = "WALL", False, 0.0
+        self.polylines.append(
+            PolylineEntity(
+                handle=self.next_handle(),
+                vertices=vertices,
+                closed=closed,
+                area=area,
+                perimeter=perimeter,
+                layer=self.layer_names[role],
+            )
+        )
+
+    def block(self, cells: int) -> None:
+        rng = self.rng
+        name, role, tags, _ = rng.choices(_BLOCKS, weights=[b[3] for b in _BLOCKS])[0]
+        number = len(self.blocks) + 1
+        values = {
+            "MARK": f"{name[0]}{number}",
+            "WIDTH": format_float(rng.choice(_DOOR_WIDTHS)),
+            "NAME": rng.choice(_ROOM_NAMES),
+            "NUMBER": f"{self.index + 1}.{number:02d}",
+        }
+        x, y = self.point(cells)
+        self.insert(name, role, x, y, {tag: values[tag] for tag in tags})
+
+    def title_block(self) -> None:
+        rng = self.rng
+        issued = date(2024, 1, 1) + timedelta(days=rng.randrange(730))
+        values = {
+            "DWG_NO": f"A-{self.index + 1:03d}",
+            "TITLE": rng.choice(_SHEET_TITLES),
+            "DATE": issued.isoformat(),
+            "REV": rng.choice("ABCD"),
+            "DRAWN_BY": rng.choice(_INITIALS),
+            "SCALE": rng.choice(("1:50", "1:100", "1:200")),
+        }
+        self.insert(TITLE_BLOCK, "TITLE", 0.0, -5000.0, values)
+
+    def insert(self, name: str, role: str, x: float, y: float, values: dict) -> None:
+        handle = self.next_handle()
+        self.blocks.append(
+            BlockReference(
+                handle=handle,
+                name=name,
+                insertion_point=Point3D(x=x, y=y),
+                layer=self.layer_names[role],
+                rotation=self.rng.choice((0.0, 0.0, 90.0, 180.0, 270.0)),
+            )
+        )
+        if values:
+            self.block_attributes[handle] = [
+                BlockAttribute(tag=tag, value=value, handle=self.next_handle())
+                for tag, value in values.items()
+            ]
+
+    def finish(self, cells: int, path: str) -> MockDrawing:
+        side = max(1, math.isqrt(cells)) * 10000.0
+        return MockDrawing(
+            path=path,
+            texts=self.texts,
+            layers=[LayerEntity(name="0")]
+            + [
+                LayerEntity(name=name, color=_ROLES[role])
+                for role, name in self.layer_names.items()
+            ],
+            dimensions=self.dimensions,
+            polylines=self.polylines,
+            blocks=self.blocks,
+            block_attributes=self.block_attributes,
+            layouts=[LayoutInfo(name="Model"), LayoutInfo(name="Layout1")],
+            extents=DrawingExtents(
+                min_point=Point3D(x=0, y=-5000.0), max_point=Point3D(x=side, y=side)
+            ),
+        )
+
+
+def generate_drawing(spec: ProjectSpec, index: int, path: str = "") -> MockDrawing:
+    """Build drawing *index* of the project described by *spec*."""
+    builder = _Builder(spec, index, layer_vocabulary(spec.standard))
+    cells = max(1, spec.entities // 20)
+    makers = (builder.text, builder.dimension, builder.polyline, builder.block)
+    for make in builder.rng.choices(makers, weights=spec.mix, k=spec.entities):
+        make(cells)
+    builder.title_block()
+    return builder.finish(cells, path)
+
+
+def drawing_paths(spec: ProjectSpec, folder: Path, suffix: str) -> list[Path]:
+    """Return the file names of the project's drawings under *folder*."""
+    width = max(3, len(str(spec.drawings)))
+    return [folder / f"sheet_{i:0{width}d}{suffix}" for i in range(spec.drawings)]
+
+
+def mock_project(
+    spec: ProjectSpec,
+    folder: Path,
+    adapter: MockAutoCADAdapter | None = None,
+) -> MockAutoCADAdapter:
+    """Register the project with a mock adapter, creating placeholder files.
+
+    Each drawing gets an empty ``.dwg`` file under *folder* so discovery,
+    backups and manifests see a real project tree.
+    """
+    adapter = adapter or MockAutoCADAdapter(open_delay=settings.mock_open_delay)
+    folder.mkdir(parents=True, exist_ok=True)
+    for index, path in enumerate(drawing_paths(spec, folder, ".dwg")):
+        path.write_bytes(b"")
+        adapter.add_drawing(generate_drawing(spec, index, str(path)))
+    return adapter
+
+
+def write_dxf_project(spec: ProjectSpec, folder: Path) -> list[Path]:
+    """Write the project as ASCII DXF files under *folder*."""
+    folder.mkdir(parents=True, exist_ok=True)
+    paths = drawing_paths(spec, folder, ".dxf")
+    for index, path in enumerate(paths):
+        write_dxf(generate_drawing(spec, index, str(path)), path)
+    return paths
+
+
+# ── DXF output ────────────────────────────────────────────────────
+
+
+def _entity(etype: str, handle: str, layer: str, *tags: Tag) -> Record:
+    return [(0, etype), (5, handle), (100, "AcDbEntity"), (8, layer), *tags]
+
+
+def _xy(point: Point3D, code: int = 10) -> list[Tag]:
+    return [(code, format_float(point.x)), (code + 10, format_float(point.y))]
+
+
+def _entity_records(drawing: MockDrawing, handles: Iterator[str]) -> Iterator[Record]:
+    for i, text in enumerate(drawing.texts):
+        etype = "MTEXT" if text.entity_type == "AcDbMText" else "TEXT"
+        position = (
+            _xy(text.position)
+            if text.position is not None
+            else [(10, format_float(i * 10.0)), (20, "0.0")]
+        )
+        yield _entity(etype, text.handle, text.layer, *position, (1, text.text))
+    for dim in drawing.dimensions:
+        points = [
+            tag
+            for n, p in enumerate(dim.associated_points[:2])
+            for tag in _xy(p, 13 + n)
+        ]
+        yield _entity(
+            "DIMENSION",
+            dim.handle,
+            dim.layer,
+            (70, str(32 | _DIMENSION_CODES.get(dim.dimension_type, 0))),
+            (1, dim.text_override or "<>"),
+            *points,
+            (42, format_float(dim.value)),
+        )
+    for polyline in drawing.polylines:
+        yield _entity(
+            "LWPOLYLINE",
+            polyline.handle,
+            polyline.layer,
+            (90, str(len(polyline.vertices))),
+            (70, "1" if polyline.closed else "0"),
+            *[tag for vertex in polyline.vertices for tag in _xy(vertex)],
+        )
+    for block in drawing.blocks:
+        attributes = drawing.block_attributes.get(block.handle, [])
+        yield _entity(
+            "INSERT",
+            block.handle,
+            block.layer,
+            *([(66, "1")] if attributes else []),
+            (2, block.name),
+            *_xy(block.insertion_point),
+            (50, format_float(block.rotation)),
+        )
+        if attributes:
+            for attribute in attributes:
+                yield _entity(
+                    "ATTRIB",
+                    attribute.handle,
+                    block.layer,
+                    *_xy(block.insertion_point),
+                    (1, attribute.value),
+                    (2, attribute.tag),
+                )
+            yield _entity("SEQEND", next(handles), block.layer)
+
+
+def write_dxf(drawing: MockDrawing, path: Path) -> None:
+    """Write *drawing* as an ASCII DXF, streaming its entities to disk."""
+    doc = DXFDocument.new()
+    for layer in drawing.layers[1:]:  # layer 0 is in the skeleton
+        doc.add_table_entry(
+            "LAYER",
+            [
+                (0, "LAYER"),
+                (5, doc.next_handle()),
+                (100, "AcDbSymbolTableRecord"),
+                (100, "AcDbLayerTableRecord"),
+                (2, layer.name),
+                (70, "1" if layer.is_frozen else "0"),
+                (62, str(layer.color if layer.is_on else -layer.color)),
+            ],
+        )
+    tags: dict[str, list[str]] = {}
+    for block in drawing.blocks:
+        attributes = drawing.block_attributes.get(block.handle, [])
+        tags.setdefault(block.name, [a.tag for a in attributes])
+    for name, block_tags in tags.items():
+        owner = doc.next_handle()
+        doc.add_table_entry(
+            "BLOCK_RECORD", [(0, "BLOCK_RECORD"), (5, owner), (2, name)]
+        )
+        definitions = [
+            [(0, "ATTDEF"), (5, doc.next_handle()), (8, "0"), (1, ""), (2, tag)]
+            for tag in block_tags
+        ]
+        doc.add_block(name, owner, definitions)
+
+    # SEQEND records close each attributed INSERT and need handles too.
+    last = max(
+        (
+            int(h, 16)
+            for h in (
+                *(t.handle for t in drawing.texts),
+                *(d.handle for d in drawing.dimensions),
+                *(p.handle for p in drawing.polylines),
+                *(b.handle for b in drawing.blocks),
+                *(
+                    a.handle
+                    for attrs in drawing.block_attributes.values()
+                    for a in attrs
+                ),
+            )
+        ),
+        default=_FIRST_HANDLE,
+    )
+    sequences = sum(1 for attrs in drawing.block_attributes.values() if attrs)
+    handles = (f"{h:X}" for h in range(last + 1, last + 1 + sequences))
+    doc.set_header_var("$HANDSEED", [(5, f"{last + 1 + sequences:X}")])
+    low, high = drawing.extents.min_point, drawing.extents.max_point
+    doc.set_header_var("$EXTMIN", [*_xy(low), (30, format_float(low.z))])
+    doc.set_header_var("$EXTMAX", [*_xy(high), (30, format_float(high.z))])
+
+    def stream() -> Iterator[Tag]:
+        for section in doc.sections:
+            yield 0, "SECTION"
+            yield 2, section.name
+            for record in section.records:
+                yield from record
+            if section.name == "ENTITIES":
+                for record in _entity_records(drawing, handles):
+                    yield from record
+            yield 0, "ENDSEC"
+        yield 0, "EOF"
+
+    write_tags(path, stream())
@@ -0,0 +1,598 @@
+"""Benchmark harness for batch operations, the knowledge base and web API.
+
+Every function in ``operations/`` is run against seeded synthetic projects
+(see :mod:`autocad_batch_commander.acad.synthetic`) of one or more sizes,
+and the knowledge loader and web endpoints are timed once per run. Each
+case records its best wall time over a few repeats, the peak resident
+set size while it ran, and how many times it called each adapter method
+(counted through an :class:`InstrumentedAdapter`).
+
+Runs are appended to a JSON history file whose ``baseline`` section holds
+the reference measurement of every ``size/case`` key. A case regresses
+when it is slower or larger than its baseline by more than the threshold
+(ignoring differences below a small noise floor), or when it makes more
+adapter calls at all: call counts are deterministic, so any increase is a
+real change in how the operation drives the CAD application. Keys without
+a baseline adopt their first measurement; ``update_baseline`` re-bases
+every measured key.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, replace
+from datetime import datetime
+from fnmatch import fnmatchcase
+from functools import partial
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+
+from loguru import logger
+
+from autocad_batch_commander.acad.instrumented import InstrumentedAdapter
+from autocad_batch_commander.acad.mock_adapter import MockAutoCADAdapter
+from autocad_batch_commander.acad.synthetic import ProjectSpec, mock_project
+from autocad_batch_commander.models import (
+    AreaExtractionRequest,
+    AuditRequest,
+    BatchPlotRequest,
+    BatchPurgeRequest,
+    BenchmarkMeasurement,
+    BenchmarkRegression,
+    BenchmarkReport,
+    BlockInsertRequest,
+    ComplianceCheckRequest,
+    ComplianceMeasurementRequest,
+    DimensionExtractionRequest,
+    DrawingInfoRequest,
+    DrawingSearchRequest,
+    LayerRenameRequest,
+    LayerStandardizeRequest,
+    PipelineRequest,
+    PipelineStage,
+    Point3D,
+    ScheduleExtractionRequest,
+    TermReplaceRequest,
+    TextReplaceRequest,
+    TitleBlockUpdateRequest,
+    XrefManageRequest,
+)
+from autocad_batch_commander.utils.profiling import Profiler
+
+# (drawings, entities per drawing)
+SIZES: dict[str, tuple[int, int]] = {
+    "small": (5, 200),
+    "medium": (20, 2_000),
+    "large": (100, 10_000),
+}
+
+# Differences below these are noise, whatever the relative change.
+_MIN_SECONDS = 0.005
+_MIN_RSS_MB = 16.0
+
+_HISTORY_VERSION = 1
+_RSS_INTERVAL = 0.002
+
+
+def parse_size(size: str) -> tuple[int, int]:
+    """Return ``(drawings, entities)`` for a preset name or ``DxE`` string."""
+    if size in SIZES:
+        return SIZES[size]
+    drawings, sep, entities = size.lower().partition("x")
+    if not sep or not drawings.isdigit() or not entities.isdigit():
+        raise ValueError(
+            f"Unknown size '{size}'; expected one of {', '.join(SIZES)} "
+            "or DRAWINGSxENTITIES (e.g. 20x5000)"
+        )
+    return int(drawings), int(entities)
+
+
+# ── Measurement ──────────────────────────────────────────────────
+
+
+def _rss_bytes() -> int | None:
+    """Return the current resident set size, or None if unavailable."""
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/self/statm") as fh:
+                return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except OSError:
+            return None
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class _Counters(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = _Counters(cb=ctypes.sizeof(_Counters))
+        process = ctypes.windll.kernel32.GetCurrentProcess()  # type: ignore[attr-defined]
+        if ctypes.windll.psapi.GetProcessMemoryInfo(  # type: ignore[attr-defined]
+            process, ctypes.byref(counters), counters.cb
+        ):
+            return counters.WorkingSetSize
+        return None
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Elsewhere only the lifetime peak is available (bytes on macOS).
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class _PeakRss:
+    """Sample the resident set size in the background and keep the peak."""
+
+    def __init__(self) -> None:
+        self.peak = _rss_bytes()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self) -> None:
+        while not self._stop.wait(_RSS_INTERVAL):
+            self._update()
+
+    def _update(self) -> None:
+        rss = _rss_bytes()
+        if rss is not None and (self.peak is None or rss > self.peak):
+            self.peak = rss
+
+    def __enter__(self) -> _PeakRss:
+        if self.peak is not None:
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        if self.peak is not None:
+            self._stop.set()
+            self._thread.join()
+            self._update()
+
+    @property
+    def megabytes(self) -> float | None:
+        return None if self.peak is None else round(self.peak / 2**20, 1)
+
+
+# ── Cases ────────────────────────────────────────────────────────
+
+
+@dataclass
+class BenchProject:
+    """A synthetic project on disk and the adapter that serves it."""
+
+    folder: Path
+    adapter: Any
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    """One benchmarked call.
+
+    *run* receives a :class:`BenchProject` for sized cases and ``None`` for
+    size-independent ones. Cases that modify drawings get a freshly
+    generated project for every repeat.
+    """
+
+    name: str
+    run: Callable[[Any], object]
+    sized: bool = True
+    mutates: bool = False
+
+
+def _operation_cases() -> list[BenchCase]:
+    from autocad_batch_commander.operations.audit_ops import audit_drawings
+    from autocad_batch_commander.operations.block_ops import (
+        batch_insert_blocks,
+        batch_update_title_blocks,
+        extract_schedule,
+    )
+    from autocad_batch_commander.operations.compliance_ops import check_compliance
+    from autocad_batch_commander.operations.drawing_ops import (
+        batch_plot,
+        batch_purge,
+        drawing_search,
+        get_drawing_info,
+    )
+    from autocad_batch_commander.operations.executor import run_batch
+    from autocad_batch_commander.operations.geometry_ops import (
+        extract_areas,
+        extract_dimensions,
+        measure_compliance,
+    )
+    from autocad_batch_commander.operations.layer_ops import (
+        batch_rename_layer,
+        batch_standardize_layers,
+    )
+    from autocad_batch_commander.operations.pipeline_ops import run_pipeline
+    from autocad_batch_commander.operations.text_ops import (
+        batch_find_replace,
+        batch_replace_terms,
+    )
+    from autocad_batch_commander.operations.xref_ops import manage_xrefs
+
+    def batch(
+        func: Callable[..., object], make: Callable[[Path], Any], mutates: bool = False
+    ) -> BenchCase:
+        return BenchCase(
+            f"operations.{func.__name__}",
+            lambda p: func(p.adapter, make(p.folder)),
+            mutates=mutates,
+        )
+
+    return [
+        batch(
+            batch_find_replace,
+            lambda f: TextReplaceRequest(
+                folder=f, find_text="TIMBER", replace_text="OAK", backup=False
+            ),
+            mutates=True,
+        ),
+        batch(
+            batch_replace_terms,
+            lambda f: TermReplaceRequest(
+                folder=f,
+                mappings={"TIMBER": "OAK", "CONCRETE": "RC", "GYPSUM": "GYP"},
+                backup=False,
+            ),
+            mutates=True,
+        ),
+        batch(
+            batch_rename_layer,
+            lambda f: LayerRenameRequest(
+                folder=f, old_name="WALL", new_name="A-WALL-NEW", backup=False
+            ),
+            mutates=True,
+        ),
+        batch(
+            batch_standardize_layers,
+            lambda f: LayerStandardizeRequest(folder=f, standard="AIA", backup=False),
+            mutates=True,
+        ),
+        batch(audit_drawings, lambda f: AuditRequest(folder=f)),
+        batch(extract_dimensions, lambda f: DimensionExtractionRequest(folder=f)),
+        batch(extract_areas, lambda f: AreaExtractionRequest(folder=f)),
+        batch(measure_compliance, lambda f: ComplianceMeasurementRequest(folder=f)),
+        batch(
+            batch_update_title_blocks,
+            lambda f: TitleBlockUpdateRequest(
+                folder=f, updates={"REV": "E", "DATE": "2026-01-01"}, backup=False
+            ),
+            mutates=True,
+        ),
+        batch(
+            extract_schedule,
+            lambda f: ScheduleExtractionRequest(folder=f, block_name="DOOR_SINGLE"),
+        ),
+        batch(
+            batch_insert_blocks,
+            lambda f: BlockInsertRequest(
+                folder=f,
+                block_name="CHAIR",
+                insertion_points=[Point3D(x=i * 1000.0, y=0) for i in range(10)],
+                backup=False,
+            ),
+            mutates=True,
+        ),
+        batch(manage_xrefs, lambda f: XrefManageRequest(folder=f)),
+        batch(
+            drawing_search,
+            lambda f: DrawingSearchRequest(folder=f, search_text="BEDROOM"),
+        ),
+        batch(batch_plot, lambda f: BatchPlotRequest(folder=f)),
+        batch(batch_purge, lambda f: BatchPurgeRequest(folder=f, backup=False)),
+        batch(get_drawing_info, lambda f: DrawingInfoRequest(folder=f)),
+        batch(
+            run_pipeline,
+            lambda f: PipelineRequest(
+                folder=f,
+                stages=[
+                    PipelineStage(
+                        operation="find_replace",
+                        params={"find_text": "TIMBER", "replace_text": "OAK"},
+                    ),
+                    PipelineStage(
+                        operation="standardize_layers", params={"standard": "AIA"}
+                    ),
+                    PipelineStage(operation="purge"),
+                ],
+                backup=False,
+            ),
+            mutates=True,
+        ),
+        BenchCase(
+            "operations.run_batch",
+            lambda p: run_batch(
+                get_drawing_info,
+                DrawingInfoRequest(folder=p.folder),
+                adapter=p.adapter,
+                cache=False,
+            ),
+        ),
+        BenchCase(
+            "operations.check_compliance",
+            lambda _: check_compliance(ComplianceCheckRequest()),
+            sized=False,
+        ),
+    ]
+
+
+def _knowledge_cases() -> list[BenchCase]:
+    from autocad_batch_commander.knowledge.loader import (
+        load_ubbl_content,
+        query_knowledge_base,
+    )
+
+    return [
+        BenchCase(
+            "knowledge.query_knowledge_base",
+            lambda _: query_knowledge_base("minimum corridor width fire escape"),
+            sized=False,
+        ),
+        BenchCase(
+            "knowledge.load_ubbl_content", lambda _: load_ubbl_content(), sized=False
+        ),
+    ]
+
+
+def _web_cases() -> list[BenchCase]:
+    try:
+        from fastapi.testclient import TestClient
+
+        from autocad_batch_commander.web.api import app
+    except ImportError as exc:
+        logger.warning(f"Skipping web API benchmarks: {exc}")
+        return []
+    client = TestClient(app)
+    # The first request pays one-off import and event-loop setup costs.
+    client.get("/api/health")
+
+    def endpoint(method: str, url: str, body: dict | None = None) -> BenchCase:
+        def run(_: None) -> None:
+            client.request(method, url, json=body).raise_for_status()
+
+        return BenchCase(f"web.{method} {url}", run, sized=False)
+
+    return [
+        endpoint("GET", "/api/health"),
+        endpoint("POST", "/api/query", {"question": "minimum corridor width"}),
+        endpoint("GET", "/api/rules"),
+        endpoint("GET", "/api/rules/ubbl-spatial"),
+        endpoint("POST", "/api/compliance/check", {"rule_sets": ["ubbl-spatial"]}),
+        endpoint("GET", "/api/ubbl"),
+    ]
+
+
+def benchmark_cases() -> list[BenchCase]:
+    """Return every benchmark case, operations first."""
+    return [*_operation_cases(), *_knowledge_cases(), *_web_cases()]
+
+
+def _select(cases: list[BenchCase], patterns: Iterable[str] | None) -> list[BenchCase]:
+    patterns = list(patterns or [])
+    if not patterns:
+        return cases
+    return [c for c in cases if any(fnmatchcase(c.name, p) for p in patterns)]
+
+
+def _measure(
+    case: BenchCase,
+    project: Callable[[bool], BenchProject | None],
+    repeat: int,
+) -> tuple[float, float | None, dict[str, int]]:
+    best = float("inf")
+    peak: float | None = None
+    calls: dict[str, int] = {}
+    for _ in range(max(1, repeat)):
+        target = project(case.mutates)
+        profiler = Profiler(case.name, measure_bytes=False)
+        if target is not None:
+            target = replace(
+                target, adapter=InstrumentedAdapter(target.adapter, profiler)
+            )
+        gc.collect()
+        with _PeakRss() as rss, profiler:
+            start = time.perf_counter()
+            case.run(target)
+            elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        if rss.megabytes is not None:
+            peak = max(peak or 0.0, rss.megabytes)
+        calls = dict(sorted(profiler.calls().items()))
+    return best, peak, calls
+
+
+# ── History ──────────────────────────────────────────────────────
+
+
+def _load_history(path: Path) -> dict[str, Any]:
+    if path.exists():
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") == _HISTORY_VERSION:
+            return data
+        logger.warning(f"Ignoring benchmark history with another format: {path}")
+    return {"version": _HISTORY_VERSION, "baseline": {}, "runs": []}
+
+
+def _key(measurement: BenchmarkMeasurement) -> str:
+    return f"{measurement.size}/{measurement.case}"
+
+
+def compare(
+    measurement: BenchmarkMeasurement,
+    baseline: BenchmarkMeasurement,
+    threshold: float,
+) -> list[BenchmarkRegression]:
+    """Return the ways *measurement* regressed against *baseline*."""
+    regressions: list[BenchmarkRegression] = []
+
+    def regressed(metric: str, base: float, current: float) -> None:
+        regressions.append(
+            BenchmarkRegression(
+                case=measurement.case,
+                size=measurement.size,
+                metric=metric,
+                baseline=base,
+                current=current,
+            )
+        )
+
+    base_time, time_now = baseline.wall_seconds, measurement.wall_seconds
+    if time_now > base_time * (1 + threshold) and time_now - base_time > _MIN_SECONDS:
+        regressed("wall_seconds", base_time, time_now)
+    base_rss, rss_now = baseline.peak_rss_mb, measurement.peak_rss_mb
+    if (
+        base_rss is not None
+        and rss_now is not None
+        and rss_now > base_rss * (1 + threshold)
+        and rss_now - base_rss > _MIN_RSS_MB
+    ):
+        regressed("peak_rss_mb", base_rss, rss_now)
+    base_calls = sum(baseline.adapter_calls.values())
+    calls_now = sum(measurement.adapter_calls.values())
+    if calls_now > base_calls:
+        regressed("adapter_calls", base_calls, calls_now)
+    return regressions
+
+
+# ── Runner ───────────────────────────────────────────────────────
+
+
+def _project(
+    spec: ProjectSpec, folder: Path, shared: list[BenchProject], fresh: bool
+) -> BenchProject:
+    """Build the project of *spec* in *folder*, or reuse the one in *shared*.
+
+    Read-only cases share one project; mutating (*fresh*) ones get a new one.
+    """
+    if fresh or not shared:
+        adapter = mock_project(spec, folder, MockAutoCADAdapter())
+        built = BenchProject(folder, adapter)
+        if fresh:
+            return built
+        shared.append(built)
+    return shared[0]
+
+
+def run_benchmarks(
+    sizes: Iterable[str] = ("small",),
+    *,
+    cases: Iterable[str] | None = None,
+    repeat: int = 3,
+    seed: int = 0,
+    history: Path | None = None,
+    threshold: float = 0.25,
+    update_baseline: bool = False,
+    label: str = "",
+) -> BenchmarkReport:
+    """Run the selected *cases* (glob patterns) on each project size.
+
+    With *history*, the run is appended to that JSON file and compared
+    against its baseline; see the module docstring for the rules.
+    """
+    selected = _select(benchmark_cases(), cases)
+    if not selected:
+        raise ValueError("No benchmark cases match the given patterns")
+    sized = [c for c in selected if c.sized]
+    report = BenchmarkReport()
+
+    with TemporaryDirectory(prefix="acad-bench-") as tmp:
+        for size in sizes if sized else ():
+            drawings, entities = parse_size(size)
+            spec = ProjectSpec(drawings=drawings, entities=entities, seed=seed)
+            folder = Path(tmp) / size
+            project = partial(_project, spec, folder, [])
+
+            for case in sized:
+                logger.info(f"Benchmarking {case.name} on {size}")
+                wall, rss, calls = _measure(case, project, repeat)
+                report.measurements.append(
+                    BenchmarkMeasurement(
+                        case=case.name,
+                        size=size,
+                        drawings=drawings,
+                        entities=entities,
+                        wall_seconds=round(wall, 6),
+                        peak_rss_mb=rss,
+                        adapter_calls=calls,
+                    )
+                )
+
+    for case in selected:
+        if not case.sized:
+            logger.info(f"Benchmarking {case.name}")
+            wall, rss, _ = _measure(case, lambda _: None, repeat)
+            report.measurements.append(
+                BenchmarkMeasurement(
+                    case=case.name,
+                    size="-",
+                    wall_seconds=round(wall, 6),
+                    peak_rss_mb=rss,
+                )
+            )
+
+    if history is not None:
+        _record(report, history, threshold, update_baseline, label, seed)
+    return report
+
+
+def _record(
+    report: BenchmarkReport,
+    path: Path,
+    threshold: float,
+    update_baseline: bool,
+    label: str,
+    seed: int,
+) -> None:
+    data = _load_history(path)
+    baseline: dict[str, Any] = data["baseline"]
+    for measurement in report.measurements:
+        key = _key(measurement)
+        stored = baseline.get(key)
+        if stored is not None and not update_baseline:
+            report.regressions.extend(
+                compare(
+                    measurement,
+                    BenchmarkMeasurement.model_validate(stored),
+                    threshold,
+                )
+            )
+            continue
+        baseline[key] = measurement.model_dump()
+        report.baselines_updated += 1
+
+    data["runs"].append(
+        {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "label": label,
+            "seed": seed,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "measurements": [m.model_dump() for m in report.measurements],
+            "regressions": [r.model_dump() for r in report.regressions],
+        }
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data, indent=1), encoding="utf-8")
+    tmp.replace(path)
+    report.history = str(path)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 from typing import Optional
 
@@ -9,22 +10,31 @@ import typer
 from rich.console import Console
 
 from autocad_batch_commander import __version__
-from autocad_batch_commander.acad.factory import get_acad_adapter
+from autocad_batch_commander.acad.cache import DrawingCache
 from autocad_batch_commander.cli.formatters import (
     print_area_result,
     print_audit_result,
+    print_backup_prune,
+    print_backups,
+    print_benchmarks,
+    print_cache_stats,
     print_compliance_result,
     print_dimension_result,
     print_drawing_info_result,
+    print_jobs,
     print_measurement_result,
     print_operation_result,
+    print_pipeline_result,
     print_plot_result,
     print_purge_result,
     print_regulation_result,
+    print_room_result,
     print_schedule_result,
     print_search_result,
+    print_timings,
     print_xref_result,
 )
+from autocad_batch_commander.config import settings
 from autocad_batch_commander.knowledge.loader import query_knowledge_base
 from autocad_batch_commander.models import (
     AreaExtractionRequest,
@@ -38,7 +48,10 @@ from autocad_batch_commander.models import (
     DrawingSearchRequest,
     LayerRenameRequest,
     LayerStandardizeRequest,
+    PipelineRequest,
+    RoomExtractionRequest,
     ScheduleExtractionRequest,
+    TermReplaceRequest,
     TextReplaceRequest,
     TitleBlockUpdateRequest,
     XrefManageRequest,
@@ -47,6 +60,7 @@ from autocad_batch_commander.operations import (
     block_ops,
     drawing_ops,
     geometry_ops,
+    room_ops,
     xref_ops,
 )
 from autocad_batch_commander.operations.audit_ops import audit_drawings
@@ -54,11 +68,23 @@ from autocad_batch_commander.operations.compliance_ops import (
     check_compliance,
     list_rule_sets,
 )
+from autocad_batch_commander.operations.executor import run_batch
+from autocad_batch_commander.operations.journal import JobJournal, new_job_id
 from autocad_batch_commander.operations.layer_ops import (
     batch_rename_layer,
     batch_standardize_layers,
 )
-from autocad_batch_commander.operations.text_ops import batch_find_replace
+from autocad_batch_commander.operations.pipeline_ops import run_pipeline
+from autocad_batch_commander.operations.text_ops import (
+    batch_find_replace,
+    batch_replace_terms,
+)
+from autocad_batch_commander.utils.backup import (
+    BackupStore,
+    iter_backup_stores,
+    prune_backups,
+)
+from autocad_batch_commander.utils.text_replace import load_term_mappings
 
 app = typer.Typer(
     name="autocad-cmd",
@@ -67,6 +93,69 @@ app = typer.Typer(
 )
 console = Console()
 
+_WORKERS_OPTION = typer.Option(
+    settings.workers,
+    "--workers",
+    "-w",
+    help="Worker processes to shard drawings across (1 = serial)",
+)
+
+_INCREMENTAL_OPTION = typer.Option(
+    False,
+    "--incremental",
+    help="Skip drawings unchanged since the last successful run of this command",
+)
+
+_RESUME_OPTION = typer.Option(
+    None,
+    "--resume",
+    metavar="JOB_ID",
+    help="Continue an interrupted job, skipping drawings it already finished",
+)
+
+_CHECKPOINT_OPTION = typer.Option(
+    False,
+    "--checkpoint",
+    help="Journal each drawing as it finishes so the job can be resumed",
+)
+
+_INCLUDE_OPTION = typer.Option(
+    None,
+    "--include",
+    metavar="GLOB",
+    help="Only process drawings matching this pattern (repeatable)",
+)
+
+_EXCLUDE_OPTION = typer.Option(
+    None,
+    "--exclude",
+    metavar="GLOB",
+    help="Skip drawings and folders matching this pattern (repeatable)",
+)
+
+_PROFILE_OPTION = typer.Option(
+    settings.profile, "--profile", help="Time every CAD call and print a breakdown"
+)
+
+_NO_CACHE_OPTION = typer.Option(
+    False, "--no-cache", help="Re-read every drawing instead of using the cache"
+)
+
+
+def _cache_flag(no_cache: bool) -> bool | None:
+    return False if no_cache else None
+
+
+def _job_id(resume: str | None, checkpoint: bool) -> str | None:
+    """Return the job to journal into: *resume*, a new one, or None."""
+    if resume is None and not checkpoint:
+        return None
+    job_id = resume or new_job_id()
+    console.print(
+        f"[dim]Job {job_id} — rerun with --resume {job_id} if interrupted[/dim]"
+    )
+    return job_id
+
 
 # ── Existing commands ─────────────────────────────────────────────
 
@@ -86,6 +175,13 @@ def change_text(
     ),
     backup: bool = typer.Option(True, "--backup/--no-backup", help="Create backups"),
     mock: bool = typer.Option(False, "--mock", help="Use mock adapter (testing)"),
+    workers: int = _WORKERS_OPTION,
+    incremental: bool = _INCREMENTAL_OPTION,
+    resume: Optional[str] = _RESUME_OPTION,
+    checkpoint: bool = _CHECKPOINT_OPTION,
+    include: Optional[list[str]] = _INCLUDE_OPTION,
+    exclude: Optional[list[str]] = _EXCLUDE_OPTION,
+    profile: bool = _PROFILE_OPTION,
 ) -> None:
     """Find and replace text across multiple AutoCAD drawings."""
     console.print(f"\nScanning folder: {folder}")
@@ -100,9 +196,79 @@ def change_text(
         backup=backup,
     )
 
-    adapter = get_acad_adapter(use_mock=mock, folder=folder)
-    result = batch_find_replace(adapter, request)
+    result = run_batch(
+        batch_find_replace,
+        request,
+        workers=workers,
+        use_mock=mock,
+        incremental=incremental,
+        job_id=_job_id(resume, checkpoint),
+        include=include,
+        exclude=exclude,
+        profile=profile,
+    )
     print_operation_result(result)
+    print_timings(result.timings)
+
+
+@app.command()
+def replace_terms(
+    folder: Path = typer.Option(
+        ..., "--folder", "-f", help="Folder containing DWG files"
+    ),
+    mapping: Path = typer.Option(
+        ..., "--mapping", "-m", help="CSV or JSON table of find → replace terms"
+    ),
+    layers: Optional[str] = typer.Option(
+        None, "--layers", "-l", help="Comma-separated layer filter"
+    ),
+    case_sensitive: bool = typer.Option(
+        False, "--case-sensitive", help="Case-sensitive search"
+    ),
+    whole_word: bool = typer.Option(
+        False, "--whole-word", help="Only match whole words"
+    ),
+    regex: bool = typer.Option(
+        False, "--regex", help="Treat terms as regular expressions"
+    ),
+    backup: bool = typer.Option(True, "--backup/--no-backup", help="Create backups"),
+    mock: bool = typer.Option(False, "--mock", help="Use mock adapter (testing)"),
+    workers: int = _WORKERS_OPTION,
+    incremental: bool = _INCREMENTAL_OPTION,
+    resume: Optional[str] = _RESUME_OPTION,
+    checkpoint: bool = _CHECKPOINT_OPTION,
+    include: Optional[list[str]] = _INCLUDE_OPTION,
+    exclude: Optional[list[str]] = _EXCLUDE_OPTION,
+    profile: bool = _PROFILE_OPTION,
+) -> None:
+    """Replace every term of a mapping table in a single pass per drawing."""
+    mappings = load_term_mappings(mapping)
+    console.print(f"\nScanning folder: {folder} ({len(mappings)} terms)")
+
+    layer_list = [s.strip() for s in layers.split(",")] if layers else None
+    request = TermReplaceRequest(
+        folder=folder,
+        mappings=mappings,
+        layers=layer_list,
+        case_sensitive=case_sensitive,
+        whole_word=whole_word,
+        regex=regex,
+        backup=backup,
+    )
+
+    result = run_batch(
+        batch_replace_terms,
+        request,
+        workers=workers,
+        use_mock=mock,
+        incremental=incremental,
+        job_id=_job_id(resume, checkpoint),
+        include=include,
+        exclude=exclude,
+        profile=profile,
+    )
+    print_operation_result(result)
+    print_timings(result.timings)
 
 
 @app.command()
@@ -114,6 +280,13 @@ def rename_layer(
     new_name: str = typer.Option(..., "--new-name", help="New layer name"),
     backup: bool = typer.Option(True, "--backup/--no-backup", help="Create backups"),
     mock: bool = typer.Option(False, "--mock", help="Use mock adapter (testing)"),
+    workers: int = _WORKERS_OPTION,
+    incremental: bool = _INCREMENTAL_OPTION,
+    resume: Optional[str] = _RESUME_OPTION,
+    checkpoint: bool = _CHECKPOINT_OPTION,
+    include: Optional[list[str]] = _INCLUDE_OPTION,
+    exclude: Optional[list[str]] = _EXCLUDE_OPTION,
+    profile: bool = _PROFILE_OPTION,
 ) -> None:
     """Rename a layer across multiple AutoCAD drawings."""
     console.print(f"\nRenaming layer: {old_name} -> {new_name}")
@@ -126,9 +299,19 @@ def rename_layer(
         backup=backup,
     )
 
-    adapter = get_acad_adapter(use_mock=mock, folder=folder)
-    result = batch_rename_layer(adapter, request)
+    result = run_batch(
+        batch_rename_layer,
+        request,
+        workers=workers,
+        use_mock=mock,
+        incremental=incremental,
+        job_id=_job_id(resume, checkpoint),
+        include=include,
+        exclude=exclude,
+        profile=profile,
+    )
     print_operation_result(result)
+    print_timings(result.timings)
 
 
 @app.command()
@@ -144,6 +327,13 @@ def standardize_layers(
     ),
     backup: bool = typer.Option(True, "--backup/--no-backup", help="Create backups"),
     mock: bool = typer.Option(False, "--mock", help="Use mock adapter (testing)"),
+    workers: int = _WORKERS_OPTION,
+    incremental: bool = _INCREMENTAL_OPTION,
+    resume: Optional[str] = _RESUME_OPTION,
+    checkpoint: bool = _CHECKPOINT_OPTION,
+    include: Optional[list[str]] = _INCLUDE_OPTION,
+    exclude: Optional[list[str]] = _EXCLUDE_OPTION,
+    profile: bool = _PROFILE_OPTION,
 ) -> None:
     """Standardize layer names across multiple AutoCAD drawings."""
     console.print(f"\nStandardizing layers to: {standard}")
@@ -156,9 +346,19 @@ def standardize_layers(
         backup=backup,
     )
 
-    adapter = get_acad_adapter(use_mock=mock, folder=folder)
-    result = batch_standardize_layers(adapter, request)
+    result = run_batch(
+        batch_standardize_layers,
+        request,
+        workers=workers,
+        use_mock=mock,
+        incremental=incremental,
+        job_id=_job_id(resume, checkpoint),
+        include=include,
+        exclude=exclude,
+        profile=profile,
+    )
     print_operation_result(result)
+    print_timings(result.timings)
 
 
 @app.command()
@@ -170,6 +370,13 @@ def audit(
         "AIA", "--standard", "-s", help="Standard: AIA, BS1192, UBBL"
     ),
     mock: bool = typer.Option(False, "--mock", help="Use mock adapter (testing)"),
+    workers: int = _WORKERS_OPTION,
+    incremental: bool = _INCREMENTAL_OPTION,
+    resume: Optional[str] = _RESUME_OPTION,
+    checkpoint: bool = _CHECKPOINT_OPTION,
+    include: Optional[list[str]] = _INCLUDE_OPTION,
+    exclude: Optional[list[str]] = _EXCLUDE_OPTION,
+    profile: bool = _PROFILE_OPTION,
 ) -> None:
     """Audit drawings for layer compliance."""
     console.print(f"\nAuditing drawings in: {folder}")
@@ -177,9 +384,19 @@ def audit(
 
     request = AuditRequest(folder=folder, standard=standard)
 
-    adapter = get_acad_adapter(use_mock=mock, folder=folder)
-    result = audit_drawings(adapter, request)
+    result = run_batch(
+        audit_drawings,
+        request,
+        workers=workers,
+        use_mock=mock,
+        incremental=incremental,
+        job_id=_job_id(resume, checkpoint),
+        include=include,
+        exclude=exclude,
+        profile=profile,
+    )
     print_audit_result(result)
+    print_timings(result.timings)
 
 
 @app.command()
@@ -266,6 +483,14 @@ def extract_dims(
         None, "--types", "-t", help="Dimension types: linear,aligned,angular"
     ),
     mock: bool = typer.Option(False, "--mock", help="Use mock adapter (testing)"),
+    workers: int = _WORKERS_OPTION,
+    incremental: bool = _INCREMENTAL_OPTION,
+    resume: Optional[str] = _RESUME_OPTION,
+    checkpoint: bool = _CHECKPOINT_OPTION,
+    include: Optional[list[str]] = _INCLUDE_OPTION,
+    exclude: Optional[list[str]] = _EXCLUDE_OPTION,
+    no_cache: bool = _NO_CACHE_OPTION,
+    profile: bool = _PROFILE_OPTION,
 ) -> None:
     """Extract dimensions from AutoCAD drawings."""
     console.print(f"\nExtracting dimensions from: {folder}")
@@ -276,9 +501,20 @@ def extract_dims(
     request = DimensionExtractionRequest(
         folder=folder, layers=layer_list, dimension_types=type_list
     )
-    adapter = get_acad_adapter(use_mock=mock, folder=folder)
-    result = geometry_ops.extract_dimensions(adapter, request)
+    result = run_batch(
+        geometry_ops.extract_dimensions,
+        request,
+        workers=workers,
+        use_mock=mock,
+        cache=_cache_flag(no_cache),
+        incremental=incremental,
+        job_id=_job_id(resume, checkpoint),
+        include=include,
+        exclude=exclude,
+        profile=profile,
+    )
     print_dimension_result(result)
+    print_timings(result.timings)
 
 
 @app.command()
@@ -296,6 +532,14 @@ def extract_areas(
         None, "--max-area", help="Maximum area filter (sq mm)"
     ),
     mock: bool = typer.Option(False, "--mock", help="Use mock adapter (testing)"),
+    workers: int = _WORKERS_OPTION,
+    incremental: bool = _INCREMENTAL_OPTION,
+    resume: Optional[str] = _RESUME_OPTION,
+    checkpoint: bool = _CHECKPOINT_OPTION,
+    include: Optional[list[str]] = _INCLUDE_OPTION,
+    exclude: Optional[list[str]] = _EXCLUDE_OPTION,
+    no_cache: bool = _NO_CACHE_OPTION,
+    profile: bool = _PROFILE_OPTION,
 ) -> None:
     """Extract areas from closed polylines in AutoCAD drawings."""
     console.print(f"\nExtracting areas from: {folder}")
@@ -304,9 +548,65 @@ def extract_areas(
     request = AreaExtractionRequest(
         folder=folder, layers=layer_list, min_area=min_area, max_area=max_area
     )
-    adapter = get_acad_adapter(use_mock=mock, folder=folder)
-    result = geometry_ops.extract_areas(adapter, request)
+    result = run_batch(
+        geometry_ops.extract_areas,
+        request,
+        workers=workers,
+        use_mock=mock,
+        cache=_cache_flag(no_cache),
+        incremental=incremental,
+        job_id=_job_id(resume, checkpoint),
+        include=include,
+        exclude=exclude,
+        profile=profile,
+    )
     print_area_result(result)
+    print_timings(result.timings)
+
+
+@app.command()
+def extract_rooms(
+    folder: Path = typer.Option(
+        ..., "--folder", "-f", help="Folder containing DWG files"
+    ),
+    layers: Optional[str] = typer.Option(
+        None, "--layers", "-l", help="Comma-separated room outline layer filter"
+    ),
+    label_layers: Optional[str] = typer.Option(
+        None, "--label-layers", help="Comma-separated room label layer filter"
+    ),
+    mock: bool = typer.Option(False, "--mock", help="Use mock adapter (testing)"),
+    workers: int = _WORKERS_OPTION,
+    incremental: bool = _INCREMENTAL_OPTION,
+    resume: Optional[str] = _RESUME_OPTION,
+    checkpoint: bool = _CHECKPOINT_OPTION,
+    include: Optional[list[str]] = _INCLUDE_OPTION,
+    exclude: Optional[list[str]] = _EXCLUDE_OPTION,
+    no_cache: bool = _NO_CACHE_OPTION,
+    profile: bool = _PROFILE_OPTION,
+) -> None:
+    """Recognise rooms from labels inside closed polylines."""
+    console.print(f"\nRecognising rooms in: {folder}")
+
+    layer_list = [s.strip() for s in layers.split(",")] if layers else None
+    label_list = [s.strip() for s in label_layers.split(",")] if label_layers else None
+    request = RoomExtractionRequest(
+        folder=folder, layers=layer_list, label_layers=label_list
+    )
+    result = run_batch(
+        room_ops.extract_rooms,
+        request,
+        workers=workers,
+        use_mock=mock,
+        cache=_cache_flag(no_cache),
+        incremental=incremental,
+        job_id=_job_id(resume, checkpoint),
+        include=include,
+        exclude=exclude,
+        profile=profile,
+    )
+    print_room_result(result)
+    print_timings(result.timings)
 
 
 @app.command()
@@ -320,19 +620,39 @@ def check_drawing(
     building_type: Optional[str] = typer.Option(
         None, "--building-type", "-b", help="Building type filter"
     ),
+    units: str = typer.Option("mm", "--units", "-u", help="Drawing units: mm, cm or m"),
     mock: bool = typer.Option(False, "--mock", help="Use mock adapter (testing)"),
+    workers: int = _WORKERS_OPTION,
+    incremental: bool = _INCREMENTAL_OPTION,
+    resume: Optional[str] = _RESUME_OPTION,
+    checkpoint: bool = _CHECKPOINT_OPTION,
+    include: Optional[list[str]] = _INCLUDE_OPTION,
+    exclude: Optional[list[str]] = _EXCLUDE_OPTION,
+    no_cache: bool = _NO_CACHE_OPTION,
+    profile: bool = _PROFILE_OPTION,
 ) -> None:
-    """Measure drawing dimensions against compliance rules."""
+    """Measure drawing dimensions and room areas against compliance rules."""
     rs = [s.strip() for s in rule_sets.split(",")] if rule_sets else ["ubbl-spatial"]
     console.print(f"\nChecking drawing compliance: {', '.join(rs)}")
     console.print(f"Folder: {folder}")
 
     request = ComplianceMeasurementRequest(
-        folder=folder, rule_sets=rs, building_type=building_type
+        folder=folder, rule_sets=rs, building_type=building_type, drawing_units=units
+    )
+    result = run_batch(
+        geometry_ops.measure_compliance,
+        request,
+        workers=workers,
+        use_mock=mock,
+        cache=_cache_flag(no_cache),
+        incremental=incremental,
+        job_id=_job_id(resume, checkpoint),
+        include=include,
+        exclude=exclude,
+        profile=profile,
     )
-    adapter = get_acad_adapter(use_mock=mock, folder=folder)
-    result = geometry_ops.measure_compliance(adapter, request)
     print_measurement_result(result)
+    print_timings(result.timings)
 
 
 # ── New block commands ────────────────────────────────────────────
@@ -354,6 +674,13 @@ def update_titleblock(
     ),
     backup: bool = typer.Option(True, "--backup/--no-backup", help="Create backups"),
     mock: bool = typer.Option(False, "--mock", help="Use mock adapter (testing)"),
+    workers: int = _WORKERS_OPTION,
+    incremental: bool = _INCREMENTAL_OPTION,
+    resume: Optional[str] = _RESUME_OPTION,
+    checkpoint: bool = _CHECKPOINT_OPTION,
+    include: Optional[list[str]] = _INCLUDE_OPTION,
+    exclude: Optional[list[str]] = _EXCLUDE_OPTION,
+    profile: bool = _PROFILE_OPTION,
 ) -> None:
     """Update title block attributes across drawings."""
     console.print(f"\nUpdating title blocks: {block_name}")
@@ -367,9 +694,19 @@ def update_titleblock(
     request = TitleBlockUpdateRequest(
         folder=folder, block_name=block_name, updates=update_dict, backup=backup
     )
-    adapter = get_acad_adapter(use_mock=mock, folder=folder)
-    result = block_ops.batch_update_title_blocks(adapter, request)
+    result = run_batch(
+        block_ops.batch_update_title_blocks,
+        request,
+        workers=workers,
+        use_mock=mock,
+        incremental=incremental,
+        job_id=_job_id(resume, checkpoint),
+        include=include,
+        exclude=exclude,
+        profile=profile,
+    )
     print_operation_result(result)
+    print_timings(result.timings)
 
 
 @app.command()
@@ -384,6 +721,14 @@ def extract_schedule(
         None, "--tags", "-t", help="Comma-separated attribute tags to extract"
     ),
     mock: bool = typer.Option(False, "--mock", help="Use mock adapter (testing)"),
+    workers: int = _WORKERS_OPTION,
+    incremental: bool = _INCREMENTAL_OPTION,
+    resume: Optional[str] = _RESUME_OPTION,
+    checkpoint: bool = _CHECKPOINT_OPTION,
+    include: Optional[list[str]] = _INCLUDE_OPTION,
+    exclude: Optional[list[str]] = _EXCLUDE_OPTION,
+    no_cache: bool = _NO_CACHE_OPTION,
+    profile: bool = _PROFILE_OPTION,
 ) -> None:
     """Extract schedule data from block attributes."""
     console.print(f"\nExtracting schedule: {block_name}")
@@ -392,9 +737,20 @@ def extract_schedule(
     request = ScheduleExtractionRequest(
         folder=folder, block_name=block_name, tags=tag_list
     )
-    adapter = get_acad_adapter(use_mock=mock, folder=folder)
-    result = block_ops.extract_schedule(adapter, request)
+    result = run_batch(
+        block_ops.extract_schedule,
+        request,
+        workers=workers,
+        use_mock=mock,
+        cache=_cache_flag(no_cache),
+        incremental=incremental,
+        job_id=_job_id(resume, checkpoint),
+        include=include,
+        exclude=exclude,
+        profile=profile,
+    )
     print_schedule_result(result)
+    print_timings(result.timings)
 
 
 # ── New XREF commands ─────────────────────────────────────────────
@@ -415,6 +771,13 @@ def manage_xrefs_cmd(
         None, "--xref-path", help="XREF file path (for attach)"
     ),
     mock: bool = typer.Option(False, "--mock", help="Use mock adapter (testing)"),
+    workers: int = _WORKERS_OPTION,
+    incremental: bool = _INCREMENTAL_OPTION,
+    resume: Optional[str] = _RESUME_OPTION,
+    checkpoint: bool = _CHECKPOINT_OPTION,
+    include: Optional[list[str]] = _INCLUDE_OPTION,
+    exclude: Optional[list[str]] = _EXCLUDE_OPTION,
+    profile: bool = _PROFILE_OPTION,
 ) -> None:
     """Manage external references across drawings."""
     console.print(f"\nXREF {action}: {folder}")
@@ -422,9 +785,19 @@ def manage_xrefs_cmd(
     request = XrefManageRequest(
         folder=folder, action=action, xref_name=xref_name, xref_path=xref_path
     )
-    adapter = get_acad_adapter(use_mock=mock, folder=folder)
-    result = xref_ops.manage_xrefs(adapter, request)
+    result = run_batch(
+        xref_ops.manage_xrefs,
+        request,
+        workers=workers,
+        use_mock=mock,
+        incremental=incremental,
+        job_id=_job_id(resume, checkpoint),
+        include=include,
+        exclude=exclude,
+        profile=profile,
+    )
     print_xref_result(result)
+    print_timings(result.timings)
 
 
 # ── New drawing utility commands ──────────────────────────────────
@@ -445,7 +818,23 @@ def search_drawings(
     case_sensitive: bool = typer.Option(
         False, "--case-sensitive", help="Case-sensitive search"
     ),
+    layers: Optional[str] = typer.Option(
+        None, "--layers", "-l", help="Comma-separated layer filter"
+    ),
+    entity_types: Optional[str] = typer.Option(
+        None,
+        "--entity-types",
+        help="Comma-separated text entity types: AcDbText,AcDbMText",
+    ),
     mock: bool = typer.Option(False, "--mock", help="Use mock adapter (testing)"),
+    workers: int = _WORKERS_OPTION,
+    incremental: bool = _INCREMENTAL_OPTION,
+    resume: Optional[str] = _RESUME_OPTION,
+    checkpoint: bool = _CHECKPOINT_OPTION,
+    include: Optional[list[str]] = _INCLUDE_OPTION,
+    exclude: Optional[list[str]] = _EXCLUDE_OPTION,
+    no_cache: bool = _NO_CACHE_OPTION,
+    profile: bool = _PROFILE_OPTION,
 ) -> None:
     """Search for text across drawings."""
     console.print(f"\nSearching for: {search_text}")
@@ -453,15 +842,30 @@ def search_drawings(
     search_in_list = (
         [s.strip() for s in search_in.split(",")] if search_in else ["text"]
     )
+    layer_list = [s.strip() for s in layers.split(",")] if layers else None
+    type_list = [s.strip() for s in entity_types.split(",")] if entity_types else None
     request = DrawingSearchRequest(
         folder=folder,
         search_text=search_text,
         search_in=search_in_list,
         case_sensitive=case_sensitive,
+        layers=layer_list,
+        entity_types=type_list,
+    )
+    result = run_batch(
+        drawing_ops.drawing_search,
+        request,
+        workers=workers,
+        use_mock=mock,
+        cache=_cache_flag(no_cache),
+        incremental=incremental,
+        job_id=_job_id(resume, checkpoint),
+        include=include,
+        exclude=exclude,
+        profile=profile,
     )
-    adapter = get_acad_adapter(use_mock=mock, folder=folder)
-    result = drawing_ops.drawing_search(adapter, request)
     print_search_result(result)
+    print_timings(result.timings)
 
 
 @app.command()
@@ -479,6 +883,13 @@ def batch_plot_cmd(
         "PDF", "--format", help="Output format: PDF or DWF"
     ),
     mock: bool = typer.Option(False, "--mock", help="Use mock adapter (testing)"),
+    workers: int = _WORKERS_OPTION,
+    incremental: bool = _INCREMENTAL_OPTION,
+    resume: Optional[str] = _RESUME_OPTION,
+    checkpoint: bool = _CHECKPOINT_OPTION,
+    include: Optional[list[str]] = _INCLUDE_OPTION,
+    exclude: Optional[list[str]] = _EXCLUDE_OPTION,
+    profile: bool = _PROFILE_OPTION,
 ) -> None:
     """Batch plot drawings to PDF/DWF."""
     console.print(f"\nBatch plotting: {folder}")
@@ -489,9 +900,19 @@ def batch_plot_cmd(
         layout_name=layout,
         output_format=output_format,
     )
-    adapter = get_acad_adapter(use_mock=mock, folder=folder)
-    result = drawing_ops.batch_plot(adapter, request)
+    result = run_batch(
+        drawing_ops.batch_plot,
+        request,
+        workers=workers,
+        use_mock=mock,
+        incremental=incremental,
+        job_id=_job_id(resume, checkpoint),
+        include=include,
+        exclude=exclude,
+        profile=profile,
+    )
     print_plot_result(result)
+    print_timings(result.timings)
 
 
 @app.command()
@@ -504,14 +925,31 @@ def purge(
     ),
     backup: bool = typer.Option(True, "--backup/--no-backup", help="Create backups"),
     mock: bool = typer.Option(False, "--mock", help="Use mock adapter (testing)"),
+    workers: int = _WORKERS_OPTION,
+    incremental: bool = _INCREMENTAL_OPTION,
+    resume: Optional[str] = _RESUME_OPTION,
+    checkpoint: bool = _CHECKPOINT_OPTION,
+    include: Optional[list[str]] = _INCLUDE_OPTION,
+    exclude: Optional[list[str]] = _EXCLUDE_OPTION,
+    profile: bool = _PROFILE_OPTION,
 ) -> None:
     """Purge unused items from drawings."""
     console.print(f"\nPurging: {folder}")
 
     request = BatchPurgeRequest(folder=folder, audit=do_audit, backup=backup)
-    adapter = get_acad_adapter(use_mock=mock, folder=folder)
-    result = drawing_ops.batch_purge(adapter, request)
+    result = run_batch(
+        drawing_ops.batch_purge,
+        request,
+        workers=workers,
+        use_mock=mock,
+        incremental=incremental,
+        job_id=_job_id(resume, checkpoint),
+        include=include,
+        exclude=exclude,
+        profile=profile,
+    )
     print_purge_result(result)
+    print_timings(result.timings)
 
 
 @app.command()
@@ -520,14 +958,212 @@ def drawing_info(
         ..., "--folder", "-f", help="Folder containing DWG files"
     ),
     mock: bool = typer.Option(False, "--mock", help="Use mock adapter (testing)"),
+    workers: int = _WORKERS_OPTION,
+    incremental: bool = _INCREMENTAL_OPTION,
+    resume: Optional[str] = _RESUME_OPTION,
+    checkpoint: bool = _CHECKPOINT_OPTION,
+    include: Optional[list[str]] = _INCLUDE_OPTION,
+    exclude: Optional[list[str]] = _EXCLUDE_OPTION,
+    no_cache: bool = _NO_CACHE_OPTION,
+    profile: bool = _PROFILE_OPTION,
 ) -> None:
     """Show drawing info summary for each DWG file."""
     console.print(f"\nDrawing info: {folder}")
 
     request = DrawingInfoRequest(folder=folder)
-    adapter = get_acad_adapter(use_mock=mock, folder=folder)
-    result = drawing_ops.get_drawing_info(adapter, request)
+    result = run_batch(
+        drawing_ops.get_drawing_info,
+        request,
+        workers=workers,
+        use_mock=mock,
+        cache=_cache_flag(no_cache),
+        incremental=incremental,
+        job_id=_job_id(resume, checkpoint),
+        include=include,
+        exclude=exclude,
+        profile=profile,
+    )
     print_drawing_info_result(result)
+    print_timings(result.timings)
+
+
+@app.command()
+def pipeline(
+    folder: Path = typer.Option(
+        ..., "--folder", "-f", help="Folder containing DWG files"
+    ),
+    plan: Path = typer.Option(
+        ...,
+        "--plan",
+        "-p",
+        help='JSON file with a list of stages, e.g. [{"operation": "purge"}]',
+    ),
+    backup: bool = typer.Option(True, "--backup/--no-backup", help="Create backups"),
+    mock: bool = typer.Option(False, "--mock", help="Use mock adapter (testing)"),
+    workers: int = _WORKERS_OPTION,
+    incremental: bool = _INCREMENTAL_OPTION,
+    resume: Optional[str] = _RESUME_OPTION,
+    checkpoint: bool = _CHECKPOINT_OPTION,
+    include: Optional[list[str]] = _INCLUDE_OPTION,
+    exclude: Optional[list[str]] = _EXCLUDE_OPTION,
+    profile: bool = _PROFILE_OPTION,
+) -> None:
+    """Run several operations per drawing, opening and saving each file once."""
+    data = json.loads(plan.read_text(encoding="utf-8"))
+    stages = data["stages"] if isinstance(data, dict) else data
+    request = PipelineRequest(folder=folder, stages=stages, backup=backup)
+
+    console.print(
+        f"\nRunning pipeline: {' -> '.join(s.operation for s in request.stages)}"
+    )
+    console.print(f"Folder: {folder}")
+
+    result = run_batch(
+        run_pipeline,
+        request,
+        workers=workers,
+        use_mock=mock,
+        incremental=incremental,
+        job_id=_job_id(resume, checkpoint),
+        include=include,
+        exclude=exclude,
+        profile=profile,
+    )
+    print_pipeline_result(result)
+    print_timings(result.timings)
+
+
+# ── Extraction cache ──────────────────────────────────────────────
+
+
+cache_app = typer.Typer(help="Inspect or clear the extraction cache.")
+app.add_typer(cache_app, name="cache")
+
+
+@cache_app.command("stats")
+def cache_stats() -> None:
+    """Show extraction cache size and hit rate."""
+    print_cache_stats(DrawingCache.from_settings().stats())
+
+
+@cache_app.command("clear")
+def cache_clear() -> None:
+    """Delete every cached drawing."""
+    cache = DrawingCache.from_settings()
+    cache.clear()
+    console.print(f"\nCleared extraction cache at {cache.db_path}")
+
+
+backup_app = typer.Typer(help="List, restore or prune drawing backups.")
+app.add_typer(backup_app, name="backups")
+
+
+@backup_app.command("list")
+def backups_list(
+    folder: Path = typer.Option(
+        ..., "--folder", "-f", help="Folder containing DWG files"
+    ),
+) -> None:
+    """List the backups kept under a folder, newest first."""
+    found = []
+    for store in iter_backup_stores(folder):
+        found.extend(store.backups())
+        store.close()
+    print_backups(sorted(found, key=lambda b: b.created_at, reverse=True))
+
+
+@backup_app.command("restore")
+def backups_restore(
+    drawing: Path = typer.Argument(..., help="Drawing to restore"),
+    backup_id: Optional[int] = typer.Option(
+        None, "--id", help="Backup to restore (default: the latest)"
+    ),
+) -> None:
+    """Restore a drawing from its backups (its current state is backed up first)."""
+    store = BackupStore.for_drawing(drawing)
+    try:
+        restored = store.restore(drawing, backup_id)
+    except FileNotFoundError as exc:
+        console.print(f"[red]{exc}[/red]")
+        raise typer.Exit(1) from exc
+    finally:
+        store.close()
+    console.print(
+        f"\nRestored {drawing} from backup {restored.id} "
+        f"({restored.created_at:%Y-%m-%d %H:%M:%S})"
+    )
+
+
+@backup_app.command("prune")
+def backups_prune(
+    folder: Path = typer.Option(
+        ..., "--folder", "-f", help="Folder containing DWG files"
+    ),
+    keep_last: int = typer.Option(
+        settings.backup_keep_last, "--keep-last", help="Backups to keep per drawing"
+    ),
+    keep_days: int = typer.Option(
+        settings.backup_keep_days,
+        "--keep-days",
+        help="Also keep every backup newer than this many days",
+    ),
+) -> None:
+    """Delete backups outside the retention policy."""
+    print_backup_prune(prune_backups(folder, keep_last, keep_days))
+
+
+@app.command()
+def jobs(
+    limit: int = typer.Option(20, "--limit", "-n", help="Number of jobs to show"),
+) -> None:
+    """List recent batch jobs and how far each one got."""
+    print_jobs(JobJournal.from_settings().jobs(limit))
+
+
+@app.command()
+def bench(
+    size: Optional[list[str]] = typer.Option(
+        None,
+        "--size",
+        "-s",
+        help="Project size: small, medium, large or DRAWINGSxENTITIES (repeatable)",
+    ),
+    case: Optional[list[str]] = typer.Option(
+        None, "--case", "-c", help="Only run cases matching this glob (repeatable)"
+    ),
+    repeat: int = typer.Option(3, "--repeat", "-n", help="Runs per case (best kept)"),
+    history: Path = typer.Option(
+        Path(".benchmarks/history.json"), "--history", help="JSON history file"
+    ),
+    threshold: float = typer.Option(
+        0.25, "--threshold", help="Allowed slowdown/growth over baseline (0.25 = 25%)"
+    ),
+    seed: int = typer.Option(0, "--seed", help="Synthetic project seed"),
+    update_baseline: bool = typer.Option(
+        False, "--update-baseline", help="Record this run as the new baseline"
+    ),
+    label: str = typer.Option("", "--label", help="Note stored with the run"),
+) -> None:
+    """Benchmark every operation on synthetic projects; exit 1 on regression."""
+    from autocad_batch_commander.benchmark import run_benchmarks
+
+    try:
+        report = run_benchmarks(
+            size or ["small"],
+            cases=case,
+            repeat=repeat,
+            seed=seed,
+            history=history,
+            threshold=threshold,
+            update_baseline=update_baseline,
+            label=label,
+        )
+    except ValueError as exc:
+        console.print(f"[red]{exc}[/red]")
+        raise typer.Exit(1) from exc
+    print_benchmarks(report)
+    if report.regressions:
+        raise typer.Exit(1)
 
 
 # ── Server + Version ──────────────────────────────────────────────
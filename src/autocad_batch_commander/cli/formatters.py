@@ -8,14 +8,23 @@ from rich.table import Table
 from autocad_batch_commander.models import (
     AreaExtractionResult,
     AuditResult,
+    BackupInfo,
+    BackupPruneResult,
+    BatchResult,
+    BenchmarkReport,
+    CacheStats,
     ComplianceCheckResult,
     ComplianceMeasurementResult,
     DimensionExtractionResult,
     DrawingInfoResult,
     DrawingSearchResult,
+    JobInfo,
     OperationResult,
+    OperationTimings,
+    PipelineResult,
     PlotResult,
     PurgeResult,
+    RoomExtractionResult,
     ScheduleResult,
     XrefListResult,
 )
@@ -23,11 +32,17 @@ from autocad_batch_commander.models import (
 console = Console()
 
 
+def _print_skipped(result: BatchResult) -> None:
+    if result.skipped_files:
+        console.print(f"  Files Skipped:    {len(result.skipped_files)} (unchanged)")
+
+
 def print_operation_result(result: OperationResult) -> None:
     """Print a summary of a batch operation result."""
     console.print("\n[green bold]Operation Complete![/green bold]")
     console.print("[dim]" + "━" * 40 + "[/dim]")
     console.print(f"  Files Processed:  {result.files_processed}")
+    _print_skipped(result)
     console.print(f"  Files Modified:   {result.files_modified}")
     console.print(f"  Total Changes:    {result.total_changes}")
     console.print(f"  Errors:           {len(result.errors)}")
@@ -44,6 +59,7 @@ def print_audit_result(result: AuditResult) -> None:
     console.print("\n[green bold]Audit Complete![/green bold]")
     console.print("[dim]" + "━" * 40 + "[/dim]")
     console.print(f"  Files Audited:      {result.files_processed}")
+    _print_skipped(result)
     console.print(f"  Compliant:          {result.compliant_files}")
     console.print(f"  Non-compliant:      {result.non_compliant_files}")
     console.print(f"  Total Findings:     {result.total_findings}")
@@ -122,6 +138,7 @@ def print_dimension_result(result: DimensionExtractionResult) -> None:
     console.print("\n[green bold]Dimension Extraction Complete![/green bold]")
     console.print("[dim]" + "━" * 40 + "[/dim]")
     console.print(f"  Files Processed:    {result.files_processed}")
+    _print_skipped(result)
     console.print(f"  Total Dimensions:   {result.total_dimensions}")
     console.print("[dim]" + "━" * 40 + "[/dim]")
 
@@ -151,6 +168,7 @@ def print_area_result(result: AreaExtractionResult) -> None:
     console.print("\n[green bold]Area Extraction Complete![/green bold]")
     console.print("[dim]" + "━" * 40 + "[/dim]")
     console.print(f"  Files Processed:  {result.files_processed}")
+    _print_skipped(result)
     console.print(f"  Total Areas:      {result.total_areas}")
     console.print("[dim]" + "━" * 40 + "[/dim]")
 
@@ -175,11 +193,44 @@ def print_area_result(result: AreaExtractionResult) -> None:
         console.print(table)
 
 
+def print_room_result(result: RoomExtractionResult) -> None:
+    """Print room recognition results."""
+    console.print("\n[green bold]Room Recognition Complete![/green bold]")
+    console.print("[dim]" + "━" * 40 + "[/dim]")
+    console.print(f"  Files Processed:  {result.files_processed}")
+    _print_skipped(result)
+    console.print(f"  Total Rooms:      {result.total_rooms}")
+    console.print(f"  Unplaced Labels:  {result.unplaced_labels}")
+    console.print("[dim]" + "━" * 40 + "[/dim]")
+
+    if result.rooms:
+        table = Table(title="Recognised Rooms", show_lines=False)
+        table.add_column("File", style="cyan", max_width=30)
+        table.add_column("Handle")
+        table.add_column("Room Type", style="bold")
+        table.add_column("Label")
+        table.add_column("Area (sq mm)", justify="right")
+        table.add_column("W × L (mm)", justify="right")
+
+        for room in result.rooms:
+            table.add_row(
+                room.file.split("/")[-1],
+                room.handle,
+                room.room_type,
+                room.label,
+                f"{room.area:,.0f}",
+                f"{room.width:,.0f} × {room.length:,.0f}",
+            )
+
+        console.print(table)
+
+
 def print_measurement_result(result: ComplianceMeasurementResult) -> None:
     """Print compliance measurement results."""
     console.print("\n[green bold]Compliance Measurement Complete![/green bold]")
     console.print("[dim]" + "━" * 40 + "[/dim]")
     console.print(f"  Files Processed:  {result.files_processed}")
+    _print_skipped(result)
     console.print(f"  Total Checks:     {result.total_checks}")
     console.print(f"  Pass:             {result.pass_count}")
     console.print(f"  Fail:             {result.fail_count}")
@@ -200,8 +251,8 @@ def print_measurement_result(result: ComplianceMeasurementResult) -> None:
                 f.file.split("/")[-1],
                 f.rule_id,
                 f.parameter,
-                f"{f.measured_value:.0f} {f.unit}",
-                f"{f.threshold:.0f} {f.unit}",
+                f"{f.measured_value:,.6g} {f.unit}",
+                f"{f.threshold:,.6g} {f.unit}",
                 f"[{status_style}]{f.status.upper()}[/{status_style}]",
             )
 
@@ -214,6 +265,7 @@ def print_schedule_result(result: ScheduleResult) -> None:
     console.print("[dim]" + "━" * 40 + "[/dim]")
     console.print(f"  Block Name:       {result.block_name}")
     console.print(f"  Files Processed:  {result.files_processed}")
+    _print_skipped(result)
     console.print(f"  Total Entries:    {result.total_entries}")
     console.print("[dim]" + "━" * 40 + "[/dim]")
 
@@ -237,6 +289,7 @@ def print_xref_result(result: XrefListResult) -> None:
     console.print(f"\n[green bold]XREF {result.action.title()} Complete![/green bold]")
     console.print("[dim]" + "━" * 40 + "[/dim]")
     console.print(f"  Files Processed:  {result.files_processed}")
+    _print_skipped(result)
     if result.action == "list":
         console.print(f"  Total XREFs:      {result.total_xrefs}")
     else:
@@ -271,6 +324,7 @@ def print_search_result(result: DrawingSearchResult) -> None:
     console.print("[dim]" + "━" * 40 + "[/dim]")
     console.print(f"  Search Text:      {result.search_text}")
     console.print(f"  Files Processed:  {result.files_processed}")
+    _print_skipped(result)
     console.print(f"  Total Matches:    {result.total_matches}")
     console.print("[dim]" + "━" * 40 + "[/dim]")
 
@@ -297,6 +351,7 @@ def print_plot_result(result: PlotResult) -> None:
     console.print("\n[green bold]Batch Plot Complete![/green bold]")
     console.print("[dim]" + "━" * 40 + "[/dim]")
     console.print(f"  Files Processed:  {result.files_processed}")
+    _print_skipped(result)
     console.print(f"  Layouts Plotted:  {result.files_plotted}")
     console.print("[dim]" + "━" * 40 + "[/dim]")
 
@@ -311,17 +366,52 @@ def print_purge_result(result: PurgeResult) -> None:
     console.print("\n[green bold]Batch Purge Complete![/green bold]")
     console.print("[dim]" + "━" * 40 + "[/dim]")
     console.print(f"  Files Processed:  {result.files_processed}")
+    _print_skipped(result)
     console.print(f"  Files Purged:     {result.files_purged}")
     console.print(f"  Items Purged:     {result.total_items_purged}")
     console.print(f"  Audit Issues:     {len(result.audit_issues)}")
     console.print("[dim]" + "━" * 40 + "[/dim]")
 
 
+def print_pipeline_result(result: PipelineResult) -> None:
+    """Print a single-open pipeline result with one row per stage."""
+    console.print("\n[green bold]Pipeline Complete![/green bold]")
+    console.print("[dim]" + "━" * 40 + "[/dim]")
+    console.print(f"  Files Processed:  {result.files_processed}")
+    _print_skipped(result)
+    console.print(f"  Files Modified:   {result.files_modified}")
+    console.print(f"  Total Changes:    {result.total_changes}")
+    console.print(f"  Errors:           {len(result.errors)}")
+    console.print("[dim]" + "━" * 40 + "[/dim]")
+
+    if result.stages:
+        table = Table(title="Stages", show_lines=False)
+        table.add_column("#", justify="right")
+        table.add_column("Operation", style="cyan")
+        table.add_column("Files Modified", justify="right")
+        table.add_column("Changes", justify="right")
+
+        for i, stage in enumerate(result.stages, 1):
+            table.add_row(
+                str(i),
+                stage.operation,
+                str(stage.files_modified),
+                str(stage.total_changes),
+            )
+        console.print(table)
+
+    if result.errors:
+        console.print("\n[yellow bold]Errors:[/yellow bold]")
+        for err in result.errors:
+            console.print(f"  {err.file}: {err.error}")
+
+
 def print_drawing_info_result(result: DrawingInfoResult) -> None:
     """Print drawing info summary results."""
     console.print("\n[green bold]Drawing Info Summary[/green bold]")
     console.print("[dim]" + "━" * 40 + "[/dim]")
     console.print(f"  Files Processed:  {result.files_processed}")
+    _print_skipped(result)
     console.print("[dim]" + "━" * 40 + "[/dim]")
 
     if result.details:
@@ -348,3 +438,181 @@ def print_drawing_info_result(result: DrawingInfoResult) -> None:
             )
 
         console.print(table)
+
+
+def print_cache_stats(stats: CacheStats) -> None:
+    """Print extraction cache usage."""
+    lookups = stats.hits + stats.misses
+    hit_rate = f"{stats.hits / lookups:.0%}" if lookups else "-"
+    console.print("\n[green bold]Extraction Cache[/green bold]")
+    console.print("[dim]" + "━" * 40 + "[/dim]")
+    console.print(f"  Location:         {stats.path}")
+    console.print(f"  Drawings:         {stats.drawings}")
+    console.print(
+        f"  Size:             {stats.size_bytes / 2**20:.1f} MB"
+        f" / {stats.max_bytes / 2**20:.0f} MB"
+    )
+    console.print(f"  Hits / Misses:    {stats.hits} / {stats.misses} ({hit_rate})")
+    console.print(f"  Evictions:        {stats.evictions}")
+    console.print("[dim]" + "━" * 40 + "[/dim]")
+
+
+def print_jobs(jobs: list[JobInfo]) -> None:
+    """Print recent checkpointed batch jobs."""
+    if not jobs:
+        console.print("\nNo batch jobs recorded yet.")
+        return
+
+    table = Table(title="Batch Jobs", show_lines=False)
+    table.add_column("Job ID", style="cyan")
+    table.add_column("Operation")
+    table.add_column("Folder", max_width=40)
+    table.add_column("Done", justify="right")
+    table.add_column("Status")
+    table.add_column("Last Update")
+
+    for job in jobs:
+        style = "green" if job.status == "complete" else "yellow"
+        table.add_row(
+            job.job_id,
+            job.operation.rsplit(".", 1)[-1],
+            job.folder,
+            str(job.files_done),
+            f"[{style}]{job.status}[/{style}]",
+            job.updated_at.strftime("%Y-%m-%d %H:%M"),
+        )
+
+    console.print(table)
+
+
+def print_backups(backups: list[BackupInfo]) -> None:
+    """Print cataloged drawing backups, newest first."""
+    if not backups:
+        console.print("\nNo backups found.")
+        return
+
+    table = Table(title="Drawing Backups", show_lines=False)
+    table.add_column("ID", justify="right", style="cyan")
+    table.add_column("File", max_width=50)
+    table.add_column("Taken")
+    table.add_column("Size", justify="right")
+    table.add_column("SHA-256")
+
+    for backup in backups:
+        table.add_row(
+            str(backup.id),
+            backup.file,
+            backup.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+            f"{backup.size_bytes / 2**20:.1f} MB",
+            backup.sha256[:12],
+        )
+
+    console.print(table)
+
+
+def print_backup_prune(result: BackupPruneResult) -> None:
+    """Print what a backup prune removed."""
+    console.print("\n[green bold]Backup Prune Complete[/green bold]")
+    console.print("[dim]" + "━" * 40 + "[/dim]")
+    console.print(f"  Stores Scanned:   {result.stores}")
+    console.print(f"  Backups Removed:  {result.backups_removed}")
+    console.print(f"  Objects Deleted:  {result.objects_removed}")
+    console.print(f"  Space Freed:      {result.bytes_freed / 2**20:.1f} MB")
+    console.print("[dim]" + "━" * 40 + "[/dim]")
+
+
+def print_benchmarks(report: BenchmarkReport) -> None:
+    """Print benchmark measurements and any regressions against the baseline."""
+    table = Table(title="Benchmarks", show_lines=False)
+    table.add_column("Size")
+    table.add_column("Case", style="cyan")
+    table.add_column("Wall", justify="right")
+    table.add_column("Peak RSS", justify="right")
+    table.add_column("Adapter Calls", justify="right")
+
+    regressed = {(r.size, r.case) for r in report.regressions}
+    for m in report.measurements:
+        style = "red" if (m.size, m.case) in regressed else ""
+        table.add_row(
+            m.size,
+            f"[{style}]{m.case}[/{style}]" if style else m.case,
+            f"{m.wall_seconds * 1000:.1f} ms",
+            f"{m.peak_rss_mb:.0f} MB" if m.peak_rss_mb is not None else "-",
+            str(sum(m.adapter_calls.values())) if m.adapter_calls else "-",
+        )
+
+    console.print(table)
+    if report.history:
+        console.print(f"  History:          {report.history}")
+        console.print(f"  Baselines Set:    {report.baselines_updated}")
+    if not report.regressions:
+        console.print("\n[green]No regressions.[/green]")
+        return
+    console.print(f"\n[red bold]{len(report.regressions)} regression(s):[/red bold]")
+    for r in report.regressions:
+        console.print(
+            f"  [red]{r.size}/{r.case}[/red] {r.metric}: {r.baseline:g} → {r.current:g}"
+        )
+
+
+def print_timings(timings: OperationTimings | None) -> None:
+    """Print where a profiled run spent its time (no-op if not profiled)."""
+    if timings is None:
+        return
+    other = (
+        timings.wall_seconds - timings.adapter_seconds - sum(timings.sections.values())
+    )
+    wall = timings.wall_seconds or 1.0
+
+    console.print("\n[green bold]Profile[/green bold]")
+    console.print("[dim]" + "━" * 40 + "[/dim]")
+    console.print(f"  Wall Time:        {timings.wall_seconds:.3f}s")
+    console.print(
+        f"  CAD Calls:        {timings.adapter_seconds:.3f}s"
+        f" ({timings.adapter_seconds / wall:.0%})"
+    )
+    for name, seconds in sorted(timings.sections.items()):
+        label = f"{name.replace('_', ' ').title()}:"
+        console.print(f"  {label:<18}{seconds:.3f}s ({seconds / wall:.0%})")
+    console.print(
+        f"  Other (Python):   {max(other, 0.0):.3f}s ({max(other, 0.0) / wall:.0%})"
+    )
+    console.print("[dim]" + "━" * 40 + "[/dim]")
+
+    table = Table(title="CAD Calls", show_lines=False)
+    table.add_column("Method", style="cyan")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total", justify="right")
+    table.add_column("Mean", justify="right")
+    table.add_column("Max", justify="right")
+    table.add_column("Items", justify="right")
+    table.add_column("Bytes", justify="right")
+
+    for m in timings.methods:
+        # Pipeline stages get their own rows.
+        name = (
+            m.method
+            if m.operation == timings.operation
+            else f"{m.operation}: {m.method}"
+        )
+        calls = (
+            f"{m.calls} [red]({m.errors} failed)[/red]" if m.errors else str(m.calls)
+        )
+        table.add_row(
+            name,
+            calls,
+            f"{m.seconds * 1000:.1f} ms",
+            f"{m.seconds / m.calls * 1000:.2f} ms" if m.calls else "-",
+            f"{m.max_seconds * 1000:.1f} ms",
+            str(m.items),
+            f"{m.bytes / 1024:.1f} KB" if m.bytes else "-",
+        )
+    console.print(table)
+
+    slowest = sorted(timings.files, key=lambda f: -f.adapter_seconds)[:5]
+    if slowest:
+        console.print("  Slowest drawings (CAD time):")
+        for f in slowest:
+            console.print(
+                f"    {f.adapter_seconds * 1000:8.1f} ms  {f.calls:5} calls  {f.file}"
+            )
@@ -43,7 +43,23 @@ class Settings(BaseSettings):
     standards_dir: Path = _PROJECT_ROOT / "standards"
     knowledge_dir: Path = _PROJECT_ROOT / "knowledge"
     use_mock: bool = False
-    cad_engine: str = "auto"  # auto | autocad | bricscad | zwcad | mock
+    cad_engine: str = "auto"  # auto | autocad | bricscad | zwcad | dxf | mock
+    workers: int = 1  # worker processes for batch operations (1 = serial)
+    mock_open_delay: float = 0.0  # simulated open_drawing latency (seconds)
+    mock_synthetic_entities: int = 0  # >0: seeded synthetic mock drawings this big
+    mock_synthetic_seed: int = 0
+    discovery_workers: int = 8  # threads listing directories in parallel
+    include_patterns: list[str] = []  # globs a drawing must match to be processed
+    exclude_patterns: list[str] = []  # globs for drawings/directories to skip
+    include_dxf: bool = False  # CAD applications: process .dxf files as well as .dwg
+    backup_keep_last: int = 10  # backups always kept per drawing by `backups prune`
+    backup_keep_days: int = 30  # ...plus any newer than this
+    backup_prefetch: int = 4  # drawings staged ahead of the one being edited
+    backup_io_workers: int = 2  # threads staging drawing backups ahead
+    cache_enabled: bool = True  # serve read-only getters from the extraction cache
+    cache_dir: Path = Path.home() / ".cache" / "autocad-batch-commander"
+    cache_max_mb: int = 512
+    profile: bool = False  # time every adapter call into result ``timings``
 
     # AI Chat settings
     openai_api_key: str = ""
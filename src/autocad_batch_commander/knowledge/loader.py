@@ -5,6 +5,10 @@ from __future__ import annotations
 from pathlib import Path
 
 from autocad_batch_commander.config import settings
+from autocad_batch_commander.knowledge.search import knowledge_index
+
+# Files scoring below this fraction of the best match are left out.
+RELATIVE_CUTOFF = 0.5
 
 
 def _knowledge_dir() -> Path:
@@ -20,57 +24,25 @@ def load_index() -> str:
     return index_path.read_text(encoding="utf-8")
 
 
-def find_relevant_files(query: str) -> list[Path]:
+def find_relevant_files(query: str, limit: int = 5) -> list[Path]:
     """Find knowledge base files relevant to a query.
 
-    Scans the topic index for keyword matches and returns paths to
-    the matching Markdown files. Uses simple keyword overlap — no
-    embeddings or vector search needed for a small corpus.
+    Ranks files with the BM25 index of :mod:`.search` and returns up to
+    *limit* paths, best first, dropping those scoring under
+    :data:`RELATIVE_CUTOFF` of the best match. Falls back to every file
+    when no query term occurs in the knowledge base.
     """
-    index_text = load_index()
-    query_lower = query.lower()
-    query_words = set(query_lower.split())
-
-    qa_dir = _knowledge_dir() / "qa"
-    matched: list[Path] = []
-
-    # Parse the quick-reference section for keyword → file mappings
-    for line in index_text.splitlines():
-        line_stripped = line.strip()
-
-        # Match quick reference lines: - **keyword** → `file.md`
-        if line_stripped.startswith("- **") and "→" in line_stripped:
-            keyword_part = line_stripped.split("**")[1].lower()
-            keywords = {w.strip() for w in keyword_part.replace("/", " ").split()}
-
-            if keywords & query_words:
-                # Extract file paths from the line
-                for segment in line_stripped.split("`"):
-                    if segment.endswith(".md"):
-                        candidate = qa_dir / segment
-                        if candidate.exists() and candidate not in matched:
-                            matched.append(candidate)
-
-        # Match table rows: | `ubbl/03-spatial-requirements.md` | topics... |
-        if "|" in line_stripped and ".md" in line_stripped:
-            parts = line_stripped.split("|")
-            for part in parts:
-                part = part.strip()
-                # Check if any query word appears in the topic column
-                if any(w in part.lower() for w in query_words if len(w) > 2):
-                    # Extract file path from any backtick segment in the row
-                    for segment in line_stripped.split("`"):
-                        if segment.endswith(".md"):
-                            candidate = qa_dir / segment
-                            if candidate.exists() and candidate not in matched:
-                                matched.append(candidate)
+    ranked = knowledge_index().search(query)
+    if ranked:
+        best = ranked[0][0]
+        return [
+            path for score, path in ranked[:limit] if score >= best * RELATIVE_CUTOFF
+        ]
 
     # Fallback: if no matches found, load all files
-    if not matched:
-        matched = sorted(qa_dir.rglob("*.md"))
-        matched = [f for f in matched if f.name != "_index.md"]
-
-    return matched
+    qa_dir = _knowledge_dir() / "qa"
+    matched = sorted(qa_dir.rglob("*.md"))
+    return [f for f in matched if f.name != "_index.md"]
 
 
 def load_files(paths: list[Path]) -> dict[str, str]:
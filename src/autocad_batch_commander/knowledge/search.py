@@ -0,0 +1,207 @@
+"""BM25 search over the regulation knowledge base.
+
+Every ``qa/**/*.md`` file is tokenised once into an inverted index: words
+are lower-cased, lightly stemmed ("routes", "route" → ``rout``) and
+Malay terms folded onto their English equivalents ("bomba", "kebakaran"
+→ ``fir``), so a query in either language finds the same files. The
+topics listed for a file in ``qa/_index.md`` count :data:`TOPIC_WEIGHT`
+times, as the curated description of what the file is about.
+
+Postings store each term's precomputed BM25 weight per file, so a query
+is a dictionary lookup and a few additions per query term. The index is
+built on first use and kept in memory; each search stats the Markdown
+files and rebuilds it when a file was added, removed or modified, so
+edits show up without a restart.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from autocad_batch_commander.config import settings
+
+# BM25 term-frequency saturation and document-length normalisation.
+K1 = 1.5
+B = 0.75
+
+# How many times a topic listed in ``_index.md`` counts against body text.
+TOPIC_WEIGHT = 5
+
+# Equivalent terms, the first of each group being the one they fold to.
+SYNONYMS: tuple[tuple[str, ...], ...] = (
+    ("fire", "bomba", "kebakaran"),
+    ("building", "bangunan"),
+    ("staircase", "stair", "stairs", "tangga"),
+    ("room", "bilik", "ruang"),
+    ("corridor", "koridor"),
+    ("door", "pintu"),
+    ("window", "tingkap"),
+    ("lift", "elevator", "lif"),
+    ("toilet", "tandas"),
+    ("kitchen", "dapur"),
+    ("parking", "parkir"),
+    ("exit", "keluar"),
+    ("height", "tinggi", "ketinggian"),
+    ("width", "lebar"),
+    ("area", "luas", "keluasan"),
+    ("approval", "kelulusan"),
+    ("plan", "pelan"),
+    ("ventilation", "pengudaraan"),
+    ("lighting", "pencahayaan"),
+    ("drainage", "saliran", "perparitan"),
+    ("sewerage", "pembetungan"),
+    ("sprinkler", "pemercik"),
+    ("alarm", "penggera"),
+    ("roof", "bumbung"),
+    ("wall", "dinding"),
+    ("floor", "lantai"),
+    ("storey", "tingkat"),
+    ("certificate", "sijil"),
+    ("electrical", "elektrik"),
+    ("housing", "perumahan"),
+    ("accessibility", "accessible", "oku", "disabled"),
+)
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from how in is it of on or that the this "
+    "to what when where which with".split()
+)
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def _stem(word: str) -> str:
+    """Strip common English inflections so word forms share a term."""
+    if word.isdigit() or len(word) <= 3:
+        return word
+    if word.endswith("ies") and len(word) > 4:
+        word = word[:-3] + "y"
+    elif word.endswith("ing") and len(word) > 5:
+        word = word[:-3]
+    elif word.endswith("ed") and len(word) > 4:
+        word = word[:-2]
+    elif word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        word = word[:-1]
+    return word[:-1] if word.endswith("e") and len(word) > 3 else word
+
+
+_CANONICAL = {_stem(word): _stem(group[0]) for group in SYNONYMS for word in group[1:]}
+
+
+def tokenize(text: str) -> list[str]:
+    """Return the index terms of *text*."""
+    terms = []
+    for word in _TOKEN.findall(text.lower()):
+        if word in STOPWORDS or (len(word) < 2 and not word.isdigit()):
+            continue
+        term = _stem(word)
+        terms.append(_CANONICAL.get(term, term))
+    return terms
+
+
+def _stamp(qa_dir: Path) -> tuple[int, int, int]:
+    """Return the file count, newest mtime and total size of *qa_dir*'s files."""
+    stats = [path.stat() for path in qa_dir.rglob("*.md")]
+    return (
+        len(stats),
+        max((st.st_mtime_ns for st in stats), default=0),
+        sum(st.st_size for st in stats),
+    )
+
+
+def _index_topics(qa_dir: Path) -> dict[Path, list[str]]:
+    """Return the topic text ``_index.md`` lists for each file."""
+    index_path = qa_dir / "_index.md"
+    if not index_path.exists():
+        return {}
+    topics: dict[Path, list[str]] = {}
+    for line in index_path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line.startswith("- **") and "→" in line:
+            text = line.split("**")[1]  # - **keyword** → `file.md`, ...
+        elif line.startswith("|") and ".md`" in line:
+            text = line  # | `file.md` | topics |
+        else:
+            continue
+        for segment in line.split("`")[1::2]:
+            if segment.endswith(".md"):
+                topics.setdefault(qa_dir / segment, []).append(text)
+    return topics
+
+
+@dataclass
+class KnowledgeIndex:
+    """Inverted index with BM25 weights over the knowledge base files."""
+
+    root: Path
+    stamp: tuple[int, int, int] = (0, 0, 0)  # see _stamp()
+    files: list[Path] = field(default_factory=list)
+    postings: dict[str, list[tuple[int, float]]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, qa_dir: Path) -> KnowledgeIndex:
+        """Tokenise and index every Markdown file under *qa_dir*."""
+        index = cls(root=qa_dir, stamp=_stamp(qa_dir))
+        topics = _index_topics(qa_dir)
+        counts: list[Counter[str]] = []
+        for path in sorted(qa_dir.rglob("*.md")):
+            if path.name == "_index.md":
+                continue
+            terms = Counter(tokenize(path.read_text(encoding="utf-8")))
+            for text in topics.get(path, ()):
+                for term in tokenize(text):
+                    terms[term] += TOPIC_WEIGHT
+            index.files.append(path)
+            counts.append(terms)
+
+        lengths = [sum(c.values()) for c in counts]
+        avg_length = sum(lengths) / len(lengths) if lengths else 0.0
+        frequency = Counter(term for c in counts for term in c)
+        n = len(counts)
+        for doc, (terms, length) in enumerate(zip(counts, lengths)):
+            norm = K1 * (1 - B + B * length / avg_length)
+            for term, tf in terms.items():
+                df = frequency[term]
+                idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+                weight = idf * tf * (K1 + 1) / (tf + norm)
+                index.postings.setdefault(term, []).append((doc, weight))
+        return index
+
+    def search(self, query: str) -> list[tuple[float, Path]]:
+        """Return ``(score, path)`` of files matching *query*, best first."""
+        scores: dict[int, float] = {}
+        for term in set(tokenize(query)):
+            for doc, weight in self.postings.get(term, ()):
+                scores[doc] = scores.get(doc, 0.0) + weight
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [(score, self.files[doc]) for doc, score in ranked]
+
+
+_lock = threading.Lock()
+_index: KnowledgeIndex | None = None
+
+
+def knowledge_index() -> KnowledgeIndex:
+    """Return the index of ``settings.knowledge_dir``, rebuilt if files changed."""
+    global _index
+    qa_dir = settings.knowledge_dir / "qa"
+    stamp = _stamp(qa_dir)
+    index = _index
+    if index is None or (index.root, index.stamp) != (qa_dir, stamp):
+        with _lock:
+            if _index is None or (_index.root, _index.stamp) != (qa_dir, stamp):
+                _index = KnowledgeIndex.build(qa_dir)
+            index = _index
+    return index
+
+
+def clear_index() -> None:
+    """Drop the index so the next search rebuilds it regardless."""
+    global _index
+    with _lock:
+        _index = None
@@ -6,7 +6,6 @@ from pathlib import Path
 
 from mcp.server.fastmcp import FastMCP
 
-from autocad_batch_commander.acad.factory import get_acad_adapter
 from autocad_batch_commander.knowledge.loader import query_knowledge_base
 from autocad_batch_commander.models import (
     AreaExtractionRequest,
@@ -20,7 +19,10 @@ from autocad_batch_commander.models import (
     DrawingSearchRequest,
     LayerRenameRequest,
     LayerStandardizeRequest,
+    PipelineRequest,
+    RoomExtractionRequest,
     ScheduleExtractionRequest,
+    TermReplaceRequest,
     TextReplaceRequest,
     TitleBlockUpdateRequest,
     XrefManageRequest,
@@ -40,16 +42,23 @@ from autocad_batch_commander.operations.drawing_ops import (
     drawing_search,
     get_drawing_info,
 )
+from autocad_batch_commander.operations.executor import run_batch
 from autocad_batch_commander.operations.geometry_ops import (
     extract_areas,
     extract_dimensions,
     measure_compliance,
 )
+from autocad_batch_commander.operations.journal import new_job_id
 from autocad_batch_commander.operations.layer_ops import (
     batch_rename_layer,
     batch_standardize_layers,
 )
-from autocad_batch_commander.operations.text_ops import batch_find_replace
+from autocad_batch_commander.operations.pipeline_ops import run_pipeline
+from autocad_batch_commander.operations.room_ops import extract_rooms
+from autocad_batch_commander.operations.text_ops import (
+    batch_find_replace,
+    batch_replace_terms,
+)
 from autocad_batch_commander.operations.xref_ops import manage_xrefs
 
 mcp = FastMCP("autocad-batch-commander")
@@ -66,6 +75,8 @@ def batch_change_text(
     layers: list[str] | None = None,
     case_sensitive: bool = False,
     backup: bool = True,
+    resume_job_id: str | None = None,
+    checkpoint: bool = False,
 ) -> dict:
     """Find and replace text across multiple AutoCAD drawings.
 
@@ -76,8 +87,10 @@ def batch_change_text(
         layers: Optional list of layer names to restrict the search.
         case_sensitive: Whether the search is case-sensitive.
         backup: Create backup before modifying.
+        resume_job_id: job_id returned by an interrupted run, to continue it.
+        checkpoint: Journal each drawing so an interrupted run can be
+            resumed; the job_id to resume with is returned.
     """
-    adapter = get_acad_adapter()
     request = TextReplaceRequest(
         folder=Path(folder_path),
         find_text=find_text,
@@ -86,8 +99,52 @@ def batch_change_text(
         case_sensitive=case_sensitive,
         backup=backup,
     )
-    result = batch_find_replace(adapter, request)
-    return result.model_dump()
+    job_id = resume_job_id or (new_job_id() if checkpoint else None)
+    result = run_batch(batch_find_replace, request, job_id=job_id)
+    return {"job_id": job_id, **result.model_dump()}
+
+
+@mcp.tool()
+def batch_replace_terms_tool(
+    folder_path: str,
+    mappings: dict[str, str],
+    layers: list[str] | None = None,
+    case_sensitive: bool = False,
+    whole_word: bool = False,
+    regex: bool = False,
+    backup: bool = True,
+    resume_job_id: str | None = None,
+    checkpoint: bool = False,
+) -> dict:
+    """Replace many terms at once (spec codes, room names…) across drawings.
+
+    All terms are applied in a single pass over each text entity; where
+    terms overlap, the longest match wins.
+
+    Args:
+        folder_path: Path to folder containing DWG files.
+        mappings: Table of text to find → text to replace it with.
+        layers: Optional list of layer names to restrict the search.
+        case_sensitive: Whether the search is case-sensitive.
+        whole_word: Only match whole words.
+        regex: Treat the terms as regular expressions.
+        backup: Create backup before modifying.
+        resume_job_id: job_id returned by an interrupted run, to continue it.
+        checkpoint: Journal each drawing so an interrupted run can be
+            resumed; the job_id to resume with is returned.
+    """
+    request = TermReplaceRequest(
+        folder=Path(folder_path),
+        mappings=mappings,
+        layers=layers,
+        case_sensitive=case_sensitive,
+        whole_word=whole_word,
+        regex=regex,
+        backup=backup,
+    )
+    job_id = resume_job_id or (new_job_id() if checkpoint else None)
+    result = run_batch(batch_replace_terms, request, job_id=job_id)
+    return {"job_id": job_id, **result.model_dump()}
 
 
 @mcp.tool()
@@ -96,6 +153,8 @@ def batch_rename_layer_tool(
     old_layer_name: str,
     new_layer_name: str,
     backup: bool = True,
+    resume_job_id: str | None = None,
+    checkpoint: bool = False,
 ) -> dict:
     """Rename a layer across multiple AutoCAD drawings.
 
@@ -104,16 +163,19 @@ def batch_rename_layer_tool(
         old_layer_name: Current layer name.
         new_layer_name: New layer name.
         backup: Create backup before modifying.
+        resume_job_id: job_id returned by an interrupted run, to continue it.
+        checkpoint: Journal each drawing so an interrupted run can be
+            resumed; the job_id to resume with is returned.
     """
-    adapter = get_acad_adapter()
     request = LayerRenameRequest(
         folder=Path(folder_path),
         old_name=old_layer_name,
         new_name=new_layer_name,
         backup=backup,
     )
-    result = batch_rename_layer(adapter, request)
-    return result.model_dump()
+    job_id = resume_job_id or (new_job_id() if checkpoint else None)
+    result = run_batch(batch_rename_layer, request, job_id=job_id)
+    return {"job_id": job_id, **result.model_dump()}
 
 
 @mcp.tool()
@@ -122,6 +184,8 @@ def standardize_layers_tool(
     standard: str = "AIA",
     report_only: bool = False,
     backup: bool = True,
+    resume_job_id: str | None = None,
+    checkpoint: bool = False,
 ) -> dict:
     """Standardize layer names to a naming convention (AIA, BS1192, UBBL).
 
@@ -130,33 +194,41 @@ def standardize_layers_tool(
         standard: Naming standard to apply (AIA, BS1192, UBBL).
         report_only: If true, only report changes without applying.
         backup: Create backup before modifying.
+        resume_job_id: job_id returned by an interrupted run, to continue it.
+        checkpoint: Journal each drawing so an interrupted run can be
+            resumed; the job_id to resume with is returned.
     """
-    adapter = get_acad_adapter()
     request = LayerStandardizeRequest(
         folder=Path(folder_path),
         standard=standard,
         report_only=report_only,
         backup=backup,
     )
-    result = batch_standardize_layers(adapter, request)
-    return result.model_dump()
+    job_id = resume_job_id or (new_job_id() if checkpoint else None)
+    result = run_batch(batch_standardize_layers, request, job_id=job_id)
+    return {"job_id": job_id, **result.model_dump()}
 
 
 @mcp.tool()
 def audit_drawings_tool(
     folder_path: str,
     standard: str = "AIA",
+    resume_job_id: str | None = None,
+    checkpoint: bool = False,
 ) -> dict:
     """Audit drawings for layer compliance against a naming standard.
 
     Args:
         folder_path: Path to folder containing DWG files.
         standard: Naming standard to check against (AIA, BS1192, UBBL).
+        resume_job_id: job_id returned by an interrupted run, to continue it.
+        checkpoint: Journal each drawing so an interrupted run can be
+            resumed; the job_id to resume with is returned.
     """
-    adapter = get_acad_adapter()
     request = AuditRequest(folder=Path(folder_path), standard=standard)
-    result = audit_drawings(adapter, request)
-    return result.model_dump()
+    job_id = resume_job_id or (new_job_id() if checkpoint else None)
+    result = run_batch(audit_drawings, request, job_id=job_id)
+    return {"job_id": job_id, **result.model_dump()}
 
 
 @mcp.tool()
@@ -215,6 +287,8 @@ def extract_dimensions_tool(
     folder_path: str,
     layers: list[str] | None = None,
     dimension_types: list[str] | None = None,
+    resume_job_id: str | None = None,
+    checkpoint: bool = False,
 ) -> dict:
     """Extract all dimension entities from AutoCAD drawings.
 
@@ -222,13 +296,16 @@ def extract_dimensions_tool(
         folder_path: Path to folder containing DWG files.
         layers: Optional layer name filter.
         dimension_types: Optional filter: linear, aligned, angular, radial, diametric.
+        resume_job_id: job_id returned by an interrupted run, to continue it.
+        checkpoint: Journal each drawing so an interrupted run can be
+            resumed; the job_id to resume with is returned.
     """
-    adapter = get_acad_adapter()
     request = DimensionExtractionRequest(
         folder=Path(folder_path), layers=layers, dimension_types=dimension_types
     )
-    result = extract_dimensions(adapter, request)
-    return result.model_dump()
+    job_id = resume_job_id or (new_job_id() if checkpoint else None)
+    result = run_batch(extract_dimensions, request, job_id=job_id)
+    return {"job_id": job_id, **result.model_dump()}
 
 
 @mcp.tool()
@@ -237,6 +314,8 @@ def extract_areas_tool(
     layers: list[str] | None = None,
     min_area: float | None = None,
     max_area: float | None = None,
+    resume_job_id: str | None = None,
+    checkpoint: bool = False,
 ) -> dict:
     """Extract areas from closed polylines in AutoCAD drawings.
 
@@ -245,13 +324,51 @@ def extract_areas_tool(
         layers: Optional layer name filter.
         min_area: Minimum area filter (sq mm).
         max_area: Maximum area filter (sq mm).
+        resume_job_id: job_id returned by an interrupted run, to continue it.
+        checkpoint: Journal each drawing so an interrupted run can be
+            resumed; the job_id to resume with is returned.
     """
-    adapter = get_acad_adapter()
     request = AreaExtractionRequest(
         folder=Path(folder_path), layers=layers, min_area=min_area, max_area=max_area
     )
-    result = extract_areas(adapter, request)
-    return result.model_dump()
+    job_id = resume_job_id or (new_job_id() if checkpoint else None)
+    result = run_batch(extract_areas, request, job_id=job_id)
+    return {"job_id": job_id, **result.model_dump()}
+
+
+@mcp.tool()
+def extract_rooms_tool(
+    folder_path: str,
+    layers: list[str] | None = None,
+    label_layers: list[str] | None = None,
+    vocabulary: dict[str, list[str]] | None = None,
+    resume_job_id: str | None = None,
+    checkpoint: bool = False,
+) -> dict:
+    """Recognise rooms from labels inside closed polylines.
+
+    Each room label ("MASTER BEDROOM", "DAPUR", ...) is paired with the
+    innermost closed polyline containing it, giving the room's type, area
+    and bounding-box width and length.
+
+    Args:
+        folder_path: Path to folder containing DWG files.
+        layers: Optional layer filter for room outlines.
+        label_layers: Optional layer filter for room labels.
+        vocabulary: Extra labels per room type, e.g. {"kitchen": ["KIT"]}.
+        resume_job_id: job_id returned by an interrupted run, to continue it.
+        checkpoint: Journal each drawing so an interrupted run can be
+            resumed; the job_id to resume with is returned.
+    """
+    request = RoomExtractionRequest(
+        folder=Path(folder_path),
+        layers=layers,
+        label_layers=label_layers,
+        vocabulary=vocabulary,
+    )
+    job_id = resume_job_id or (new_job_id() if checkpoint else None)
+    result = run_batch(extract_rooms, request, job_id=job_id)
+    return {"job_id": job_id, **result.model_dump()}
 
 
 @mcp.tool()
@@ -259,26 +376,34 @@ def measure_compliance_tool(
     folder_path: str,
     rule_sets: list[str] | None = None,
     building_type: str | None = None,
+    drawing_units: str = "mm",
+    resume_job_id: str | None = None,
+    checkpoint: bool = False,
 ) -> dict:
-    """Measure drawing dimensions against compliance rules automatically.
+    """Measure drawing dimensions and room areas against compliance rules.
 
-    Extracts dimensions from drawings and compares against UBBL rule
-    thresholds. Uses layer-to-rule mapping to determine which rules
-    apply to which dimensions.
+    Extracts dimensions and closed polylines from drawings and compares
+    them against UBBL rule thresholds. Uses layer-to-rule mapping to
+    determine which rules apply to which dimensions and areas.
 
     Args:
         folder_path: Path to folder containing DWG files.
         rule_sets: Rule set names (default: ubbl-spatial).
         building_type: Building type filter.
+        drawing_units: Units the drawings are drawn in: mm, cm or m.
+        resume_job_id: job_id returned by an interrupted run, to continue it.
+        checkpoint: Journal each drawing so an interrupted run can be
+            resumed; the job_id to resume with is returned.
     """
-    adapter = get_acad_adapter()
     request = ComplianceMeasurementRequest(
         folder=Path(folder_path),
         rule_sets=rule_sets or ["ubbl-spatial"],
         building_type=building_type,
+        drawing_units=drawing_units,
     )
-    result = measure_compliance(adapter, request)
-    return result.model_dump()
+    job_id = resume_job_id or (new_job_id() if checkpoint else None)
+    result = run_batch(measure_compliance, request, job_id=job_id)
+    return {"job_id": job_id, **result.model_dump()}
 
 
 # ── New block tools ───────────────────────────────────────────────
@@ -290,6 +415,8 @@ def update_title_blocks_tool(
     updates: dict[str, str],
     block_name: str = "TITLE_BLOCK",
     backup: bool = True,
+    resume_job_id: str | None = None,
+    checkpoint: bool = False,
 ) -> dict:
     """Update title block attributes across all drawings.
 
@@ -298,16 +425,19 @@ def update_title_blocks_tool(
         updates: Dict of TAG -> VALUE pairs to update.
         block_name: Name of the title block (default: TITLE_BLOCK).
         backup: Create backup before modifying.
+        resume_job_id: job_id returned by an interrupted run, to continue it.
+        checkpoint: Journal each drawing so an interrupted run can be
+            resumed; the job_id to resume with is returned.
     """
-    adapter = get_acad_adapter()
     request = TitleBlockUpdateRequest(
         folder=Path(folder_path),
         block_name=block_name,
         updates=updates,
         backup=backup,
     )
-    result = batch_update_title_blocks(adapter, request)
-    return result.model_dump()
+    job_id = resume_job_id or (new_job_id() if checkpoint else None)
+    result = run_batch(batch_update_title_blocks, request, job_id=job_id)
+    return {"job_id": job_id, **result.model_dump()}
 
 
 @mcp.tool()
@@ -315,6 +445,8 @@ def extract_schedule_tool(
     folder_path: str,
     block_name: str,
     tags: list[str] | None = None,
+    resume_job_id: str | None = None,
+    checkpoint: bool = False,
 ) -> dict:
     """Extract schedule data from block attributes across drawings.
 
@@ -325,13 +457,16 @@ def extract_schedule_tool(
         folder_path: Path to folder containing DWG files.
         block_name: Name of the block to extract data from.
         tags: Optional list of specific attribute tags to extract.
+        resume_job_id: job_id returned by an interrupted run, to continue it.
+        checkpoint: Journal each drawing so an interrupted run can be
+            resumed; the job_id to resume with is returned.
     """
-    adapter = get_acad_adapter()
     request = ScheduleExtractionRequest(
         folder=Path(folder_path), block_name=block_name, tags=tags
     )
-    result = extract_schedule(adapter, request)
-    return result.model_dump()
+    job_id = resume_job_id or (new_job_id() if checkpoint else None)
+    result = run_batch(extract_schedule, request, job_id=job_id)
+    return {"job_id": job_id, **result.model_dump()}
 
 
 # ── New XREF tools ────────────────────────────────────────────────
@@ -344,6 +479,8 @@ def manage_xrefs_tool(
     xref_name: str | None = None,
     xref_path: str | None = None,
     xref_type: str = "attach",
+    resume_job_id: str | None = None,
+    checkpoint: bool = False,
 ) -> dict:
     """Manage external references across drawings.
 
@@ -353,8 +490,10 @@ def manage_xrefs_tool(
         xref_name: XREF name (required for reload/attach/detach).
         xref_path: XREF file path (required for attach).
         xref_type: attach or overlay (for attach action).
+        resume_job_id: job_id returned by an interrupted run, to continue it.
+        checkpoint: Journal each drawing so an interrupted run can be
+            resumed; the job_id to resume with is returned.
     """
-    adapter = get_acad_adapter()
     request = XrefManageRequest(
         folder=Path(folder_path),
         action=action,
@@ -362,8 +501,9 @@ def manage_xrefs_tool(
         xref_path=xref_path,
         xref_type=xref_type,
     )
-    result = manage_xrefs(adapter, request)
-    return result.model_dump()
+    job_id = resume_job_id or (new_job_id() if checkpoint else None)
+    result = run_batch(manage_xrefs, request, job_id=job_id)
+    return {"job_id": job_id, **result.model_dump()}
 
 
 # ── New drawing utility tools ─────────────────────────────────────
@@ -375,6 +515,10 @@ def search_drawings_tool(
     search_text: str,
     search_in: list[str] | None = None,
     case_sensitive: bool = False,
+    layers: list[str] | None = None,
+    entity_types: list[str] | None = None,
+    resume_job_id: str | None = None,
+    checkpoint: bool = False,
 ) -> dict:
     """Search for text across drawings in text entities, block attributes, and layer names.
 
@@ -383,16 +527,23 @@ def search_drawings_tool(
         search_text: Text to search for.
         search_in: Where to search: text, attributes, layers (default: all).
         case_sensitive: Case-sensitive search.
+        layers: Optional layer filter for text and attribute matches.
+        entity_types: Optional text entity types (AcDbText, AcDbMText).
+        resume_job_id: job_id returned by an interrupted run, to continue it.
+        checkpoint: Journal each drawing so an interrupted run can be
+            resumed; the job_id to resume with is returned.
     """
-    adapter = get_acad_adapter()
     request = DrawingSearchRequest(
         folder=Path(folder_path),
         search_text=search_text,
         search_in=search_in or ["text", "attributes", "layers"],
         case_sensitive=case_sensitive,
+        layers=layers,
+        entity_types=entity_types,
     )
-    result = drawing_search(adapter, request)
-    return result.model_dump()
+    job_id = resume_job_id or (new_job_id() if checkpoint else None)
+    result = run_batch(drawing_search, request, job_id=job_id)
+    return {"job_id": job_id, **result.model_dump()}
 
 
 @mcp.tool()
@@ -401,6 +552,8 @@ def batch_plot_tool(
     output_dir: str | None = None,
     layout_name: str | None = None,
     output_format: str = "PDF",
+    resume_job_id: str | None = None,
+    checkpoint: bool = False,
 ) -> dict:
     """Batch plot drawing layouts to PDF or DWF.
 
@@ -409,16 +562,19 @@ def batch_plot_tool(
         output_dir: Output directory (default: <folder>/plots/).
         layout_name: Specific layout to plot (default: all non-Model layouts).
         output_format: PDF or DWF.
+        resume_job_id: job_id returned by an interrupted run, to continue it.
+        checkpoint: Journal each drawing so an interrupted run can be
+            resumed; the job_id to resume with is returned.
     """
-    adapter = get_acad_adapter()
     request = BatchPlotRequest(
         folder=Path(folder_path),
         output_dir=Path(output_dir) if output_dir else None,
         layout_name=layout_name,
         output_format=output_format,
     )
-    result = batch_plot(adapter, request)
-    return result.model_dump()
+    job_id = resume_job_id or (new_job_id() if checkpoint else None)
+    result = run_batch(batch_plot, request, job_id=job_id)
+    return {"job_id": job_id, **result.model_dump()}
 
 
 @mcp.tool()
@@ -426,6 +582,8 @@ def batch_purge_tool(
     folder_path: str,
     audit: bool = True,
     backup: bool = True,
+    resume_job_id: str | None = None,
+    checkpoint: bool = False,
 ) -> dict:
     """Purge unused items from drawings and optionally audit for errors.
 
@@ -433,16 +591,21 @@ def batch_purge_tool(
         folder_path: Path to folder containing DWG files.
         audit: Run audit after purge.
         backup: Create backup before modifying.
+        resume_job_id: job_id returned by an interrupted run, to continue it.
+        checkpoint: Journal each drawing so an interrupted run can be
+            resumed; the job_id to resume with is returned.
     """
-    adapter = get_acad_adapter()
     request = BatchPurgeRequest(folder=Path(folder_path), audit=audit, backup=backup)
-    result = batch_purge(adapter, request)
-    return result.model_dump()
+    job_id = resume_job_id or (new_job_id() if checkpoint else None)
+    result = run_batch(batch_purge, request, job_id=job_id)
+    return {"job_id": job_id, **result.model_dump()}
 
 
 @mcp.tool()
 def get_drawing_info_tool(
     folder_path: str,
+    resume_job_id: str | None = None,
+    checkpoint: bool = False,
 ) -> dict:
     """Get comprehensive drawing info summary for each DWG file.
 
@@ -451,11 +614,43 @@ def get_drawing_info_tool(
 
     Args:
         folder_path: Path to folder containing DWG files.
+        resume_job_id: job_id returned by an interrupted run, to continue it.
+        checkpoint: Journal each drawing so an interrupted run can be
+            resumed; the job_id to resume with is returned.
     """
-    adapter = get_acad_adapter()
     request = DrawingInfoRequest(folder=Path(folder_path))
-    result = get_drawing_info(adapter, request)
-    return result.model_dump()
+    job_id = resume_job_id or (new_job_id() if checkpoint else None)
+    result = run_batch(get_drawing_info, request, job_id=job_id)
+    return {"job_id": job_id, **result.model_dump()}
+
+
+@mcp.tool()
+def run_pipeline_tool(
+    folder_path: str,
+    stages: list[dict],
+    backup: bool = True,
+    resume_job_id: str | None = None,
+    checkpoint: bool = False,
+) -> dict:
+    """Run several operations on each drawing with a single open and save.
+
+    Each stage is {"operation": ..., "params": {...}} where operation is one
+    of find_replace, rename_layer, standardize_layers, update_title_blocks,
+    insert_blocks or purge, and params are that operation's fields, e.g.
+    {"operation": "rename_layer", "params": {"old_name": "WALL", "new_name": "A-WALL"}}.
+
+    Args:
+        folder_path: Path to folder containing DWG files.
+        stages: Ordered list of stages to apply to every drawing.
+        backup: Create backup before modifying.
+        resume_job_id: job_id returned by an interrupted run, to continue it.
+        checkpoint: Journal each drawing so an interrupted run can be
+            resumed; the job_id to resume with is returned.
+    """
+    request = PipelineRequest(folder=Path(folder_path), stages=stages, backup=backup)
+    job_id = resume_job_id or (new_job_id() if checkpoint else None)
+    result = run_batch(run_pipeline, request, job_id=job_id)
+    return {"job_id": job_id, **result.model_dump()}
 
 
 # ── Natural language tool ─────────────────────────────────────────
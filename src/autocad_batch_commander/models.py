@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from pathlib import Path
+from typing import Any, ClassVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 # ── Geometry primitives ──────────────────────────────────────────
@@ -35,6 +37,7 @@ class TextEntity(BaseModel):
     text: str
     layer: str
     entity_type: str = "AcDbText"  # AcDbText | AcDbMText
+    position: Point3D | None = None  # insertion point, if the source reports it
 
 
 class LayerEntity(BaseModel):
@@ -62,11 +65,22 @@ class PolylineEntity(BaseModel):
 
     handle: str
     vertices: list[Point3D] = Field(default_factory=list)
+    # Per-vertex arc bulge (DXF convention); empty when every edge is straight.
+    bulges: list[float] = Field(default_factory=list)
     closed: bool = False
     area: float = 0.0
     perimeter: float = 0.0
     layer: str = "0"
 
+    @model_validator(mode="after")
+    def _one_bulge_per_vertex(self) -> PolylineEntity:
+        if self.bulges and len(self.bulges) != len(self.vertices):
+            raise ValueError(
+                f"Polyline {self.handle} has {len(self.bulges)} bulges "
+                f"for {len(self.vertices)} vertices"
+            )
+        return self
+
 
 class BlockReference(BaseModel):
     """A block reference (insert) inside a drawing."""
@@ -146,6 +160,18 @@ class TextReplaceRequest(BaseModel):
     backup: bool = True
 
 
+class TermReplaceRequest(BaseModel):
+    """Parameters for replacing many find → replace terms in one pass."""
+
+    folder: Path
+    mappings: dict[str, str]
+    layers: list[str] | None = None
+    case_sensitive: bool = False
+    whole_word: bool = False
+    regex: bool = False
+    backup: bool = True
+
+
 class LayerRenameRequest(BaseModel):
     """Parameters for a batch layer rename operation."""
 
@@ -189,12 +215,24 @@ class AreaExtractionRequest(BaseModel):
     max_area: float | None = None
 
 
+class RoomExtractionRequest(BaseModel):
+    """Parameters for recognising rooms from labels inside closed polylines."""
+
+    folder: Path
+    layers: list[str] | None = None  # restrict room outlines to these layers
+    label_layers: list[str] | None = None  # restrict labels to these layers
+    vocabulary: dict[str, list[str]] | None = None  # room type → extra labels
+    backup: bool = False
+
+
 class ComplianceMeasurementRequest(BaseModel):
     """Parameters for measuring drawing dimensions against compliance rules."""
 
     folder: Path
     rule_sets: list[str] = Field(default_factory=lambda: ["ubbl-spatial"])
     building_type: str | None = None
+    drawing_units: str = "mm"  # mm | cm | m
+    recognize_rooms: bool = True  # classify room outlines by their labels
     backup: bool = False
 
 
@@ -246,6 +284,8 @@ class DrawingSearchRequest(BaseModel):
         default_factory=lambda: ["text", "attributes", "layers"]
     )
     case_sensitive: bool = False
+    layers: list[str] | None = None  # restrict text/attribute search to layers
+    entity_types: list[str] | None = None  # AcDbText | AcDbMText
 
 
 class BatchPlotRequest(BaseModel):
@@ -271,9 +311,102 @@ class DrawingInfoRequest(BaseModel):
     folder: Path
 
 
+class PipelineStage(BaseModel):
+    """One operation in a single-open pipeline run.
+
+    *operation* is one of find_replace, rename_layer, standardize_layers,
+    update_title_blocks, insert_blocks, purge or recognize_rooms. *params*
+    are the fields of the matching request model (minus ``folder`` and
+    ``backup``, which come from the pipeline request).
+    """
+
+    operation: str
+    params: dict[str, Any] = Field(default_factory=dict)
+
+
+class PipelineRequest(BaseModel):
+    """Parameters for running several operations per drawing with one open."""
+
+    folder: Path
+    stages: list[PipelineStage] = Field(default_factory=list)
+    backup: bool = True
+
+
+# ── Profiling ─────────────────────────────────────────────────────
+
+# Upper bounds (seconds) of the adapter call latency histogram buckets; a
+# final overflow bucket catches slower calls.
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class MethodTimings(BaseModel):
+    """Calls to one adapter method within one operation (or pipeline stage)."""
+
+    operation: str
+    method: str
+    calls: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+    max_seconds: float = 0.0
+    items: int = 0  # entities returned (list length or count)
+    bytes: int = 0  # JSON size of what was returned
+    # Calls per LATENCY_BUCKETS bucket, plus the overflow bucket.
+    histogram: list[int] = Field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1)
+    )
+
+
+class FileTimings(BaseModel):
+    """Adapter time spent on one drawing."""
+
+    file: str
+    calls: int = 0
+    adapter_seconds: float = 0.0
+
+
+class OperationTimings(BaseModel):
+    """Where a profiled batch run spent its time.
+
+    Sharded runs add up the time of every worker, so ``wall_seconds`` can
+    exceed the elapsed time. Time not spent in the adapter or a named
+    section (e.g. ``backup_wait``) was spent in Python and disk I/O.
+    """
+
+    operation: str
+    wall_seconds: float = 0.0
+    adapter_seconds: float = 0.0
+    sections: dict[str, float] = Field(default_factory=dict)
+    methods: list[MethodTimings] = Field(default_factory=list)
+    files: list[FileTimings] = Field(default_factory=list)
+
+
 # ── Results ───────────────────────────────────────────────────────
 
 
+class BatchResult(BaseModel):
+    """Fields shared by the results of every batch operation."""
+
+    # Unchanged files an incremental run did not reprocess.
+    skipped_files: list[str] = Field(default_factory=list)
+    # Adapter call breakdown, filled in when the run was profiled.
+    timings: OperationTimings | None = None
+
+
 class FileDetail(BaseModel):
     """Per-file detail in an operation result."""
 
@@ -282,7 +415,7 @@ class FileDetail(BaseModel):
     error: str | None = None
 
 
-class OperationResult(BaseModel):
+class OperationResult(BatchResult):
     """Result of a batch operation."""
 
     files_processed: int = 0
@@ -302,7 +435,7 @@ class AuditFinding(BaseModel):
     layer: str | None = None
 
 
-class AuditResult(BaseModel):
+class AuditResult(BatchResult):
     """Result of an audit operation."""
 
     files_processed: int = 0
@@ -320,7 +453,7 @@ class FileDimensionDetail(BaseModel):
     error: str | None = None
 
 
-class DimensionExtractionResult(BaseModel):
+class DimensionExtractionResult(BatchResult):
     """Result of a dimension extraction operation."""
 
     files_processed: int = 0
@@ -337,7 +470,7 @@ class FileAreaDetail(BaseModel):
     error: str | None = None
 
 
-class AreaExtractionResult(BaseModel):
+class AreaExtractionResult(BatchResult):
     """Result of an area extraction operation."""
 
     files_processed: int = 0
@@ -346,6 +479,32 @@ class AreaExtractionResult(BaseModel):
     errors: list[FileDetail] = Field(default_factory=list)
 
 
+class RoomRecord(BaseModel):
+    """A room: a closed polyline and the label found inside it."""
+
+    file: str = ""
+    handle: str  # room outline polyline
+    room_type: str
+    parameter: str = ""  # compliance rule parameter the room's area feeds
+    label: str
+    label_handle: str = ""
+    layer: str = "0"
+    area: float = 0.0  # drawing units²
+    perimeter: float = 0.0
+    width: float = 0.0  # shorter side of the bounding box
+    length: float = 0.0  # longer side of the bounding box
+
+
+class RoomExtractionResult(BatchResult):
+    """Result of a room recognition operation."""
+
+    files_processed: int = 0
+    total_rooms: int = 0
+    unplaced_labels: int = 0  # room labels outside every closed polyline
+    rooms: list[RoomRecord] = Field(default_factory=list)
+    errors: list[FileDetail] = Field(default_factory=list)
+
+
 class MeasurementFinding(BaseModel):
     """A single compliance measurement finding."""
 
@@ -359,9 +518,10 @@ class MeasurementFinding(BaseModel):
     unit: str
     status: str = "pass"  # pass | fail
     severity: str = "error"
+    handle: str = ""  # measured dimension or polyline
 
 
-class ComplianceMeasurementResult(BaseModel):
+class ComplianceMeasurementResult(BatchResult):
     """Result of measuring dimensions against compliance rules."""
 
     files_processed: int = 0
@@ -380,7 +540,7 @@ class ScheduleRow(BaseModel):
     attributes: dict[str, str] = Field(default_factory=dict)
 
 
-class ScheduleResult(BaseModel):
+class ScheduleResult(BatchResult):
     """Result of a schedule extraction operation."""
 
     files_processed: int = 0
@@ -398,7 +558,7 @@ class FileXrefDetail(BaseModel):
     error: str | None = None
 
 
-class XrefListResult(BaseModel):
+class XrefListResult(BatchResult):
     """Result of an XREF management operation."""
 
     files_processed: int = 0
@@ -419,7 +579,7 @@ class SearchMatch(BaseModel):
     matched_text: str = ""
 
 
-class DrawingSearchResult(BaseModel):
+class DrawingSearchResult(BatchResult):
     """Result of a drawing search operation."""
 
     files_processed: int = 0
@@ -438,7 +598,7 @@ class FilePlotDetail(BaseModel):
     error: str | None = None
 
 
-class PlotResult(BaseModel):
+class PlotResult(BatchResult):
     """Result of a batch plot operation."""
 
     files_processed: int = 0
@@ -447,7 +607,7 @@ class PlotResult(BaseModel):
     errors: list[FileDetail] = Field(default_factory=list)
 
 
-class PurgeResult(BaseModel):
+class PurgeResult(BatchResult):
     """Result of a batch purge operation."""
 
     files_processed: int = 0
@@ -472,7 +632,7 @@ class FileInfoDetail(BaseModel):
     error: str | None = None
 
 
-class DrawingInfoResult(BaseModel):
+class DrawingInfoResult(BatchResult):
     """Result of a drawing info summary operation."""
 
     files_processed: int = 0
@@ -480,6 +640,29 @@ class DrawingInfoResult(BaseModel):
     errors: list[FileDetail] = Field(default_factory=list)
 
 
+class PipelineStageResult(BaseModel):
+    """Result of one stage of a pipeline run."""
+
+    operation: str
+    files_modified: int = 0
+    total_changes: int = 0
+    details: list[FileDetail] = Field(default_factory=list)
+    rooms: list[RoomRecord] = Field(default_factory=list)  # recognize_rooms
+
+
+class PipelineResult(BatchResult):
+    """Result of a single-open pipeline run, with one entry per stage."""
+
+    # Stage results line up by position when merging sharded runs.
+    merge_aligned: ClassVar[frozenset[str]] = frozenset({"stages"})
+
+    files_processed: int = 0
+    files_modified: int = 0
+    total_changes: int = 0
+    stages: list[PipelineStageResult] = Field(default_factory=list)
+    errors: list[FileDetail] = Field(default_factory=list)
+
+
 # ── Compliance rules ─────────────────────────────────────────────
 
 
@@ -556,3 +739,89 @@ class RegulationResult(BaseModel):
     query: str
     files_loaded: int = 0
     content: dict[str, str] = Field(default_factory=dict)
+
+
+# ── Batch jobs ───────────────────────────────────────────────────
+
+
+class JobInfo(BaseModel):
+    """Summary of a checkpointed batch job."""
+
+    job_id: str
+    operation: str
+    folder: str
+    status: str = "running"  # running | complete
+    files_done: int = 0
+    started_at: datetime
+    updated_at: datetime
+
+
+# ── Backups ──────────────────────────────────────────────────────
+
+
+class BackupInfo(BaseModel):
+    """One cataloged backup of a drawing."""
+
+    id: int
+    file: str
+    sha256: str
+    size_bytes: int
+    created_at: datetime
+
+
+class BackupPruneResult(BaseModel):
+    """What applying a backup retention policy removed."""
+
+    stores: int = 0
+    backups_removed: int = 0
+    objects_removed: int = 0
+    bytes_freed: int = 0
+
+
+# ── Extraction cache ─────────────────────────────────────────────
+
+
+class CacheStats(BaseModel):
+    """Usage summary of the on-disk extraction cache."""
+
+    path: str
+    drawings: int = 0
+    size_bytes: int = 0
+    max_bytes: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+# ── Benchmarks ───────────────────────────────────────────────────
+
+
+class BenchmarkMeasurement(BaseModel):
+    """Cost of one benchmark case on one synthetic project size."""
+
+    case: str
+    size: str  # size preset or DRAWINGSxENTITIES; "-" if size-independent
+    drawings: int = 0
+    entities: int = 0  # per drawing
+    wall_seconds: float
+    peak_rss_mb: float | None = None
+    adapter_calls: dict[str, int] = Field(default_factory=dict)
+
+
+class BenchmarkRegression(BaseModel):
+    """A measurement that got worse than its baseline beyond the threshold."""
+
+    case: str
+    size: str
+    metric: str  # wall_seconds | peak_rss_mb | adapter_calls
+    baseline: float
+    current: float
+
+
+class BenchmarkReport(BaseModel):
+    """Result of a benchmark run compared against the stored baseline."""
+
+    measurements: list[BenchmarkMeasurement] = Field(default_factory=list)
+    regressions: list[BenchmarkRegression] = Field(default_factory=list)
+    history: str | None = None
+    baselines_updated: int = 0
@@ -2,36 +2,36 @@
 
 from __future__ import annotations
 
-import json
+from pathlib import Path
 
 from loguru import logger
 
 from autocad_batch_commander.acad.port import AutoCADPort
-from autocad_batch_commander.config import settings
 from autocad_batch_commander.models import AuditFinding, AuditRequest, AuditResult
+from autocad_batch_commander.operations.journal import track_files
+from autocad_batch_commander.standards import registry
 from autocad_batch_commander.utils.file_ops import get_dwg_files
 
 
 def _load_standard(standard: str) -> dict:
-    path = settings.standards_dir / f"{standard.lower()}.json"
-    if not path.exists():
-        raise FileNotFoundError(f"Standard file not found: {path}")
-    return json.loads(path.read_text())
+    return registry.layer_standard(standard)
 
 
 def audit_drawings(
     adapter: AutoCADPort,
     request: AuditRequest,
+    *,
+    files: list[Path] | None = None,
 ) -> AuditResult:
     """Audit drawings for layer compliance against a naming standard."""
     standard_data = _load_standard(request.standard)
     valid_layer_names = set(standard_data.get("mappings", {}).values())
     required_layers = set(standard_data.get("required_layers", []))
 
-    dwg_files = get_dwg_files(request.folder)
+    dwg_files = files if files is not None else get_dwg_files(request.folder)
     result = AuditResult()
 
-    for dwg in dwg_files:
+    for dwg in track_files(result, dwg_files):
         try:
             adapter.open_drawing(str(dwg))
             layers = adapter.get_layers()
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 from loguru import logger
 
 from autocad_batch_commander.acad.port import AutoCADPort
@@ -14,54 +16,63 @@ from autocad_batch_commander.models import (
     ScheduleRow,
     TitleBlockUpdateRequest,
 )
-from autocad_batch_commander.utils.file_ops import create_backup, get_dwg_files
+from autocad_batch_commander.operations.journal import track_files
+from autocad_batch_commander.utils.backup import BackupWriter
+from autocad_batch_commander.utils.file_ops import get_dwg_files
+
+
+def apply_title_block_updates(
+    adapter: AutoCADPort, request: TitleBlockUpdateRequest
+) -> int:
+    """Update title block attributes in the open drawing. Returns the change count."""
+    updates = {
+        block.handle: dict(request.updates)
+        for block in adapter.get_blocks()
+        if block.name == request.block_name
+    }
+    if not updates or not request.updates:
+        return 0
+    return adapter.set_block_attributes(updates)
 
 
 def batch_update_title_blocks(
     adapter: AutoCADPort,
     request: TitleBlockUpdateRequest,
+    *,
+    files: list[Path] | None = None,
 ) -> OperationResult:
     """Update title block attributes across all DWG files in the folder."""
-    dwg_files = get_dwg_files(request.folder)
+    dwg_files = files if files is not None else get_dwg_files(request.folder)
     result = OperationResult()
 
-    for dwg in dwg_files:
-        detail = FileDetail(file=str(dwg))
-        try:
-            if request.backup:
-                create_backup(dwg)
-
-            adapter.open_drawing(str(dwg))
-            blocks = adapter.get_blocks()
-            changes = 0
-
-            for block in blocks:
-                if block.name != request.block_name:
-                    continue
-                for tag, value in request.updates.items():
-                    if adapter.set_block_attribute(block.handle, tag, value):
-                        changes += 1
-
-            if changes > 0:
-                adapter.save_drawing()
-                result.files_modified += 1
-                result.total_changes += changes
+    with BackupWriter(request.backup) as backups:
+        for dwg in track_files(result, backups.prefetch(dwg_files)):
+            detail = FileDetail(file=str(dwg))
+            try:
+                adapter.open_drawing(str(dwg))
+                changes = apply_title_block_updates(adapter, request)
 
-            detail.changes = changes
-            adapter.close_drawing()
-            result.files_processed += 1
+                if changes > 0:
+                    backups.commit(dwg)
+                    adapter.save_drawing()
+                    result.files_modified += 1
+                    result.total_changes += changes
 
-        except Exception as exc:
-            logger.error(f"Error processing {dwg}: {exc}")
-            detail.error = str(exc)
-            result.errors.append(detail)
-            try:
+                detail.changes = changes
                 adapter.close_drawing()
-            except Exception:
-                pass
-            continue
+                result.files_processed += 1
 
-        result.details.append(detail)
+            except Exception as exc:
+                logger.error(f"Error processing {dwg}: {exc}")
+                detail.error = str(exc)
+                result.errors.append(detail)
+                try:
+                    adapter.close_drawing()
+                except Exception:
+                    pass
+                continue
+
+            result.details.append(detail)
 
     return result
 
@@ -69,12 +80,14 @@ def batch_update_title_blocks(
 def extract_schedule(
     adapter: AutoCADPort,
     request: ScheduleExtractionRequest,
+    *,
+    files: list[Path] | None = None,
 ) -> ScheduleResult:
     """Extract schedule data from block attributes across DWG files."""
-    dwg_files = get_dwg_files(request.folder)
+    dwg_files = files if files is not None else get_dwg_files(request.folder)
     result = ScheduleResult(block_name=request.block_name)
 
-    for dwg in dwg_files:
+    for dwg in track_files(result, dwg_files):
         try:
             adapter.open_drawing(str(dwg))
             blocks = adapter.get_blocks()
@@ -112,54 +125,58 @@ def extract_schedule(
     return result
 
 
+def apply_block_inserts(adapter: AutoCADPort, request: BlockInsertRequest) -> int:
+    """Insert the requested blocks into the open drawing. Returns the count."""
+    for point in request.insertion_points:
+        adapter.insert_block(
+            request.block_name,
+            point,
+            scale_x=request.scale,
+            scale_y=request.scale,
+            scale_z=request.scale,
+            rotation=request.rotation,
+            layer=request.layer,
+        )
+    return len(request.insertion_points)
+
+
 def batch_insert_blocks(
     adapter: AutoCADPort,
     request: BlockInsertRequest,
+    *,
+    files: list[Path] | None = None,
 ) -> OperationResult:
     """Insert named blocks at specified points across DWG files."""
-    dwg_files = get_dwg_files(request.folder)
+    dwg_files = files if files is not None else get_dwg_files(request.folder)
     result = OperationResult()
 
-    for dwg in dwg_files:
-        detail = FileDetail(file=str(dwg))
-        try:
-            if request.backup:
-                create_backup(dwg)
+    with BackupWriter(request.backup) as backups:
+        for dwg in track_files(result, backups.prefetch(dwg_files)):
+            detail = FileDetail(file=str(dwg))
+            try:
+                adapter.open_drawing(str(dwg))
+                changes = apply_block_inserts(adapter, request)
 
-            adapter.open_drawing(str(dwg))
-            changes = 0
-
-            for point in request.insertion_points:
-                adapter.insert_block(
-                    request.block_name,
-                    point,
-                    scale_x=request.scale,
-                    scale_y=request.scale,
-                    scale_z=request.scale,
-                    rotation=request.rotation,
-                    layer=request.layer,
-                )
-                changes += 1
-
-            if changes > 0:
-                adapter.save_drawing()
-                result.files_modified += 1
-                result.total_changes += changes
-
-            detail.changes = changes
-            adapter.close_drawing()
-            result.files_processed += 1
+                if changes > 0:
+                    backups.commit(dwg)
+                    adapter.save_drawing()
+                    result.files_modified += 1
+                    result.total_changes += changes
 
-        except Exception as exc:
-            logger.error(f"Error processing {dwg}: {exc}")
-            detail.error = str(exc)
-            result.errors.append(detail)
-            try:
+                detail.changes = changes
                 adapter.close_drawing()
-            except Exception:
-                pass
-            continue
-
-        result.details.append(detail)
+                result.files_processed += 1
+
+            except Exception as exc:
+                logger.error(f"Error processing {dwg}: {exc}")
+                detail.error = str(exc)
+                result.errors.append(detail)
+                try:
+                    adapter.close_drawing()
+                except Exception:
+                    pass
+                continue
+
+            result.details.append(detail)
 
     return result
@@ -9,6 +9,7 @@ from loguru import logger
 
 from autocad_batch_commander.acad.port import AutoCADPort
 from autocad_batch_commander.models import (
+    AuditIssue,
     BatchPlotRequest,
     BatchPurgeRequest,
     DrawingInfoRequest,
@@ -22,42 +23,54 @@ from autocad_batch_commander.models import (
     PurgeResult,
     SearchMatch,
 )
-from autocad_batch_commander.utils.file_ops import create_backup, get_dwg_files
+from autocad_batch_commander.operations.journal import track_files
+from autocad_batch_commander.utils.backup import BackupWriter
+from autocad_batch_commander.utils.file_ops import get_dwg_files
+
+
+def apply_purge(
+    adapter: AutoCADPort, request: BatchPurgeRequest
+) -> tuple[int, list[AuditIssue]]:
+    """Purge (and optionally audit) the open drawing.
+
+    Returns the number of items purged and any audit issues found.
+    """
+    purged = adapter.purge()
+    issues = adapter.audit_drawing(fix=True) if request.audit else []
+    return purged, issues
 
 
 def batch_purge(
     adapter: AutoCADPort,
     request: BatchPurgeRequest,
+    *,
+    files: list[Path] | None = None,
 ) -> PurgeResult:
     """Purge unused items (and optionally audit) across DWG files."""
-    dwg_files = get_dwg_files(request.folder)
+    dwg_files = files if files is not None else get_dwg_files(request.folder)
     result = PurgeResult()
 
-    for dwg in dwg_files:
-        try:
-            if request.backup:
-                create_backup(dwg)
-
-            adapter.open_drawing(str(dwg))
-            purged = adapter.purge()
-            result.total_items_purged += purged
-
-            if request.audit:
-                issues = adapter.audit_drawing(fix=True)
+    with BackupWriter(request.backup) as backups:
+        for dwg in track_files(result, backups.prefetch(dwg_files)):
+            try:
+                adapter.open_drawing(str(dwg))
+                purged, issues = apply_purge(adapter, request)
+                result.total_items_purged += purged
                 result.audit_issues.extend(issues)
 
-            adapter.save_drawing()
-            result.files_purged += 1
-            result.files_processed += 1
-            adapter.close_drawing()
-
-        except Exception as exc:
-            logger.error(f"Error processing {dwg}: {exc}")
-            result.errors.append(FileDetail(file=str(dwg), error=str(exc)))
-            try:
+                backups.commit(dwg)
+                adapter.save_drawing()
+                result.files_purged += 1
+                result.files_processed += 1
                 adapter.close_drawing()
-            except Exception:
-                pass
+
+            except Exception as exc:
+                logger.error(f"Error processing {dwg}: {exc}")
+                result.errors.append(FileDetail(file=str(dwg), error=str(exc)))
+                try:
+                    adapter.close_drawing()
+                except Exception:
+                    pass
 
     return result
 
@@ -65,14 +78,16 @@ def batch_purge(
 def batch_plot(
     adapter: AutoCADPort,
     request: BatchPlotRequest,
+    *,
+    files: list[Path] | None = None,
 ) -> PlotResult:
     """Plot layouts to PDF/DWF across DWG files."""
-    dwg_files = get_dwg_files(request.folder)
+    dwg_files = files if files is not None else get_dwg_files(request.folder)
     output_dir = request.output_dir or request.folder / "plots"
     output_dir.mkdir(parents=True, exist_ok=True)
     result = PlotResult()
 
-    for dwg in dwg_files:
+    for dwg in track_files(result, dwg_files):
         try:
             adapter.open_drawing(str(dwg))
             layouts = adapter.get_layouts()
@@ -117,19 +132,24 @@ def batch_plot(
 def drawing_search(
     adapter: AutoCADPort,
     request: DrawingSearchRequest,
+    *,
+    files: list[Path] | None = None,
 ) -> DrawingSearchResult:
     """Search text, attributes, and layer names across DWG files."""
-    dwg_files = get_dwg_files(request.folder)
+    dwg_files = files if files is not None else get_dwg_files(request.folder)
     result = DrawingSearchResult(search_text=request.search_text)
     flags = 0 if request.case_sensitive else re.IGNORECASE
     pattern = re.compile(re.escape(request.search_text), flags)
 
-    for dwg in dwg_files:
+    for dwg in track_files(result, dwg_files):
         try:
             adapter.open_drawing(str(dwg))
 
             if "text" in request.search_in:
-                for t in adapter.get_text_entities():
+                texts = adapter.get_text_entities(
+                    layers=request.layers, entity_types=request.entity_types
+                )
+                for t in texts:
                     if pattern.search(t.text):
                         result.matches.append(
                             SearchMatch(
@@ -142,7 +162,7 @@ def drawing_search(
                         )
 
             if "attributes" in request.search_in:
-                for block in adapter.get_blocks():
+                for block in adapter.get_blocks(layers=request.layers):
                     for attr in adapter.get_block_attributes(block.handle):
                         if pattern.search(attr.value) or pattern.search(attr.tag):
                             result.matches.append(
@@ -188,12 +208,14 @@ def drawing_search(
 def get_drawing_info(
     adapter: AutoCADPort,
     request: DrawingInfoRequest,
+    *,
+    files: list[Path] | None = None,
 ) -> DrawingInfoResult:
     """Get comprehensive summary info for each DWG file."""
-    dwg_files = get_dwg_files(request.folder)
+    dwg_files = files if files is not None else get_dwg_files(request.folder)
     result = DrawingInfoResult()
 
-    for dwg in dwg_files:
+    for dwg in track_files(result, dwg_files):
         try:
             adapter.open_drawing(str(dwg))
 
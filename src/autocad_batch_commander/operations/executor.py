@@ -0,0 +1,319 @@
+"""Process-pool executor that shards batch operations across worker processes.
+
+Every batch function in ``operations/`` has the signature
+``func(adapter, request, *, files=None) -> <Result>``. The executor splits
+the folder's drawing list into contiguous shards, runs each shard in a
+worker process that owns its own adapter, and merges the per-shard result
+models back together in shard order so the output is identical to a
+serial run. Serial runs instead stream drawings from
+:func:`~autocad_batch_commander.utils.discovery.iter_drawings`, so the
+first drawing is processed while the rest of the tree is still being
+walked; batch functions only iterate ``files`` once.
+"""
+
+from __future__ import annotations
+
+import math
+import multiprocessing
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, TypeVar, get_type_hints
+
+from loguru import logger
+from pydantic import BaseModel
+
+from autocad_batch_commander.acad.cache import close_cache, with_cache
+from autocad_batch_commander.acad.factory import get_acad_adapter
+from autocad_batch_commander.acad.instrumented import InstrumentedAdapter
+from autocad_batch_commander.acad.port import AutoCADPort
+from autocad_batch_commander.config import settings
+from autocad_batch_commander.models import OperationTimings
+from autocad_batch_commander.operations.journal import (
+    Checkpoint,
+    FileCheckpoints,
+    JobJournal,
+    UntrackedFunction,
+)
+from autocad_batch_commander.operations.manifest import (
+    RunManifest,
+    failed_files,
+    operation_name,
+    request_fingerprint,
+)
+from autocad_batch_commander.utils.discovery import drawing_extensions, iter_drawings
+from autocad_batch_commander.utils.profiling import Profiler, merge_timings
+
+R = TypeVar("R", bound=BaseModel)
+
+AdapterFactory = Callable[[], AutoCADPort]
+
+# Shards per worker — more shards than workers evens out slow drawings.
+_SHARDS_PER_WORKER = 4
+
+# Adapter owned by the current worker process (set by the pool initializer).
+_worker_adapter: AutoCADPort | None = None
+
+
+def shard_files(files: list[Path], shards: int) -> list[list[Path]]:
+    """Split *files* into at most *shards* contiguous, order-preserving chunks."""
+    if not files:
+        return []
+    shards = max(1, min(shards, len(files)))
+    size = math.ceil(len(files) / shards)
+    return [files[i : i + size] for i in range(0, len(files), size)]
+
+
+def merge_results(results: list[R]) -> R:
+    """Merge per-shard result models of the same type into one.
+
+    Counters are summed, lists are concatenated in shard order, and scalar
+    fields (``action``, ``search_text``, ``block_name``…) keep the first
+    non-empty value. List fields named in a model's ``merge_aligned`` class
+    attribute are merged element by element instead of concatenated, and
+    profiling ``timings`` are combined per adapter method.
+    """
+    if not results:
+        raise ValueError("No results to merge")
+
+    merged = results[0].model_copy(deep=True)
+    aligned: frozenset[str] = getattr(type(merged), "merge_aligned", frozenset())
+    for other in results[1:]:
+        for name in type(merged).model_fields:
+            current = getattr(merged, name)
+            value = getattr(other, name)
+            if name in aligned:
+                setattr(
+                    merged,
+                    name,
+                    [merge_results([a, b]) for a, b in zip(current, value)],
+                )
+            elif isinstance(current, OperationTimings) and value is not None:
+                setattr(merged, name, merge_timings(current, value))
+            elif isinstance(current, bool):
+                setattr(merged, name, current or value)
+            elif isinstance(current, (int, float)):
+                setattr(merged, name, current + value)
+            elif isinstance(current, list):
+                current.extend(value)
+            elif isinstance(current, dict):
+                current.update(value)
+            elif not current and value:
+                setattr(merged, name, value)
+    return merged
+
+
+def _init_worker(
+    adapter_factory: AdapterFactory | None,
+    adapter_options: dict[str, Any],
+    cache: bool | None,
+) -> None:
+    global _worker_adapter
+    if adapter_factory is not None:
+        adapter = adapter_factory()
+    else:
+        adapter = get_acad_adapter(**adapter_options)
+    _worker_adapter = with_cache(adapter, cache)
+
+
+def _remember(files: Iterable[Path], seen: list[Path]) -> Iterator[Path]:
+    """Pass *files* through, appending each one to *seen*."""
+    for path in files:
+        seen.append(path)
+        yield path
+
+
+def _call(
+    func: Callable[..., R],
+    adapter: AutoCADPort,
+    request: BaseModel,
+    files: Iterable[Path],
+    profile: bool,
+) -> R:
+    """Run *func*, recording its adapter calls in ``result.timings`` if *profile*."""
+    if not profile:
+        return func(adapter, request, files=files)
+    with Profiler(func.__name__) as profiler:
+        instrumented = InstrumentedAdapter(adapter, profiler)
+        result = func(instrumented, request, files=files)
+    result.timings = profiler.timings()  # type: ignore[attr-defined]
+    return result
+
+
+def _run_files(
+    func: Callable[..., R],
+    adapter: AutoCADPort,
+    request: BaseModel,
+    files: Iterable[Path],
+    checkpoint: Checkpoint | None,
+    profile: bool = False,
+) -> R | None:
+    """Run *func* over *files*, journaling each drawing if *checkpoint* is set.
+
+    *func* is called once for all *files* and journals each drawing through
+    :func:`~autocad_batch_commander.operations.journal.track_files`; a
+    function that does not is called once per drawing instead. Checkpointed
+    runs return None; the caller reads the results back from the journal so
+    resumed and fresh drawings merge the same way.
+    """
+    if checkpoint is None:
+        return _call(func, adapter, request, files, profile)
+    files = list(files)
+    journal = JobJournal(checkpoint.db_path)
+    try:
+        try:
+            with FileCheckpoints(journal, checkpoint.job_id) as tracker:
+                result = _call(func, adapter, request, tracker.files(files), profile)
+            tracker.finish(result)
+        except UntrackedFunction:
+            for dwg in files:
+                result = _call(func, adapter, request, [dwg], profile)
+                journal.record(checkpoint.job_id, dwg, result)
+    finally:
+        journal.close()
+    return None
+
+
+def _run_shard(
+    func: Callable[..., R],
+    request: BaseModel,
+    files: list[Path],
+    checkpoint: Checkpoint | None = None,
+    profile: bool = False,
+) -> R | None:
+    if _worker_adapter is None:
+        raise RuntimeError("Worker adapter was not initialised")
+    try:
+        return _run_files(func, _worker_adapter, request, files, checkpoint, profile)
+    finally:
+        close_cache(_worker_adapter)
+
+
+def run_batch(
+    func: Callable[..., R],
+    request: BaseModel,
+    *,
+    adapter: AutoCADPort | None = None,
+    workers: int | None = None,
+    use_mock: bool = False,
+    cad_engine: str | None = None,
+    adapter_factory: AdapterFactory | None = None,
+    cache: bool | None = None,
+    incremental: bool = False,
+    job_id: str | None = None,
+    include: Sequence[str] | None = None,
+    exclude: Sequence[str] | None = None,
+    profile: bool | None = None,
+) -> R:
+    """Run a batch operation, optionally sharded across worker processes.
+
+    With ``workers <= 1`` the operation runs in-process against *adapter*
+    (or a fresh adapter from :func:`get_acad_adapter`). With more workers,
+    each process builds its own adapter — via *adapter_factory* if given
+    (it must be picklable), otherwise ``get_acad_adapter`` with the same
+    *use_mock*/*cad_engine* options and the request folder. Workers are
+    spawned rather than forked so COM apartments and loguru handlers start
+    clean on every platform.
+
+    Adapters are wrapped with :func:`~autocad_batch_commander.acad.cache.with_cache`
+    so unchanged drawings are served from the extraction cache; *cache*
+    forces that on or off (``--no-cache`` passes False).
+
+    With *incremental*, drawings the :class:`RunManifest` records as done
+    for the same operation and request are skipped and listed in the
+    result's ``skipped_files``; the manifest is updated after the run.
+
+    With *job_id*, every drawing's result is checkpointed to the
+    :class:`JobJournal` as it completes. If that job already exists (a
+    ``--resume``), drawings it finished without errors are not processed
+    again and their journaled results are merged into the returned one.
+
+    *include*/*exclude* are glob patterns selecting which drawings under
+    the folder are processed (see :func:`iter_drawings`).
+
+    With *profile* (default ``settings.profile``), every adapter call is
+    timed through an :class:`InstrumentedAdapter` and the breakdown is
+    returned in the result's ``timings``.
+    """
+    workers = settings.workers if workers is None else workers
+    profile = settings.profile if profile is None else profile
+    cad_engine = cad_engine or settings.cad_engine
+    folder: Path = request.folder  # type: ignore[attr-defined]
+    adapter_options = {"use_mock": use_mock, "folder": folder, "cad_engine": cad_engine}
+    operation, fingerprint = operation_name(func), request_fingerprint(request)
+
+    drawings = iter_drawings(
+        folder,
+        include=include,
+        exclude=exclude,
+        extensions=drawing_extensions(cad_engine),
+    )
+
+    done: set[str] = set()
+    checkpoint: Checkpoint | None = None
+    if job_id is not None:
+        journal = JobJournal.from_settings()
+        if journal.begin(job_id, operation, fingerprint, folder):
+            done = journal.done_files(job_id)
+        checkpoint = Checkpoint(journal.db_path, job_id)
+
+    # Serial runs consume the walk as it goes; sharding, the manifest and
+    # resumed jobs need the full list up front.
+    dwg_files: list[Path] = []
+    streaming = workers <= 1 and not incremental and not done
+    pending: Iterable[Path]
+    shards: list[list[Path]] = []
+    if streaming:
+        pending = _remember(drawings, dwg_files)
+    else:
+        dwg_files = list(drawings)
+        if incremental:
+            manifest = RunManifest.from_settings()
+            dwg_files, skipped = manifest.partition(operation, fingerprint, dwg_files)
+        pending = [p for p in dwg_files if str(p) not in done]
+        if done:
+            logger.info(f"Resuming job {job_id}: {len(pending)} drawings left")
+        shards = shard_files(pending, workers * _SHARDS_PER_WORKER)
+
+    result: R | None = None
+    if done and not pending:
+        pass  # resuming a finished job: everything is in the journal
+    elif workers <= 1 or len(shards) <= 1:
+        if adapter is None:
+            adapter = (
+                adapter_factory()
+                if adapter_factory is not None
+                else get_acad_adapter(**adapter_options)
+            )
+        adapter = with_cache(adapter, cache)
+        try:
+            result = _run_files(func, adapter, request, pending, checkpoint, profile)
+        finally:
+            close_cache(adapter)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(shards)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(adapter_factory, adapter_options, cache),
+        ) as pool:
+            futures = [
+                pool.submit(_run_shard, func, request, shard, checkpoint, profile)
+                for shard in shards
+            ]
+            outputs = [f.result() for f in futures]
+        if checkpoint is None:
+            result = merge_results(outputs)  # type: ignore[arg-type]
+
+    if checkpoint is not None:
+        result_type: type[R] = get_type_hints(func)["return"]
+        results = journal.results(checkpoint.job_id, dwg_files, result_type)
+        result = merge_results(results) if results else result_type()
+        journal.finish(checkpoint.job_id)
+        journal.close()
+
+    if incremental:
+        manifest.record(operation, fingerprint, dwg_files, failed_files(result))
+        manifest.close()
+        result.skipped_files = [str(p) for p in skipped]  # type: ignore[union-attr]
+    return result  # type: ignore[return-value]
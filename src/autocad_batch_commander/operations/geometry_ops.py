@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import json
+from pathlib import Path
 
 from loguru import logger
 
 from autocad_batch_commander.acad.port import AutoCADPort
-from autocad_batch_commander.config import settings
 from autocad_batch_commander.models import (
     AreaExtractionRequest,
     AreaExtractionResult,
@@ -19,26 +18,32 @@ from autocad_batch_commander.models import (
     FileDetail,
     FileDimensionDetail,
     MeasurementFinding,
+    PolylineEntity,
 )
-from autocad_batch_commander.operations.compliance_ops import load_rule_set
+from autocad_batch_commander.operations.journal import track_files
+from autocad_batch_commander.operations.room_ops import RoomVocabulary, match_rooms
+from autocad_batch_commander.operations.rule_engine import RuleEngine
 from autocad_batch_commander.utils.file_ops import get_dwg_files
+from autocad_batch_commander.utils.geometry import measure_polylines
 
 
 def extract_dimensions(
     adapter: AutoCADPort,
     request: DimensionExtractionRequest,
+    *,
+    files: list[Path] | None = None,
 ) -> DimensionExtractionResult:
     """Extract all dimension entities from DWG files in the folder."""
-    dwg_files = get_dwg_files(request.folder)
+    dwg_files = files if files is not None else get_dwg_files(request.folder)
     result = DimensionExtractionResult()
 
-    for dwg in dwg_files:
+    for dwg in track_files(result, dwg_files):
         try:
             adapter.open_drawing(str(dwg))
-            dims = adapter.get_dimensions(layers=request.layers)
-
-            if request.dimension_types:
-                dims = [d for d in dims if d.dimension_type in request.dimension_types]
+            dims = adapter.get_dimensions(
+                layers=request.layers,
+                dimension_types=request.dimension_types or None,
+            )
 
             result.details.append(FileDimensionDetail(file=str(dwg), dimensions=dims))
             result.total_dimensions += len(dims)
@@ -56,19 +61,40 @@ def extract_dimensions(
     return result
 
 
+def _with_geometry(polylines: list[PolylineEntity]) -> list[PolylineEntity]:
+    """Fill in area and perimeter the adapter did not report.
+
+    Offline adapters and exports may leave them at zero; all such
+    polylines of a drawing are measured in one pass.
+    """
+    missing = [i for i, p in enumerate(polylines) if not p.area and len(p.vertices) > 2]
+    measured = measure_polylines([polylines[i] for i in missing])
+    filled = list(polylines)
+    for i, geometry in zip(missing, measured):
+        filled[i] = polylines[i].model_copy(
+            update={
+                "area": geometry.area,
+                "perimeter": polylines[i].perimeter or geometry.perimeter,
+            }
+        )
+    return filled
+
+
 def extract_areas(
     adapter: AutoCADPort,
     request: AreaExtractionRequest,
+    *,
+    files: list[Path] | None = None,
 ) -> AreaExtractionResult:
     """Extract closed polyline areas from DWG files in the folder."""
-    dwg_files = get_dwg_files(request.folder)
+    dwg_files = files if files is not None else get_dwg_files(request.folder)
     result = AreaExtractionResult()
 
-    for dwg in dwg_files:
+    for dwg in track_files(result, dwg_files):
         try:
             adapter.open_drawing(str(dwg))
             polys = adapter.get_polylines(layers=request.layers)
-            closed = [p for p in polys if p.closed]
+            closed = _with_geometry([p for p in polys if p.closed])
 
             if request.min_area is not None:
                 closed = [p for p in closed if p.area >= request.min_area]
@@ -91,89 +117,72 @@ def extract_areas(
     return result
 
 
-def _load_dimension_mapping() -> list[dict]:
-    """Load the layer → rule parameter mapping file."""
-    mapping_path = settings.standards_dir / "dimension_mapping.json"
-    if not mapping_path.exists():
-        return []
-    data = json.loads(mapping_path.read_text(encoding="utf-8"))
-    return data.get("mappings", [])
-
-
-def _match_layer_to_parameter(layer_name: str, mappings: list[dict]) -> str | None:
-    """Check if a layer name matches any mapping pattern."""
-    upper = layer_name.upper()
-    for m in mappings:
-        for pattern in m["layer_patterns"]:
-            if pattern.upper() in upper:
-                return m["rule_parameter"]
-    return None
-
-
 def measure_compliance(
     adapter: AutoCADPort,
     request: ComplianceMeasurementRequest,
+    *,
+    files: list[Path] | None = None,
 ) -> ComplianceMeasurementResult:
-    """Extract dimensions from drawings and compare against compliance rules.
+    """Measure drawings against compliance rules.
 
-    This is the key differentiator: automated measurement verification.
+    Dimensions (by their layer's linear mapping) and closed polylines of
+    each drawing are checked in a single batch, converted from
+    ``request.drawing_units`` to each rule's unit. A polyline is checked
+    as the room type its label names when ``request.recognize_rooms`` is
+    set and it encloses one, else by its layer's area mapping.
     """
-    dwg_files = get_dwg_files(request.folder)
-    mappings = _load_dimension_mapping()
+    dwg_files = files if files is not None else get_dwg_files(request.folder)
+    engine = RuleEngine.compile(request.rule_sets, request.building_type)
+    engine.scales(request.drawing_units)  # reject an unknown unit up front
+    vocabulary = RoomVocabulary.load() if request.recognize_rooms else None
     result = ComplianceMeasurementResult()
 
-    # Load all requested rule sets
-    rules_by_param: dict[str, list] = {}
-    for rule_name in request.rule_sets:
-        try:
-            rule_set = load_rule_set(rule_name)
-            for rule in rule_set.rules:
-                if request.building_type and rule.building_type:
-                    if request.building_type not in rule.building_type:
-                        continue
-                rules_by_param.setdefault(rule.parameter, []).append(rule)
-        except FileNotFoundError:
-            logger.warning(f"Rule set '{rule_name}' not found, skipping")
-
-    for dwg in dwg_files:
+    for dwg in track_files(result, dwg_files):
         try:
             adapter.open_drawing(str(dwg))
             dims = adapter.get_dimensions()
-
-            for dim in dims:
-                param = _match_layer_to_parameter(dim.layer, mappings)
-                if param is None:
-                    continue
-
-                matching_rules = rules_by_param.get(param, [])
-                for rule in matching_rules:
-                    result.total_checks += 1
-                    if rule.check_type == "min_dimension":
-                        status = "pass" if dim.value >= rule.threshold else "fail"
-                    elif rule.check_type == "max_dimension":
-                        status = "pass" if dim.value <= rule.threshold else "fail"
-                    else:
-                        status = "pass"
-
-                    if status == "pass":
-                        result.pass_count += 1
-                    else:
-                        result.fail_count += 1
-
-                    result.findings.append(
-                        MeasurementFinding(
-                            file=str(dwg),
-                            rule_id=rule.id,
-                            description=rule.description,
-                            by_law=rule.by_law,
-                            parameter=rule.parameter,
-                            threshold=rule.threshold,
-                            measured_value=dim.value,
-                            unit=rule.unit,
-                            status=status,
-                            severity=rule.severity,
-                        )
+            rooms = _with_geometry([p for p in adapter.get_polylines() if p.closed])
+            room_types: dict[str, str] = {}
+            if vocabulary is not None and rooms:
+                labelled, _ = match_rooms(
+                    rooms, adapter.get_text_entities(), vocabulary
+                )
+                room_types = {room.handle: room.parameter for room in labelled}
+
+            measured = [(d.handle, d.value) for d in dims] + [
+                (p.handle, p.area) for p in rooms
+            ]
+            checks = engine.evaluate(
+                [engine.parameter(d.layer) for d in dims]
+                + [
+                    room_types.get(p.handle) or engine.parameter(p.layer, "area")
+                    for p in rooms
+                ],
+                [value for _, value in measured],
+                request.drawing_units,
+            )
+            for check in checks:
+                rule = check.rule
+                status = "pass" if check.passed else "fail"
+                result.findings.append(
+                    MeasurementFinding(
+                        file=str(dwg),
+                        rule_id=rule.id,
+                        description=rule.description,
+                        by_law=rule.by_law,
+                        parameter=rule.parameter,
+                        threshold=rule.threshold,
+                        measured_value=check.value,
+                        unit=rule.unit,
+                        status=status,
+                        severity=rule.severity,
+                        handle=measured[check.measurement][0],
                     )
+                )
+            passed = sum(check.passed for check in checks)
+            result.total_checks += len(checks)
+            result.pass_count += passed
+            result.fail_count += len(checks) - passed
 
             result.files_processed += 1
             adapter.close_drawing()
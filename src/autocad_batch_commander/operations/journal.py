@@ -0,0 +1,326 @@
+"""Durable per-file checkpoint journal for resumable batch jobs.
+
+When :func:`~autocad_batch_commander.operations.executor.run_batch` is
+given a job ID, each drawing's result is committed to a SQLite journal as
+soon as it finishes (in the parent process for serial runs, in the worker
+for sharded ones), so a crash or hung CAD session loses at most the
+drawing in flight. Running again with the same job ID skips the drawings
+that finished without an error and merges their stored results with the
+new ones.
+
+Batch functions run once over all their drawings and loop over them
+through :func:`track_files`, which journals each drawing's share of the
+result — what it added to the counters and lists — as the loop moves on
+to the next one.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+import uuid
+from collections.abc import Iterable, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+from autocad_batch_commander.config import settings
+from autocad_batch_commander.models import JobInfo, OperationTimings
+from autocad_batch_commander.operations.manifest import failed_files
+
+R = TypeVar("R", bound=BaseModel)
+
+JOURNAL_FILENAME = "jobs.sqlite3"
+
+# Finished jobs are dropped from the journal after this long.
+_RETENTION_SECONDS = 30 * 24 * 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    operation TEXT NOT NULL,
+    request TEXT NOT NULL,
+    folder TEXT NOT NULL,
+    status TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    job_id TEXT NOT NULL,
+    path TEXT NOT NULL,
+    result TEXT NOT NULL,
+    ok INTEGER NOT NULL,
+    PRIMARY KEY (job_id, path)
+);
+"""
+
+
+def new_job_id() -> str:
+    """Return a short random job ID."""
+    return uuid.uuid4().hex[:12]
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """Where a worker should journal results (picklable for spawn)."""
+
+    db_path: Path
+    job_id: str
+
+
+class JobJournal:
+    """SQLite journal of batch jobs and their per-file results."""
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+
+    @classmethod
+    def from_settings(cls) -> JobJournal:
+        return cls(settings.cache_dir / JOURNAL_FILENAME)
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            # Make every committed checkpoint survive a power loss.
+            conn.execute("PRAGMA synchronous=FULL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # ── Jobs ───────────────────────────────────────────────────────
+
+    def begin(self, job_id: str, operation: str, request: str, folder: Path) -> bool:
+        """Start job *job_id*, or reopen it if it already exists.
+
+        Returns True when an existing job is being resumed. A job can only
+        be resumed by the same operation with the same request parameters.
+        """
+        row = self._db.execute(
+            "SELECT operation, request FROM jobs WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        now = time.time()
+        if row is None:
+            with self._db:
+                self._db.execute(
+                    "INSERT INTO jobs VALUES (?, ?, ?, ?, 'running', ?, ?)",
+                    (job_id, operation, request, str(folder), now, now),
+                )
+            self._prune(now - _RETENTION_SECONDS)
+            return False
+        if row[0] != operation:
+            raise ValueError(f"Job {job_id} was started by {row[0]}, not {operation}")
+        if row[1] != request:
+            raise ValueError(f"Job {job_id} was started with different parameters")
+        with self._db:
+            self._db.execute(
+                "UPDATE jobs SET status = 'running', updated_at = ? WHERE job_id = ?",
+                (now, job_id),
+            )
+        return True
+
+    def finish(self, job_id: str) -> None:
+        with self._db:
+            self._db.execute(
+                "UPDATE jobs SET status = 'complete', updated_at = ? WHERE job_id = ?",
+                (time.time(), job_id),
+            )
+
+    def jobs(self, limit: int = 20) -> list[JobInfo]:
+        """Return the most recently active jobs, newest first."""
+        rows = self._db.execute(
+            "SELECT j.job_id, j.operation, j.folder, j.status, j.started_at, "
+            "j.updated_at, COUNT(e.path) FROM jobs j "
+            "LEFT JOIN entries e ON e.job_id = j.job_id "
+            "GROUP BY j.job_id ORDER BY j.updated_at DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+        return [
+            JobInfo(
+                job_id=job_id,
+                operation=operation,
+                folder=folder,
+                status=status,
+                files_done=done,
+                started_at=datetime.fromtimestamp(started),
+                updated_at=datetime.fromtimestamp(updated),
+            )
+            for job_id, operation, folder, status, started, updated, done in rows
+        ]
+
+    def _prune(self, before: float) -> None:
+        with self._db:
+            self._db.execute(
+                "DELETE FROM entries WHERE job_id IN (SELECT job_id FROM jobs "
+                "WHERE status = 'complete' AND updated_at < ?)",
+                (before,),
+            )
+            self._db.execute(
+                "DELETE FROM jobs WHERE status = 'complete' AND updated_at < ?",
+                (before,),
+            )
+
+    # ── Per-file results ───────────────────────────────────────────
+
+    def record(self, job_id: str, path: Path, result: BaseModel) -> None:
+        """Durably store the result of one drawing."""
+        ok = str(path) not in failed_files(result)
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (job_id, str(path), result.model_dump_json(), ok),
+            )
+            self._db.execute(
+                "UPDATE jobs SET updated_at = ? WHERE job_id = ?",
+                (time.time(), job_id),
+            )
+
+    def done_files(self, job_id: str) -> set[str]:
+        """Return the drawings the job finished without an error."""
+        return {
+            path
+            for (path,) in self._db.execute(
+                "SELECT path FROM entries WHERE job_id = ? AND ok", (job_id,)
+            )
+        }
+
+    def results(self, job_id: str, files: list[Path], result_type: type[R]) -> list[R]:
+        """Return the journaled results for *files*, in that order."""
+        stored = dict(
+            self._db.execute(
+                "SELECT path, result FROM entries WHERE job_id = ?", (job_id,)
+            ).fetchall()
+        )
+        return [
+            result_type.model_validate_json(stored[str(path)])
+            for path in files
+            if str(path) in stored
+        ]
+
+
+# ── Per-drawing progress of a single batch call ───────────────────
+
+
+class UntrackedFunction(Exception):
+    """The batch function does not loop through :func:`track_files`."""
+
+
+def _mark(result: BaseModel) -> dict[str, object]:
+    """Return where *result*'s counters and lists stand now."""
+    aligned: frozenset[str] = getattr(type(result), "merge_aligned", frozenset())
+    mark: dict[str, object] = {}
+    for name in type(result).model_fields:
+        value = getattr(result, name)
+        if name in aligned:
+            mark[name] = [_mark(item) for item in value]
+        elif isinstance(value, list):
+            mark[name] = len(value)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            mark[name] = value
+    return mark
+
+
+def _since(result: R, mark: dict[str, object]) -> R:
+    """Return what *result* gained since *mark*, as a result of its own.
+
+    The inverse of :func:`~autocad_batch_commander.operations.executor.merge_results`:
+    merging the pieces of a run gives back the whole.
+    """
+    aligned: frozenset[str] = getattr(type(result), "merge_aligned", frozenset())
+    update: dict[str, object] = {}
+    for name in type(result).model_fields:
+        value = getattr(result, name)
+        if name in aligned:
+            marks = mark[name]
+            update[name] = [
+                _since(item, marks[i]) if i < len(marks) else item
+                for i, item in enumerate(value)
+            ]
+        elif name in mark:
+            if isinstance(value, list):
+                update[name] = value[mark[name] :]
+            else:
+                update[name] = value - mark[name]
+        elif isinstance(value, OperationTimings):
+            update[name] = None  # added to the last drawing by finish()
+    return result.model_copy(update=update)
+
+
+_tracker: ContextVar[FileCheckpoints | None] = ContextVar("_tracker", default=None)
+
+
+def track_files(result: R, files: Iterable[Path]) -> Iterable[Path]:
+    """Loop over a batch function's *files*, checkpointing *result*.
+
+    Under a checkpointed :func:`run_batch`, each drawing's share of
+    *result* is journaled when the loop asks for the next drawing (or
+    ends), so loop over the return value exactly once and keep per-drawing
+    work inside the loop. Otherwise *files* is returned unchanged.
+    """
+    tracker = _tracker.get()
+    return files if tracker is None else tracker.track(result, files)
+
+
+class FileCheckpoints:
+    """Journals the per-drawing results of one batch function call."""
+
+    def __init__(self, journal: JobJournal, job_id: str) -> None:
+        self.journal = journal
+        self.job_id = job_id
+        self._tracking = False
+        self._last: tuple[Path, BaseModel] | None = None
+
+    def __enter__(self) -> FileCheckpoints:
+        self._token = _tracker.set(self)
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        _tracker.reset(self._token)
+
+    def files(self, files: Iterable[Path]) -> Iterator[Path]:
+        """Feed *files* to the batch function, refusing if it is untracked."""
+        for path in files:
+            if not self._tracking:
+                raise UntrackedFunction
+            yield path
+
+    def track(self, result: R, files: Iterable[Path]) -> Iterator[Path]:
+        self._tracking = True
+        mark = _mark(result)
+        previous: Path | None = None
+        for path in files:
+            if previous is not None:
+                mark = self._record(previous, result, mark)
+            previous = path
+            yield path
+        if previous is not None:
+            self._record(previous, result, mark)
+
+    def _record(
+        self, path: Path, result: BaseModel, mark: dict[str, object]
+    ) -> dict[str, object]:
+        piece = _since(result, mark)
+        self.journal.record(self.job_id, path, piece)
+        self._last = (path, piece)
+        return _mark(result)
+
+    def finish(self, result: BaseModel) -> None:
+        """Add the call's profiling timings to its last drawing's entry."""
+        timings = getattr(result, "timings", None)
+        if self._last is not None and timings is not None:
+            path, piece = self._last
+            self.journal.record(
+                self.job_id, path, piece.model_copy(update={"timings": timings})
+            )
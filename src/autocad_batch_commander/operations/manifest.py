@@ -0,0 +1,168 @@
+"""Run manifest for incremental batch operations.
+
+After an incremental run, every processed drawing is recorded with its
+fingerprint (size, mtime, SHA-256 as it was left by the run), the
+operation, a fingerprint of the request and the outcome. The next run of
+the same operation and request only processes drawings that are new,
+changed since then, or failed last time.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from autocad_batch_commander.config import settings
+from autocad_batch_commander.utils.file_ops import file_sha256
+
+MANIFEST_FILENAME = "manifest.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS manifest (
+    operation TEXT NOT NULL,
+    request TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    processed_at REAL NOT NULL,
+    PRIMARY KEY (operation, request, path)
+);
+"""
+
+
+def operation_name(func: Callable) -> str:
+    """Return a stable name for a batch function."""
+    return f"{func.__module__}.{func.__qualname__}"
+
+
+def request_fingerprint(request: BaseModel) -> str:
+    """Hash the request parameters, ignoring the folder they run on."""
+    payload = request.model_dump_json(exclude={"folder"})
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def failed_files(result: BaseModel) -> set[str]:
+    """Return the drawings a batch result reports as failed."""
+    failed = {e.file for e in getattr(result, "errors", [])}
+    # Audits report per-file errors as findings rather than in ``errors``.
+    failed.update(
+        f.file
+        for f in getattr(result, "findings", [])
+        if getattr(f, "finding_type", None) == "error"
+    )
+    return failed
+
+
+class RunManifest:
+    """SQLite record of what each incremental run last did to each drawing."""
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+
+    @classmethod
+    def from_settings(cls) -> RunManifest:
+        return cls(settings.cache_dir / MANIFEST_FILENAME)
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def partition(
+        self, operation: str, request: str, files: list[Path]
+    ) -> tuple[list[Path], list[Path]]:
+        """Split *files* into ``(to_process, skipped)``, both in input order.
+
+        A drawing is skipped when its last recorded outcome was ``ok`` and
+        its size and mtime still match, or its size and hash do (a copy or
+        ``touch`` that left the content alone).
+        """
+        rows = {
+            path: (size, mtime_ns, sha256)
+            for path, size, mtime_ns, sha256 in self._db.execute(
+                "SELECT path, size, mtime_ns, sha256 FROM manifest "
+                "WHERE operation = ? AND request = ? AND outcome = 'ok'",
+                (operation, request),
+            )
+        }
+        todo: list[Path] = []
+        skipped: list[Path] = []
+        touched: list[tuple[int, str]] = []
+        for path in files:
+            row = rows.get(str(path.resolve()))
+            try:
+                stat = path.stat()
+                if row is None or row[0] != stat.st_size:
+                    todo.append(path)
+                elif row[1] == stat.st_mtime_ns:
+                    skipped.append(path)
+                elif row[2] == file_sha256(path):
+                    skipped.append(path)
+                    touched.append((stat.st_mtime_ns, str(path.resolve())))
+                else:
+                    todo.append(path)
+            except OSError:
+                # Gone or locked since discovery: let the run report it.
+                todo.append(path)
+
+        if touched:
+            with self._db:
+                self._db.executemany(
+                    "UPDATE manifest SET mtime_ns = ? WHERE operation = ? "
+                    "AND request = ? AND path = ?",
+                    [(mtime, operation, request, path) for mtime, path in touched],
+                )
+        return todo, skipped
+
+    def record(
+        self,
+        operation: str,
+        request: str,
+        files: Iterable[Path],
+        failed: set[str],
+    ) -> None:
+        """Record the outcome of *files* as they are on disk after the run."""
+        now = time.time()
+        rows = []
+        for path in files:
+            try:
+                stat = path.stat()
+                digest = file_sha256(path)
+            except OSError:
+                continue
+            outcome = "error" if str(path) in failed else "ok"
+            rows.append(
+                (
+                    operation,
+                    request,
+                    str(path.resolve()),
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                    digest,
+                    outcome,
+                    now,
+                )
+            )
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO manifest VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
@@ -0,0 +1,221 @@
+"""Single-open pipeline: run several operations per drawing with one open/save."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import NamedTuple
+
+from loguru import logger
+
+from autocad_batch_commander.acad.port import AutoCADPort
+from autocad_batch_commander.models import (
+    BatchPurgeRequest,
+    BlockInsertRequest,
+    FileDetail,
+    LayerRenameRequest,
+    LayerStandardizeRequest,
+    PipelineRequest,
+    PipelineResult,
+    PipelineStage,
+    PipelineStageResult,
+    RoomExtractionRequest,
+    RoomRecord,
+    TermReplaceRequest,
+    TextReplaceRequest,
+    TitleBlockUpdateRequest,
+)
+from autocad_batch_commander.operations.block_ops import (
+    apply_block_inserts,
+    apply_title_block_updates,
+)
+from autocad_batch_commander.operations.drawing_ops import apply_purge
+from autocad_batch_commander.operations.journal import track_files
+from autocad_batch_commander.operations.layer_ops import (
+    apply_rename_layer,
+    apply_standardize_layers,
+    load_standard_mappings,
+)
+from autocad_batch_commander.operations.room_ops import (
+    RoomVocabulary,
+    recognize_rooms,
+)
+from autocad_batch_commander.operations.text_ops import (
+    apply_replace_terms,
+    compile_terms,
+)
+from autocad_batch_commander.utils.backup import BackupWriter
+from autocad_batch_commander.utils.file_ops import get_dwg_files
+from autocad_batch_commander.utils.profiling import profile_stage
+
+PIPELINE_OPERATIONS = (
+    "find_replace",
+    "replace_terms",
+    "rename_layer",
+    "standardize_layers",
+    "update_title_blocks",
+    "insert_blocks",
+    "purge",
+    "recognize_rooms",
+)
+
+StageFunc = Callable[[AutoCADPort], int]
+
+
+class PreparedStage(NamedTuple):
+    """A validated stage bound to its operation logic."""
+
+    func: StageFunc
+    mutates: bool  # report-only stages never trigger a save
+    rooms: list[RoomRecord] | None = None  # filled per drawing by the stage
+
+
+def _prepare_stage(stage: PipelineStage, folder: Path) -> PreparedStage:
+    """Validate a stage and bind it to its operation logic."""
+    params = {**stage.params, "folder": folder, "backup": False}
+
+    if stage.operation == "find_replace":
+        text_req = TextReplaceRequest(**params)
+        text_replacer = compile_terms(text_req)
+        return PreparedStage(
+            lambda adapter: apply_replace_terms(
+                adapter, text_replacer, text_req.layers
+            ),
+            True,
+        )
+
+    elif stage.operation == "replace_terms":
+        terms_req = TermReplaceRequest(**params)
+        replacer = compile_terms(terms_req)
+        return PreparedStage(
+            lambda adapter: apply_replace_terms(adapter, replacer, terms_req.layers),
+            True,
+        )
+
+    elif stage.operation == "rename_layer":
+        rename_req = LayerRenameRequest(**params)
+        return PreparedStage(
+            lambda adapter: apply_rename_layer(adapter, rename_req), True
+        )
+
+    elif stage.operation == "standardize_layers":
+        std_req = LayerStandardizeRequest(**params)
+        mappings = std_req.custom_mappings or load_standard_mappings(std_req.standard)
+        return PreparedStage(
+            lambda adapter: apply_standardize_layers(
+                adapter, mappings, report_only=std_req.report_only
+            ),
+            not std_req.report_only,
+        )
+
+    elif stage.operation == "update_title_blocks":
+        title_req = TitleBlockUpdateRequest(**params)
+        return PreparedStage(
+            lambda adapter: apply_title_block_updates(adapter, title_req), True
+        )
+
+    elif stage.operation == "insert_blocks":
+        insert_req = BlockInsertRequest(**params)
+        return PreparedStage(
+            lambda adapter: apply_block_inserts(adapter, insert_req), True
+        )
+
+    elif stage.operation == "purge":
+        purge_req = BatchPurgeRequest(**params)
+
+        def _purge(adapter: AutoCADPort) -> int:
+            purged, issues = apply_purge(adapter, purge_req)
+            for issue in issues:
+                logger.info(f"Audit: {issue.description}")
+            return purged
+
+        return PreparedStage(_purge, True)
+
+    elif stage.operation == "recognize_rooms":
+        rooms_req = RoomExtractionRequest(**params)
+        vocabulary = RoomVocabulary.load(rooms_req.vocabulary)
+        found: list[RoomRecord] = []
+
+        def _recognize(adapter: AutoCADPort) -> int:
+            rooms, _ = recognize_rooms(
+                adapter, vocabulary, rooms_req.layers, rooms_req.label_layers
+            )
+            found.extend(rooms)
+            return len(rooms)
+
+        return PreparedStage(_recognize, False, found)
+
+    raise ValueError(
+        f"Unknown pipeline operation '{stage.operation}'. "
+        f"Expected one of: {', '.join(PIPELINE_OPERATIONS)}"
+    )
+
+
+def run_pipeline(
+    adapter: AutoCADPort,
+    request: PipelineRequest,
+    *,
+    files: list[Path] | None = None,
+) -> PipelineResult:
+    """Apply every stage to each drawing with a single open/save/close cycle.
+
+    Stages run in order against the already-open document; the drawing is
+    saved once if any modifying stage reported changes. A failure in any
+    stage discards the drawing's changes (it is closed without saving).
+    """
+    prepared = [_prepare_stage(stage, request.folder) for stage in request.stages]
+    dwg_files = files if files is not None else get_dwg_files(request.folder)
+    result = PipelineResult(
+        stages=[PipelineStageResult(operation=s.operation) for s in request.stages]
+    )
+
+    with BackupWriter(request.backup) as backups:
+        for dwg in track_files(result, backups.prefetch(dwg_files)):
+            try:
+                adapter.open_drawing(str(dwg))
+                for p in prepared:
+                    if p.rooms is not None:
+                        p.rooms.clear()
+                stage_changes = []
+                for stage, p in zip(request.stages, prepared):
+                    with profile_stage(stage.operation):
+                        stage_changes.append(p.func(adapter))
+                modified = any(
+                    changes > 0 and p.mutates
+                    for changes, p in zip(stage_changes, prepared)
+                )
+
+                if modified:
+                    backups.commit(dwg)
+                    adapter.save_drawing()
+                    result.files_modified += 1
+
+                for stage_result, changes, p in zip(
+                    result.stages, stage_changes, prepared
+                ):
+                    stage_result.details.append(
+                        FileDetail(file=str(dwg), changes=changes)
+                    )
+                    stage_result.total_changes += changes
+                    if changes > 0 and p.mutates:
+                        stage_result.files_modified += 1
+                    for room in p.rooms or ():
+                        room.file = str(dwg)
+                        stage_result.rooms.append(room)
+
+                # Report-only stages propose changes; only written ones count.
+                result.total_changes += sum(
+                    changes for changes, p in zip(stage_changes, prepared) if p.mutates
+                )
+                adapter.close_drawing()
+                result.files_processed += 1
+
+            except Exception as exc:
+                logger.error(f"Error processing {dwg}: {exc}")
+                result.errors.append(FileDetail(file=str(dwg), error=str(exc)))
+                try:
+                    adapter.close_drawing()
+                except Exception:
+                    pass
+
+    return result
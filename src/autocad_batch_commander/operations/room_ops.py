@@ -0,0 +1,204 @@
+"""Room recognition: pair room label text with the polyline enclosing it.
+
+Each text whose wording names a room type ("MASTER BEDROOM 2", "DAPUR")
+is looked up in a :class:`~autocad_batch_commander.utils.spatial.SpatialIndex`
+over the drawing's closed polylines, and the innermost polyline that
+contains the label's insertion point becomes that room. Matching costs a
+tree query per label rather than a test of every label against every
+outline, so sheets with thousands of rooms stay fast.
+
+Room types and their labels come from ``standards/room_types.json``; a
+request can add labels of its own.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from pathlib import Path
+
+from loguru import logger
+
+from autocad_batch_commander.acad.port import AutoCADPort
+from autocad_batch_commander.models import (
+    FileDetail,
+    PolylineEntity,
+    RoomExtractionRequest,
+    RoomExtractionResult,
+    RoomRecord,
+    TextEntity,
+)
+from autocad_batch_commander.operations.journal import track_files
+from autocad_batch_commander.standards import registry
+from autocad_batch_commander.utils.file_ops import get_dwg_files
+from autocad_batch_commander.utils.geometry import measure_polylines
+from autocad_batch_commander.utils.spatial import SpatialIndex, SpatialItem
+
+# MText formatting codes (\P, \A1;, {\fArial|b1;...}) and anything else
+# that is not a letter or digit separate words.
+_FORMATTING = re.compile(r"\\[A-Za-z][^;\\{}]*;|\\[A-Za-z]")
+_SEPARATORS = re.compile(r"[^A-Z0-9]+")
+
+
+def _words(text: str) -> tuple[str, ...]:
+    return tuple(_SEPARATORS.split(_FORMATTING.sub(" ", text).upper()))
+
+
+class RoomVocabulary:
+    """Classifies label text into room types.
+
+    A label gets the room type of the longest phrase (in words) it
+    contains, the earliest one on ties, so "MASTER BEDROOM 2" is a master
+    bedroom rather than a bedroom.
+    """
+
+    def __init__(self, room_types: dict[str, dict]) -> None:
+        self.parameters = {
+            name: spec.get("parameter", f"{name}_area")
+            for name, spec in room_types.items()
+        }
+        # first word → [(phrase words, room type)], longest phrase first
+        self._phrases: dict[str, list[tuple[tuple[str, ...], str]]] = {}
+        for name, spec in room_types.items():
+            for label in spec.get("labels", []):
+                words = tuple(w for w in _words(label) if w)
+                if words:
+                    self._phrases.setdefault(words[0], []).append((words, name))
+        for phrases in self._phrases.values():
+            phrases.sort(key=lambda p: -len(p[0]))
+        self._memo: dict[str, str | None] = {}
+
+    @classmethod
+    def load(cls, extra: dict[str, list[str]] | None = None) -> RoomVocabulary:
+        """Return the standard vocabulary with *extra* labels per room type."""
+        room_types = {
+            name: {**spec, "labels": list(spec.get("labels", []))}
+            for name, spec in registry.room_types().items()
+        }
+        for name, labels in (extra or {}).items():
+            room_types.setdefault(name, {"labels": []})["labels"].extend(labels)
+        return cls(room_types)
+
+    def classify(self, text: str) -> str | None:
+        """Return the room type *text* names, or ``None``."""
+        try:
+            return self._memo[text]
+        except KeyError:
+            pass
+        words = [w for w in _words(text) if w]
+        best: tuple[int, str] | None = None
+        for i, word in enumerate(words):
+            for phrase, name in self._phrases.get(word, ()):
+                if best is not None and len(phrase) <= best[0]:
+                    break
+                if tuple(words[i : i + len(phrase)]) == phrase:
+                    best = (len(phrase), name)
+                    break
+        room_type = best[1] if best is not None else None
+        self._memo[text] = room_type
+        return room_type
+
+
+def match_rooms(
+    polylines: Sequence[PolylineEntity],
+    texts: Sequence[TextEntity],
+    vocabulary: RoomVocabulary,
+) -> tuple[list[RoomRecord], int]:
+    """Pair room labels in *texts* with the closed *polylines* enclosing them.
+
+    Returns the rooms, in label order, and the number of room labels that
+    lie inside no closed polyline. A label inside nested outlines goes to
+    the smallest; an outline holding several labels keeps the first.
+    """
+    outlines = [p for p in polylines if p.closed and len(p.vertices) > 2]
+    measured = measure_polylines(outlines)
+    index = SpatialIndex(
+        SpatialItem("polyline", p.handle, g.bbox, p) for p, g in zip(outlines, measured)
+    )
+    geometry = {p.handle: g for p, g in zip(outlines, measured)}
+
+    rooms: list[RoomRecord] = []
+    taken: set[str] = set()
+    unplaced = 0
+    for text in texts:
+        if text.position is None:
+            continue
+        room_type = vocabulary.classify(text.text)
+        if room_type is None:
+            continue
+        enclosing = index.containing(text.position.x, text.position.y)
+        if not enclosing:
+            unplaced += 1
+            continue
+        outline = min(enclosing, key=lambda item: geometry[item.handle].area)
+        if outline.handle in taken:
+            continue
+        taken.add(outline.handle)
+        polyline: PolylineEntity = outline.entity
+        g = geometry[outline.handle]
+        x0, y0, x1, y1 = g.bbox
+        rooms.append(
+            RoomRecord(
+                handle=polyline.handle,
+                room_type=room_type,
+                parameter=vocabulary.parameters[room_type],
+                label=text.text,
+                label_handle=text.handle,
+                layer=polyline.layer,
+                area=polyline.area or g.area,
+                perimeter=polyline.perimeter or g.perimeter,
+                width=min(x1 - x0, y1 - y0),
+                length=max(x1 - x0, y1 - y0),
+            )
+        )
+    return rooms, unplaced
+
+
+def recognize_rooms(
+    adapter: AutoCADPort,
+    vocabulary: RoomVocabulary,
+    layers: list[str] | None = None,
+    label_layers: list[str] | None = None,
+) -> tuple[list[RoomRecord], int]:
+    """Recognise the rooms of the open drawing (see :func:`match_rooms`)."""
+    return match_rooms(
+        adapter.get_polylines(layers=layers),
+        adapter.get_text_entities(layers=label_layers),
+        vocabulary,
+    )
+
+
+def extract_rooms(
+    adapter: AutoCADPort,
+    request: RoomExtractionRequest,
+    *,
+    files: list[Path] | None = None,
+) -> RoomExtractionResult:
+    """Recognise labelled rooms in DWG files in the folder."""
+    vocabulary = RoomVocabulary.load(request.vocabulary)
+    dwg_files = files if files is not None else get_dwg_files(request.folder)
+    result = RoomExtractionResult()
+
+    for dwg in track_files(result, dwg_files):
+        try:
+            adapter.open_drawing(str(dwg))
+            rooms, unplaced = recognize_rooms(
+                adapter, vocabulary, request.layers, request.label_layers
+            )
+            for room in rooms:
+                room.file = str(dwg)
+            result.rooms.extend(rooms)
+            result.total_rooms += len(rooms)
+            result.unplaced_labels += unplaced
+            result.files_processed += 1
+            adapter.close_drawing()
+
+        except Exception as exc:
+            logger.error(f"Error processing {dwg}: {exc}")
+            result.errors.append(FileDetail(file=str(dwg), error=str(exc)))
+            try:
+                adapter.close_drawing()
+            except Exception:
+                pass
+
+    return result
@@ -0,0 +1,288 @@
+"""Compiled compliance rules for measurement checks.
+
+:class:`RuleEngine` is compiled from the requested rule sets and
+``dimension_mapping.json`` as held by the standards registry, and reused
+until those files change. It holds :class:`LayerMatcher` objects — an
+Aho-Corasick automaton over the mapping's layer patterns per kind of
+measurement, memoised per distinct layer name — and the rules indexed by
+parameter, with their thresholds and check types packed side by side.
+:meth:`RuleEngine.evaluate` then pairs all measurements of a drawing with
+their rules and decides every check at once — dimensions and
+closed-polyline areas alike, converted from drawing units to each rule's
+unit — with one comparison per check type over the whole batch
+(vectorised when NumPy is installed).
+"""
+
+from __future__ import annotations
+
+import operator
+from collections import deque
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from loguru import logger
+
+from autocad_batch_commander.models import ComplianceRule
+from autocad_batch_commander.operations.compliance_ops import load_rule_set
+from autocad_batch_commander.standards import registry
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised without the extra
+    np = None  # type: ignore[assignment]
+
+# check_type → comparison of measured value against threshold; works on
+# floats and element-wise on arrays. Check types that cannot be measured
+# from geometry (durations, ratios) are not listed and always pass.
+CHECKS: dict[str, Callable[[Any, Any], Any]] = {
+    "min_dimension": operator.ge,
+    "max_dimension": operator.le,
+}
+
+
+# Length of one drawing unit, in metres.
+DRAWING_UNITS: dict[str, float] = {"mm": 1e-3, "cm": 1e-2, "m": 1.0}
+
+# Rule unit → (power of length, metres per unit of length). Measurements are
+# converted from drawing units to the rule's unit before comparing; rules
+# in other units (minutes, ratios, litres) are compared unconverted.
+RULE_UNITS: dict[str, tuple[int, float]] = {
+    "mm": (1, 1e-3),
+    "metres": (1, 1.0),
+    "sq_metres": (2, 1.0),
+}
+
+
+def load_dimension_mapping() -> list[dict]:
+    """Load the layer → rule parameter mapping file."""
+    return registry.dimension_mapping()
+
+
+class LayerMatcher:
+    """Map layer names to rule parameters by substring patterns.
+
+    A layer maps to the parameter of the first mapping (in file order)
+    with any pattern occurring in the upper-cased layer name. All patterns
+    are searched in one pass of an Aho-Corasick automaton, and each
+    distinct layer name is resolved only once.
+    """
+
+    def __init__(self, mappings: Sequence[dict]) -> None:
+        self._parameters = [m["rule_parameter"] for m in mappings]
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail = [0]
+        self._best = [len(mappings)]  # lowest mapping index matched at a state
+        self._memo: dict[str, str | None] = {}
+        for priority, mapping in enumerate(mappings):
+            for pattern in mapping["layer_patterns"]:
+                self._insert(pattern.upper(), priority)
+        self._link()
+
+    def _insert(self, pattern: str, priority: int) -> None:
+        state = 0
+        for char in pattern:
+            following = self._goto[state].get(char)
+            if following is None:
+                following = len(self._goto)
+                self._goto[state][char] = following
+                self._goto.append({})
+                self._fail.append(0)
+                self._best.append(len(self._parameters))
+            state = following
+        self._best[state] = min(self._best[state], priority)
+
+    def _link(self) -> None:
+        """Set failure links breadth-first and fold outputs along them."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, following in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[following] = self._goto[fail].get(char, 0)
+                self._best[following] = min(
+                    self._best[following], self._best[self._fail[following]]
+                )
+                queue.append(following)
+
+    def match(self, layer: str) -> str | None:
+        """Return the rule parameter for *layer*, or ``None``."""
+        try:
+            return self._memo[layer]
+        except KeyError:
+            pass
+        state, best = 0, self._best[0]
+        for char in layer.upper():
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            best = min(best, self._best[state])
+        parameter = self._parameters[best] if best < len(self._parameters) else None
+        self._memo[layer] = parameter
+        return parameter
+
+
+@dataclass(frozen=True)
+class Check:
+    """Outcome of one rule applied to one measurement."""
+
+    measurement: int  # index into the evaluated batch
+    rule: ComplianceRule
+    passed: bool
+    value: float  # the measurement in the rule's unit
+
+
+class RuleEngine:
+    """Rules and layer mapping compiled for batched evaluation.
+
+    Layers are matched separately per kind of measurement — ``linear``
+    for dimensions, ``area`` for closed polylines — after the mapping's
+    ``dimension_type`` (``linear`` when absent).
+    """
+
+    def __init__(
+        self, rules: Sequence[ComplianceRule], mappings: Sequence[dict]
+    ) -> None:
+        self.rules = list(rules)
+        kinds: dict[str, list[dict]] = {"linear": [], "area": []}
+        for mapping in mappings:
+            kinds.setdefault(mapping.get("dimension_type", "linear"), []).append(
+                mapping
+            )
+        self.matchers = {kind: LayerMatcher(m) for kind, m in kinds.items()}
+        self._scales: dict[str, list[float]] = {}
+        self._by_parameter: dict[str, list[int]] = {}
+        for index, rule in enumerate(self.rules):
+            self._by_parameter.setdefault(rule.parameter, []).append(index)
+        self._thresholds = [rule.threshold for rule in self.rules]
+        checks = list(CHECKS)
+        self._codes = [
+            checks.index(r.check_type) if r.check_type in CHECKS else -1
+            for r in self.rules
+        ]
+        if np is not None:
+            self._threshold_array = np.array(self._thresholds, dtype=np.float64)
+            self._code_array = np.array(self._codes, dtype=np.int64)
+
+    @classmethod
+    def compile(
+        cls, rule_sets: Sequence[str], building_type: str | None = None
+    ) -> RuleEngine:
+        """Load *rule_sets* and the dimension mapping into an engine.
+
+        Rules restricted to other building types are left out; missing
+        rule sets are skipped with a warning. Engines are kept and reused
+        until one of their standards files changes, so layer names matched
+        in earlier runs stay resolved.
+        """
+        sources: list[Any] = []
+        for rule_name in rule_sets:
+            try:
+                sources.append(load_rule_set(rule_name))
+            except FileNotFoundError:
+                logger.warning(f"Rule set '{rule_name}' not found, skipping")
+        mappings = load_dimension_mapping()
+        sources.append(mappings)
+
+        key = (registry.root, tuple(rule_sets), building_type)
+        cached = _compiled.get(key)
+        if cached is not None and len(cached[0]) == len(sources):
+            if all(a is b for a, b in zip(cached[0], sources)):
+                return cached[1]
+
+        rules: list[ComplianceRule] = []
+        for rule_set in sources[:-1]:
+            for rule in rule_set.rules:
+                if building_type and rule.building_type:
+                    if building_type not in rule.building_type:
+                        continue
+                rules.append(rule)
+        engine = cls(rules, mappings)
+        _compiled[key] = (tuple(sources), engine)
+        return engine
+
+    def parameter(self, layer: str, kind: str = "linear") -> str | None:
+        """Return the rule parameter a *kind* measurement on *layer* gives."""
+        matcher = self.matchers.get(kind)
+        return matcher.match(layer) if matcher is not None else None
+
+    def scales(self, units: str) -> list[float]:
+        """Return, per rule, the factor from *units* to the rule's unit."""
+        scales = self._scales.get(units)
+        if scales is None:
+            if units not in DRAWING_UNITS:
+                known = ", ".join(DRAWING_UNITS)
+                raise ValueError(f"Unknown drawing unit '{units}' (use {known})")
+            scales = []
+            for rule in self.rules:
+                power, metres = RULE_UNITS.get(rule.unit, (0, 1.0))
+                scales.append((DRAWING_UNITS[units] / metres) ** power)
+            self._scales[units] = scales
+        return scales
+
+    def evaluate(
+        self,
+        parameters: Sequence[str | None],
+        values: Sequence[float],
+        units: str = "mm",
+    ) -> list[Check]:
+        """Check measurement ``values[i]`` of ``parameters[i]`` against its rules.
+
+        *values* are in drawing *units*; linear and area measurements
+        can be mixed. Checks come out in measurement order, then rule
+        order.
+        """
+        measurements: list[int] = []
+        rule_indices: list[int] = []
+        for i, parameter in enumerate(parameters):
+            if parameter is None:
+                continue
+            indices = self._by_parameter.get(parameter)
+            if indices:
+                measurements.extend([i] * len(indices))
+                rule_indices.extend(indices)
+        if not rule_indices:
+            return []
+        converted, passed = self._decide(
+            measurements, rule_indices, values, self.scales(units)
+        )
+        return [
+            Check(m, self.rules[r], ok, value)
+            for m, r, ok, value in zip(measurements, rule_indices, passed, converted)
+        ]
+
+    def _decide(
+        self,
+        measurements: list[int],
+        rules: list[int],
+        values: Sequence[float],
+        scales: list[float],
+    ) -> tuple[list[float], list[bool]]:
+        if np is None:
+            names = list(CHECKS)
+            converted = [values[m] * scales[r] for m, r in zip(measurements, rules)]
+            passed = [
+                True
+                if self._codes[r] < 0
+                else bool(CHECKS[names[self._codes[r]]](value, self._thresholds[r]))
+                for value, r in zip(converted, rules)
+            ]
+            return converted, passed
+        measured = (
+            np.asarray(values, dtype=np.float64)[measurements]
+            * np.asarray(scales, dtype=np.float64)[rules]
+        )
+        thresholds = self._threshold_array[rules]
+        codes = self._code_array[rules]
+        passed = np.ones(len(rules), dtype=bool)
+        for code, compare in enumerate(CHECKS.values()):
+            mask = codes == code
+            if mask.any():
+                passed[mask] = compare(measured[mask], thresholds[mask])
+        return measured.tolist(), passed.tolist()
+
+
+# (standards dir, rule sets, building type) → (parsed sources, engine)
+_compiled: dict[tuple[Any, ...], tuple[tuple[Any, ...], RuleEngine]] = {}
@@ -1,8 +1,8 @@
-"""Batch text find-and-replace operation."""
+"""Batch text find-and-replace operations."""
 
 from __future__ import annotations
 
-import re
+from pathlib import Path
 
 from loguru import logger
 
@@ -10,70 +10,125 @@ from autocad_batch_commander.acad.port import AutoCADPort
 from autocad_batch_commander.models import (
     FileDetail,
     OperationResult,
+    TermReplaceRequest,
     TextReplaceRequest,
 )
-from autocad_batch_commander.utils.file_ops import create_backup, get_dwg_files
-
-
-def _replace(original: str, find: str, replace: str, *, case_sensitive: bool) -> str:
-    if case_sensitive:
-        return original.replace(find, replace)
-    return re.compile(re.escape(find), re.IGNORECASE).sub(replace, original)
+from autocad_batch_commander.operations.journal import track_files
+from autocad_batch_commander.utils.backup import BackupWriter
+from autocad_batch_commander.utils.file_ops import get_dwg_files
+from autocad_batch_commander.utils.text_replace import TermReplacer
+
+
+def compile_terms(request: TermReplaceRequest | TextReplaceRequest) -> TermReplacer:
+    """Compile a request's terms once, to be applied to every drawing."""
+    if isinstance(request, TextReplaceRequest):
+        return TermReplacer(
+            {request.find_text: request.replace_text},
+            case_sensitive=request.case_sensitive,
+        )
+    return TermReplacer(
+        request.mappings,
+        case_sensitive=request.case_sensitive,
+        whole_word=request.whole_word,
+        regex=request.regex,
+    )
+
+
+def apply_replace_terms(
+    adapter: AutoCADPort, replacer: TermReplacer, layers: list[str] | None = None
+) -> int:
+    """Rewrite the open drawing's texts with *replacer*. Returns entities changed."""
+    updates: dict[str, str] = {}
+    for entity in adapter.get_text_entities(layers=layers):
+        new_text, matches = replacer.sub(entity.text)
+        if matches:
+            updates[entity.handle] = new_text
+    if updates:
+        adapter.set_texts(updates)
+    return len(updates)
 
 
 def batch_find_replace(
     adapter: AutoCADPort,
     request: TextReplaceRequest,
+    *,
+    files: list[Path] | None = None,
 ) -> OperationResult:
     """Execute a batch text find-and-replace across all DWG files in the folder."""
-    dwg_files = get_dwg_files(request.folder)
+    replacer = compile_terms(request)
+    dwg_files = files if files is not None else get_dwg_files(request.folder)
     result = OperationResult()
 
-    for dwg in dwg_files:
-        detail = FileDetail(file=str(dwg))
-        try:
-            if request.backup:
-                create_backup(dwg)
-
-            adapter.open_drawing(str(dwg))
-            texts = adapter.get_text_entities(layers=request.layers)
-
-            changes = 0
-            for entity in texts:
-                if request.case_sensitive:
-                    match = request.find_text in entity.text
-                else:
-                    match = request.find_text.lower() in entity.text.lower()
-
-                if match:
-                    new_text = _replace(
-                        entity.text,
-                        request.find_text,
-                        request.replace_text,
-                        case_sensitive=request.case_sensitive,
-                    )
-                    adapter.set_text(entity.handle, new_text)
-                    changes += 1
-
-            if changes > 0:
-                adapter.save_drawing()
-                result.files_modified += 1
-                result.total_changes += changes
-
-            detail.changes = changes
-            adapter.close_drawing()
-            result.files_processed += 1
-
-        except Exception as exc:
-            logger.error(f"Error processing {dwg}: {exc}")
-            detail.error = str(exc)
-            result.errors.append(detail)
+    with BackupWriter(request.backup) as backups:
+        for dwg in track_files(result, backups.prefetch(dwg_files)):
+            detail = FileDetail(file=str(dwg))
             try:
+                adapter.open_drawing(str(dwg))
+                changes = apply_replace_terms(adapter, replacer, request.layers)
+
+                if changes > 0:
+                    backups.commit(dwg)
+                    adapter.save_drawing()
+                    result.files_modified += 1
+                    result.total_changes += changes
+
+                detail.changes = changes
                 adapter.close_drawing()
-            except Exception:
-                pass
-            continue
+                result.files_processed += 1
+
+            except Exception as exc:
+                logger.error(f"Error processing {dwg}: {exc}")
+                detail.error = str(exc)
+                result.errors.append(detail)
+                try:
+                    adapter.close_drawing()
+                except Exception:
+                    pass
+                continue
+
+            result.details.append(detail)
+
+    return result
+
 
-        result.details.append(detail)
+def batch_replace_terms(
+    adapter: AutoCADPort,
+    request: TermReplaceRequest,
+    *,
+    files: list[Path] | None = None,
+) -> OperationResult:
+    """Apply a whole find → replace table to every DWG file in one pass each."""
+    replacer = compile_terms(request)
+    dwg_files = files if files is not None else get_dwg_files(request.folder)
+    result = OperationResult()
+
+    with BackupWriter(request.backup) as backups:
+        for dwg in track_files(result, backups.prefetch(dwg_files)):
+            detail = FileDetail(file=str(dwg))
+            try:
+                adapter.open_drawing(str(dwg))
+                changes = apply_replace_terms(adapter, replacer, request.layers)
+
+                if changes > 0:
+                    backups.commit(dwg)
+                    adapter.save_drawing()
+                    result.files_modified += 1
+                    result.total_changes += changes
+
+                detail.changes = changes
+                adapter.close_drawing()
+                result.files_processed += 1
+
+            except Exception as exc:
+                logger.error(f"Error processing {dwg}: {exc}")
+                detail.error = str(exc)
+                result.errors.append(detail)
+                try:
+                    adapter.close_drawing()
+                except Exception:
+                    pass
+                continue
+
+            result.details.append(detail)
 
     return result
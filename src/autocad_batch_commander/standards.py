@@ -0,0 +1,209 @@
+"""Process-wide cache of the JSON files under ``settings.standards_dir``.
+
+Layer standards (``aia.json``, ...), compliance rule sets
+(``rules/*.json``), ``dimension_mapping.json`` and ``room_types.json``
+are parsed once and kept in memory by :data:`registry`. Every access
+stats the file and reparses it only when its mtime or size changed, so
+edits on disk show up on the next call without a restart while repeated
+requests — web and MCP calls, batch runs — cost a ``stat`` instead of a
+read and parse.
+
+:meth:`StandardsRegistry.rules` looks rules up across every rule set
+through indexes by id, category, building type and parameter, rebuilt
+when a rule file changes. Returned objects are shared: treat them as
+read-only.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
+
+from autocad_batch_commander.config import settings
+from autocad_batch_commander.models import ComplianceRule, ComplianceRuleSet
+
+T = TypeVar("T")
+
+# Stand-in building type for rules that apply to every building type.
+ANY_BUILDING = "*"
+
+
+@dataclass(frozen=True)
+class RuleIndex:
+    """Rules of every rule set, indexed for lookup."""
+
+    by_id: dict[str, ComplianceRule] = field(default_factory=dict)
+    by_category: dict[str, list[ComplianceRule]] = field(default_factory=dict)
+    by_building_type: dict[str, list[ComplianceRule]] = field(default_factory=dict)
+    by_parameter: dict[str, list[ComplianceRule]] = field(default_factory=dict)
+    by_rule_set: dict[str, list[ComplianceRule]] = field(default_factory=dict)
+    rule_set_of: dict[str, str] = field(default_factory=dict)  # rule id → set
+    position: dict[int, int] = field(default_factory=dict)  # id(rule) → order
+
+    @classmethod
+    def build(cls, rule_sets: dict[str, ComplianceRuleSet]) -> RuleIndex:
+        index = cls()
+        for name, rule_set in rule_sets.items():
+            index.by_rule_set[name] = list(rule_set.rules)
+            for rule in rule_set.rules:
+                index.position[id(rule)] = len(index.position)
+                index.by_id.setdefault(rule.id, rule)
+                index.rule_set_of.setdefault(rule.id, name)
+                index.by_category.setdefault(rule.category, []).append(rule)
+                index.by_parameter.setdefault(rule.parameter, []).append(rule)
+                for building in rule.building_type or [ANY_BUILDING]:
+                    index.by_building_type.setdefault(building, []).append(rule)
+        return index
+
+
+class StandardsRegistry:
+    """Parsed standards files, reloaded when they change on disk."""
+
+    def __init__(self, root: Path | None = None) -> None:
+        self._root = root
+        self._lock = threading.Lock()
+        self._files: dict[Path, tuple[tuple[int, int], Any]] = {}
+        self._listing: tuple[Path, int, list[str]] | None = None
+        self._index: tuple[tuple[ComplianceRuleSet, ...], RuleIndex] | None = None
+
+    @property
+    def root(self) -> Path:
+        """The standards directory (``settings.standards_dir`` by default)."""
+        return self._root if self._root is not None else settings.standards_dir
+
+    def clear(self) -> None:
+        """Drop everything cached."""
+        with self._lock:
+            self._files.clear()
+            self._listing = None
+            self._index = None
+
+    def _load(self, path: Path, parse: Callable[[Any], T]) -> T:
+        """Return *path* parsed by *parse*, reusing the cached value if unchanged.
+
+        Raises :class:`FileNotFoundError` when the file does not exist.
+        """
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._files.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        value = parse(json.loads(path.read_text(encoding="utf-8")))
+        with self._lock:
+            self._files[path] = (stamp, value)
+        return value
+
+    # ── Files ──────────────────────────────────────────────────────
+
+    def layer_standard(self, standard: str) -> dict:
+        """Return the parsed ``<standard>.json`` layer naming standard."""
+        path = self.root / f"{standard.lower()}.json"
+        try:
+            return self._load(path, dict)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Standard file not found: {path}") from None
+
+    def rule_set(self, name: str) -> ComplianceRuleSet:
+        """Return the validated rule set ``rules/<name>.json``."""
+        path = self.root / "rules" / f"{name}.json"
+        try:
+            return self._load(path, lambda data: ComplianceRuleSet(**data))
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Rule set not found: {path}") from None
+
+    def rule_set_names(self) -> list[str]:
+        """Return the names of the available rule sets."""
+        rules_dir = self.root / "rules"
+        try:
+            stamp = rules_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+        listing = self._listing
+        if listing is None or listing[:2] != (rules_dir, stamp):
+            names = sorted(p.stem for p in rules_dir.glob("*.json"))
+            listing = self._listing = (rules_dir, stamp, names)
+        return list(listing[2])
+
+    def dimension_mapping(self) -> list[dict]:
+        """Return the layer → rule parameter mappings of ``dimension_mapping.json``."""
+        try:
+            return self._load(
+                self.root / "dimension_mapping.json",
+                lambda data: data.get("mappings", []),
+            )
+        except FileNotFoundError:
+            return []
+
+    def room_types(self) -> dict[str, dict]:
+        """Return the room vocabulary of ``room_types.json``, by room type."""
+        try:
+            return self._load(
+                self.root / "room_types.json",
+                lambda data: data.get("room_types", {}),
+            )
+        except FileNotFoundError:
+            return {}
+
+    # ── Rule lookup ────────────────────────────────────────────────
+
+    def index(self) -> RuleIndex:
+        """Return the indexes over all rule sets, rebuilt if any changed."""
+        rule_sets = {name: self.rule_set(name) for name in self.rule_set_names()}
+        sources = tuple(rule_sets.values())
+        cached = self._index
+        if cached is not None and len(cached[0]) == len(sources):
+            if all(a is b for a, b in zip(cached[0], sources)):
+                return cached[1]
+        index = RuleIndex.build(rule_sets)
+        self._index = (sources, index)
+        return index
+
+    def rule(self, rule_id: str) -> ComplianceRule | None:
+        """Return the rule with id *rule_id* from any rule set."""
+        return self.index().by_id.get(rule_id)
+
+    def rules(
+        self,
+        *,
+        rule_set: str | None = None,
+        category: str | Sequence[str] | None = None,
+        building_type: str | None = None,
+        parameter: str | None = None,
+    ) -> list[ComplianceRule]:
+        """Return the rules matching every filter given, in file order.
+
+        Rules that name no building type apply to every *building_type*,
+        and an empty one does not filter; several categories match a rule
+        in any of them.
+        """
+        index = self.index()
+        candidates: list[list[ComplianceRule]] = []
+        if rule_set is not None:
+            candidates.append(index.by_rule_set.get(rule_set, []))
+        if isinstance(category, str):
+            candidates.append(index.by_category.get(category, []))
+        elif category is not None:
+            candidates.append(
+                [rule for c in set(category) for rule in index.by_category.get(c, [])]
+            )
+        if parameter is not None:
+            candidates.append(index.by_parameter.get(parameter, []))
+        if building_type:
+            candidates.append(
+                index.by_building_type.get(building_type, [])
+                + index.by_building_type.get(ANY_BUILDING, [])
+            )
+        if not candidates:
+            return [r for rules in index.by_rule_set.values() for r in rules]
+        smallest = min(candidates, key=len)
+        others = [{id(rule) for rule in c} for c in candidates if c is not smallest]
+        matched = [r for r in smallest if all(id(r) in ids for ids in others)]
+        return sorted(matched, key=lambda rule: index.position[id(rule)])
+
+
+registry = StandardsRegistry()
@@ -0,0 +1,468 @@
+"""Content-addressed drawing backups.
+
+Each drawing folder gets a ``.backups`` store next to it (on the same
+filesystem, so copy-on-write clones work and discovery skips it). File
+contents live once under ``objects/<sha[:2]>/<sha256>`` no matter how many
+runs back them up; a SQLite catalog records which drawing was backed up
+to which object and when. New objects are reflinked (``FICLONE``) where
+the filesystem supports it and copied otherwise. Hardlinks are never
+used: CAD applications and the DXF writer may rewrite a drawing in place,
+which would silently change a hardlinked backup too.
+
+Batch operations use a :class:`BackupWriter`, which hashes the next few
+drawings and stages a fsynced copy of each under a temporary name in
+``objects/`` on a background thread pool while the current one is in CAD.
+:meth:`BackupWriter.commit` (called right before ``save_drawing``) only has
+to rename that drawing's stage into place and catalog it; stages of
+drawings that end up unchanged are deleted when the writer closes.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import sqlite3
+import stat
+import time
+import uuid
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from loguru import logger
+
+from autocad_batch_commander.config import settings
+from autocad_batch_commander.models import BackupInfo, BackupPruneResult
+from autocad_batch_commander.utils.discovery import BACKUP_DIR_NAME
+from autocad_batch_commander.utils.file_ops import file_sha256
+from autocad_batch_commander.utils.profiling import record_section
+
+CATALOG_FILENAME = "catalog.sqlite3"
+
+# Linux ioctl that makes dst share src's extents (btrfs, XFS, bcachefs…).
+_FICLONE = 0x40049409
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS backups (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS backups_name ON backups (name, created_at);
+"""
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    """Clone *src* to *dst* without copying data; False if unsupported."""
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        return False
+    try:
+        with src.open("rb") as fsrc, dst.open("wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    except OSError:
+        dst.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def _fsync(path: Path) -> None:
+    # Windows can only flush files opened for writing; POSIX fsyncs any
+    # descriptor, so a read-only copy never needs write access.
+    writable = os.name == "nt" and path.is_file()
+    fd = os.open(path, os.O_RDWR if writable else os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@dataclass(frozen=True)
+class Digest:
+    """A drawing's content hash and the size and mtime it was taken at."""
+
+    sha256: str
+    size: int
+    mtime_ns: int
+
+    @classmethod
+    def of(cls, path: Path) -> Digest:
+        before = path.stat()
+        return cls(file_sha256(path), before.st_size, before.st_mtime_ns)
+
+    def matches(self, path: Path) -> bool:
+        """Whether *path* still looks the way it did when hashed."""
+        current = path.stat()
+        return (self.size, self.mtime_ns) == (current.st_size, current.st_mtime_ns)
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """A drawing's content as stored in a backup store."""
+
+    sha256: str
+    size: int
+    mtime_ns: int
+    created: bool  # False when an identical object was already stored
+
+
+@dataclass(frozen=True)
+class Staged:
+    """A drawing's content copied into a store but not yet an object."""
+
+    digest: Digest
+    tmp: Path | None  # None when an identical object was already stored
+
+
+class BackupStore:
+    """The ``.backups`` store of one drawing folder."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._conn: sqlite3.Connection | None = None
+
+    @classmethod
+    def for_drawing(cls, path: Path) -> BackupStore:
+        return cls(path.parent / BACKUP_DIR_NAME)
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.root / CATALOG_FILENAME, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            # A cataloged backup must survive a crash during the save after it.
+            conn.execute("PRAGMA synchronous=FULL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def object_path(self, sha256: str) -> Path:
+        return self.root / "objects" / sha256[:2] / sha256
+
+    # ── Writing ────────────────────────────────────────────────────
+
+    def snapshot(self, path: Path, digest: Digest | None = None) -> Snapshot:
+        """Durably store the current content of *path*.
+
+        *digest* saves rehashing a drawing hashed earlier, if it has not
+        changed since. Nothing is written when an identical object is
+        already stored. Does not touch the catalog, so it is safe to call
+        from any thread.
+        """
+        return self.promote(self.stage(path, digest))
+
+    def stage(self, path: Path, digest: Digest | None = None) -> Staged:
+        """Durably copy *path* into the store under a temporary name.
+
+        The copy only becomes a backup once :meth:`promote` renames it into
+        place; :meth:`discard` drops it instead. Safe to call from any
+        thread.
+        """
+        if digest is None or not digest.matches(path):
+            digest = Digest.of(path)
+        target = self.object_path(digest.sha256)
+        if target.exists():
+            return Staged(digest, None)
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f"{digest.sha256}.{uuid.uuid4().hex}.tmp")
+        if not _reflink(path, tmp):
+            shutil.copyfile(path, tmp)
+        _fsync(tmp)  # before copystat, which may make it read-only
+        shutil.copystat(path, tmp)
+        os.chmod(tmp, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+        return Staged(digest, tmp)
+
+    def promote(self, staged: Staged) -> Snapshot:
+        """Turn a staged copy into a stored object."""
+        digest = staged.digest
+        target = self.object_path(digest.sha256)
+        if staged.tmp is None or target.exists():
+            self.discard(staged)
+            return Snapshot(digest.sha256, digest.size, digest.mtime_ns, False)
+        os.replace(staged.tmp, target)
+        if os.name == "posix":  # make the rename itself durable
+            _fsync(target.parent)
+        return Snapshot(digest.sha256, digest.size, digest.mtime_ns, True)
+
+    def discard(self, staged: Staged) -> None:
+        """Delete a staged copy that will not be promoted."""
+        if staged.tmp is not None and staged.tmp.exists():
+            self._remove_object(staged.tmp)
+
+    def record(self, path: Path, sha256: str) -> BackupInfo:
+        """Catalog object *sha256* as a backup of *path* taken now."""
+        size = self.object_path(sha256).stat().st_size
+        now = time.time()
+        with self._db:
+            cursor = self._db.execute(
+                "INSERT INTO backups (name, sha256, size, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (path.name, sha256, size, now),
+            )
+        return BackupInfo(
+            id=cursor.lastrowid or 0,
+            file=str(path),
+            sha256=sha256,
+            size_bytes=size,
+            created_at=datetime.fromtimestamp(now),
+        )
+
+    def backup(self, path: Path) -> BackupInfo:
+        """Snapshot and catalog *path*."""
+        return self.record(path, self.snapshot(path).sha256)
+
+    # ── Reading ────────────────────────────────────────────────────
+
+    def backups(self, name: str | None = None) -> list[BackupInfo]:
+        """Return the backups in this store (of drawing *name*), newest first."""
+        sql = "SELECT id, name, sha256, size, created_at FROM backups"
+        params: tuple[str, ...] = ()
+        if name is not None:
+            sql += " WHERE name = ?"
+            params = (name,)
+        rows = self._db.execute(sql + " ORDER BY created_at DESC, id DESC", params)
+        return [
+            BackupInfo(
+                id=backup_id,
+                file=str(self.root.parent / drawing),
+                sha256=sha256,
+                size_bytes=size,
+                created_at=datetime.fromtimestamp(created),
+            )
+            for backup_id, drawing, sha256, size, created in rows
+        ]
+
+    def restore(self, path: Path, backup_id: int | None = None) -> BackupInfo:
+        """Put a backup of *path* back in place (the latest one by default).
+
+        The drawing's current content is backed up first, so a restore can
+        itself be undone.
+        """
+        candidates = self.backups(path.name)
+        if backup_id is not None:
+            candidates = [b for b in candidates if b.id == backup_id]
+        if not candidates:
+            raise FileNotFoundError(f"No backup of {path} in {self.root}")
+        chosen = candidates[0]
+
+        if path.exists():
+            self.backup(path)
+        tmp = path.with_name(f".{path.name}.restore")
+        shutil.copyfile(self.object_path(chosen.sha256), tmp)
+        os.replace(tmp, path)
+        return chosen
+
+    # ── Retention ──────────────────────────────────────────────────
+
+    def prune(self, keep_last: int, keep_days: float) -> BackupPruneResult:
+        """Drop backups outside the retention policy and unreferenced objects.
+
+        For every drawing the *keep_last* newest backups are kept, plus any
+        taken within the last *keep_days* days.
+        """
+        cutoff = time.time() - keep_days * 86400
+        rows = self._db.execute(
+            "SELECT id, name, created_at FROM backups "
+            "ORDER BY name, created_at DESC, id DESC"
+        ).fetchall()
+        seen: dict[str, int] = {}
+        expired: list[tuple[int]] = []
+        for backup_id, name, created in rows:
+            seen[name] = seen.get(name, 0) + 1
+            if seen[name] > keep_last and created < cutoff:
+                expired.append((backup_id,))
+        with self._db:
+            self._db.executemany("DELETE FROM backups WHERE id = ?", expired)
+
+        result = BackupPruneResult(stores=1, backups_removed=len(expired))
+        for obj in (self.root / "objects").glob("*/*"):
+            if obj.suffix != ".tmp" and not self.is_referenced(obj.name):
+                result.bytes_freed += self._remove_object(obj)
+                result.objects_removed += 1
+        return result
+
+    def is_referenced(self, sha256: str) -> bool:
+        return (
+            self._db.execute(
+                "SELECT 1 FROM backups WHERE sha256 = ? LIMIT 1", (sha256,)
+            ).fetchone()
+            is not None
+        )
+
+    @staticmethod
+    def _remove_object(obj: Path) -> int:
+        size = obj.stat().st_size
+        os.chmod(obj, stat.S_IRUSR | stat.S_IWUSR)  # Windows won't delete 0o444
+        obj.unlink()
+        return size
+
+
+@dataclass
+class BackupWriterStats:
+    """What a :class:`BackupWriter` did and how long saves waited for it."""
+
+    backups: int = 0
+    prefetched: int = 0  # drawings staged ahead of the cursor
+    unused: int = 0  # prefetched drawings that were not saved
+    wait_seconds: float = 0.0
+
+
+class BackupWriter:
+    """Back drawings up ahead of the processing cursor.
+
+    Wrap the drawing loop's iterable with :meth:`prefetch` to stage
+    copies of the next *ahead* drawings on background threads, and call
+    :meth:`commit` right before saving a drawing; it promotes that
+    drawing's copy and returns only once the backup is on disk and
+    cataloged. Drawings that are never committed leave nothing behind in
+    the store once the writer is closed. A disabled writer
+    passes files through and makes ``commit`` a no-op, so operations can
+    use it unconditionally.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        *,
+        ahead: int | None = None,
+        workers: int | None = None,
+    ) -> None:
+        self.enabled = enabled
+        self.ahead = settings.backup_prefetch if ahead is None else ahead
+        self.workers = workers or settings.backup_io_workers
+        self.stats = BackupWriterStats()
+        self._pool: ThreadPoolExecutor | None = None
+        self._pending: dict[Path, Future[Staged]] = {}
+        self._stores: dict[Path, BackupStore] = {}
+
+    def __enter__(self) -> BackupWriter:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _store(self, path: Path) -> BackupStore:
+        root = path.parent / BACKUP_DIR_NAME
+        if root not in self._stores:
+            self._stores[root] = BackupStore(root)
+        return self._stores[root]
+
+    def prefetch(self, files: Iterable[Path]) -> Iterator[Path]:
+        """Yield *files* while staging up to *ahead* of them in advance."""
+        if not self.enabled or self.ahead <= 0:
+            yield from files
+            return
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="backup"
+            )
+        window: deque[Path] = deque()
+        for path in files:
+            self._pending[path] = self._pool.submit(self._store(path).stage, path)
+            self.stats.prefetched += 1
+            window.append(path)
+            if len(window) > self.ahead:
+                yield window.popleft()
+        while window:
+            yield window.popleft()
+
+    def commit(self, path: Path) -> None:
+        """Block until *path* is durably backed up; call before saving it."""
+        if not self.enabled:
+            return
+        start = time.perf_counter()
+        store = self._store(path)
+        staged: Staged | None = None
+        future = self._pending.pop(path, None)
+        if future is not None:
+            try:
+                staged = future.result()
+            except OSError as exc:
+                logger.warning(f"Background backup of {path} failed, retrying: {exc}")
+        if staged is not None and not staged.digest.matches(path):
+            store.discard(staged)  # changed since it was staged
+            staged = None
+
+        snapshot = store.promote(staged) if staged else store.snapshot(path)
+        store.record(path, snapshot.sha256)
+        waited = time.perf_counter() - start
+        self.stats.backups += 1
+        self.stats.wait_seconds += waited
+        record_section("backup_wait", waited)
+
+    def close(self) -> None:
+        """Stop background staging and delete stages nobody committed."""
+        for future in self._pending.values():
+            future.cancel()
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        for path, future in self._pending.items():
+            if future.cancelled() or future.exception() is not None:
+                continue
+            try:
+                self._store(path).discard(future.result())
+            except OSError as exc:
+                logger.warning(f"Could not remove staged backup of {path}: {exc}")
+        self.stats.unused += len(self._pending)
+        self._pending.clear()
+        for store in self._stores.values():
+            store.close()
+        self._stores.clear()
+        if self.stats.prefetched or self.stats.backups:
+            logger.info(
+                f"Backups: {self.stats.backups} written, "
+                f"{self.stats.unused} prefetched but unused, "
+                f"{self.stats.wait_seconds:.2f}s spent waiting"
+            )
+
+
+def create_backup(file_path: Path) -> BackupInfo:
+    """Back up *file_path* into the ``.backups`` store of its folder."""
+    store = BackupStore.for_drawing(file_path)
+    try:
+        return store.backup(file_path)
+    finally:
+        store.close()
+
+
+def iter_backup_stores(folder: Path) -> Iterator[BackupStore]:
+    """Yield the backup store of every directory under *folder* that has one."""
+    for dirpath, dirnames, _ in os.walk(folder):
+        if BACKUP_DIR_NAME in dirnames:
+            dirnames.remove(BACKUP_DIR_NAME)
+            root = Path(dirpath) / BACKUP_DIR_NAME
+            if (root / CATALOG_FILENAME).exists():
+                yield BackupStore(root)
+
+
+def prune_backups(folder: Path, keep_last: int, keep_days: float) -> BackupPruneResult:
+    """Apply the retention policy to every backup store under *folder*."""
+    total = BackupPruneResult()
+    for store in iter_backup_stores(folder):
+        try:
+            pruned = store.prune(keep_last, keep_days)
+        finally:
+            store.close()
+        logger.info(
+            f"Pruned {pruned.backups_removed} backups from {store.root} "
+            f"({pruned.bytes_freed} bytes freed)"
+        )
+        total.stores += pruned.stores
+        total.backups_removed += pruned.backups_removed
+        total.objects_removed += pruned.objects_removed
+        total.bytes_freed += pruned.bytes_freed
+    return total
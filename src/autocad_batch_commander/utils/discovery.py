@@ -0,0 +1,151 @@
+"""Drawing discovery built on ``os.scandir`` with parallel directory listing.
+
+:func:`iter_drawings` walks a project tree depth-first in sorted order and
+yields drawings as soon as their directory has been listed, while a thread
+pool lists the subdirectories ahead of the cursor. On network shares,
+where each listing is a round trip, that overlaps the latency of many
+directories instead of paying it one at a time, and callers can start
+processing before the walk finishes. The order is depth-first with
+names sorted per directory, so ``a/x.dwg`` comes before ``a-b/y.dwg``
+and ``a.dwg``. That is how :class:`~pathlib.Path` objects sort
+(component by component), not how their strings do.
+
+Which extensions count as drawings depends on the CAD engine (see
+:func:`drawing_extensions`). Backup directories are always skipped,
+extensions match case-insensitively (``PLAN.DWG``), and include/exclude
+patterns are shell-style globs matched case-insensitively against the
+path relative to the folder. A pattern
+without a ``/`` matches any single path component instead, so
+``exclude=["archive"]`` prunes every ``archive`` directory and
+``include=["A-*.dwg"]`` selects by file name anywhere in the tree.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+from loguru import logger
+
+from autocad_batch_commander.config import settings
+
+DWG_EXTENSIONS = (".dwg",)
+DXF_EXTENSIONS = (".dxf",)
+
+# Backup store kept next to each drawing (see utils.backup).
+BACKUP_DIR_NAME = ".backups"
+
+_Listing = tuple[list[str], list[str]]  # (file names, directory names)
+
+
+def _scan(directory: Path) -> _Listing:
+    files: list[str] = []
+    dirs: list[str] = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.name)
+                    elif entry.is_file():
+                        files.append(entry.name)
+                except OSError:
+                    continue
+    except OSError as exc:
+        logger.warning(f"Skipping unreadable directory {directory}: {exc}")
+    return files, dirs
+
+
+class _Patterns:
+    """Case-insensitive glob matcher for relative paths."""
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.paths: list[str] = []
+        self.names: list[str] = []
+        for pattern in patterns:
+            pattern = pattern.replace("\\", "/").strip("/").lower()
+            (self.paths if "/" in pattern else self.names).append(pattern)
+
+    def __bool__(self) -> bool:
+        return bool(self.paths or self.names)
+
+    def match(self, relative: str) -> bool:
+        relative = relative.lower()
+        if any(fnmatchcase(relative, p) for p in self.paths):
+            return True
+        parts = relative.split("/")
+        return any(fnmatchcase(part, p) for p in self.names for part in parts)
+
+
+def drawing_extensions(cad_engine: str | None = None) -> tuple[str, ...]:
+    """Return the drawing extensions *cad_engine* processes.
+
+    The offline DXF adapter only opens ``.dxf`` files. CAD applications
+    (and the mock) process ``.dwg`` files, plus ``.dxf`` exports when
+    ``settings.include_dxf`` opts in. *cad_engine* defaults to
+    ``settings.cad_engine``.
+    """
+    if (cad_engine or settings.cad_engine) == "dxf":
+        return DXF_EXTENSIONS
+    if settings.include_dxf:
+        return DWG_EXTENSIONS + DXF_EXTENSIONS
+    return DWG_EXTENSIONS
+
+
+def iter_drawings(
+    folder: Path,
+    *,
+    recursive: bool = True,
+    include: Sequence[str] | None = None,
+    exclude: Sequence[str] | None = None,
+    extensions: Sequence[str] | None = None,
+    workers: int | None = None,
+) -> Iterator[Path]:
+    """Yield drawing files under *folder* in sorted, depth-first order.
+
+    *include* keeps only drawings matching at least one pattern; *exclude*
+    drops matching drawings and prunes matching directories without
+    listing them. Both default to ``settings.include_patterns`` and
+    ``settings.exclude_patterns``. *extensions* defaults to
+    :func:`drawing_extensions` for the configured engine. *workers* bounds
+    the directory-listing threads (default ``settings.discovery_workers``).
+    """
+    if extensions is None:
+        extensions = drawing_extensions()
+    suffixes = tuple(ext.lower() for ext in extensions)
+    included = _Patterns(settings.include_patterns if include is None else include)
+    excluded = _Patterns(settings.exclude_patterns if exclude is None else exclude)
+    workers = workers or settings.discovery_workers
+
+    def wanted(name: str, relative: str) -> bool:
+        if not name.lower().endswith(suffixes):
+            return False
+        if included and not included.match(relative):
+            return False
+        return not (excluded and excluded.match(relative))
+
+    def walk(directory: Path, prefix: str, listing: Future[_Listing]) -> Iterator[Path]:
+        files, dirs = listing.result()
+        subdirs: dict[str, Future[_Listing]] = {}
+        if recursive:
+            for name in dirs:
+                if name == BACKUP_DIR_NAME or (
+                    excluded and excluded.match(prefix + name)
+                ):
+                    continue
+                subdirs[name] = pool.submit(_scan, directory / name)
+
+        for name in sorted([*files, *subdirs]):
+            if name in subdirs:
+                yield from walk(directory / name, f"{prefix}{name}/", subdirs[name])
+            elif wanted(name, prefix + name):
+                yield directory / name
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="discovery")
+    try:
+        yield from walk(folder, "", pool.submit(_scan, folder))
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -1,29 +1,50 @@
-"""File discovery and backup utilities."""
+"""File discovery and hashing utilities."""
 
 from __future__ import annotations
 
-import shutil
-from datetime import datetime
+import hashlib
+from collections.abc import Sequence
 from pathlib import Path
 
-
-def get_dwg_files(folder: Path, recursive: bool = True) -> list[Path]:
-    """Return all .dwg files under *folder*, sorted by name."""
-    pattern = "**/*.dwg" if recursive else "*.dwg"
-    return sorted(folder.glob(pattern))
-
-
-def create_backup(file_path: Path) -> Path:
-    """Create a timestamped backup copy in a ``.backups`` sibling directory.
-
-    Returns the path to the backup file.
+from autocad_batch_commander.utils.discovery import (
+    drawing_extensions,
+    iter_drawings,
+)
+
+__all__ = ["drawing_extensions", "file_sha256", "get_dwg_files"]
+
+
+def get_dwg_files(
+    folder: Path,
+    recursive: bool = True,
+    *,
+    include: Sequence[str] | None = None,
+    exclude: Sequence[str] | None = None,
+    cad_engine: str | None = None,
+) -> list[Path]:
+    """Return the drawings under *folder* that *cad_engine* opens, sorted.
+
+    ``.backups`` directories are skipped; see
+    :func:`~autocad_batch_commander.utils.discovery.iter_drawings` for the
+    *include*/*exclude* patterns and
+    :func:`~autocad_batch_commander.utils.discovery.drawing_extensions` for
+    which files each engine opens.
     """
-    backup_dir = file_path.parent / ".backups"
-    backup_dir.mkdir(exist_ok=True)
-
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_name = f"{file_path.stem}_{timestamp}{file_path.suffix}"
-    backup_path = backup_dir / backup_name
-
-    shutil.copy2(file_path, backup_path)
-    return backup_path
+    return list(
+        iter_drawings(
+            folder,
+            recursive=recursive,
+            include=include,
+            exclude=exclude,
+            extensions=drawing_extensions(cad_engine),
+        )
+    )
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    """Return the hex SHA-256 digest of *path*, read in chunks."""
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        while chunk := fh.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
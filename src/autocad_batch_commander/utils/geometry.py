@@ -0,0 +1,379 @@
+"""Polyline geometry — area, perimeter, centroid and bounding box.
+
+:func:`measure_polylines` measures every polyline of a drawing in one
+pass. With NumPy installed (the ``geometry`` extra) the vertices are
+packed into contiguous arrays (:class:`PolylineArrays`: one ``(N, 2)``
+coordinate array, per-vertex bulges and per-polyline offsets) and every
+quantity is computed with whole-array operations; without it the same
+formulas run in plain Python, so results never depend on the extra.
+
+Bulges follow the DXF convention: the tangent of a quarter of the arc's
+included angle, positive when the arc runs counter-clockwise from a vertex
+to the next. Areas and centroids include the circular segments that
+bulged edges add or cut away; bounding boxes include the arcs' extreme
+points. Open polylines have zero area, and their centroid is the
+length-weighted midpoint of their edges.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from autocad_batch_commander.models import PolylineEntity
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised without the extra
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+HAVE_NUMPY = np is not None
+
+# Areas below this (drawing units²) are treated as degenerate.
+_EPSILON = 1e-12
+
+
+@dataclass(frozen=True)
+class PolylineGeometry:
+    """Measured geometry of one polyline, in drawing units."""
+
+    area: float
+    perimeter: float
+    centroid: tuple[float, float]
+    bbox: tuple[float, float, float, float]  # min x, min y, max x, max y
+
+
+def _bulges(polyline: PolylineEntity) -> list[float]:
+    return polyline.bulges or [0.0] * len(polyline.vertices)
+
+
+def measure_polylines(
+    polylines: Sequence[PolylineEntity],
+) -> list[PolylineGeometry]:
+    """Measure *polylines*, vectorised when NumPy is available."""
+    return measure(
+        [[(v.x, v.y) for v in p.vertices] for p in polylines],
+        [_bulges(p) for p in polylines],
+        [p.closed for p in polylines],
+    )
+
+
+def measure(
+    vertices: Sequence[Sequence[tuple[float, float]]],
+    bulges: Sequence[Sequence[float]],
+    closed: Sequence[bool],
+) -> list[PolylineGeometry]:
+    """Measure polylines given as parallel per-polyline sequences."""
+    if HAVE_NUMPY:
+        return PolylineArrays.pack(vertices, bulges, closed).measure()
+    return [
+        _measure_one(list(v), list(b), c) for v, b, c in zip(vertices, bulges, closed)
+    ]
+
+
+# ── Plain Python ─────────────────────────────────────────────────
+
+
+def _arc(
+    a: tuple[float, float], b: tuple[float, float], bulge: float
+) -> tuple[float, float, float, float, float, float]:
+    """Return ``(radius, theta, segment area, centre x, centre y, direction)``.
+
+    *direction* is the unit normal sign: the arc bulges to the right of
+    a → b for positive bulges and to the left for negative ones.
+    """
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    chord = math.hypot(dx, dy)
+    theta = 4.0 * math.atan(abs(bulge))
+    half = theta / 2.0
+    radius = chord / (2.0 * math.sin(half))
+    segment = radius * radius * (theta - math.sin(theta)) / 2.0
+    side = math.copysign(1.0, bulge)
+    nx, ny = side * dy / chord, -side * dx / chord
+    offset = radius * math.cos(half)
+    cx = (a[0] + b[0]) / 2.0 - offset * nx
+    cy = (a[1] + b[1]) / 2.0 - offset * ny
+    return radius, theta, segment, cx, cy, side
+
+
+def _arc_extremes(
+    a: tuple[float, float],
+    radius: float,
+    theta: float,
+    cx: float,
+    cy: float,
+    side: float,
+) -> list[tuple[float, float]]:
+    """Return the axis-extreme points the arc starting at *a* passes through."""
+    start = math.atan2(a[1] - cy, a[0] - cx)
+    points = []
+    for k in range(4):
+        angle = k * math.pi / 2.0
+        swept = (angle - start) % math.tau if side > 0 else (start - angle) % math.tau
+        if swept <= theta:
+            points.append(
+                (cx + radius * math.cos(angle), cy + radius * math.sin(angle))
+            )
+    return points
+
+
+def _measure_one(
+    vertices: list[tuple[float, float]], bulges: list[float], closed: bool
+) -> PolylineGeometry:
+    if not vertices:
+        return PolylineGeometry(0.0, 0.0, (0.0, 0.0), (0.0, 0.0, 0.0, 0.0))
+    count = len(vertices)
+    xs = [v[0] for v in vertices]
+    ys = [v[1] for v in vertices]
+    min_x, max_x, min_y, max_y = min(xs), max(xs), min(ys), max(ys)
+    twice_area = moment_x = moment_y = 0.0
+    perimeter = path_x = path_y = 0.0
+
+    segments = count if closed else count - 1
+    for i in range(segments if count > 1 else 0):
+        a, b = vertices[i], vertices[(i + 1) % count]
+        cross = a[0] * b[1] - b[0] * a[1]
+        twice_area += cross
+        moment_x += (a[0] + b[0]) * cross / 6.0
+        moment_y += (a[1] + b[1]) * cross / 6.0
+        chord = math.hypot(b[0] - a[0], b[1] - a[1])
+        length = chord
+        if bulges[i] != 0.0 and chord > 0.0:
+            radius, theta, segment, cx, cy, side = _arc(a, b, bulges[i])
+            length = radius * theta
+            half = theta / 2.0
+            reach = (
+                4.0 * radius * math.sin(half) ** 3 / (3.0 * (theta - math.sin(theta)))
+            )
+            nx = side * (b[1] - a[1]) / chord
+            ny = -side * (b[0] - a[0]) / chord
+            twice_area += 2.0 * side * segment
+            moment_x += side * segment * (cx + reach * nx)
+            moment_y += side * segment * (cy + reach * ny)
+            for x, y in _arc_extremes(a, radius, theta, cx, cy, side):
+                min_x, max_x = min(min_x, x), max(max_x, x)
+                min_y, max_y = min(min_y, y), max(max_y, y)
+        perimeter += length
+        path_x += length * (a[0] + b[0]) / 2.0
+        path_y += length * (a[1] + b[1]) / 2.0
+
+    signed = twice_area / 2.0
+    if closed and abs(signed) > _EPSILON:
+        centroid = (moment_x / signed, moment_y / signed)
+    elif perimeter > 0.0:
+        centroid = (path_x / perimeter, path_y / perimeter)
+    else:
+        centroid = vertices[0]
+    return PolylineGeometry(
+        abs(signed) if closed else 0.0,
+        perimeter,
+        centroid,
+        (min_x, min_y, max_x, max_y),
+    )
+
+
+def outline(
+    polyline: PolylineEntity, max_angle: float = math.pi / 8
+) -> list[tuple[float, float]]:
+    """Return the polyline's vertices with bulged edges split into chords.
+
+    Each arc is replaced by chords spanning at most *max_angle* radians,
+    so the result can go to straight-edged algorithms such as
+    point-in-polygon tests. A closed polyline's ring is not repeated at
+    the end.
+    """
+    vertices = [(v.x, v.y) for v in polyline.vertices]
+    bulges = _bulges(polyline)
+    count = len(vertices)
+    if count < 2 or not any(bulges):
+        return vertices
+    points: list[tuple[float, float]] = []
+    segments = count if polyline.closed else count - 1
+    for i in range(segments):
+        a, b = vertices[i], vertices[(i + 1) % count]
+        points.append(a)
+        if bulges[i] == 0.0 or a == b:
+            continue
+        radius, theta, _, cx, cy, side = _arc(a, b, bulges[i])
+        start = math.atan2(a[1] - cy, a[0] - cx)
+        steps = max(2, math.ceil(theta / max_angle))
+        for k in range(1, steps):
+            angle = start + side * theta * k / steps
+            points.append(
+                (cx + radius * math.cos(angle), cy + radius * math.sin(angle))
+            )
+    if not polyline.closed:
+        points.append(vertices[-1])
+    return points
+
+
+# ── NumPy ────────────────────────────────────────────────────────
+
+
+@dataclass
+class PolylineArrays:
+    """Vertices of many polylines packed into contiguous arrays.
+
+    Polyline ``i`` owns rows ``offsets[i]:offsets[i + 1]`` of ``xy`` and
+    ``bulges``. Requires NumPy.
+    """
+
+    xy: NDArray[Any]  # (N, 2) float64
+    bulges: NDArray[Any]  # (N,) float64
+    offsets: NDArray[Any]  # (P + 1,) int64
+    closed: NDArray[Any]  # (P,) bool
+
+    @classmethod
+    def pack(
+        cls,
+        vertices: Sequence[Sequence[tuple[float, float]]],
+        bulges: Sequence[Sequence[float]],
+        closed: Sequence[bool],
+    ) -> PolylineArrays:
+        counts = [len(v) for v in vertices]
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        xy = np.array(
+            [point for v in vertices for point in v], dtype=np.float64
+        ).reshape(-1, 2)
+        flat_bulges = np.array([bulge for b in bulges for bulge in b], dtype=np.float64)
+        return cls(xy, flat_bulges, offsets, np.array(closed, dtype=bool))
+
+    @classmethod
+    def from_polylines(cls, polylines: Sequence[PolylineEntity]) -> PolylineArrays:
+        return cls.pack(
+            [[(v.x, v.y) for v in p.vertices] for p in polylines],
+            [_bulges(p) for p in polylines],
+            [p.closed for p in polylines],
+        )
+
+    def __len__(self) -> int:
+        return len(self.closed)
+
+    def measure(self) -> list[PolylineGeometry]:
+        """Measure every polyline in one vectorised pass."""
+        area, perimeter, centroid, bbox = self.metrics()
+        return [
+            PolylineGeometry(a, p, (cx, cy), (x0, y0, x1, y1))
+            for a, p, (cx, cy), (x0, y0, x1, y1) in zip(
+                area.tolist(), perimeter.tolist(), centroid.tolist(), bbox.tolist()
+            )
+        ]
+
+    def metrics(
+        self,
+    ) -> tuple[NDArray[Any], NDArray[Any], NDArray[Any], NDArray[Any]]:
+        """Return ``(area, perimeter, centroid, bbox)`` arrays, one row per polyline."""
+        polylines = len(self.closed)
+        counts = np.diff(self.offsets)
+        starts = self.offsets[:-1]
+        owner = np.repeat(np.arange(polylines), counts)
+        xy = self.xy
+
+        # Each vertex starts the edge to the next one; the last vertex of a
+        # closed polyline wraps to its first, that of an open one has no edge.
+        nonempty = counts > 0
+        last = self.offsets[1:][nonempty] - 1
+        following = np.arange(len(xy)) + 1
+        following[last] = starts[nonempty]
+        valid = np.ones(len(xy), dtype=bool)
+        valid[last[~self.closed[nonempty]]] = False
+        valid &= (counts >= 2)[owner]
+
+        a, b = xy, xy[following]
+        d = b - a
+        chord = np.hypot(d[:, 0], d[:, 1])
+        cross = np.where(valid, a[:, 0] * b[:, 1] - b[:, 0] * a[:, 1], 0.0)
+        bulge = np.where(valid & (chord > 0.0), self.bulges, 0.0)
+        arc = bulge != 0.0
+
+        # Circular segments of bulged edges (zero elsewhere).
+        safe_chord = np.where(arc, chord, 1.0)
+        theta = 4.0 * np.arctan(np.abs(bulge))
+        half = theta / 2.0
+        radius = np.where(
+            arc, safe_chord / (2.0 * np.sin(np.where(arc, half, 1.0))), 0.0
+        )
+        segment = radius * radius * (theta - np.sin(theta)) / 2.0
+        side = np.sign(bulge)
+        normal = np.stack([d[:, 1], -d[:, 0]], axis=1) * (side / safe_chord)[:, None]
+        middle = (a + b) / 2.0
+        centre = middle - (radius * np.cos(half))[:, None] * normal
+        with np.errstate(divide="ignore", invalid="ignore"):
+            reach = np.where(
+                arc,
+                4.0 * radius * np.sin(half) ** 3 / (3.0 * (theta - np.sin(theta))),
+                0.0,
+            )
+        segment_centroid = centre + reach[:, None] * normal
+        signed_segment = side * segment
+
+        def total(values: NDArray[Any]) -> NDArray[Any]:
+            return np.bincount(owner, weights=values, minlength=polylines)
+
+        signed_area = total(cross) / 2.0 + total(signed_segment)
+        moment = np.stack(
+            [
+                total((a[:, k] + b[:, k]) * cross) / 6.0
+                + total(signed_segment * segment_centroid[:, k])
+                for k in (0, 1)
+            ],
+            axis=1,
+        )
+        length = np.where(valid, np.where(arc, radius * theta, chord), 0.0)
+        perimeter = total(length)
+        path = np.stack([total(length * middle[:, k]) for k in (0, 1)], axis=1)
+
+        centroid = np.zeros((polylines, 2))
+        first = np.zeros((polylines, 2))
+        first[nonempty] = xy[starts[nonempty]]
+        solid = self.closed & (np.abs(signed_area) > _EPSILON)
+        walked = ~solid & (perimeter > 0.0)
+        centroid[solid] = moment[solid] / signed_area[solid, None]
+        centroid[walked] = path[walked] / perimeter[walked, None]
+        rest = ~solid & ~walked
+        centroid[rest] = first[rest]
+
+        bbox = np.zeros((polylines, 4))
+        if nonempty.any():
+            bbox[nonempty, :2] = np.minimum.reduceat(xy, starts[nonempty], axis=0)
+            bbox[nonempty, 2:] = np.maximum.reduceat(xy, starts[nonempty], axis=0)
+        if arc.any():
+            self._extend_by_arcs(bbox, owner, a, arc, radius, theta, centre, side)
+
+        area = np.where(self.closed, np.abs(signed_area), 0.0)
+        return area, perimeter, centroid, bbox
+
+    @staticmethod
+    def _extend_by_arcs(
+        bbox: NDArray[Any],
+        owner: NDArray[Any],
+        a: NDArray[Any],
+        arc: NDArray[Any],
+        radius: NDArray[Any],
+        theta: NDArray[Any],
+        centre: NDArray[Any],
+        side: NDArray[Any],
+    ) -> None:
+        """Grow *bbox* to the axis-extreme points that bulged edges pass."""
+        rows = np.flatnonzero(arc)
+        c, r, t, s = centre[rows], radius[rows], theta[rows], side[rows]
+        start = np.arctan2(a[rows, 1] - c[:, 1], a[rows, 0] - c[:, 0])
+        for k in range(4):
+            angle = k * math.pi / 2.0
+            swept = np.where(s > 0, angle - start, start - angle) % math.tau
+            hit = swept <= t
+            if not hit.any():
+                continue
+            x = c[hit, 0] + r[hit] * math.cos(angle)
+            y = c[hit, 1] + r[hit] * math.sin(angle)
+            who = owner[rows[hit]]
+            np.minimum.at(bbox[:, 0], who, x)
+            np.minimum.at(bbox[:, 1], who, y)
+            np.maximum.at(bbox[:, 2], who, x)
+            np.maximum.at(bbox[:, 3], who, y)
@@ -0,0 +1,183 @@
+"""Process-wide metrics rendered in the Prometheus text exposition format.
+
+Profiled batch runs add their adapter call breakdown here when they finish
+(see :mod:`autocad_batch_commander.utils.profiling`), and the web server
+times its own requests; ``GET /metrics`` renders :data:`REGISTRY`. Only
+counters and histograms are needed, so this is a small stand-in for the
+``prometheus_client`` package rather than a dependency on it.
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from collections.abc import Sequence
+from itertools import accumulate
+
+from autocad_batch_commander.models import LATENCY_BUCKETS, OperationTimings
+
+LabelValues = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    """A monotonically increasing value per label combination."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._values: dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, *labels: str) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            return [
+                f"{self.name}{_labels(self.labels, key)} {_number(value)}"
+                for key, value in sorted(self._values.items())
+            ]
+
+
+class Histogram:
+    """Observations bucketed by :data:`LATENCY_BUCKETS`, per label combination."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        # label values -> (per-bucket counts incl. overflow, sum of observations)
+        self._series: dict[LabelValues, tuple[list[int], float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        counts[bisect_left(LATENCY_BUCKETS, value)] = 1
+        self.add(counts, value, *labels)
+
+    def add(self, counts: Sequence[int], total: float, *labels: str) -> None:
+        """Merge pre-bucketed *counts* whose observations sum to *total*."""
+        with self._lock:
+            current, current_total = self._series.get(
+                labels, ([0] * (len(LATENCY_BUCKETS) + 1), 0.0)
+            )
+            merged = [a + b for a, b in zip(current, counts)]
+            self._series[labels] = (merged, current_total + total)
+
+    def count(self, *labels: str) -> int:
+        return sum(self._series.get(labels, ([], 0.0))[0])
+
+    def samples(self) -> list[str]:
+        lines: list[str] = []
+        with self._lock:
+            series = sorted(self._series.items())
+        for key, (counts, total) in series:
+            cumulative = list(accumulate(counts))
+            for bound, count in zip((*LATENCY_BUCKETS, "+Inf"), cumulative):
+                le = f'le="{bound if isinstance(bound, str) else _number(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_labels(self.labels, key, le)} {count}"
+                )
+            lines.append(f"{self.name}_sum{_labels(self.labels, key)} {_number(total)}")
+            lines.append(
+                f"{self.name}_count{_labels(self.labels, key)} {cumulative[-1]}"
+            )
+        return lines
+
+
+class Registry:
+    """The metrics exported by this process."""
+
+    def __init__(self) -> None:
+        self._metrics: list[Counter | Histogram] = []
+
+    def register(self, metric: Counter | Histogram) -> Counter | Histogram:
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        metric = Counter(name, help, labels)
+        self.register(metric)
+        return metric
+
+    def histogram(self, name: str, help: str, labels: Sequence[str] = ()) -> Histogram:
+        metric = Histogram(name, help, labels)
+        self.register(metric)
+        return metric
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text format."""
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+ADAPTER_CALL_SECONDS = REGISTRY.histogram(
+    "acad_adapter_call_seconds",
+    "Latency of CAD adapter calls made by profiled batch runs.",
+    ("operation", "method"),
+)
+ADAPTER_CALL_ERRORS = REGISTRY.counter(
+    "acad_adapter_call_errors_total",
+    "CAD adapter calls that raised.",
+    ("operation", "method"),
+)
+ADAPTER_ITEMS = REGISTRY.counter(
+    "acad_adapter_items_total",
+    "Entities returned by CAD adapter calls.",
+    ("operation", "method"),
+)
+ADAPTER_BYTES = REGISTRY.counter(
+    "acad_adapter_bytes_total",
+    "JSON size of what CAD adapter calls returned.",
+    ("operation", "method"),
+)
+OPERATION_SECONDS = REGISTRY.counter(
+    "acad_operation_seconds_total",
+    "Wall time of profiled batch runs, by section (adapter, backup_wait, other).",
+    ("operation", "section"),
+)
+
+
+def record_timings(timings: OperationTimings) -> None:
+    """Add a profiled run's breakdown to the process-wide metrics."""
+    for m in timings.methods:
+        labels = (m.operation, m.method)
+        ADAPTER_CALL_SECONDS.add(m.histogram, m.seconds, *labels)
+        if m.errors:
+            ADAPTER_CALL_ERRORS.inc(m.errors, *labels)
+        ADAPTER_ITEMS.inc(m.items, *labels)
+        ADAPTER_BYTES.inc(m.bytes, *labels)
+    sections = {"adapter": timings.adapter_seconds, **timings.sections}
+    other = timings.wall_seconds - sum(sections.values())
+    for section, seconds in {**sections, "other": max(other, 0.0)}.items():
+        OPERATION_SECONDS.inc(seconds, timings.operation, section)
@@ -0,0 +1,203 @@
+"""Per-operation profiling of batch runs.
+
+A :class:`Profiler` collects what an
+:class:`~autocad_batch_commander.acad.instrumented.InstrumentedAdapter`
+reports about each adapter call — latency, entities and bytes returned —
+keyed by operation (or pipeline stage) and method, and per drawing. While
+a profiler is active, code that does not see the adapter can still add
+its own time: :func:`record_section` books time under a named section
+(``BackupWriter`` reports ``backup_wait`` this way) and
+:func:`profile_stage` attributes adapter calls to a pipeline stage. Both
+are no-ops when nothing is being profiled.
+"""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from autocad_batch_commander.models import (
+    LATENCY_BUCKETS,
+    FileTimings,
+    MethodTimings,
+    OperationTimings,
+)
+from autocad_batch_commander.utils.metrics import record_timings
+
+_active: ContextVar[Profiler | None] = ContextVar("profiler", default=None)
+
+
+def _items(result: Any) -> int:
+    if isinstance(result, (list, tuple, dict)):
+        return len(result)
+    if isinstance(result, int) and not isinstance(result, bool):
+        return result
+    return 0
+
+
+def _bytes(result: Any) -> int:
+    if result is None or isinstance(result, (bool, int)):
+        return 0
+    if isinstance(result, (str, BaseModel, list, tuple, dict)):
+        return len(to_json(result))
+    return 0
+
+
+class Profiler:
+    """Collects adapter call timings for one batch run.
+
+    Use it as a context manager around the run; on exit it becomes the
+    active profiler no longer and its totals are added to the process-wide
+    metrics. *measure_bytes* can be turned off to skip serialising every
+    returned entity list.
+    """
+
+    def __init__(self, operation: str, *, measure_bytes: bool = True) -> None:
+        self.operation = operation
+        self.measure_bytes = measure_bytes
+        self.wall_seconds = 0.0
+        self._stage = operation
+        self._methods: dict[tuple[str, str], MethodTimings] = {}
+        self._files: dict[str, FileTimings] = {}
+        self._file: FileTimings | None = None
+        self._sections: dict[str, float] = {}
+        self._start = 0.0
+        self._token: Token[Profiler | None] | None = None
+
+    def __enter__(self) -> Profiler:
+        self._token = _active.set(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.wall_seconds += time.perf_counter() - self._start
+        if self._token is not None:
+            _active.reset(self._token)
+            self._token = None
+        record_timings(self.timings())
+
+    # ── Recording ──────────────────────────────────────────────────
+
+    def open_file(self, path: str) -> None:
+        """Attribute the following calls to drawing *path*."""
+        self._file = self._files.setdefault(path, FileTimings(file=path))
+
+    def close_file(self) -> None:
+        self._file = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Attribute adapter calls made inside the block to operation *name*."""
+        outer, self._stage = self._stage, name
+        try:
+            yield
+        finally:
+            self._stage = outer
+
+    def record(
+        self, method: str, seconds: float, result: Any = None, *, error: bool = False
+    ) -> None:
+        """Add one adapter call that took *seconds* and returned *result*."""
+        key = (self._stage, method)
+        stats = self._methods.get(key)
+        if stats is None:
+            stats = self._methods[key] = MethodTimings(
+                operation=self._stage, method=method
+            )
+        stats.calls += 1
+        stats.seconds += seconds
+        stats.max_seconds = max(stats.max_seconds, seconds)
+        stats.histogram[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        if error:
+            stats.errors += 1
+        else:
+            stats.items += _items(result)
+            if self.measure_bytes:
+                stats.bytes += _bytes(result)
+        if self._file is not None:
+            self._file.calls += 1
+            self._file.adapter_seconds += seconds
+
+    def add_section(self, name: str, seconds: float) -> None:
+        """Book *seconds* of non-adapter work under section *name*."""
+        self._sections[name] = self._sections.get(name, 0.0) + seconds
+
+    # ── Report ─────────────────────────────────────────────────────
+
+    def calls(self) -> dict[str, int]:
+        """Return the number of calls per adapter method, across stages."""
+        counts: dict[str, int] = {}
+        for (_, method), stats in self._methods.items():
+            counts[method] = counts.get(method, 0) + stats.calls
+        return counts
+
+    def timings(self) -> OperationTimings:
+        methods = sorted(self._methods.values(), key=lambda m: -m.seconds)
+        return OperationTimings(
+            operation=self.operation,
+            wall_seconds=self.wall_seconds,
+            adapter_seconds=sum(m.seconds for m in methods),
+            sections=dict(self._sections),
+            methods=[m.model_copy() for m in methods],
+            files=[f.model_copy() for f in self._files.values()],
+        )
+
+
+def record_section(name: str, seconds: float) -> None:
+    """Book *seconds* under section *name* if a run is being profiled."""
+    profiler = _active.get()
+    if profiler is not None:
+        profiler.add_section(name, seconds)
+
+
+@contextmanager
+def profile_stage(name: str) -> Iterator[None]:
+    """Attribute adapter calls in the block to *name* if a run is profiled."""
+    profiler = _active.get()
+    if profiler is None:
+        yield
+        return
+    with profiler.stage(name):
+        yield
+
+
+def merge_timings(
+    first: OperationTimings, second: OperationTimings
+) -> OperationTimings:
+    """Combine the timings of two shards (or drawings) of the same run."""
+    merged = first.model_copy(deep=True)
+    merged.wall_seconds += second.wall_seconds
+    merged.adapter_seconds += second.adapter_seconds
+    for name, seconds in second.sections.items():
+        merged.sections[name] = merged.sections.get(name, 0.0) + seconds
+
+    methods = {(m.operation, m.method): m for m in merged.methods}
+    for other in second.methods:
+        stats = methods.get((other.operation, other.method))
+        if stats is None:
+            merged.methods.append(other.model_copy())
+            continue
+        stats.calls += other.calls
+        stats.errors += other.errors
+        stats.seconds += other.seconds
+        stats.max_seconds = max(stats.max_seconds, other.max_seconds)
+        stats.items += other.items
+        stats.bytes += other.bytes
+        stats.histogram = [a + b for a, b in zip(stats.histogram, other.histogram)]
+    merged.methods.sort(key=lambda m: -m.seconds)
+
+    files = {f.file: f for f in merged.files}
+    for other in second.files:
+        if other.file in files:
+            files[other.file].calls += other.calls
+            files[other.file].adapter_seconds += other.adapter_seconds
+        else:
+            merged.files.append(other.model_copy())
+    return merged
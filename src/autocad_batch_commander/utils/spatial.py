@@ -0,0 +1,281 @@
+"""Per-drawing spatial index over polylines, dimensions, blocks and text.
+
+:class:`SpatialIndex` is a static R-tree, bulk-loaded with the
+Sort-Tile-Recursive packing: items are sorted into vertical slices by x,
+each slice into runs by y, and the runs become the leaves of a tree whose
+nodes hold up to ``node_size`` children. A query only descends into nodes
+whose box it touches, so finding what lies at a point, in a box or nearest
+to a point costs O(log n + hits) instead of a pass over every entity.
+
+Each entity is indexed by its bounding box: polylines by the box of their
+outline (arcs included), dimensions by the box of their associated
+points, blocks by their insertion point and text by its position (text
+without a position is left out). Containment queries then test the
+candidate polylines exactly, with bulged edges split into short chords.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from autocad_batch_commander.models import (
+    BlockReference,
+    DimensionEntity,
+    PolylineEntity,
+    TextEntity,
+)
+from autocad_batch_commander.utils.geometry import measure_polylines, outline
+
+if TYPE_CHECKING:
+    from autocad_batch_commander.acad.port import AutoCADPort
+
+BBox = tuple[float, float, float, float]  # min x, min y, max x, max y
+
+
+@dataclass(frozen=True)
+class SpatialItem:
+    """One indexed entity."""
+
+    kind: str  # polyline | dimension | block | text
+    handle: str
+    bbox: BBox
+    entity: Any = field(compare=False, repr=False)
+
+    @property
+    def point(self) -> tuple[float, float]:
+        """The item's reference point: the centre of its box."""
+        return (self.bbox[0] + self.bbox[2]) / 2.0, (self.bbox[1] + self.bbox[3]) / 2.0
+
+
+@dataclass
+class _Node:
+    bbox: BBox
+    children: list[_Node] = field(default_factory=list)
+    items: list[SpatialItem] = field(default_factory=list)
+
+
+def _union(boxes: Iterable[BBox]) -> BBox:
+    x0, y0, x1, y1 = zip(*boxes)
+    return min(x0), min(y0), max(x1), max(y1)
+
+
+def _intersects(a: BBox, b: BBox) -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def _box_distance(box: BBox, x: float, y: float) -> float:
+    dx = max(box[0] - x, 0.0, x - box[2])
+    dy = max(box[1] - y, 0.0, y - box[3])
+    return math.hypot(dx, dy)
+
+
+def _segment_distance(
+    x: float, y: float, a: tuple[float, float], b: tuple[float, float]
+) -> float:
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    length = dx * dx + dy * dy
+    t = 0.0 if length == 0.0 else ((x - a[0]) * dx + (y - a[1]) * dy) / length
+    t = min(1.0, max(0.0, t))
+    return math.hypot(x - a[0] - t * dx, y - a[1] - t * dy)
+
+
+def point_in_ring(x: float, y: float, ring: Sequence[tuple[float, float]]) -> bool:
+    """Return whether (*x*, *y*) lies inside the closed *ring* (even-odd rule)."""
+    inside = False
+    count = len(ring)
+    for i in range(count):
+        (ax, ay), (bx, by) = ring[i - 1], ring[i]
+        if (ay > y) != (by > y) and x < ax + (y - ay) * (bx - ax) / (by - ay):
+            inside = not inside
+    return inside
+
+
+def _str_pack(entries: list[Any], key: Any, node_size: int) -> list[list[Any]]:
+    """Group *entries* into runs of *node_size* by Sort-Tile-Recursive."""
+    runs = math.ceil(len(entries) / node_size)
+    slices = math.ceil(math.sqrt(runs))
+    per_slice = slices * node_size
+    by_x = sorted(entries, key=lambda e: key(e)[0] + key(e)[2])
+    groups: list[list[Any]] = []
+    for s in range(0, len(by_x), per_slice):
+        column = sorted(by_x[s : s + per_slice], key=lambda e: key(e)[1] + key(e)[3])
+        groups.extend(
+            column[i : i + node_size] for i in range(0, len(column), node_size)
+        )
+    return groups
+
+
+class SpatialIndex:
+    """Static R-tree over the entities of one drawing.
+
+    Build it with :meth:`from_entities` or :meth:`for_drawing`; it does
+    not change after construction. Every query takes an optional *kind*
+    (``polyline``, ``dimension``, ``block`` or ``text``) to restrict the
+    items returned.
+    """
+
+    def __init__(self, items: Iterable[SpatialItem], *, node_size: int = 16) -> None:
+        self._items = list(items)
+        self._outlines: dict[str, list[tuple[float, float]]] = {}
+        self._root: _Node | None = None
+        if not self._items:
+            return
+        level = [
+            _Node(_union(i.bbox for i in run), items=run)
+            for run in _str_pack(self._items, lambda i: i.bbox, node_size)
+        ]
+        while len(level) > 1:
+            level = [
+                _Node(_union(n.bbox for n in run), children=run)
+                for run in _str_pack(level, lambda n: n.bbox, node_size)
+            ]
+        self._root = level[0]
+
+    @classmethod
+    def from_entities(
+        cls,
+        *,
+        polylines: Sequence[PolylineEntity] = (),
+        dimensions: Sequence[DimensionEntity] = (),
+        blocks: Sequence[BlockReference] = (),
+        texts: Sequence[TextEntity] = (),
+        node_size: int = 16,
+    ) -> SpatialIndex:
+        items = [
+            SpatialItem("polyline", p.handle, g.bbox, p)
+            for p, g in zip(polylines, measure_polylines(polylines))
+            if p.vertices
+        ]
+        for dim in dimensions:
+            if dim.associated_points:
+                box = _union((p.x, p.y, p.x, p.y) for p in dim.associated_points)
+                items.append(SpatialItem("dimension", dim.handle, box, dim))
+        for block in blocks:
+            ip = block.insertion_point
+            items.append(
+                SpatialItem("block", block.handle, (ip.x, ip.y, ip.x, ip.y), block)
+            )
+        for text in texts:
+            if text.position is not None:
+                p = text.position
+                items.append(
+                    SpatialItem("text", text.handle, (p.x, p.y, p.x, p.y), text)
+                )
+        return cls(items, node_size=node_size)
+
+    @classmethod
+    def for_drawing(
+        cls, adapter: AutoCADPort, layers: list[str] | None = None
+    ) -> SpatialIndex:
+        """Index the entities of the drawing open in *adapter*."""
+        return cls.from_entities(
+            polylines=adapter.get_polylines(layers=layers),
+            dimensions=adapter.get_dimensions(layers=layers),
+            blocks=adapter.get_blocks(layers=layers),
+            texts=adapter.get_text_entities(layers=layers),
+        )
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[SpatialItem]:
+        return iter(self._items)
+
+    # ── Queries ────────────────────────────────────────────────────
+
+    def intersecting(self, bbox: BBox, kind: str | None = None) -> list[SpatialItem]:
+        """Return the items whose box intersects *bbox*."""
+        found: list[SpatialItem] = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            if not _intersects(node.bbox, bbox):
+                continue
+            stack.extend(node.children)
+            found.extend(
+                item
+                for item in node.items
+                if (kind is None or item.kind == kind) and _intersects(item.bbox, bbox)
+            )
+        return found
+
+    def containing(self, x: float, y: float) -> list[SpatialItem]:
+        """Return the closed polylines whose outline encloses (*x*, *y*)."""
+        return [
+            item
+            for item in self.intersecting((x, y, x, y), "polyline")
+            if item.entity.closed and point_in_ring(x, y, self.outline(item))
+        ]
+
+    def inside(
+        self, polyline: SpatialItem, kind: str | None = None
+    ) -> list[SpatialItem]:
+        """Return the items whose reference point lies inside closed *polyline*."""
+        ring = self.outline(polyline)
+        return [
+            item
+            for item in self.intersecting(polyline.bbox, kind)
+            if item is not polyline and point_in_ring(*item.point, ring)
+        ]
+
+    def nearest(
+        self,
+        x: float,
+        y: float,
+        k: int = 1,
+        kind: str | None = None,
+        max_distance: float = math.inf,
+    ) -> list[tuple[float, SpatialItem]]:
+        """Return up to *k* ``(distance, item)`` pairs closest to (*x*, *y*).
+
+        Points and boxes are measured to their box; polylines to their
+        outline, at distance zero from inside a closed one.
+        """
+        if self._root is None or k <= 0:
+            return []
+        found: list[tuple[float, SpatialItem]] = []
+        tie = 0  # keeps heap entries comparable
+        heap: list[tuple[float, int, _Node | SpatialItem]] = [(0.0, tie, self._root)]
+        while heap and len(found) < k:
+            distance, _, entry = heapq.heappop(heap)
+            if distance > max_distance:
+                break
+            if isinstance(entry, SpatialItem):
+                found.append((distance, entry))
+                continue
+            for child in entry.children:
+                tie += 1
+                heapq.heappush(heap, (_box_distance(child.bbox, x, y), tie, child))
+            for item in entry.items:
+                if kind is None or item.kind == kind:
+                    tie += 1
+                    heapq.heappush(heap, (self._distance(item, x, y), tie, item))
+        return found
+
+    # ── Helpers ────────────────────────────────────────────────────
+
+    def outline(self, item: SpatialItem) -> list[tuple[float, float]]:
+        """Return (and memoise) a polyline item's outline as straight chords."""
+        ring = self._outlines.get(item.handle)
+        if ring is None:
+            ring = self._outlines[item.handle] = outline(item.entity)
+        return ring
+
+    def _distance(self, item: SpatialItem, x: float, y: float) -> float:
+        if item.kind != "polyline":
+            return _box_distance(item.bbox, x, y)
+        ring = self.outline(item)
+        if item.entity.closed and point_in_ring(x, y, ring):
+            return 0.0
+        if len(ring) == 1:
+            return math.hypot(x - ring[0][0], y - ring[0][1])
+        edges = (
+            zip(ring, ring[1:] + ring[:1])
+            if item.entity.closed
+            else zip(ring, ring[1:])
+        )
+        return min(_segment_distance(x, y, a, b) for a, b in edges)
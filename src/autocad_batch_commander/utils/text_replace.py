@@ -0,0 +1,217 @@
+"""Single-pass multi-term text replacement.
+
+:class:`TermReplacer` compiles a find → replace table once and rewrites a
+string in one scan, however many terms the table has. Literal terms go
+into an Aho-Corasick automaton; at each position the longest matching term
+wins and matches never overlap, which is what applying ``str.replace``
+per term would give if the terms did not interfere with each other (and
+unlike that, a replacement is never rescanned for other terms). Regex
+terms are combined into one alternation, where the first listed term
+that matches at the leftmost position wins.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+def load_term_mappings(path: Path) -> dict[str, str]:
+    """Read a find → replace table from a ``.json`` or ``.csv`` file.
+
+    JSON may be an object (``{"find": "replace"}``) or a list of
+    ``{"find": ..., "replace": ...}`` objects. CSV has two columns, find
+    and replace, with an optional ``find,replace`` header row.
+    """
+    suffix = path.suffix.lower()
+    if suffix == ".json":
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if isinstance(data, dict):
+            pairs = list(data.items())
+        else:
+            pairs = [(row["find"], row["replace"]) for row in data]
+    elif suffix == ".csv":
+        with path.open(newline="", encoding="utf-8-sig") as fh:
+            rows = [row for row in csv.reader(fh) if row]
+        if rows and [c.strip().lower() for c in rows[0][:2]] == ["find", "replace"]:
+            rows = rows[1:]
+        pairs = [(row[0], row[1] if len(row) > 1 else "") for row in rows]
+    else:
+        raise ValueError(f"Unsupported mapping file {path}; expected .json or .csv")
+
+    mappings: dict[str, str] = {}
+    for find, replace in pairs:
+        if not find:
+            raise ValueError(f"Empty search term in {path}")
+        mappings[str(find)] = str(replace)
+    return mappings
+
+
+def _fold(text: str) -> str:
+    # Lower-case without changing the length, so offsets map back to *text*.
+    lowered = text.lower()
+    if len(lowered) == len(text):  # no character expanded (e.g. "İ" → "i̇")
+        return lowered
+    return "".join(c if len(low := c.lower()) != 1 else low for c in text)
+
+
+def _is_word_char(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+
+def _shift_backrefs(template: str, outer: int) -> str:
+    def shift(match: re.Match[str]) -> str:
+        if match.group(0) == "\\\\":
+            return match.group(0)
+        return f"\\g<{outer + int(match.group(1) or match.group(2))}>"
+
+    return re.sub(r"\\\\|\\([1-9][0-9]?)|\\g<([0-9]+)>", shift, template)
+
+
+@dataclass
+class _Node:
+    goto: dict[str, int] = field(default_factory=dict)
+    fail: int = 0
+    # Lengths of the terms ending here, including via fail links, longest first.
+    out: list[int] = field(default_factory=list)
+    term: int = -1
+
+
+class TermReplacer:
+    """A compiled find → replace table applied in a single pass."""
+
+    def __init__(
+        self,
+        mappings: dict[str, str],
+        *,
+        case_sensitive: bool = False,
+        whole_word: bool = False,
+        regex: bool = False,
+    ) -> None:
+        if not mappings:
+            raise ValueError("No search terms given")
+        self.case_sensitive = case_sensitive
+        self.whole_word = whole_word
+        self.regex = regex
+        self._replacements = list(mappings.values())
+        if regex:
+            self._compile_regex(list(mappings))
+        else:
+            self._compile_automaton(list(mappings))
+
+    # ── Literal terms (Aho-Corasick) ───────────────────────────────
+
+    def _compile_automaton(self, terms: list[str]) -> None:
+        nodes = [_Node()]
+        # term index by (folded) term; later duplicates win like dict updates
+        for index, term in enumerate(terms):
+            key = term if self.case_sensitive else _fold(term)
+            state = 0
+            for c in key:
+                nxt = nodes[state].goto.get(c)
+                if nxt is None:
+                    nxt = len(nodes)
+                    nodes[state].goto[c] = nxt
+                    nodes.append(_Node())
+                state = nxt
+            nodes[state].term = index
+            nodes[state].out = [len(key)]
+
+        queue = list(nodes[0].goto.values())
+        for state in queue:  # breadth-first, so fail targets are done first
+            node = nodes[state]
+            node.out = node.out + nodes[node.fail].out
+            for c, nxt in node.goto.items():
+                fail = node.fail
+                while fail and c not in nodes[fail].goto:
+                    fail = nodes[fail].fail
+                target = nodes[fail].goto.get(c, 0)
+                nodes[nxt].fail = target if target != nxt else 0
+                queue.append(nxt)
+        self._nodes = nodes
+        # Flat tables for the scan loop.
+        self._goto = [node.goto for node in nodes]
+        self._fail = [node.fail for node in nodes]
+        self._out = [tuple(node.out) for node in nodes]
+
+    def _term_at(self, key: str, start: int, length: int) -> int:
+        state = 0
+        for c in key[start : start + length]:
+            state = self._nodes[state].goto[c]
+        return self._nodes[state].term
+
+    def _literal_sub(self, text: str) -> tuple[str, int]:
+        key = text if self.case_sensitive else _fold(text)
+        goto, fail, out = self._goto, self._fail, self._out
+        # Longest acceptable match starting at each position.
+        best: dict[int, int] = {}
+        state = 0
+        for end, c in enumerate(key, 1):
+            while state and c not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(c, 0)
+            if not state:
+                continue
+            for length in out[state]:
+                start = end - length
+                if length <= best.get(start, 0):
+                    continue
+                if self.whole_word and not self._on_word_boundary(text, start, end):
+                    continue
+                best[start] = length
+
+        if not best:
+            return text, 0
+        parts: list[str] = []
+        pos = count = 0
+        for start in sorted(best):
+            if start < pos:
+                continue  # overlaps the previous match
+            length = best[start]
+            parts.append(text[pos:start])
+            parts.append(self._replacements[self._term_at(key, start, length)])
+            pos = start + length
+            count += 1
+        parts.append(text[pos:])
+        return "".join(parts), count
+
+    @staticmethod
+    def _on_word_boundary(text: str, start: int, end: int) -> bool:
+        before = start == 0 or not _is_word_char(text[start - 1])
+        after = end == len(text) or not _is_word_char(text[end])
+        return before and after
+
+    # ── Regex terms ────────────────────────────────────────────────
+
+    def _compile_regex(self, patterns: list[str]) -> None:
+        flags = 0 if self.case_sensitive else re.IGNORECASE
+        # Each term becomes one capturing group of a combined alternation;
+        # its own groups are renumbered, so shift backrefs in its template.
+        self._templates: dict[int, str] = {}
+        alternatives: list[str] = []
+        group = 1
+        for pattern, replacement in zip(patterns, self._replacements):
+            self._templates[group] = _shift_backrefs(replacement, group)
+            alternatives.append(f"({pattern})")
+            group += re.compile(pattern, flags).groups + 1
+        combined = "|".join(alternatives)
+        if self.whole_word:
+            combined = rf"\b(?:{combined})\b"
+        self._combined = re.compile(combined, flags)
+
+    def _regex_sub(self, text: str) -> tuple[str, int]:
+        # The outer group of the matching term closes last, so it is lastindex.
+        return self._combined.subn(
+            lambda m: m.expand(self._templates[m.lastindex or 0]), text
+        )
+
+    # ── Public API ─────────────────────────────────────────────────
+
+    def sub(self, text: str) -> tuple[str, int]:
+        """Return *text* with every term replaced, and the number of matches."""
+        if self.regex:
+            return self._regex_sub(text)
+        return self._literal_sub(text)
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import json
+import time
 from pathlib import Path
 
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse, StreamingResponse
+from fastapi.responses import HTMLResponse, PlainTextResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
 
@@ -22,6 +23,8 @@ from autocad_batch_commander.operations.compliance_ops import (
     load_rule_set,
 )
 from autocad_batch_commander.models import ComplianceCheckRequest
+from autocad_batch_commander.standards import registry
+from autocad_batch_commander.utils.metrics import REGISTRY
 
 # ── App setup ────────────────────────────────────────────────────
 
@@ -34,6 +37,27 @@ app = FastAPI(
 _template_dir = Path(__file__).parent / "templates"
 templates = Jinja2Templates(directory=str(_template_dir))
 
+_HTTP_SECONDS = REGISTRY.histogram(
+    "acad_http_request_seconds",
+    "Latency of web API requests.",
+    ("method", "route", "status"),
+)
+
+
+@app.middleware("http")
+async def _time_requests(request: Request, call_next):
+    start = time.perf_counter()
+    response = await call_next(request)
+    # Label by route template so path parameters don't explode cardinality.
+    route = getattr(request.scope.get("route"), "path", "unmatched")
+    _HTTP_SECONDS.observe(
+        time.perf_counter() - start,
+        request.method,
+        route,
+        str(response.status_code),
+    )
+    return response
+
 
 # ── Request / response models ───────────────────────────────────
 
@@ -76,9 +100,30 @@ def rules():
 
 
 @app.get("/api/rules/{rule_set}")
-def rule_set_detail(rule_set: str):
+def rule_set_detail(
+    rule_set: str,
+    category: str | None = None,
+    building_type: str | None = None,
+    parameter: str | None = None,
+):
     rs = load_rule_set(rule_set)
-    return rs.model_dump()
+    if category is None and building_type is None and parameter is None:
+        return rs.model_dump()
+    matched = registry.rules(
+        rule_set=rule_set,
+        category=category,
+        building_type=building_type,
+        parameter=parameter,
+    )
+    return rs.model_copy(update={"rules": matched}).model_dump()
+
+
+@app.get("/api/rule/{rule_id}")
+def rule_detail(rule_id: str):
+    rule = registry.rule(rule_id)
+    if rule is None:
+        raise HTTPException(status_code=404, detail=f"Rule '{rule_id}' not found")
+    return {"rule_set": registry.index().rule_set_of[rule_id], **rule.model_dump()}
 
 
 @app.post("/api/compliance/check")
@@ -165,6 +210,13 @@ def submit_feedback(body: dict):
     return {"status": "ok"}
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    return PlainTextResponse(
+        REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 # ── Web UI ───────────────────────────────────────────────────────
 
 
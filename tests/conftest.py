@@ -7,6 +7,7 @@ from pathlib import Path
 import pytest
 
 from autocad_batch_commander.acad.mock_adapter import MockAutoCADAdapter
+from autocad_batch_commander.config import settings
 from autocad_batch_commander.models import (
     BlockAttribute,
     BlockReference,
@@ -23,6 +24,14 @@ from autocad_batch_commander.models import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path_factory, monkeypatch) -> None:
+    """Keep the extraction cache out of the user's home directory."""
+    cache_dir = tmp_path_factory.mktemp("cache")
+    monkeypatch.setattr(settings, "cache_dir", cache_dir)
+    monkeypatch.setenv("ACAD_CMD_CACHE_DIR", str(cache_dir))
+
+
 @pytest.fixture
 def mock_adapter() -> MockAutoCADAdapter:
     """Return a MockAutoCADAdapter with two pre-loaded drawings."""
@@ -0,0 +1,245 @@
+"""Tests for the content-addressed backup store."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from autocad_batch_commander.acad.mock_adapter import MockAutoCADAdapter
+from autocad_batch_commander.cli.app import app
+from autocad_batch_commander.models import TextEntity, TextReplaceRequest
+from autocad_batch_commander.operations.text_ops import batch_find_replace
+from autocad_batch_commander.utils import backup as backup_mod
+from autocad_batch_commander.utils.backup import (
+    BackupStore,
+    BackupWriter,
+    create_backup,
+    prune_backups,
+)
+from autocad_batch_commander.utils.file_ops import file_sha256
+
+
+def _drawing(tmp_path: Path, content: bytes = b"revision A") -> Path:
+    path = tmp_path / "plan.dwg"
+    path.write_bytes(content)
+    return path
+
+
+def test_backup_is_stored_by_content(tmp_path):
+    drawing = _drawing(tmp_path)
+
+    info = create_backup(drawing)
+
+    stored = BackupStore.for_drawing(drawing).object_path(info.sha256)
+    assert stored.read_bytes() == b"revision A"
+    assert stored.is_relative_to(tmp_path / ".backups")
+    assert stored.stat().st_mode & 0o222 == 0  # read-only
+
+
+def test_identical_content_is_stored_once(tmp_path):
+    drawing = _drawing(tmp_path)
+    copy = tmp_path / "copy.dwg"
+    copy.write_bytes(b"revision A")
+
+    first = create_backup(drawing)
+    second = create_backup(drawing)
+    third = create_backup(copy)
+
+    objects = list((tmp_path / ".backups" / "objects").glob("*/*"))
+    assert len(objects) == 1
+    assert first.sha256 == second.sha256 == third.sha256
+    assert len(BackupStore(tmp_path / ".backups").backups()) == 3
+
+
+def test_falls_back_to_copy_without_reflink(tmp_path, monkeypatch):
+    monkeypatch.setattr(backup_mod, "_reflink", lambda src, dst: False)
+    drawing = _drawing(tmp_path)
+
+    info = create_backup(drawing)
+
+    assert BackupStore.for_drawing(drawing).object_path(info.sha256).exists()
+
+
+def test_backs_up_read_only_drawings(tmp_path, monkeypatch):
+    real_open = os.open
+
+    def checked_open(path, flags, *args, **kwargs):
+        # Enforce file modes even when the tests run as root.
+        writes = flags & (os.O_WRONLY | os.O_RDWR)
+        if writes and os.path.isfile(path) and not os.stat(path).st_mode & 0o200:
+            raise PermissionError(13, "Permission denied", str(path))
+        return real_open(path, flags, *args, **kwargs)
+
+    monkeypatch.setattr(backup_mod.os, "open", checked_open)
+    monkeypatch.setattr(backup_mod, "_reflink", lambda src, dst: False)
+    drawing = _drawing(tmp_path)
+    drawing.chmod(0o444)
+
+    info = create_backup(drawing)
+
+    stored = BackupStore.for_drawing(drawing).object_path(info.sha256)
+    assert stored.read_bytes() == b"revision A"
+
+
+def test_restore_latest_and_by_id(tmp_path):
+    drawing = _drawing(tmp_path)
+    first = create_backup(drawing)
+    drawing.write_bytes(b"revision B")
+    create_backup(drawing)
+    drawing.write_bytes(b"revision C")
+
+    store = BackupStore.for_drawing(drawing)
+    store.restore(drawing)
+    assert drawing.read_bytes() == b"revision B"
+
+    store.restore(drawing, first.id)
+    assert drawing.read_bytes() == b"revision A"
+    # Each restore backed up the state it replaced.
+    assert b"revision C" in [
+        store.object_path(b.sha256).read_bytes() for b in store.backups("plan.dwg")
+    ]
+
+
+def test_prune_keeps_newest_and_recent(tmp_path):
+    drawing = _drawing(tmp_path)
+    for rev in (b"A", b"B", b"C", b"D"):
+        drawing.write_bytes(rev)
+        create_backup(drawing)
+    store = BackupStore.for_drawing(drawing)
+    old = time.time() - 90 * 86400
+    with store._db:
+        store._db.execute("UPDATE backups SET created_at = ? WHERE id <= 3", (old,))
+    store.close()
+
+    result = prune_backups(tmp_path, keep_last=2, keep_days=30)
+
+    assert result.backups_removed == 2
+    assert result.objects_removed == 2
+    assert [b.id for b in store.backups()] == [4, 3]
+
+
+def test_cli_list_restore_and_prune(tmp_path):
+    drawing = _drawing(tmp_path)
+    create_backup(drawing)
+    drawing.write_bytes(b"broken")
+    runner = CliRunner()
+
+    listed = runner.invoke(app, ["backups", "list", "--folder", str(tmp_path)])
+    restored = runner.invoke(app, ["backups", "restore", str(drawing)])
+    pruned = runner.invoke(
+        app,
+        ["backups", "prune", "--folder", str(tmp_path), "--keep-last", "1"],
+    )
+
+    assert listed.exit_code == 0
+    assert "Drawing Backups" in listed.output
+    assert restored.exit_code == 0
+    assert drawing.read_bytes() == b"revision A"
+    assert pruned.exit_code == 0
+    assert "Backups Removed" in pruned.output
+
+
+class BackupCheckingAdapter(MockAutoCADAdapter):
+    """Mock adapter that asserts each drawing is backed up before it is saved."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.saved: list[str] = []
+
+    def save_drawing(self) -> None:
+        path = Path(self._require_drawing().path)
+        store = BackupStore.for_drawing(path)
+        [backup] = store.backups(path.name)
+        assert store.object_path(backup.sha256).read_bytes() == path.read_bytes()
+        store.close()
+        self.saved.append(str(path))
+        super().save_drawing()
+
+
+def test_save_waits_for_prefetched_backup(tmp_path, monkeypatch):
+    monkeypatch.setattr(backup_mod.settings, "backup_prefetch", 2)
+    adapter = BackupCheckingAdapter()
+    for i in range(6):
+        path = tmp_path / f"sheet_{i}.dwg"
+        path.write_bytes(f"sheet {i}".encode())
+        text = "TIMBER" if i % 2 else "STEEL"
+        adapter.add_mock_drawing(
+            str(path), texts=[TextEntity(handle="T", text=text, layer="0")]
+        )
+
+    request = TextReplaceRequest(
+        folder=tmp_path, find_text="TIMBER", replace_text="OAK"
+    )
+    edited = sorted(file_sha256(tmp_path / f"sheet_{i}.dwg") for i in (1, 3, 5))
+    result = batch_find_replace(adapter, request)
+
+    assert result.files_modified == 3
+    assert len(adapter.saved) == 3
+    # The three untouched sheets were hashed ahead but never copied.
+    objects = (tmp_path / ".backups").glob("objects/*/*")
+    assert sorted(p.name for p in objects) == edited
+
+
+def test_unsaved_prefetch_leaves_nothing_behind(tmp_path):
+    drawing = _drawing(tmp_path)
+    objects = tmp_path / ".backups" / "objects"
+
+    with BackupWriter(ahead=1) as writer:
+        for path in writer.prefetch([drawing]):
+            staged = writer._pending[path].result()
+            assert staged.digest.sha256 == file_sha256(drawing)
+            assert staged.tmp is not None
+            assert staged.tmp.read_bytes() == b"revision A"
+            assert staged.tmp.parent.is_relative_to(objects)
+
+    assert list(objects.glob("*/*")) == []
+    assert writer.stats.prefetched == writer.stats.unused == 1
+
+
+def test_commit_promotes_the_staged_copy(tmp_path, monkeypatch):
+    drawing = _drawing(tmp_path)
+
+    with BackupWriter(ahead=1) as writer:
+        for path in writer.prefetch([drawing]):
+            staged = writer._pending[path].result()
+            monkeypatch.setattr(
+                BackupStore, "stage", lambda *_: pytest.fail("copied on commit")
+            )
+            writer.commit(path)
+
+    store = BackupStore.for_drawing(drawing)
+    [backup] = store.backups()
+    assert not staged.tmp.exists()
+    assert store.object_path(backup.sha256).read_bytes() == b"revision A"
+    assert writer.stats.unused == 0
+
+
+def test_commit_resnapshots_a_drawing_changed_after_prefetch(tmp_path):
+    drawing = _drawing(tmp_path)
+
+    with BackupWriter(ahead=1) as writer:
+        for path in writer.prefetch([drawing]):
+            writer._pending[path].result()
+            path.write_bytes(b"edited by someone else")
+            writer.commit(path)
+
+    store = BackupStore.for_drawing(drawing)
+    [backup] = store.backups()
+    assert store.object_path(backup.sha256).read_bytes() == b"edited by someone else"
+    assert writer.stats.backups == 1
+    assert writer.stats.prefetched == 1
+    assert writer.stats.wait_seconds > 0
+
+
+def test_disabled_writer_passes_files_through(tmp_path):
+    drawing = _drawing(tmp_path)
+
+    with BackupWriter(enabled=False) as writer:
+        assert list(writer.prefetch([drawing])) == [drawing]
+        writer.commit(drawing)
+
+    assert not (tmp_path / ".backups").exists()
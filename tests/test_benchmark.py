@@ -0,0 +1,131 @@
+"""Tests for the benchmark harness."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from autocad_batch_commander.benchmark import (
+    compare,
+    parse_size,
+    run_benchmarks,
+)
+from autocad_batch_commander.cli.app import app
+from autocad_batch_commander.models import BenchmarkMeasurement
+
+runner = CliRunner()
+
+
+def _measurement(**overrides) -> BenchmarkMeasurement:
+    values = {
+        "case": "operations.audit_drawings",
+        "size": "small",
+        "wall_seconds": 0.1,
+        "peak_rss_mb": 100.0,
+        "adapter_calls": {"open_drawing": 5, "get_layers": 5},
+    }
+    return BenchmarkMeasurement(**(values | overrides))
+
+
+def test_parse_size():
+    assert parse_size("medium") == (20, 2000)
+    assert parse_size("3x150") == (3, 150)
+    with pytest.raises(ValueError):
+        parse_size("huge")
+
+
+def test_compare_flags_each_metric_beyond_threshold_and_noise():
+    base = _measurement()
+
+    assert compare(_measurement(wall_seconds=0.12), base, 0.25) == []
+    assert compare(_measurement(peak_rss_mb=110.0), base, 0.05) == []  # < 16 MB
+    assert (
+        compare(
+            _measurement(wall_seconds=0.001), _measurement(wall_seconds=0.0005), 0.25
+        )
+        == []
+    )
+
+    slower = compare(_measurement(wall_seconds=0.2), base, 0.25)
+    assert [(r.metric, r.baseline, r.current) for r in slower] == [
+        ("wall_seconds", 0.1, 0.2)
+    ]
+    bigger = compare(_measurement(peak_rss_mb=200.0), base, 0.25)
+    assert [r.metric for r in bigger] == ["peak_rss_mb"]
+    chattier = compare(
+        _measurement(adapter_calls={"open_drawing": 5, "get_layers": 6}), base, 0.25
+    )
+    assert [r.metric for r in chattier] == ["adapter_calls"]
+
+
+def test_history_seeds_baseline_then_detects_regressions(tmp_path: Path):
+    history = tmp_path / "history.json"
+
+    first = run_benchmarks(
+        ["2x60"], cases=["operations.drawing_search"], repeat=1, history=history
+    )
+    assert first.baselines_updated == 1
+    assert first.regressions == []
+    [measurement] = first.measurements
+    assert measurement.drawings == 2 and measurement.entities == 60
+    assert measurement.adapter_calls["open_drawing"] == 2
+
+    # Pretend the baseline made fewer adapter calls.
+    data = json.loads(history.read_text())
+    data["baseline"]["2x60/operations.drawing_search"]["adapter_calls"] = {}
+    history.write_text(json.dumps(data))
+
+    second = run_benchmarks(
+        ["2x60"], cases=["operations.drawing_search"], repeat=1, history=history
+    )
+    assert [r.metric for r in second.regressions] == ["adapter_calls"]
+    assert len(json.loads(history.read_text())["runs"]) == 2
+
+    rebased = run_benchmarks(
+        ["2x60"],
+        cases=["operations.drawing_search"],
+        repeat=1,
+        history=history,
+        update_baseline=True,
+    )
+    assert rebased.regressions == []
+    assert rebased.baselines_updated == 1
+
+
+def test_mutating_cases_get_a_fresh_project_each_repeat():
+    case = ["operations.batch_standardize_layers"]
+    once = run_benchmarks(["2x100"], cases=case, repeat=1).measurements[0]
+    twice = run_benchmarks(["2x100"], cases=case, repeat=2).measurements[0]
+
+    # The last repeat still found legacy layers to rename and saved.
+    assert once.adapter_calls["save_drawing"] == 2
+    assert twice.adapter_calls == once.adapter_calls
+
+
+def test_bench_cli(tmp_path: Path):
+    history = tmp_path / "history.json"
+    args = ["bench", "--size", "2x50", "--case", "knowledge.*", "--case", "*xrefs"]
+    args += ["-n", "1", "--history", str(history)]
+
+    result = runner.invoke(app, args)
+
+    assert result.exit_code == 0, result.output
+    assert "manage_xrefs" in result.output
+    assert "query_knowledge_base" in result.output
+    assert history.exists()
+
+    assert runner.invoke(app, ["bench", "--case", "nothing*"]).exit_code == 1
+
+
+@pytest.mark.benchmark
+def test_benchmark_suite_has_no_regressions():
+    history = Path(os.environ.get("ACAD_CMD_BENCH_HISTORY", ".benchmarks/history.json"))
+    sizes = os.environ.get("ACAD_CMD_BENCH_SIZES", "small,medium").split(",")
+
+    report = run_benchmarks(sizes, history=history, label="pytest")
+
+    assert report.regressions == [], report.regressions
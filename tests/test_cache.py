@@ -0,0 +1,297 @@
+"""Tests for the on-disk extraction cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from autocad_batch_commander.acad import cache as cache_mod
+from autocad_batch_commander.acad.cache import CachedAdapter, DrawingCache, with_cache
+from autocad_batch_commander.acad.dxf import DXFDocument
+from autocad_batch_commander.acad.mock_adapter import MockAutoCADAdapter
+from autocad_batch_commander.cli.app import app
+from autocad_batch_commander.models import (
+    BlockAttribute,
+    BlockReference,
+    DimensionEntity,
+    DrawingInfoRequest,
+    LayerEntity,
+    TextEntity,
+)
+from autocad_batch_commander.operations.drawing_ops import get_drawing_info
+from autocad_batch_commander.operations.executor import run_batch
+
+
+class CountingAdapter(MockAutoCADAdapter):
+    def __init__(self) -> None:
+        super().__init__()
+        self.opens = 0
+
+    def open_drawing(self, path: str) -> None:
+        self.opens += 1
+        super().open_drawing(path)
+
+
+@pytest.fixture
+def drawing(tmp_path: Path) -> Path:
+    path = tmp_path / "plan.dwg"
+    path.write_bytes(b"drawing v1")
+    return path
+
+
+@pytest.fixture
+def inner(drawing: Path) -> CountingAdapter:
+    adapter = CountingAdapter()
+    adapter.add_mock_drawing(
+        str(drawing),
+        texts=[
+            TextEntity(handle="T1", text="DOOR", layer="A-DOOR"),
+            TextEntity(handle="T2", text="NOTE", layer="TEXT", entity_type="AcDbMText"),
+        ],
+        layers=[LayerEntity(name="A-DOOR"), LayerEntity(name="TEXT")],
+        dimensions=[
+            DimensionEntity(handle="D1", value=900.0),
+            DimensionEntity(handle="D2", dimension_type="aligned", value=1200.0),
+        ],
+        blocks=[BlockReference(handle="B1", name="TITLE_BLOCK", layer="TITLE")],
+        block_attributes={"B1": [BlockAttribute(tag="DATE", value="2024-01-15")]},
+    )
+    return adapter
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> DrawingCache:
+    return DrawingCache(tmp_path / "cache" / "extraction.sqlite3", 1 << 20)
+
+
+def _read_all(adapter: CachedAdapter, path: Path) -> tuple:
+    adapter.open_drawing(str(path))
+    result = (
+        adapter.get_text_entities(),
+        adapter.get_layers(),
+        adapter.get_dimensions(),
+        adapter.get_blocks(),
+        adapter.get_block_attributes("B1"),
+        adapter.get_drawing_extents(),
+    )
+    adapter.close_drawing()
+    return result
+
+
+def test_unchanged_drawing_is_not_reopened(inner, cache, drawing):
+    adapter = CachedAdapter(inner, cache)
+
+    first = _read_all(adapter, drawing)
+    second = _read_all(adapter, drawing)
+
+    assert first == second
+    assert inner.opens == 1
+    stats = cache.stats()
+    assert stats.drawings == 1
+    assert stats.hits == 6
+    assert stats.misses == 6
+
+
+def test_filters_are_applied_to_cached_data(inner, cache, drawing):
+    adapter = CachedAdapter(inner, cache)
+    _read_all(adapter, drawing)
+
+    adapter.open_drawing(str(drawing))
+    texts = adapter.get_text_entities(layers=["TEXT"])
+    mtexts = adapter.get_text_entities(entity_types=["AcDbText"])
+    aligned = adapter.get_dimensions(dimension_types=["aligned"])
+
+    assert [t.handle for t in texts] == ["T2"]
+    assert [t.handle for t in mtexts] == ["T1"]
+    assert [d.handle for d in aligned] == ["D2"]
+    assert adapter.get_blocks(layers=["0"]) == []
+    assert inner.opens == 1
+
+
+def test_changed_drawing_is_reread(inner, cache, drawing):
+    adapter = CachedAdapter(inner, cache)
+    _read_all(adapter, drawing)
+
+    drawing.write_bytes(b"drawing v2 with more content")
+    _read_all(adapter, drawing)
+
+    assert inner.opens == 2
+
+
+def test_touched_drawing_is_verified_by_hash(inner, cache, drawing):
+    adapter = CachedAdapter(inner, cache)
+    _read_all(adapter, drawing)
+
+    stat = drawing.stat()
+    os.utime(drawing, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    _read_all(adapter, drawing)
+    drawing.write_bytes(b"drawing v3")  # same size, different content
+    _read_all(adapter, drawing)
+
+    assert inner.opens == 2
+
+
+def test_edit_drops_entry_and_reads_live_data(inner, cache, drawing):
+    adapter = CachedAdapter(inner, cache)
+    _read_all(adapter, drawing)
+
+    adapter.open_drawing(str(drawing))
+    adapter.set_text("T1", "TIMBER DOOR")
+    assert adapter.get_text_entities()[0].text == "TIMBER DOOR"
+    adapter.save_drawing()
+    adapter.close_drawing()
+
+    assert cache.stats().drawings == 0
+    assert inner.opens == 2
+
+
+def test_bulk_edits_drop_entry(inner, cache, drawing):
+    adapter = CachedAdapter(inner, cache)
+    _read_all(adapter, drawing)
+
+    adapter.open_drawing(str(drawing))
+    adapter.set_texts({"T1": "OAK DOOR", "T2": "SEE PLAN"})
+    assert adapter.rename_layers({"TEXT": "A-TEXT"}) == ["TEXT"]
+    assert adapter.set_block_attributes({"B1": {"DATE": "2025-06-01"}}) == 1
+    texts = adapter.get_text_entities()
+    adapter.close_drawing()
+
+    assert [(t.text, t.layer) for t in texts] == [
+        ("OAK DOOR", "A-DOOR"),
+        ("SEE PLAN", "A-TEXT"),
+    ]
+    assert cache.stats().drawings == 0
+
+
+def test_edited_drawing_is_never_stored(inner, cache, drawing, monkeypatch):
+    puts = []
+    monkeypatch.setattr(cache, "put", lambda key, payloads: puts.append(key))
+    adapter = CachedAdapter(inner, cache)
+
+    adapter.open_drawing(str(drawing))
+    adapter.get_text_entities()
+    adapter.set_text("T1", "TIMBER DOOR")
+    adapter.close_drawing()
+
+    assert puts == []
+    assert cache.stats().drawings == 0
+
+
+def test_editing_session_never_fingerprints(inner, cache, drawing, monkeypatch):
+    monkeypatch.setattr(
+        cache_mod, "file_sha256", lambda path: pytest.fail(f"hashed {path}")
+    )
+    adapter = CachedAdapter(inner, cache)
+
+    adapter.open_drawing(str(drawing))
+    texts = adapter.get_text_entities()
+    adapter.set_text(texts[0].handle, "TIMBER DOOR")
+    adapter.save_drawing()
+    adapter.close_drawing()
+
+    assert cache.stats().drawings == 0
+    assert inner.opens == 1
+
+
+def test_uncached_reads_pass_filters_through(inner, cache, drawing, monkeypatch):
+    calls = []
+    get_text_entities = inner.get_text_entities
+    monkeypatch.setattr(
+        inner,
+        "get_text_entities",
+        lambda **filters: calls.append(filters) or get_text_entities(**filters),
+    )
+    adapter = CachedAdapter(inner, cache)
+
+    adapter.open_drawing(str(drawing))
+    adapter.set_text("T2", "SEE PLAN")
+    texts = adapter.get_text_entities(layers=["TEXT"])
+    adapter.close_drawing()
+
+    assert [t.text for t in texts] == ["SEE PLAN"]
+    assert calls == [{"layers": ["TEXT"], "entity_types": None}]
+
+
+def test_cached_reads_do_not_commit(inner, cache, drawing):
+    adapter = CachedAdapter(inner, cache)
+    _read_all(adapter, drawing)
+    cache.close()
+
+    _read_all(adapter, drawing)
+    _read_all(adapter, drawing)
+
+    assert cache._db.total_changes == 0
+    assert cache.stats().hits == 12
+    cache.close()
+    assert DrawingCache(cache.db_path, cache.max_bytes).stats().hits == 12
+
+
+def test_missing_file_is_passed_through(cache):
+    adapter = CachedAdapter(MockAutoCADAdapter(), cache)
+    with pytest.raises(FileNotFoundError):
+        adapter.open_drawing("nowhere.dwg")
+
+
+def test_least_recently_used_drawings_are_evicted(tmp_path, cache):
+    inner = MockAutoCADAdapter()
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"sheet_{i}.dwg"
+        path.write_bytes(f"sheet {i}".encode())
+        inner.add_mock_drawing(
+            str(path),
+            texts=[
+                TextEntity(handle=f"T{n}", text=os.urandom(64).hex(), layer="TEXT")
+                for n in range(40)
+            ],
+        )
+        paths.append(path)
+    small = DrawingCache(cache.db_path, 8000)
+    adapter = CachedAdapter(inner, small)
+
+    for path in paths:
+        adapter.open_drawing(str(path))
+        adapter.get_text_entities()
+        adapter.close_drawing()
+
+    stats = small.stats()
+    assert stats.evictions >= 1
+    assert stats.size_bytes <= 8000
+    assert small.lookup(paths[-1]) is not None
+    assert small.get(str(paths[-1].resolve()), "texts") is not None
+    assert small.get(str(paths[0].resolve()), "texts") is None
+
+
+def test_with_cache_skips_mock_unless_forced():
+    mock = MockAutoCADAdapter()
+    assert with_cache(mock) is mock
+    assert with_cache(mock, False) is mock
+    assert isinstance(with_cache(mock, True), CachedAdapter)
+
+
+def test_run_batch_serves_second_run_from_cache(tmp_path):
+    DXFDocument.new().write(tmp_path / "plan.dxf")
+    request = DrawingInfoRequest(folder=tmp_path)
+
+    first = run_batch(get_drawing_info, request, cad_engine="dxf")
+    second = run_batch(get_drawing_info, request, cad_engine="dxf")
+    uncached = run_batch(get_drawing_info, request, cad_engine="dxf", cache=False)
+
+    assert first == second == uncached
+    stats = DrawingCache.from_settings().stats()
+    assert stats.drawings == 1
+    assert stats.hits == stats.misses
+
+
+def test_cache_cli_stats_and_clear():
+    runner = CliRunner()
+    result = runner.invoke(app, ["cache", "stats"])
+    assert result.exit_code == 0
+    assert "Extraction Cache" in result.output
+
+    result = runner.invoke(app, ["cache", "clear"])
+    assert result.exit_code == 0
+    assert "Cleared" in result.output
@@ -0,0 +1,349 @@
+"""Tests for the shared COM adapter base using fake COM objects.
+
+``com_base`` refuses to import off Windows, so these tests patch
+``sys.platform`` and provide a stand-in ``win32com.client`` module whose
+``Dispatch`` returns an in-process fake of the AutoCAD object model.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+
+import pytest
+
+
+class FakeEntity:
+    def __init__(self, app: FakeApp, entity_name: str, **props) -> None:
+        self._app = app
+        self.EntityName = entity_name
+        self.__dict__.update(props)
+
+    def __getattribute__(self, name: str):
+        if not name.startswith("_") and name[0].isupper():
+            object.__getattribute__(self, "_app").property_reads += 1
+        return object.__getattribute__(self, name)
+
+
+_DXF_NAMES = {
+    "AcDbText": "TEXT",
+    "AcDbMText": "MTEXT",
+    "AcDbRotatedDimension": "DIMENSION",
+    "AcDbPolyline": "LWPOLYLINE",
+    "AcDbBlockReference": "INSERT",
+    "AcDbLine": "LINE",
+}
+
+
+class FakeSelectionSet:
+    def __init__(self, app: FakeApp, doc: FakeDocument) -> None:
+        self._app = app
+        self._doc = doc
+        self._items: list[FakeEntity] = []
+
+    def Select(self, mode, pt1, pt2, codes, values) -> None:
+        filters = dict(zip(codes, values))
+        self._app.selections.append(filters)
+        types = filters[0].split(",")
+        layers = filters[8].split(",") if 8 in filters else None
+        self._items = [
+            e
+            for e in self._doc.ModelSpace._entities
+            if _DXF_NAMES[e.__dict__["EntityName"]] in types
+            and (layers is None or e.__dict__["Layer"] in layers)
+        ]
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def Delete(self) -> None:
+        pass
+
+
+class FakeSelectionSets:
+    def __init__(self, app: FakeApp, doc: FakeDocument) -> None:
+        self._app = app
+        self._doc = doc
+
+    def Item(self, name: str):
+        raise KeyError(name)
+
+    def Add(self, name: str) -> FakeSelectionSet:
+        return FakeSelectionSet(self._app, self._doc)
+
+
+class FakeModelSpace:
+    def __init__(self, app: FakeApp, entities: list[FakeEntity]) -> None:
+        self._app = app
+        self._entities = entities
+
+    def __iter__(self):
+        self._app.modelspace_walks += 1
+        return iter(list(self._entities))
+
+    def InsertBlock(self, pt, name, sx, sy, sz, rotation):
+        ref = FakeEntity(
+            self._app,
+            "AcDbBlockReference",
+            Handle=f"NEW{len(self._entities)}",
+            Name=name,
+            Layer="0",
+            InsertionPoint=pt,
+            Rotation=rotation,
+            XScaleFactor=sx,
+            YScaleFactor=sy,
+            ZScaleFactor=sz,
+        )
+        self._entities.append(ref)
+        return ref
+
+
+class FakeLayer:
+    def __init__(self, name: str) -> None:
+        self.Name = name
+        self.color = 7
+        self.LayerOn = True
+        self.Freeze = False
+
+
+class FakeLayers:
+    def __init__(self, names: list[str]) -> None:
+        self._layers = [FakeLayer(n) for n in names]
+
+    def __iter__(self):
+        return iter(self._layers)
+
+    def Item(self, name: str) -> FakeLayer:
+        for layer in self._layers:
+            if layer.Name == name:
+                return layer
+        raise KeyError(name)
+
+
+class FakeDocument:
+    def __init__(self, app: FakeApp, entities: list[FakeEntity]) -> None:
+        self.ModelSpace = FakeModelSpace(app, entities)
+        self.Layers = FakeLayers(["0", "WALL", "TEXT", "DIMENSION"])
+        self.SelectionSets = FakeSelectionSets(app, self)
+        self.closed = False
+        self.handle_lookups = 0
+        self.undo_marks: list[str] = []
+
+    def StartUndoMark(self) -> None:
+        self.undo_marks.append("start")
+
+    def EndUndoMark(self) -> None:
+        self.undo_marks.append("end")
+
+    def HandleToObject(self, handle: str) -> FakeEntity:
+        self.handle_lookups += 1
+        for entity in self.ModelSpace._entities:
+            if entity.Handle == handle:
+                return entity
+        raise KeyError(handle)
+
+    def Close(self, save: bool) -> None:
+        self.closed = True
+
+
+class FakeDocuments:
+    def __init__(self, app: FakeApp) -> None:
+        self._app = app
+
+    def Open(self, path: str) -> FakeDocument:
+        return FakeDocument(self._app, self._app.make_entities())
+
+
+class FakeApp:
+    def __init__(self) -> None:
+        self.Visible = True
+        self.Documents = FakeDocuments(self)
+        self.modelspace_walks = 0
+        self.property_reads = 0
+        self.selections: list[dict] = []
+
+    def make_entities(self) -> list[FakeEntity]:
+        attributes = [
+            FakeEntity(self, "AcDbAttribute", TagString=tag, TextString="", Handle=h)
+            for tag, h in (("DATE", "A1"), ("REV", "A2"))
+        ]
+        return [
+            FakeEntity(
+                self, "AcDbText", Handle="T1", TextString="TIMBER DOOR", Layer="TEXT"
+            ),
+            FakeEntity(self, "AcDbMText", Handle="T2", TextString="NOTE", Layer="WALL"),
+            FakeEntity(
+                self,
+                "AcDbRotatedDimension",
+                Handle="D1",
+                Measurement=1200.0,
+                TextOverride="",
+                Layer="DIMENSION",
+            ),
+            FakeEntity(
+                self,
+                "AcDbPolyline",
+                Handle="P1",
+                Coordinates=(0.0, 0.0, 10.0, 0.0, 10.0, 5.0, 0.0, 5.0),
+                Closed=True,
+                Area=50.0,
+                Length=30.0,
+                Layer="WALL",
+            ),
+            FakeEntity(
+                self,
+                "AcDbBlockReference",
+                Handle="B1",
+                Name="TITLE_BLOCK",
+                Layer="0",
+                InsertionPoint=(0.0, 0.0, 0.0),
+                Rotation=0.0,
+                XScaleFactor=1.0,
+                YScaleFactor=1.0,
+                ZScaleFactor=1.0,
+                GetAttributes=lambda: attributes,
+            ),
+            FakeEntity(self, "AcDbLine", Handle="L1", Layer="WALL"),
+        ]
+
+
+@pytest.fixture
+def com_adapter(monkeypatch):
+    """Return a COMAdapterBase instance wired to a FakeApp."""
+    app = FakeApp()
+    client = types.ModuleType("win32com.client")
+    client.Dispatch = lambda prog_id: app
+    client.VARIANT = lambda vartype, value: value
+    com = types.ModuleType("pythoncom")
+    com.Empty = None
+    com.VT_ARRAY, com.VT_I2, com.VT_VARIANT = 0x2000, 2, 12
+    monkeypatch.setitem(sys.modules, "pythoncom", com)
+    package = types.ModuleType("win32com")
+    package.client = client
+    monkeypatch.setitem(sys.modules, "win32com", package)
+    monkeypatch.setitem(sys.modules, "win32com.client", client)
+    monkeypatch.setattr(sys, "platform", "win32")
+    monkeypatch.delitem(
+        sys.modules, "autocad_batch_commander.acad.com_base", raising=False
+    )
+
+    com_base = importlib.import_module("autocad_batch_commander.acad.com_base")
+    adapter = com_base.COMAdapterBase()
+    adapter.open_drawing("plan.dwg")
+    yield adapter, app
+    sys.modules.pop("autocad_batch_commander.acad.com_base", None)
+
+
+def test_getters_share_one_modelspace_walk(com_adapter):
+    adapter, app = com_adapter
+
+    assert [t.handle for t in adapter.get_text_entities()] == ["T1", "T2"]
+    assert adapter.get_dimensions()[0].value == 1200.0
+    assert adapter.get_polylines()[0].area == 50.0
+    assert adapter.get_blocks()[0].name == "TITLE_BLOCK"
+    assert app.modelspace_walks == 1
+
+
+def test_layer_filter_served_from_cache(com_adapter):
+    adapter, app = com_adapter
+    adapter.get_blocks()
+
+    assert [t.handle for t in adapter.get_text_entities(layers=["WALL"])] == ["T2"]
+    assert [p.handle for p in adapter.get_polylines(layers=["TEXT"])] == []
+    assert adapter.get_text_entities(entity_types=["AcDbText"])[0].handle == "T1"
+    assert app.modelspace_walks == 1
+    assert app.selections == []
+
+
+def test_filtered_query_uses_selection_set(com_adapter):
+    adapter, app = com_adapter
+
+    walls = adapter.get_polylines(layers=["WALL"])
+    texts = adapter.get_text_entities(layers=["WALL"], entity_types=["AcDbMText"])
+
+    assert [p.handle for p in walls] == ["P1"]
+    assert [t.handle for t in texts] == ["T2"]
+    assert app.modelspace_walks == 0
+    assert app.selections[0] == {0: "LWPOLYLINE,POLYLINE", 410: "Model", 8: "WALL"}
+    assert app.selections[1] == {0: "MTEXT", 410: "Model", 8: "WALL"}
+
+
+def test_selection_set_narrows_dimension_subtypes(com_adapter):
+    adapter, app = com_adapter
+
+    assert adapter.get_dimensions(dimension_types=["angular"]) == []
+    assert [d.handle for d in adapter.get_dimensions(layers=["DIMENSION"])] == ["D1"]
+    assert app.selections[0][0] == "DIMENSION"
+    assert 8 not in app.selections[0]
+    assert app.modelspace_walks == 0
+
+
+def test_layer_names_are_escaped(com_adapter):
+    adapter, app = com_adapter
+
+    adapter.get_blocks(layers=["A-WALL#1"])
+
+    assert app.selections[0][8] == "A`-WALL`#1"
+
+
+def test_set_text_and_rename_layer_update_cache(com_adapter):
+    adapter, app = com_adapter
+    adapter.get_text_entities()
+
+    adapter.set_text("T1", "ALUMINIUM DOOR")
+    assert adapter.rename_layer("WALL", "A-WALL") is True
+
+    texts = adapter.get_text_entities()
+    assert texts[0].text == "ALUMINIUM DOOR"
+    assert texts[1].layer == "A-WALL"
+    assert adapter.get_polylines(layers=["A-WALL"])[0].handle == "P1"
+    assert app.modelspace_walks == 1
+
+
+def test_bulk_setters_reuse_scanned_objects(com_adapter):
+    adapter, app = com_adapter
+    adapter.get_text_entities()
+    doc = adapter._doc
+
+    adapter.set_texts({"T1": "OAK DOOR", "T2": "NEW NOTE"})
+    count = adapter.set_block_attributes({"B1": {"DATE": "2025-06-01", "REV": "B"}})
+
+    assert [t.text for t in adapter.get_text_entities()] == ["OAK DOOR", "NEW NOTE"]
+    assert count == 2
+    assert doc.HandleToObject("B1").GetAttributes()[1].TextString == "B"
+    assert doc.handle_lookups == 1  # only the assertion above
+    assert doc.undo_marks == ["start", "end", "start", "end"]
+    assert app.modelspace_walks == 1
+
+
+def test_rename_layers_follows_chains_in_cache(com_adapter):
+    adapter, app = com_adapter
+    adapter.get_text_entities()
+
+    renamed = adapter.rename_layers({"WALL": "TMP", "TEXT": "WALL", "NOPE": "X"})
+
+    assert renamed == ["WALL", "TEXT"]
+    assert [t.layer for t in adapter.get_text_entities()] == ["WALL", "TMP"]
+    assert app.modelspace_walks == 1
+
+
+def test_insert_block_invalidates_cache(com_adapter):
+    from autocad_batch_commander.models import Point3D
+
+    adapter, app = com_adapter
+    assert len(adapter.get_blocks()) == 1
+
+    adapter.insert_block("DOOR", Point3D(x=1, y=2))
+
+    assert len(adapter.get_blocks()) == 2
+    assert app.modelspace_walks == 2
+
+
+def test_cache_reset_on_reopen(com_adapter):
+    adapter, app = com_adapter
+    adapter.get_text_entities()
+    adapter.close_drawing()
+    adapter.open_drawing("other.dwg")
+    adapter.get_text_entities()
+    assert app.modelspace_walks == 2
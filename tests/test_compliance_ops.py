@@ -63,6 +63,13 @@ def test_check_compliance_building_type_filter():
     assert result_residential.total_rules > 0
 
 
+def test_check_compliance_empty_building_type_is_no_filter():
+    everything = check_compliance(ComplianceCheckRequest(building_type=None))
+    empty = check_compliance(ComplianceCheckRequest(building_type=""))
+
+    assert empty.total_rules == everything.total_rules
+
+
 def test_check_compliance_category_filter():
     """Filtering by category returns only matching rules."""
     request = ComplianceCheckRequest(
@@ -110,3 +117,46 @@ def test_check_compliance_corridor_width_residential():
     assert corridor_rules[0].threshold == 1.2
     assert corridor_rules[0].unit == "metres"
     assert corridor_rules[0].by_law == "By-Law 34(1)"
+
+
+def test_check_compliance_matches_a_linear_scan():
+    """Indexed lookup finds the same rules, in file order, as scanning."""
+    request = ComplianceCheckRequest(
+        rule_sets=["ubbl-fire", "ubbl-spatial"],
+        building_type="residential",
+        categories=["corridor", "escape", "room_size"],
+    )
+    expected = [
+        rule.id
+        for name in request.rule_sets
+        for rule in load_rule_set(name).rules
+        if not rule.building_type or request.building_type in rule.building_type
+        if rule.category in request.categories
+    ]
+
+    result = check_compliance(request)
+
+    assert [f.rule_id for f in result.findings] == expected
+    assert result.total_rules == len(expected)
+
+
+def test_rules_api_filters_through_the_registry():
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    from autocad_batch_commander.web.api import app
+
+    client = TestClient(app)
+    spatial = load_rule_set("ubbl-spatial")
+    rule = spatial.rules[0]
+
+    filtered = client.get(
+        "/api/rules/ubbl-spatial", params={"category": rule.category}
+    ).json()
+    found = client.get(f"/api/rule/{rule.id}").json()
+
+    assert [r["id"] for r in filtered["rules"]] == [
+        r.id for r in spatial.rules if r.category == rule.category
+    ]
+    assert (found["id"], found["rule_set"]) == (rule.id, "ubbl-spatial")
+    assert client.get("/api/rule/NO-SUCH-RULE").status_code == 404
@@ -158,6 +158,27 @@ def test_drawing_search_case_insensitive(tmp_path: Path) -> None:
     assert result.total_matches == 1
 
 
+def test_drawing_search_layer_and_type_filters(tmp_path: Path) -> None:
+    adapter = _adapter_with_full_drawing(tmp_path)
+    request = DrawingSearchRequest(
+        folder=tmp_path,
+        search_text="O",
+        search_in=["text", "attributes"],
+        layers=["TEXT"],
+    )
+    result = drawing_search(adapter, request)
+
+    assert [m.entity_handle for m in result.matches] == ["T1"]
+
+    request = DrawingSearchRequest(
+        folder=tmp_path,
+        search_text="DOOR",
+        search_in=["text"],
+        entity_types=["AcDbMText"],
+    )
+    assert drawing_search(adapter, request).total_matches == 0
+
+
 def test_get_drawing_info(tmp_path: Path) -> None:
     adapter = _adapter_with_full_drawing(tmp_path)
     request = DrawingInfoRequest(folder=tmp_path)
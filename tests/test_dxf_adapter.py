@@ -0,0 +1,446 @@
+"""Tests for the offline pure-Python DXF adapter."""
+
+from __future__ import annotations
+
+import math
+from pathlib import Path
+
+import pytest
+
+from autocad_batch_commander.acad.dxf import DXFDocument, get_value, iter_tags
+from autocad_batch_commander.acad.dxf_adapter import DXFAdapter
+from autocad_batch_commander.acad.factory import get_acad_adapter
+from autocad_batch_commander.models import Point3D, TextReplaceRequest
+from autocad_batch_commander.operations.executor import run_batch
+from autocad_batch_commander.operations.text_ops import batch_find_replace
+from autocad_batch_commander.utils.file_ops import get_dwg_files
+
+
+def _layer(doc: DXFDocument, name: str, color: int = 7) -> None:
+    doc.add_table_entry(
+        "LAYER",
+        [
+            (0, "LAYER"),
+            (5, doc.next_handle()),
+            (100, "AcDbSymbolTableRecord"),
+            (100, "AcDbLayerTableRecord"),
+            (2, name),
+            (70, "0"),
+            (62, str(color)),
+        ],
+    )
+
+
+def _entity(doc: DXFDocument, etype: str, layer: str, *tags) -> str:
+    handle = doc.next_handle()
+    doc.section("ENTITIES").records.append(
+        [(0, etype), (5, handle), (100, "AcDbEntity"), (8, layer), *tags]
+    )
+    return handle
+
+
+def _write_plan(path: Path) -> Path:
+    doc = DXFDocument.new()
+    for name, color in (("TEXT", 7), ("ROOM", 3), ("DIMENSION", 6), ("TITLE", 2)):
+        _layer(doc, name, color)
+    _layer(doc, "UNUSED", 1)
+
+    _entity(doc, "TEXT", "TEXT", (10, "0.0"), (20, "0.0"), (1, "TIMBER DOOR"))
+    _entity(
+        doc,
+        "MTEXT",
+        "TEXT",
+        (10, "100.0"),
+        (20, "100.0"),
+        (3, "A" * 250),
+        (1, "TIMBER END"),
+    )
+    _entity(
+        doc,
+        "DIMENSION",
+        "DIMENSION",
+        (70, "32"),
+        (1, "<>"),
+        (13, "0.0"),
+        (23, "0.0"),
+        (14, "3600.0"),
+        (24, "0.0"),
+        (42, "3600.0"),
+    )
+    _entity(doc, "DIMENSION", "DIMENSION", (70, "33"), (42, "900.0"))
+    _entity(
+        doc,
+        "LWPOLYLINE",
+        "ROOM",
+        (90, "4"),
+        (70, "1"),
+        *[
+            tag
+            for x, y in ((0, 0), (3600, 0), (3600, 3000), (0, 3000))
+            for tag in ((10, str(x)), (20, str(y)))
+        ],
+    )
+    # half-disc of radius 1000: straight edge then a semicircular bulge
+    _entity(
+        doc,
+        "LWPOLYLINE",
+        "ROOM",
+        (90, "2"),
+        (70, "1"),
+        (10, "-1000.0"),
+        (20, "0.0"),
+        (10, "1000.0"),
+        (20, "0.0"),
+        (42, "1.0"),
+    )
+    _entity(doc, "LINE", "ROOM", (67, "1"), (10, "0"), (20, "0"))
+
+    owner = doc.next_handle()
+    doc.add_table_entry(
+        "BLOCK_RECORD", [(0, "BLOCK_RECORD"), (5, owner), (2, "TITLE_BLOCK")]
+    )
+    doc.add_block(
+        "TITLE_BLOCK",
+        owner,
+        [
+            [
+                (0, "ATTDEF"),
+                (5, doc.next_handle()),
+                (8, "TITLE"),
+                (10, "10.0"),
+                (20, "5.0"),
+                (1, "TBC"),
+                (2, "DATE"),
+            ]
+        ],
+    )
+    doc.add_block("UNUSED_BLOCK", owner)
+    doc.add_block("STRUCT", owner, flags=4, xref_path="./xref/structural.dwg")
+
+    _entity(
+        doc,
+        "INSERT",
+        "TITLE",
+        (66, "1"),
+        (2, "TITLE_BLOCK"),
+        (10, "500.0"),
+        (20, "250.0"),
+    )
+    _entity(doc, "ATTRIB", "TITLE", (1, "2024-01-15"), (2, "DATE"))
+    _entity(doc, "SEQEND", "TITLE")
+
+    _entity(
+        doc,
+        "VIEWPORT",
+        "0",
+        (67, "1"),
+        (410, "Layout1"),
+        (10, "420.0"),
+        (20, "297.0"),
+        (40, "800.0"),
+        (41, "550.0"),
+        (45, "55000.0"),
+        (69, "2"),
+    )
+    doc.write(path)
+    return path
+
+
+@pytest.fixture
+def plan(tmp_path: Path) -> Path:
+    return _write_plan(tmp_path / "plan.dxf")
+
+
+@pytest.fixture
+def adapter(plan: Path) -> DXFAdapter:
+    adapter = DXFAdapter()
+    adapter.open_drawing(str(plan))
+    return adapter
+
+
+def test_roundtrip_preserves_tags(plan: Path, tmp_path: Path):
+    copy = tmp_path / "copy.dxf"
+    DXFDocument.read(plan).write(copy)
+    assert list(iter_tags(copy)) == list(iter_tags(plan))
+
+
+def test_read_entities(adapter: DXFAdapter):
+    texts = adapter.get_text_entities()
+    assert [t.entity_type for t in texts] == ["AcDbText", "AcDbMText"]
+    assert texts[1].text == "A" * 250 + "TIMBER END"
+    assert adapter.get_text_entities(entity_types=["AcDbText"])[0].text == (
+        "TIMBER DOOR"
+    )
+
+    dims = adapter.get_dimensions()
+    assert [(d.dimension_type, d.value) for d in dims] == [
+        ("linear", 3600.0),
+        ("aligned", 900.0),
+    ]
+    assert dims[0].text_override == ""
+    assert dims[0].associated_points[1].x == 3600.0
+    assert len(adapter.get_dimensions(dimension_types=["aligned"])) == 1
+
+    room, disc = adapter.get_polylines(layers=["ROOM"])
+    assert room.closed and room.area == pytest.approx(10_800_000.0)
+    assert room.perimeter == pytest.approx(13_200.0)
+    assert disc.area == pytest.approx(math.pi * 1000**2 / 2)
+    assert disc.perimeter == pytest.approx(2000 + math.pi * 1000)
+
+    (block,) = adapter.get_blocks()
+    assert block.name == "TITLE_BLOCK"
+    assert block.insertion_point.x == 500.0
+    attrs = adapter.get_block_attributes(block.handle)
+    assert [(a.tag, a.value) for a in attrs] == [("DATE", "2024-01-15")]
+
+
+def test_layers_layouts_xrefs(adapter: DXFAdapter):
+    layers = {ly.name: ly for ly in adapter.get_layers()}
+    assert layers["ROOM"].color == 3
+
+    layouts = adapter.get_layouts()
+    assert [ly.name for ly in layouts] == ["Model", "Layout1"]
+    assert layouts[1].viewport_count == 1
+    (viewport,) = adapter.get_viewports("Layout1")
+    assert viewport.scale == pytest.approx(100.0)
+
+    (xref,) = adapter.get_xrefs()
+    assert (xref.name, xref.status) == ("STRUCT", "not_found")
+
+    extents = adapter.get_drawing_extents()
+    assert extents.max_point.x == 3600.0
+
+
+def test_edits_are_saved(adapter: DXFAdapter, plan: Path):
+    texts = adapter.get_text_entities()
+    adapter.set_text(texts[0].handle, "ALUMINIUM DOOR")
+    adapter.set_text(texts[1].handle, "B" * 300)
+    assert adapter.rename_layer("ROOM", "A-ROOM") is True
+    block = adapter.get_blocks()[0]
+    assert adapter.set_block_attribute(block.handle, "DATE", "2025-06-01")
+    assert adapter.create_layer("NEW", color=4, is_on=False) is True
+    assert adapter.set_layer_properties("NEW", is_frozen=True) is True
+    adapter.save_drawing()
+    adapter.close_drawing()
+
+    reopened = DXFAdapter()
+    reopened.open_drawing(str(plan))
+    texts = reopened.get_text_entities()
+    assert texts[0].text == "ALUMINIUM DOOR"
+    assert texts[1].text == "B" * 300
+    assert len(reopened.get_polylines(layers=["A-ROOM"])) == 2
+    assert reopened.get_block_attributes(block.handle)[0].value == "2025-06-01"
+    new = next(ly for ly in reopened.get_layers() if ly.name == "NEW")
+    assert (new.color, new.is_on, new.is_frozen) == (4, False, True)
+
+
+def test_bulk_edits(adapter: DXFAdapter, plan: Path):
+    first, second = (t.handle for t in adapter.get_text_entities())
+    with pytest.raises(KeyError):
+        adapter.set_texts({first: "CHANGED", "FFFF": "MISSING"})
+    assert adapter.get_text_entities()[0].text == "TIMBER DOOR"
+
+    adapter.set_texts({first: "OAK DOOR", second: "C" * 260})
+    renamed = adapter.rename_layers(
+        {"ROOM": "TMP", "TEXT": "ROOM", "TMP": "TEXT", "0": "ZERO", "NOPE": "X"}
+    )
+    block = adapter.get_blocks()[0]
+    count = adapter.set_block_attributes(
+        {block.handle: {"DATE": "2025-06-01", "X": ""}}
+    )
+    adapter.save_drawing()
+
+    reopened = DXFAdapter()
+    reopened.open_drawing(str(plan))
+    assert renamed == ["ROOM", "TEXT", "TMP"]
+    assert count == 1
+    texts = reopened.get_text_entities()
+    assert [t.text for t in texts] == ["OAK DOOR", "C" * 260]
+    assert {t.layer for t in texts} == {"ROOM"}
+    assert len(reopened.get_polylines(layers=["TEXT"])) == 2
+    assert reopened.get_block_attributes(block.handle)[0].value == "2025-06-01"
+
+
+def test_layer_names_ignore_case(adapter: DXFAdapter, plan: Path):
+    assert adapter.create_layer("unused") is False
+    assert adapter.delete_layer("room") is False  # in use
+    assert adapter.rename_layer("text", "Notes") is True
+    assert adapter.rename_layer("notes", "NOTES") is True  # case-only rename
+    assert adapter.delete_layer("unused") is True
+    adapter.save_drawing()
+
+    reopened = DXFAdapter()
+    reopened.open_drawing(str(plan))
+    names = {ly.name for ly in reopened.get_layers()}
+    assert "NOTES" in names and not names & {"TEXT", "Notes", "UNUSED"}
+    assert {t.layer for t in reopened.get_text_entities()} == {"NOTES"}
+
+
+def test_insert_block_creates_attributes(adapter: DXFAdapter):
+    handle = adapter.insert_block(
+        "TITLE_BLOCK", Point3D(x=1000, y=0), rotation=90.0, layer="TITLE"
+    )
+    attrs = adapter.get_block_attributes(handle)
+    assert [(a.tag, a.value) for a in attrs] == [("DATE", "TBC")]
+    assert len(adapter.get_blocks()) == 2
+
+    with pytest.raises(ValueError, match="Block definition not found"):
+        adapter.insert_block("MISSING", Point3D(x=0, y=0))
+
+
+def test_xref_attach_detach(adapter: DXFAdapter):
+    assert adapter.attach_xref("MEP", "./xref/mep.dwg", "overlay") is True
+    assert adapter.attach_xref("MEP", "./xref/mep.dwg") is False
+    assert {x.name: x.xref_type for x in adapter.get_xrefs()} == {
+        "STRUCT": "attach",
+        "MEP": "overlay",
+    }
+    assert adapter.detach_xref("MEP") is True
+    assert [x.name for x in adapter.get_xrefs()] == ["STRUCT"]
+    assert [b.name for b in adapter.get_blocks()] == ["TITLE_BLOCK"]
+
+
+def test_purge_and_audit(adapter: DXFAdapter):
+    assert adapter.delete_layer("ROOM") is False  # in use
+    purged = adapter.purge()
+    assert purged == 2  # UNUSED_BLOCK + UNUSED layer
+    assert "UNUSED" not in {ly.name for ly in adapter.get_layers()}
+
+    adapter.insert_block("TITLE_BLOCK", Point3D(x=0, y=0), layer="GHOST")
+    issues = adapter.audit_drawing(fix=True)
+    assert any("GHOST" in i.description and i.fixed for i in issues)
+    assert adapter.audit_drawing(fix=False) == []
+
+
+def test_purge_keeps_blocks_and_layers_referenced_by_handle(tmp_path: Path):
+    doc = DXFDocument.new()
+    _layer(doc, "VP-FROZEN")
+    _layer(doc, "SCRATCH")
+    frozen = next(
+        get_value(e, 5)
+        for e in doc.table_entries("LAYER")
+        if get_value(e, 2) == "VP-FROZEN"
+    )
+    arrow = doc.next_handle()
+    doc.add_table_entry(
+        "BLOCK_RECORD", [(0, "BLOCK_RECORD"), (5, arrow), (2, "_ARROW")]
+    )
+    doc.add_block("_ARROW", arrow)
+    orphan = doc.next_handle()
+    doc.add_table_entry(
+        "BLOCK_RECORD", [(0, "BLOCK_RECORD"), (5, orphan), (2, "ORPHAN")]
+    )
+    doc.add_block("ORPHAN", orphan)
+    tables = doc.section("TABLES").records
+    tables += [
+        [(0, "TABLE"), (2, "DIMSTYLE"), (5, doc.next_handle()), (70, "1")],
+        [(0, "DIMSTYLE"), (105, doc.next_handle()), (2, "ARCH"), (342, arrow)],
+        [(0, "ENDTAB")],
+    ]
+    _entity(doc, "VIEWPORT", "0", (67, "1"), (69, "2"), (341, frozen))
+    path = tmp_path / "sheet.dxf"
+    doc.write(path)
+
+    adapter = DXFAdapter()
+    adapter.open_drawing(str(path))
+    purged = adapter.purge()
+    adapter.save_drawing()
+
+    reopened = DXFAdapter()
+    reopened.open_drawing(str(path))
+    blocks = reopened._block_names()
+    layers = {ly.name for ly in reopened.get_layers()}
+    assert purged == 2  # ORPHAN and SCRATCH
+    assert "_ARROW" in blocks and "ORPHAN" not in blocks
+    assert "VP-FROZEN" in layers and "SCRATCH" not in layers
+    assert [v.frozen_layers for v in reopened.get_viewports()] == [["VP-FROZEN"]]
+
+
+def test_rejects_dwg_and_binary(tmp_path: Path):
+    adapter = DXFAdapter()
+    with pytest.raises(ValueError, match="only open .dxf"):
+        adapter.open_drawing(str(tmp_path / "plan.dwg"))
+    binary = tmp_path / "binary.dxf"
+    binary.write_bytes(b"AutoCAD Binary DXF\r\n\x1a\x00")
+    with pytest.raises(ValueError, match="Binary DXF"):
+        adapter.open_drawing(str(binary))
+
+
+def test_factory_and_batch_run(tmp_path: Path):
+    for name in ("a.dxf", "b.dxf"):
+        _write_plan(tmp_path / name)
+    (tmp_path / "c.dwg").write_bytes(b"fake")
+
+    assert [f.name for f in get_dwg_files(tmp_path)] == ["c.dwg"]
+    assert [f.name for f in get_dwg_files(tmp_path, cad_engine="dxf")] == [
+        "a.dxf",
+        "b.dxf",
+    ]
+    assert isinstance(get_acad_adapter(cad_engine="dxf"), DXFAdapter)
+
+    request = TextReplaceRequest(
+        folder=tmp_path, find_text="TIMBER", replace_text="OAK", backup=False
+    )
+    result = run_batch(batch_find_replace, request, cad_engine="dxf")
+
+    assert result.files_modified == result.files_processed == 2
+    assert result.errors == []  # the .dwg is not offered to the DXF adapter
+    reopened = DXFAdapter()
+    reopened.open_drawing(str(tmp_path / "a.dxf"))
+    assert reopened.get_text_entities()[0].text == "OAK DOOR"
+
+
+def _write_large(path: Path, count: int) -> Path:
+    doc = DXFDocument.new()
+    _layer(doc, "WALL")
+    for i in range(count):
+        _entity(doc, "LINE", "WALL", (10, str(i)), (20, "0.0"), (11, str(i + 1)))
+    _entity(doc, "DIMENSION", "WALL", (70, "0"), (42, "1200.0"))
+    doc.write(path)
+    return path
+
+
+def test_reads_stream_without_loading(adapter: DXFAdapter):
+    adapter.get_text_entities()
+    adapter.get_dimensions()
+    adapter.get_polylines()
+    adapter.get_blocks()
+    adapter.get_layers()
+    adapter.get_layouts()
+    adapter.get_xrefs()
+    adapter.get_drawing_extents()
+    adapter.get_block_attributes(adapter.get_blocks()[0].handle)
+    adapter.audit_drawing(fix=False)
+    assert adapter._doc is None
+
+    adapter.set_text(adapter.get_text_entities()[0].handle, "OAK DOOR")
+    assert adapter._doc is not None
+    assert adapter.get_text_entities()[0].text == "OAK DOOR"
+
+
+def test_table_reads_stop_before_entities(plan: Path):
+    # corrupt the ENTITIES section: header/table reads must never reach it
+    content = plan.read_text().replace("TIMBER DOOR", "x\n  not-a-code\ny")
+    plan.write_text(content)
+    adapter = DXFAdapter()
+    adapter.open_drawing(str(plan))
+
+    assert "ROOM" in {ly.name for ly in adapter.get_layers()}
+    with pytest.raises(ValueError):
+        adapter.get_text_entities()
+
+
+def test_streaming_memory_is_independent_of_file_size(tmp_path: Path):
+    import tracemalloc
+
+    peaks = []
+    for count in (2_000, 20_000):
+        adapter = DXFAdapter()
+        adapter.open_drawing(str(_write_large(tmp_path / f"{count}.dxf", count)))
+        tracemalloc.start()
+        dims = adapter.get_dimensions()
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        assert [d.value for d in dims] == [1200.0]
+
+    assert peaks[1] < peaks[0] * 2
@@ -0,0 +1,107 @@
+"""Tests for the process-pool batch executor."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from autocad_batch_commander.acad.factory import get_acad_adapter
+from autocad_batch_commander.models import (
+    DimensionExtractionRequest,
+    DrawingSearchRequest,
+    FileDetail,
+    LayerStandardizeRequest,
+    OperationResult,
+    TextReplaceRequest,
+)
+from autocad_batch_commander.operations.drawing_ops import drawing_search
+from autocad_batch_commander.operations.executor import (
+    merge_results,
+    run_batch,
+    shard_files,
+)
+from autocad_batch_commander.operations.geometry_ops import extract_dimensions
+from autocad_batch_commander.operations.layer_ops import batch_standardize_layers
+from autocad_batch_commander.operations.text_ops import batch_find_replace
+
+
+def _project(tmp_path: Path, count: int = 9) -> Path:
+    for i in range(count):
+        (tmp_path / f"sheet_{i:03d}.dwg").write_bytes(b"fake")
+    return tmp_path
+
+
+def test_shard_files_preserves_order():
+    files = [Path(f"{i}.dwg") for i in range(10)]
+    shards = shard_files(files, 3)
+    assert len(shards) == 3
+    assert [f for shard in shards for f in shard] == files
+
+
+def test_shard_files_more_shards_than_files():
+    files = [Path("a.dwg"), Path("b.dwg")]
+    assert shard_files(files, 8) == [[Path("a.dwg")], [Path("b.dwg")]]
+    assert shard_files([], 4) == []
+
+
+def test_merge_results_sums_and_concatenates():
+    a = OperationResult(
+        files_processed=2,
+        files_modified=1,
+        total_changes=3,
+        details=[FileDetail(file="a.dwg", changes=3), FileDetail(file="b.dwg")],
+    )
+    b = OperationResult(
+        files_processed=1,
+        errors=[FileDetail(file="c.dwg", error="boom")],
+    )
+    merged = merge_results([a, b])
+    assert merged.files_processed == 3
+    assert merged.files_modified == 1
+    assert merged.total_changes == 3
+    assert [d.file for d in merged.details] == ["a.dwg", "b.dwg"]
+    assert merged.errors[0].file == "c.dwg"
+    # inputs are not mutated
+    assert a.files_processed == 2
+
+
+def test_parallel_find_replace_matches_serial(tmp_path: Path):
+    folder = _project(tmp_path)
+    request = TextReplaceRequest(
+        folder=folder, find_text="TIMBER", replace_text="ALUMINIUM", backup=False
+    )
+
+    serial = batch_find_replace(get_acad_adapter(use_mock=True, folder=folder), request)
+    parallel = run_batch(batch_find_replace, request, workers=3, use_mock=True)
+
+    assert parallel.model_dump() == serial.model_dump()
+    assert parallel.files_processed == 9
+
+
+def test_parallel_read_only_operations_match_serial(tmp_path: Path):
+    folder = _project(tmp_path)
+    cases = [
+        (extract_dimensions, DimensionExtractionRequest(folder=folder)),
+        (drawing_search, DrawingSearchRequest(folder=folder, search_text="door")),
+        (
+            batch_standardize_layers,
+            LayerStandardizeRequest(folder=folder, report_only=True),
+        ),
+    ]
+    for func, request in cases:
+        serial = func(get_acad_adapter(use_mock=True, folder=folder), request)
+        parallel = run_batch(func, request, workers=2, use_mock=True)
+        assert parallel.model_dump() == serial.model_dump(), func.__name__
+
+
+def test_run_batch_serial_uses_given_adapter(tmp_path: Path):
+    folder = _project(tmp_path, count=2)
+    adapter = get_acad_adapter(use_mock=True, folder=folder)
+    request = TextReplaceRequest(
+        folder=folder, find_text="TIMBER", replace_text="OAK", backup=False
+    )
+
+    result = run_batch(batch_find_replace, request, adapter=adapter, workers=1)
+
+    assert result.files_modified == 2
+    adapter.open_drawing(str(folder / "sheet_000.dwg"))
+    assert any("OAK" in t.text for t in adapter.get_text_entities())
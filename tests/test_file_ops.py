@@ -2,7 +2,10 @@
 
 from pathlib import Path
 
-from autocad_batch_commander.utils.file_ops import create_backup, get_dwg_files
+from autocad_batch_commander.config import settings
+from autocad_batch_commander.utils.backup import create_backup
+from autocad_batch_commander.utils.discovery import iter_drawings
+from autocad_batch_commander.utils.file_ops import get_dwg_files
 
 
 def test_get_dwg_files(dwg_folder: Path):
@@ -16,10 +19,74 @@ def test_get_dwg_files_non_recursive(dwg_folder: Path):
     assert len(files) == 2  # only top-level
 
 
-def test_create_backup(dwg_folder: Path):
-    target = dwg_folder / "plan_a.dwg"
-    backup = create_backup(target)
+def test_get_dwg_files_skips_backups(dwg_folder: Path):
+    create_backup(dwg_folder / "plan_a.dwg")
+    create_backup(dwg_folder / "sub" / "detail.dwg")
 
-    assert backup.exists()
-    assert backup.parent.name == ".backups"
-    assert "plan_a_" in backup.name
+    assert len(get_dwg_files(dwg_folder)) == 3
+
+
+def test_get_dwg_files_matches_extensions_case_insensitively(dwg_folder: Path):
+    (dwg_folder / "SITE.DWG").write_bytes(b"fake")
+    (dwg_folder / "survey.Dxf").write_bytes(b"fake")
+
+    names = [f.name for f in get_dwg_files(dwg_folder)]
+    dxf_names = [f.name for f in get_dwg_files(dwg_folder, cad_engine="dxf")]
+
+    assert "SITE.DWG" in names
+    assert "survey.Dxf" not in names
+    assert dxf_names == ["survey.Dxf"]
+
+
+def test_dxf_files_are_opt_in_for_cad_applications(dwg_folder: Path, monkeypatch):
+    (dwg_folder / "export.dxf").write_bytes(b"fake")
+    assert "export.dxf" not in [f.name for f in get_dwg_files(dwg_folder)]
+
+    monkeypatch.setattr(settings, "include_dxf", True)
+    files = get_dwg_files(dwg_folder, cad_engine="autocad")
+
+    assert "export.dxf" in [f.name for f in files]
+    assert len(files) == 4
+
+
+def test_get_dwg_files_order_matches_sorted_glob(dwg_folder: Path):
+    for rel in ("sub/a.dwg", "sub.dwg", "z/deep/x.dxf", "b/c.dwg", "A.dwg"):
+        path = dwg_folder / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"fake")
+
+    assert get_dwg_files(dwg_folder) == sorted(dwg_folder.glob("**/*.dwg"))
+
+
+def test_get_dwg_files_sorts_names_per_directory(tmp_path: Path):
+    for rel in ("a.dwg", "a-b/y.dwg", "a/x.dwg", "a/b.dwg"):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"fake")
+
+    files = [f.relative_to(tmp_path).as_posix() for f in get_dwg_files(tmp_path)]
+
+    # Depth-first: a/ ("a") sorts before "a-b" and "a.dwg", unlike "a/..."
+    # as a string, which sorts after both.
+    assert files == ["a/b.dwg", "a/x.dwg", "a-b/y.dwg", "a.dwg"]
+    assert files != sorted(files)
+
+
+def test_get_dwg_files_include_exclude(dwg_folder: Path):
+    (dwg_folder / "archive").mkdir()
+    (dwg_folder / "archive" / "plan_old.dwg").write_bytes(b"fake")
+
+    excluded = get_dwg_files(dwg_folder, exclude=["ARCHIVE", "sub/*"])
+    included = get_dwg_files(dwg_folder, include=["plan_*.dwg"], exclude=["archive"])
+    by_path = get_dwg_files(dwg_folder, include=["sub/*.dwg"])
+
+    assert [f.name for f in excluded] == ["plan_a.dwg", "plan_b.dwg"]
+    assert [f.name for f in included] == ["plan_a.dwg", "plan_b.dwg"]
+    assert [f.name for f in by_path] == ["detail.dwg"]
+
+
+def test_iter_drawings_streams(dwg_folder: Path):
+    drawings = iter_drawings(dwg_folder)
+
+    assert next(drawings) == dwg_folder / "plan_a.dwg"
+    drawings.close()
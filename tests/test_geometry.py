@@ -0,0 +1,127 @@
+"""Tests for the polyline geometry engine."""
+
+from __future__ import annotations
+
+import math
+import random
+from pathlib import Path
+
+import pytest
+
+from autocad_batch_commander.acad.mock_adapter import MockAutoCADAdapter
+from autocad_batch_commander.models import (
+    AreaExtractionRequest,
+    Point3D,
+    PolylineEntity,
+)
+from autocad_batch_commander.operations.geometry_ops import extract_areas
+from autocad_batch_commander.utils import geometry
+from autocad_batch_commander.utils.geometry import measure, measure_polylines
+
+
+def _poly(points, closed=True, bulges=None, area=0.0) -> PolylineEntity:
+    return PolylineEntity(
+        handle="P",
+        vertices=[Point3D(x=x, y=y) for x, y in points],
+        bulges=bulges or [],
+        closed=closed,
+        area=area,
+    )
+
+
+@pytest.fixture(params=["numpy", "python"])
+def engine(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(geometry, "HAVE_NUMPY", False)
+    return request.param
+
+
+def test_rectangle(engine):
+    [rect] = measure_polylines([_poly([(0, 0), (4000, 0), (4000, 3000), (0, 3000)])])
+
+    assert rect.area == pytest.approx(12_000_000)
+    assert rect.perimeter == pytest.approx(14_000)
+    assert rect.centroid == pytest.approx((2000, 1500))
+    assert rect.bbox == pytest.approx((0, 0, 4000, 3000))
+
+
+def test_half_disc_follows_the_bulge(engine):
+    # Straight edge along x, then a counter-clockwise semicircle back (bulge 1).
+    r = 1000.0
+    [disc] = measure_polylines([_poly([(-r, 0), (r, 0)], bulges=[0.0, 1.0])])
+
+    assert disc.area == pytest.approx(math.pi * r * r / 2)
+    assert disc.perimeter == pytest.approx(2 * r + math.pi * r)
+    assert disc.centroid == pytest.approx((0, 4 * r / (3 * math.pi)), abs=1e-6)
+    assert disc.bbox == pytest.approx((-r, 0, r, r))
+
+
+def test_open_empty_and_point_polylines(engine):
+    open_line, empty, point = measure_polylines(
+        [
+            _poly([(0, 0), (10, 0), (10, 10)], closed=False),
+            _poly([]),
+            _poly([(5, 7)]),
+        ]
+    )
+
+    assert open_line.area == 0.0
+    assert open_line.perimeter == pytest.approx(20)
+    assert open_line.centroid == pytest.approx((7.5, 2.5))
+    assert empty.area == empty.perimeter == 0.0
+    assert point.centroid == (5, 7)
+    assert point.bbox == (5, 7, 5, 7)
+
+
+def test_bulges_must_match_vertices():
+    with pytest.raises(ValueError, match="1 bulges for 3 vertices"):
+        _poly([(0, 0), (1, 0), (1, 1)], bulges=[0.5])
+
+
+def test_numpy_matches_python():
+    pytest.importorskip("numpy")
+    rng = random.Random(4)
+    vertices, bulges, closed = [], [], []
+    for _ in range(200):
+        count = rng.randint(0, 8)
+        vertices.append(
+            [(rng.uniform(-1e4, 1e4), rng.uniform(-1e4, 1e4)) for _ in range(count)]
+        )
+        bulges.append(
+            [rng.choice([0.0, 0.0, rng.uniform(-2, 2)]) for _ in range(count)]
+        )
+        closed.append(rng.random() < 0.7)
+
+    vectorised = measure(vertices, bulges, closed)
+    plain = [geometry._measure_one(*args) for args in zip(vertices, bulges, closed)]
+
+    for fast, slow in zip(vectorised, plain):
+        assert fast.area == pytest.approx(slow.area, rel=1e-9, abs=1e-6)
+        assert fast.perimeter == pytest.approx(slow.perimeter, rel=1e-9)
+        assert fast.centroid == pytest.approx(slow.centroid, rel=1e-6, abs=1e-6)
+        assert fast.bbox == pytest.approx(slow.bbox, rel=1e-9, abs=1e-6)
+
+
+def test_extract_areas_measures_polylines_without_area(tmp_path: Path):
+    (tmp_path / "a.dwg").write_bytes(b"fake")
+    adapter = MockAutoCADAdapter()
+    adapter.add_mock_drawing(
+        str(tmp_path / "a.dwg"),
+        polylines=[
+            _poly([(0, 0), (3000, 0), (3000, 3000), (0, 3000)]),
+            _poly([(0, 0), (100, 0), (100, 100)], area=42.0),
+        ],
+    )
+
+    result = extract_areas(
+        adapter, AreaExtractionRequest(folder=tmp_path, min_area=1_000_000)
+    )
+
+    [room] = result.details[0].areas
+    assert room.area == pytest.approx(9_000_000)
+    assert room.perimeter == pytest.approx(12_000)
+    # the adapter's own drawing is not modified
+    adapter.open_drawing(str(tmp_path / "a.dwg"))
+    assert adapter.get_polylines()[0].area == 0.0
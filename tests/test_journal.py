@@ -0,0 +1,210 @@
+"""Tests for checkpointed, resumable batch jobs."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from autocad_batch_commander.acad.factory import get_acad_adapter
+from autocad_batch_commander.acad.mock_adapter import MockAutoCADAdapter
+from autocad_batch_commander.cli.app import app
+from autocad_batch_commander.models import (
+    DrawingInfoRequest,
+    DrawingInfoResult,
+    OperationResult,
+    TextReplaceRequest,
+)
+from autocad_batch_commander.operations.drawing_ops import get_drawing_info
+from autocad_batch_commander.operations.executor import run_batch
+from autocad_batch_commander.operations.journal import JobJournal
+from autocad_batch_commander.operations.text_ops import batch_find_replace
+
+
+class CrashingAdapter(MockAutoCADAdapter):
+    """Mock adapter that counts opens and dies hard on the Nth one."""
+
+    def __init__(self, crash_on: int | None = None) -> None:
+        super().__init__()
+        self.crash_on = crash_on
+        self.opened: list[str] = []
+
+    def open_drawing(self, path: str) -> None:
+        if len(self.opened) + 1 == self.crash_on:
+            raise KeyboardInterrupt
+        self.opened.append(path)
+        super().open_drawing(path)
+
+
+def _project(tmp_path: Path, count: int = 5) -> Path:
+    for i in range(count):
+        (tmp_path / f"sheet_{i}.dwg").write_bytes(b"fake")
+    return tmp_path
+
+
+def _adapter(folder: Path, crash_on: int | None = None) -> CrashingAdapter:
+    adapter = CrashingAdapter(crash_on)
+    sample = get_acad_adapter(use_mock=True, folder=folder)
+    adapter._drawings = sample._drawings  # type: ignore[attr-defined]
+    return adapter
+
+
+def _request(folder: Path) -> TextReplaceRequest:
+    return TextReplaceRequest(
+        folder=folder, find_text="TIMBER", replace_text="OAK", backup=False
+    )
+
+
+def test_resume_continues_after_crash(tmp_path):
+    folder = _project(tmp_path)
+    expected = batch_find_replace(_adapter(folder), _request(folder))
+
+    with pytest.raises(KeyboardInterrupt):
+        run_batch(
+            batch_find_replace,
+            _request(folder),
+            adapter=_adapter(folder, crash_on=4),
+            job_id="job1",
+        )
+    assert len(JobJournal.from_settings().done_files("job1")) == 3
+
+    adapter = _adapter(folder)
+    result = run_batch(
+        batch_find_replace, _request(folder), adapter=adapter, job_id="job1"
+    )
+
+    assert adapter.opened == [str(folder / "sheet_3.dwg"), str(folder / "sheet_4.dwg")]
+    assert result.model_dump() == expected.model_dump()
+    assert JobJournal.from_settings().jobs()[0].status == "complete"
+
+
+def test_checkpointed_run_calls_the_batch_function_once(tmp_path):
+    folder = _project(tmp_path, 3)
+    calls = []
+
+    def counted(adapter, request, *, files=None) -> OperationResult:
+        calls.append(files)
+        return batch_find_replace(adapter, request, files=files)
+
+    result = run_batch(counted, _request(folder), adapter=_adapter(folder), job_id="j")
+    stored = JobJournal.from_settings().results(
+        "j", sorted(folder.glob("*.dwg")), type(result)
+    )
+
+    assert len(calls) == 1
+    assert [r.files_processed for r in stored] == [1, 1, 1]
+    assert sum(r.total_changes for r in stored) == result.total_changes > 0
+
+
+def test_untracked_function_is_journaled_per_drawing(tmp_path):
+    folder = _project(tmp_path, 2)
+    calls = []
+
+    def untracked(adapter, request, *, files=None) -> DrawingInfoResult:
+        files = list(files)
+        calls.append(files)
+        return DrawingInfoResult(files_processed=len(files))
+
+    result = run_batch(
+        untracked, DrawingInfoRequest(folder=folder), use_mock=True, job_id="j"
+    )
+
+    assert [len(files) for files in calls] == [1, 1]
+    assert result.files_processed == 2
+    assert len(JobJournal.from_settings().done_files("j")) == 2
+
+
+def test_resuming_finished_job_opens_nothing(tmp_path):
+    folder = _project(tmp_path, 2)
+    first = run_batch(
+        get_drawing_info, DrawingInfoRequest(folder=folder), use_mock=True, job_id="j"
+    )
+
+    adapter = _adapter(folder)
+    again = run_batch(
+        get_drawing_info, DrawingInfoRequest(folder=folder), adapter=adapter, job_id="j"
+    )
+
+    assert adapter.opened == []
+    assert again == first
+
+
+def test_failed_drawings_are_retried_on_resume(tmp_path):
+    folder = _project(tmp_path, 2)
+    partial = _adapter(folder)
+    del partial._drawings[str(folder / "sheet_1.dwg")]  # type: ignore[attr-defined]
+
+    first = run_batch(
+        get_drawing_info, DrawingInfoRequest(folder=folder), adapter=partial, job_id="j"
+    )
+    adapter = _adapter(folder)
+    second = run_batch(
+        get_drawing_info, DrawingInfoRequest(folder=folder), adapter=adapter, job_id="j"
+    )
+
+    assert len(first.errors) == 1
+    assert adapter.opened == [str(folder / "sheet_1.dwg")]
+    assert second.errors == []
+    assert second.files_processed == 2
+
+
+def test_resume_rejects_different_request(tmp_path):
+    folder = _project(tmp_path, 1)
+    run_batch(batch_find_replace, _request(folder), use_mock=True, job_id="j")
+
+    other = TextReplaceRequest(folder=folder, find_text="DOOR", replace_text="GATE")
+    with pytest.raises(ValueError, match="different parameters"):
+        run_batch(batch_find_replace, other, use_mock=True, job_id="j")
+    with pytest.raises(ValueError, match="was started by"):
+        run_batch(
+            get_drawing_info,
+            DrawingInfoRequest(folder=folder),
+            use_mock=True,
+            job_id="j",
+        )
+
+
+def test_parallel_job_is_journaled_by_workers(tmp_path):
+    folder = _project(tmp_path, 4)
+    serial = batch_find_replace(_adapter(folder), _request(folder))
+
+    parallel = run_batch(
+        batch_find_replace, _request(folder), workers=2, use_mock=True, job_id="par"
+    )
+
+    assert parallel.model_dump() == serial.model_dump()
+    assert len(JobJournal.from_settings().done_files("par")) == 4
+
+
+def test_cli_checkpoints_only_when_asked(tmp_path):
+    folder = _project(tmp_path, 1)
+    runner = CliRunner()
+
+    plain = runner.invoke(app, ["drawing-info", "--folder", str(folder), "--mock"])
+    assert plain.exit_code == 0
+    assert "Job " not in plain.output
+    assert JobJournal.from_settings().jobs() == []
+
+    checkpointed = runner.invoke(
+        app, ["drawing-info", "--folder", str(folder), "--mock", "--checkpoint"]
+    )
+    assert checkpointed.exit_code == 0
+    assert "--resume" in checkpointed.output
+    assert [job.status for job in JobJournal.from_settings().jobs()] == ["complete"]
+
+
+def test_cli_prints_job_and_lists_it(tmp_path):
+    folder = _project(tmp_path, 2)
+    runner = CliRunner()
+
+    result = runner.invoke(
+        app, ["drawing-info", "--folder", str(folder), "--mock", "--resume", "abc123"]
+    )
+    assert result.exit_code == 0
+    assert "Job abc123" in result.output
+
+    result = runner.invoke(app, ["jobs"])
+    assert result.exit_code == 0
+    assert "abc123" in result.output
+    assert "complete" in result.output
@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
+import pytest
+
+from autocad_batch_commander.config import settings
 from autocad_batch_commander.knowledge.loader import (
     find_relevant_files,
     load_files,
     load_index,
     query_knowledge_base,
 )
+from autocad_batch_commander.knowledge.search import (
+    KnowledgeIndex,
+    knowledge_index,
+    tokenize,
+)
 
 
 def test_load_index():
@@ -82,3 +92,52 @@ def test_query_knowledge_base_room_size():
     assert len(result) > 0
     all_content = "\n".join(result.values())
     assert "By-Law 32" in all_content
+
+
+def test_tokenize_stems_and_folds_malay_synonyms():
+    assert tokenize("Escape Routes") == tokenize("escaping route")
+    assert tokenize("bomba") == tokenize("Fire") == tokenize("kebakaran")
+    assert tokenize("the width of a corridor") == tokenize("koridor lebar")[::-1]
+
+
+def test_find_relevant_files_malay_query():
+    """A Malay query finds the same files as its English equivalent."""
+    files = find_relevant_files("tangga kebakaran")
+    assert files == find_relevant_files("fire staircase")
+    assert any("02-fire-escape.md" in str(f) for f in files)
+
+
+def test_index_is_built_once():
+    assert knowledge_index() is knowledge_index()
+
+
+def test_index_ranks_by_bm25(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    qa = tmp_path / "qa"
+    (qa / "fire").mkdir(parents=True)
+    (qa / "fire" / "doors.md").write_text("Fire doors. Fire rating of doors.")
+    (qa / "rooms.md").write_text("Room sizes and a fire exit.")
+    (qa / "_index.md").write_text("| `rooms.md` | ceiling height |\n")
+    monkeypatch.setattr(settings, "knowledge_dir", tmp_path)
+
+    index = knowledge_index()
+
+    assert isinstance(index, KnowledgeIndex) and index.root == qa
+    assert [p.name for _, p in index.search("bomba")] == ["doors.md", "rooms.md"]
+    assert [p.name for _, p in index.search("ceiling")] == ["rooms.md"]
+    assert index.search("hydrant") == []
+    assert [p.name for p in find_relevant_files("hydrant")] == ["doors.md", "rooms.md"]
+
+
+def test_index_picks_up_edits(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    qa = tmp_path / "qa"
+    qa.mkdir()
+    (qa / "doors.md").write_text("Fire doors.")
+    monkeypatch.setattr(settings, "knowledge_dir", tmp_path)
+    first = knowledge_index()
+
+    (qa / "rooms.md").write_text("Ceiling height of rooms.")
+    assert [p.name for _, p in knowledge_index().search("ceiling")] == ["rooms.md"]
+
+    (qa / "doors.md").write_text("Fire doors and hydrants.")
+    assert [p.name for _, p in knowledge_index().search("hydrant")] == ["doors.md"]
+    assert knowledge_index() is not first
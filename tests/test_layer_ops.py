@@ -92,3 +92,19 @@ def test_standardize_report_only(tmp_path: Path):
 
     assert result.total_changes == 4
     assert result.files_modified == 0  # report-only: nothing saved
+
+
+def test_standardize_applies_chained_renames(tmp_path: Path):
+    adapter = _adapter_with_dwg_files(tmp_path)
+    request = LayerStandardizeRequest(
+        folder=tmp_path,
+        custom_mappings={"WALL": "DOOR-OLD", "DOOR": "WALL"},
+        backup=False,
+    )
+    result = batch_standardize_layers(adapter, request)
+
+    assert result.total_changes == 3
+    adapter.open_drawing(str(tmp_path / "floor.dwg"))
+    names = [layer.name for layer in adapter.get_layers()]
+    assert names == ["DOOR-OLD", "WALL", "A-ANNO-TEXT"]
+    assert adapter.get_text_entities()[0].layer == "DOOR-OLD"
@@ -0,0 +1,126 @@
+"""Tests for incremental batch runs driven by the run manifest."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from autocad_batch_commander.acad.mock_adapter import MockAutoCADAdapter
+from autocad_batch_commander.models import (
+    AuditRequest,
+    DimensionExtractionRequest,
+    DrawingInfoRequest,
+)
+from autocad_batch_commander.operations.audit_ops import audit_drawings
+from autocad_batch_commander.operations.drawing_ops import get_drawing_info
+from autocad_batch_commander.operations.executor import run_batch
+from autocad_batch_commander.operations.geometry_ops import extract_dimensions
+from autocad_batch_commander.operations.manifest import RunManifest
+
+
+def _project(tmp_path: Path, count: int = 3) -> list[Path]:
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"sheet_{i}.dwg"
+        path.write_bytes(f"sheet {i}".encode())
+        paths.append(path)
+    return paths
+
+
+def _run(request, func=get_drawing_info, **kwargs):
+    return run_batch(func, request, use_mock=True, incremental=True, **kwargs)
+
+
+def test_second_run_skips_unchanged_files(tmp_path):
+    paths = _project(tmp_path)
+    request = DrawingInfoRequest(folder=tmp_path)
+
+    first = _run(request)
+    second = _run(request)
+
+    assert first.files_processed == 3
+    assert first.skipped_files == []
+    assert second.files_processed == 0
+    assert second.skipped_files == [str(p) for p in paths]
+
+
+def test_changed_and_new_files_are_processed(tmp_path):
+    paths = _project(tmp_path)
+    request = DrawingInfoRequest(folder=tmp_path)
+    _run(request)
+
+    paths[1].write_bytes(b"sheet 1, revision B")
+    (tmp_path / "sheet_9.dwg").write_bytes(b"new sheet")
+    stat = paths[2].stat()
+    os.utime(paths[2], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    result = _run(request)
+
+    assert [d.file for d in result.details] == [
+        str(paths[1]),
+        str(tmp_path / "sheet_9.dwg"),
+    ]
+    assert result.skipped_files == [str(paths[0]), str(paths[2])]
+
+
+def test_failed_files_are_retried(tmp_path):
+    paths = _project(tmp_path, 2)
+    adapter = MockAutoCADAdapter()
+    adapter.add_mock_drawing(str(paths[0]))
+    request = DrawingInfoRequest(folder=tmp_path)
+
+    first = _run(request, adapter=adapter)
+    adapter.add_mock_drawing(str(paths[1]))
+    second = _run(request, adapter=adapter)
+
+    assert [e.file for e in first.errors] == [str(paths[1])]
+    assert [d.file for d in second.details] == [str(paths[1])]
+    assert second.skipped_files == [str(paths[0])]
+
+
+def test_failed_audits_are_retried(tmp_path):
+    paths = _project(tmp_path, 2)
+    adapter = MockAutoCADAdapter()
+    adapter.add_mock_drawing(str(paths[0]))
+    request = AuditRequest(folder=tmp_path)
+
+    _run(request, func=audit_drawings, adapter=adapter)
+    second = _run(request, func=audit_drawings, adapter=adapter)
+
+    assert second.skipped_files == [str(paths[0])]
+
+
+def test_manifest_is_per_operation_and_request(tmp_path):
+    _project(tmp_path)
+    _run(DrawingInfoRequest(folder=tmp_path))
+
+    dims = _run(DimensionExtractionRequest(folder=tmp_path), func=extract_dimensions)
+    linear = _run(
+        DimensionExtractionRequest(folder=tmp_path, dimension_types=["linear"]),
+        func=extract_dimensions,
+    )
+
+    assert dims.skipped_files == []
+    assert linear.skipped_files == []
+    assert linear.files_processed == 3
+
+
+def test_non_incremental_run_ignores_manifest(tmp_path):
+    _project(tmp_path)
+    request = DrawingInfoRequest(folder=tmp_path)
+    _run(request)
+
+    result = run_batch(get_drawing_info, request, use_mock=True)
+
+    assert result.files_processed == 3
+    assert result.skipped_files == []
+
+
+def test_vanished_file_is_left_to_the_run(tmp_path):
+    paths = _project(tmp_path, 2)
+    manifest = RunManifest(tmp_path / "manifest.db")
+    paths[1].unlink()
+
+    todo, skipped = manifest.partition("op", "{}", paths)
+    manifest.close()
+
+    assert (todo, skipped) == (paths, [])
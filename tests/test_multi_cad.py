@@ -61,6 +61,39 @@ def test_mock_adapter_new_layer_ops() -> None:
     adapter.close_drawing()
 
 
+def test_mock_adapter_indexes_follow_mutations() -> None:
+    """Handle and name lookups stay consistent through renames and deletes."""
+    from autocad_batch_commander.models import LayerEntity, TextEntity
+
+    adapter = MockAutoCADAdapter()
+    adapter.add_mock_drawing(
+        "test.dwg",
+        texts=[
+            TextEntity(handle=f"T{i}", text="NOTE", layer="A" if i % 2 else "B")
+            for i in range(6)
+        ],
+        layers=[LayerEntity(name="A"), LayerEntity(name="B")],
+    )
+    adapter.open_drawing("test.dwg")
+
+    assert adapter.rename_layer("A", "B") is False  # target exists
+    assert adapter.rename_layers({"A": "C", "B": "A"}) == ["A", "B"]
+    assert adapter.delete_layer("C") is True
+    assert adapter.create_layer("C") is True
+    assert adapter.rename_layer("C", "D") is True
+    adapter.set_text("T3", "MOVED")
+    assert adapter.attach_xref("X", "x.dwg") is True
+    assert adapter.detach_xref("X") is True
+    assert adapter.reload_xref("X") is False
+
+    assert [ly.name for ly in adapter.get_layers()] == ["A", "D"]
+    texts = adapter.get_text_entities()
+    assert [t.layer for t in texts] == ["A", "D", "A", "D", "A", "D"]
+    assert texts[3].text == "MOVED"
+    assert adapter.get_xrefs() == []
+    adapter.close_drawing()
+
+
 def test_mock_adapter_block_insert() -> None:
     """Test insert_block."""
     from autocad_batch_commander.models import Point3D
@@ -0,0 +1,187 @@
+"""Tests for the single-open multi-operation pipeline."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from autocad_batch_commander.acad.mock_adapter import MockAutoCADAdapter
+from autocad_batch_commander.cli.app import app
+from autocad_batch_commander.models import (
+    BlockAttribute,
+    BlockReference,
+    LayerEntity,
+    PipelineRequest,
+    PipelineStage,
+    TextEntity,
+)
+from autocad_batch_commander.operations.executor import run_batch
+from autocad_batch_commander.operations.pipeline_ops import run_pipeline
+
+
+class CountingAdapter(MockAutoCADAdapter):
+    """Mock adapter that counts lifecycle calls."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.opens = 0
+        self.saves = 0
+
+    def open_drawing(self, path: str) -> None:
+        self.opens += 1
+        super().open_drawing(path)
+
+    def save_drawing(self) -> None:
+        self.saves += 1
+        super().save_drawing()
+
+
+def _adapter(tmp_path: Path) -> CountingAdapter:
+    adapter = CountingAdapter()
+    for name in ("plan.dwg", "detail.dwg"):
+        (tmp_path / name).write_bytes(b"fake")
+        adapter.add_mock_drawing(
+            str(tmp_path / name),
+            texts=[TextEntity(handle="T1", text="TIMBER DOOR", layer="WALL")],
+            layers=[LayerEntity(name="WALL"), LayerEntity(name="TEXT")],
+            blocks=[BlockReference(handle="B1", name="TITLE_BLOCK")],
+            block_attributes={"B1": [BlockAttribute(tag="DATE", value="2024-01-01")]},
+        )
+    return adapter
+
+
+_STAGES = [
+    PipelineStage(
+        operation="rename_layer", params={"old_name": "WALL", "new_name": "A-WALL"}
+    ),
+    PipelineStage(
+        operation="find_replace",
+        params={"find_text": "timber", "replace_text": "ALUMINIUM"},
+    ),
+    PipelineStage(
+        operation="update_title_blocks", params={"updates": {"DATE": "2025-06-01"}}
+    ),
+    PipelineStage(operation="purge", params={"audit": False}),
+]
+
+
+def test_pipeline_opens_each_drawing_once(tmp_path: Path):
+    adapter = _adapter(tmp_path)
+    request = PipelineRequest(folder=tmp_path, stages=_STAGES, backup=False)
+
+    result = run_pipeline(adapter, request)
+
+    assert adapter.opens == 2
+    assert adapter.saves == 2
+    assert result.files_processed == 2
+    assert result.files_modified == 2
+    assert [s.operation for s in result.stages] == [
+        "rename_layer",
+        "find_replace",
+        "update_title_blocks",
+        "purge",
+    ]
+    assert [s.total_changes for s in result.stages] == [2, 2, 2, 6]
+
+
+def test_pipeline_stages_see_earlier_changes(tmp_path: Path):
+    adapter = _adapter(tmp_path)
+    stages = [
+        PipelineStage(
+            operation="rename_layer", params={"old_name": "WALL", "new_name": "A-WALL"}
+        ),
+        PipelineStage(
+            operation="find_replace",
+            params={"find_text": "TIMBER", "replace_text": "OAK", "layers": ["A-WALL"]},
+        ),
+    ]
+    result = run_pipeline(
+        adapter, PipelineRequest(folder=tmp_path, stages=stages, backup=False)
+    )
+
+    assert result.stages[1].total_changes == 2
+    adapter.open_drawing(str(tmp_path / "plan.dwg"))
+    assert adapter.get_text_entities()[0].text == "OAK DOOR"
+
+
+def test_pipeline_report_only_does_not_save(tmp_path: Path):
+    adapter = _adapter(tmp_path)
+    stages = [
+        PipelineStage(
+            operation="standardize_layers",
+            params={"custom_mappings": {"WALL": "A-WALL"}, "report_only": True},
+        )
+    ]
+    result = run_pipeline(
+        adapter, PipelineRequest(folder=tmp_path, stages=stages, backup=False)
+    )
+
+    assert adapter.saves == 0
+    assert result.files_modified == 0
+    assert result.stages[0].total_changes == 2
+    assert result.total_changes == 0  # proposed, not written
+
+
+def test_pipeline_rejects_unknown_operation(tmp_path: Path):
+    request = PipelineRequest(
+        folder=tmp_path, stages=[PipelineStage(operation="explode")], backup=False
+    )
+    with pytest.raises(ValueError, match="Unknown pipeline operation"):
+        run_pipeline(MockAutoCADAdapter(), request)
+
+
+def test_pipeline_parallel_merges_stages(tmp_path: Path):
+    for i in range(6):
+        (tmp_path / f"sheet_{i}.dwg").write_bytes(b"fake")
+    request = PipelineRequest(
+        folder=tmp_path,
+        stages=[
+            PipelineStage(
+                operation="find_replace",
+                params={"find_text": "TIMBER", "replace_text": "OAK"},
+            ),
+            PipelineStage(operation="purge"),
+        ],
+        backup=False,
+    )
+
+    serial = run_batch(run_pipeline, request, workers=1, use_mock=True)
+    parallel = run_batch(run_pipeline, request, workers=2, use_mock=True)
+
+    assert parallel.model_dump() == serial.model_dump()
+    assert len(parallel.stages) == 2
+    assert len(parallel.stages[0].details) == 6
+
+
+def test_pipeline_cli(tmp_path: Path):
+    (tmp_path / "test.dwg").write_bytes(b"fake")
+    plan = tmp_path / "plan.json"
+    plan.write_text(
+        json.dumps(
+            [
+                {
+                    "operation": "rename_layer",
+                    "params": {"old_name": "WALL", "new_name": "A-WALL"},
+                },
+                {"operation": "purge"},
+            ]
+        )
+    )
+    result = CliRunner().invoke(
+        app,
+        [
+            "pipeline",
+            "--folder",
+            str(tmp_path),
+            "--plan",
+            str(plan),
+            "--mock",
+            "--no-backup",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert "Pipeline Complete" in result.output
+    assert "rename_layer" in result.output
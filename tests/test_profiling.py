@@ -0,0 +1,188 @@
+"""Tests for adapter call instrumentation and run profiling."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from autocad_batch_commander.acad.instrumented import InstrumentedAdapter
+from autocad_batch_commander.acad.mock_adapter import MockAutoCADAdapter
+from autocad_batch_commander.acad.synthetic import ProjectSpec, mock_project
+from autocad_batch_commander.cli.app import app
+from autocad_batch_commander.models import (
+    LayerStandardizeRequest,
+    PipelineRequest,
+    PipelineStage,
+    TextEntity,
+    TextReplaceRequest,
+)
+from autocad_batch_commander.operations.executor import merge_results, run_batch
+from autocad_batch_commander.operations.layer_ops import batch_standardize_layers
+from autocad_batch_commander.operations.pipeline_ops import run_pipeline
+from autocad_batch_commander.operations.text_ops import batch_find_replace
+from autocad_batch_commander.utils.metrics import Histogram
+from autocad_batch_commander.utils.profiling import Profiler
+
+runner = CliRunner()
+
+
+def test_instrumented_adapter_records_calls_per_method_and_file():
+    mock = MockAutoCADAdapter()
+    texts = [TextEntity(handle=f"T{i}", text="TIMBER", layer="A") for i in range(3)]
+    mock.add_mock_drawing("a.dwg", texts=texts)
+
+    with Profiler("test") as profiler:
+        adapter = InstrumentedAdapter(mock, profiler)
+        adapter.open_drawing("a.dwg")
+        adapter.get_text_entities()
+        adapter.get_text_entities()
+        adapter.close_drawing()
+        with pytest.raises(FileNotFoundError):
+            adapter.open_drawing("missing.dwg")
+
+    timings = profiler.timings()
+    methods = {m.method: m for m in timings.methods}
+    assert methods["get_text_entities"].calls == 2
+    assert methods["get_text_entities"].items == 6
+    assert methods["get_text_entities"].bytes > 0
+    assert methods["open_drawing"].errors == 1
+    assert sum(methods["open_drawing"].histogram) == 2
+    assert profiler.calls() == {
+        "open_drawing": 2,
+        "get_text_entities": 2,
+        "close_drawing": 1,
+    }
+    assert [(f.file, f.calls) for f in timings.files] == [
+        ("a.dwg", 4),
+        ("missing.dwg", 1),
+    ]
+    assert timings.adapter_seconds <= timings.wall_seconds
+
+
+def test_run_batch_profile_fills_timings(tmp_path: Path):
+    adapter = mock_project(ProjectSpec(drawings=3, entities=100), tmp_path)
+    request = TextReplaceRequest(
+        folder=tmp_path, find_text="TIMBER", replace_text="OAK", backup=False
+    )
+
+    plain = run_batch(batch_find_replace, request, adapter=adapter)
+    profiled = run_batch(batch_find_replace, request, adapter=adapter, profile=True)
+
+    assert plain.timings is None
+    timings = profiled.timings
+    assert timings is not None
+    assert timings.operation == "batch_find_replace"
+    assert {"open_drawing", "get_text_entities"} <= {m.method for m in timings.methods}
+    assert len(timings.files) == 3
+    assert "timings" in profiled.model_dump()
+
+
+def test_backup_wait_is_a_section(tmp_path: Path):
+    adapter = mock_project(ProjectSpec(drawings=2, entities=80), tmp_path)
+    request = LayerStandardizeRequest(folder=tmp_path, standard="AIA")
+
+    result = run_batch(batch_standardize_layers, request, adapter=adapter, profile=True)
+
+    assert result.files_modified
+    assert result.timings.sections["backup_wait"] > 0
+
+
+def test_pipeline_calls_are_attributed_to_stages(tmp_path: Path):
+    adapter = mock_project(ProjectSpec(drawings=2, entities=80), tmp_path)
+    request = PipelineRequest(
+        folder=tmp_path,
+        stages=[
+            PipelineStage(
+                operation="find_replace",
+                params={"find_text": "TIMBER", "replace_text": "OAK"},
+            ),
+            PipelineStage(operation="standardize_layers"),
+        ],
+        backup=False,
+    )
+
+    result = run_batch(run_pipeline, request, adapter=adapter, profile=True)
+
+    by_stage = {(m.operation, m.method) for m in result.timings.methods}
+    assert ("find_replace", "get_text_entities") in by_stage
+    assert ("standardize_layers", "get_layers") in by_stage
+    assert ("run_pipeline", "open_drawing") in by_stage
+
+
+def test_checkpointed_and_merged_timings_add_up(tmp_path: Path):
+    adapter = mock_project(ProjectSpec(drawings=3, entities=60), tmp_path)
+    request = TextReplaceRequest(
+        folder=tmp_path, find_text="TIMBER", replace_text="OAK", backup=False
+    )
+
+    result = run_batch(
+        batch_find_replace, request, adapter=adapter, profile=True, job_id="prof"
+    )
+
+    opens = next(m for m in result.timings.methods if m.method == "open_drawing")
+    assert opens.calls == 3
+    assert sum(opens.histogram) == 3
+    assert len(result.timings.files) == 3
+
+    doubled = merge_results([result, result])
+    opens = next(m for m in doubled.timings.methods if m.method == "open_drawing")
+    assert opens.calls == 6
+    assert len(doubled.timings.methods) == len(result.timings.methods)
+
+
+def test_histogram_renders_prometheus_buckets():
+    histogram = Histogram("test_seconds", "Test.", ("method",))
+    histogram.observe(0.0004, "get")
+    histogram.observe(0.2, "get")
+    histogram.observe(60.0, "get")
+
+    lines = histogram.samples()
+
+    assert 'test_seconds_bucket{method="get",le="0.0005"} 1' in lines
+    assert 'test_seconds_bucket{method="get",le="0.25"} 2' in lines
+    assert 'test_seconds_bucket{method="get",le="+Inf"} 3' in lines
+    assert 'test_seconds_count{method="get"} 3' in lines
+
+
+def test_web_metrics_endpoint(tmp_path: Path):
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    from autocad_batch_commander.web.api import app as web_app
+
+    adapter = mock_project(ProjectSpec(drawings=1, entities=50), tmp_path)
+    run_batch(
+        batch_find_replace,
+        TextReplaceRequest(folder=tmp_path, find_text="A", replace_text="B"),
+        adapter=adapter,
+        profile=True,
+    )
+    client = TestClient(web_app)
+    client.get("/api/health")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert "# TYPE acad_http_request_seconds histogram" in body
+    assert (
+        'acad_adapter_call_seconds_count{operation="batch_find_replace",'
+        'method="open_drawing"}' in body
+    )
+    assert 'route="/api/health",status="200"' in body
+
+
+def test_cli_profile_prints_breakdown(tmp_path: Path):
+    (tmp_path / "plan.dwg").write_bytes(b"fake")
+
+    result = runner.invoke(
+        app,
+        ["audit", "--folder", str(tmp_path), "--mock", "--profile"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Profile" in result.output
+    assert "open_drawing" in result.output
@@ -0,0 +1,172 @@
+"""Tests for room recognition."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from autocad_batch_commander.acad.mock_adapter import MockAutoCADAdapter
+from autocad_batch_commander.models import (
+    ComplianceMeasurementRequest,
+    PipelineRequest,
+    PipelineStage,
+    Point3D,
+    PolylineEntity,
+    RoomExtractionRequest,
+    TextEntity,
+)
+from autocad_batch_commander.operations.geometry_ops import measure_compliance
+from autocad_batch_commander.operations.pipeline_ops import run_pipeline
+from autocad_batch_commander.operations.room_ops import (
+    RoomVocabulary,
+    extract_rooms,
+    match_rooms,
+)
+
+
+def _rect(handle: str, x: float, y: float, w: float, d: float, layer="A-AREA"):
+    corners = [(x, y), (x + w, y), (x + w, y + d), (x, y + d)]
+    return PolylineEntity(
+        handle=handle,
+        vertices=[Point3D(x=cx, y=cy) for cx, cy in corners],
+        closed=True,
+        layer=layer,
+    )
+
+
+def _label(handle: str, text: str, x: float, y: float) -> TextEntity:
+    return TextEntity(
+        handle=handle, text=text, layer="A-ANNO", position=Point3D(x=x, y=y)
+    )
+
+
+@pytest.mark.parametrize(
+    "text, room_type",
+    [
+        ("MASTER BEDROOM", "master_bedroom"),
+        ("Bedroom 2", "bedroom"),
+        ("BILIK AIR", "bathroom"),
+        ("BILIK TIDUR UTAMA", "master_bedroom"),
+        (r"\A1;DAPUR\PBASAH", "kitchen"),
+        ("DRY KITCHEN / PANTRY", "kitchen"),
+        ("LIVING & DINING", "living_room"),
+        ("A-101", None),
+        ("BEDSIDE", None),
+    ],
+)
+def test_vocabulary_classifies_longest_phrase(text, room_type):
+    assert RoomVocabulary.load().classify(text) == room_type
+
+
+def test_vocabulary_extra_labels():
+    vocabulary = RoomVocabulary.load({"kitchen": ["KIT"], "gym": ["GYM"]})
+
+    assert vocabulary.classify("KIT 1") == "kitchen"
+    assert vocabulary.classify("HOME GYM") == "gym"
+    assert vocabulary.parameters["gym"] == "gym_area"
+
+
+def test_match_rooms_prefers_innermost_outline():
+    polylines = [
+        _rect("UNIT", 0, 0, 10000, 8000),
+        _rect("KIT", 0, 0, 3000, 2000),
+        _rect("BED", 5000, 0, 4000, 3500),
+        _rect("EMPTY", 0, 5000, 2000, 2000),
+    ]
+    texts = [
+        _label("T1", "KITCHEN", 1500, 1000),
+        _label("T2", "BEDROOM 1", 7000, 1500),
+        _label("T3", "BED", 7500, 2000),  # second label in the same room
+        _label("T4", "STORE", 20000, 0),  # outside every outline
+        _label("T5", "NOTE: SEE DETAIL", 500, 500),
+        TextEntity(handle="T6", text="TOILET", layer="A-ANNO"),  # no insertion point
+    ]
+
+    rooms, unplaced = match_rooms(polylines, texts, RoomVocabulary.load())
+
+    assert [(r.handle, r.room_type, r.label_handle) for r in rooms] == [
+        ("KIT", "kitchen", "T1"),
+        ("BED", "bedroom", "T2"),
+    ]
+    assert unplaced == 1
+    bedroom = rooms[1]
+    assert bedroom.area == pytest.approx(14_000_000)
+    assert (bedroom.width, bedroom.length) == (3500, 4000)
+    assert bedroom.parameter == "bedroom_area"
+
+
+def test_match_rooms_scales_to_large_sheets():
+    polylines, texts = [], []
+    for i in range(60):
+        for j in range(60):
+            handle = f"R{i}-{j}"
+            polylines.append(_rect(handle, i * 4000, j * 4000, 3000, 3000))
+            texts.append(
+                _label(f"L{handle}", "BILIK", i * 4000 + 1500, j * 4000 + 1500)
+            )
+
+    rooms, unplaced = match_rooms(polylines, texts, RoomVocabulary.load())
+
+    assert len(rooms) == 3600 and unplaced == 0
+    assert all(r.handle == r.label_handle[1:] for r in rooms)
+
+
+def _unit_drawing(tmp_path: Path) -> MockAutoCADAdapter:
+    (tmp_path / "unit.dwg").write_bytes(b"fake")
+    adapter = MockAutoCADAdapter()
+    adapter.add_mock_drawing(
+        str(tmp_path / "unit.dwg"),
+        polylines=[
+            _rect("P1", 0, 0, 3000, 3000),  # 9 m², a bedroom by its label
+            _rect("P2", 4000, 0, 2000, 2000, layer="A-ROOM-KIT"),
+        ],
+        texts=[_label("T1", "BEDROOM", 1500, 1500)],
+    )
+    return adapter
+
+
+def test_extract_rooms(tmp_path: Path):
+    adapter = _unit_drawing(tmp_path)
+
+    result = extract_rooms(adapter, RoomExtractionRequest(folder=tmp_path))
+
+    assert not result.errors
+    assert result.total_rooms == 1
+    assert result.rooms[0].file.endswith("unit.dwg")
+    assert result.rooms[0].room_type == "bedroom"
+
+
+def test_measure_compliance_checks_recognised_rooms(tmp_path: Path):
+    adapter = _unit_drawing(tmp_path)
+    request = ComplianceMeasurementRequest(
+        folder=tmp_path, rule_sets=["ubbl-spatial"], building_type="residential"
+    )
+
+    found = {f.handle: f for f in measure_compliance(adapter, request).findings}
+
+    assert found["P1"].parameter == "bedroom_area"
+    assert found["P2"].parameter == "kitchen_area"  # falls back to its layer
+
+    request.recognize_rooms = False
+    found = {f.handle: f for f in measure_compliance(adapter, request).findings}
+
+    assert "P1" not in found
+
+
+def test_pipeline_stage_reports_rooms(tmp_path: Path):
+    adapter = _unit_drawing(tmp_path)
+    request = PipelineRequest(
+        folder=tmp_path,
+        stages=[PipelineStage(operation="recognize_rooms")],
+        backup=False,
+    )
+
+    result = run_pipeline(adapter, request)
+
+    stage = result.stages[0]
+    assert result.files_modified == 0
+    assert stage.total_changes == 1
+    assert [(r.handle, r.file.endswith("unit.dwg")) for r in stage.rooms] == [
+        ("P1", True)
+    ]
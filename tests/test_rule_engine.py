@@ -0,0 +1,192 @@
+"""Tests for the compiled compliance rule engine."""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+from autocad_batch_commander.acad.mock_adapter import MockAutoCADAdapter
+from autocad_batch_commander.models import (
+    ComplianceMeasurementRequest,
+    ComplianceRule,
+    DimensionEntity,
+    Point3D,
+    PolylineEntity,
+)
+from autocad_batch_commander.operations import rule_engine
+from autocad_batch_commander.operations.geometry_ops import measure_compliance
+from autocad_batch_commander.operations.rule_engine import (
+    LayerMatcher,
+    RuleEngine,
+    load_dimension_mapping,
+)
+
+
+def _rule(rule_id: str, check_type: str, parameter: str, threshold: float):
+    return ComplianceRule(
+        id=rule_id,
+        description=rule_id,
+        by_law="-",
+        category="test",
+        check_type=check_type,
+        parameter=parameter,
+        threshold=threshold,
+        unit="mm",
+    )
+
+
+def _substring_match(layer: str, mappings: list[dict]) -> str | None:
+    upper = layer.upper()
+    for m in mappings:
+        if any(p.upper() in upper for p in m["layer_patterns"]):
+            return m["rule_parameter"]
+    return None
+
+
+def test_matcher_agrees_with_substring_scan():
+    mappings = load_dimension_mapping()
+    words = [p for m in mappings for p in m["layer_patterns"]] + ["X", "-", "a-"]
+    rng = random.Random(7)
+    layers = ["".join(rng.choices(words, k=rng.randint(1, 3))) for _ in range(500)]
+    layers += ["", "0", "DEFPOINTS", "a-door-frame", "stairwell", "A-CORRIDOR"]
+
+    matcher = LayerMatcher(mappings)
+
+    for layer in layers:
+        assert matcher.match(layer) == _substring_match(layer, mappings), layer
+
+
+def test_matcher_prefers_earlier_mapping_for_overlapping_patterns():
+    matcher = LayerMatcher(
+        [
+            {"layer_patterns": ["BEDROOM"], "rule_parameter": "bedroom"},
+            {"layer_patterns": ["ROOM", "DROO"], "rule_parameter": "room"},
+        ]
+    )
+
+    assert matcher.match("A-BEDROOM-2") == "bedroom"
+    assert matcher.match("A-ROOM") == "room"
+    assert matcher.match("SIDROOM") == "room"
+    assert matcher.match("WALL") is None
+
+
+@pytest.mark.parametrize("vectorised", [True, False])
+def test_evaluate_batches_checks_in_order(monkeypatch, vectorised):
+    if vectorised:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(rule_engine, "np", None)
+    engine = RuleEngine(
+        [
+            _rule("MIN", "min_dimension", "door_width", 850),
+            _rule("MAX", "max_dimension", "door_width", 1000),
+            _rule("DUR", "min_duration", "door_width", 60),
+            _rule("OTHER", "min_dimension", "stair_width", 1000),
+        ],
+        [],
+    )
+
+    checks = engine.evaluate(["door_width", None, "door_width"], [800, 5, 1200])
+
+    assert [(c.measurement, c.rule.id, c.passed) for c in checks] == [
+        (0, "MIN", False),
+        (0, "MAX", True),
+        (0, "DUR", True),
+        (2, "MIN", True),
+        (2, "MAX", False),
+        (2, "DUR", True),
+    ]
+    assert engine.evaluate([None, "unknown"], [1, 2]) == []
+
+
+def test_measure_compliance_uses_compiled_rules(tmp_path: Path):
+    (tmp_path / "plan.dwg").write_bytes(b"fake")
+    adapter = MockAutoCADAdapter()
+    adapter.add_mock_drawing(
+        str(tmp_path / "plan.dwg"),
+        dimensions=[
+            DimensionEntity(handle="D1", value=1200.0, layer="A-RAMP"),
+            DimensionEntity(handle="D2", value=1800.0, layer="a-ramp-landing"),
+            DimensionEntity(handle="D3", value=50.0, layer="WALL"),
+        ],
+    )
+    request = ComplianceMeasurementRequest(
+        folder=tmp_path, rule_sets=["accessibility", "missing-set"]
+    )
+
+    result = measure_compliance(adapter, request)
+
+    assert not result.errors
+    ramp = [f for f in result.findings if f.rule_id == "MS1184-RAMP-2"]
+    assert [(f.measured_value, f.status) for f in ramp] == [
+        (1200.0, "fail"),
+        (1800.0, "pass"),
+    ]
+    assert result.total_checks == result.pass_count + result.fail_count
+    assert result.fail_count >= 1
+
+
+def _rect(handle: str, layer: str, width: float, depth: float, closed=True):
+    corners = [(0, 0), (width, 0), (width, depth), (0, depth)]
+    return PolylineEntity(
+        handle=handle,
+        vertices=[Point3D(x=x, y=y) for x, y in corners],
+        closed=closed,
+        layer=layer,
+    )
+
+
+def test_measure_compliance_checks_areas_with_dimensions(tmp_path: Path):
+    (tmp_path / "unit.dwg").write_bytes(b"fake")
+    adapter = MockAutoCADAdapter()
+    adapter.add_mock_drawing(
+        str(tmp_path / "unit.dwg"),
+        dimensions=[
+            DimensionEntity(handle="D1", value=1000.0, layer="A-CORR"),
+            DimensionEntity(handle="D2", value=5000.0, layer="LIVING"),
+        ],
+        polylines=[
+            _rect("P1", "A-ROOM-KIT", 2000, 2000),
+            _rect("P2", "LIVING", 4000, 3000),
+            _rect("P3", "KITCHEN", 9000, 9000, closed=False),
+        ],
+    )
+    request = ComplianceMeasurementRequest(
+        folder=tmp_path, rule_sets=["ubbl-spatial"], building_type="residential"
+    )
+
+    result = measure_compliance(adapter, request)
+
+    found = {(f.handle, f.rule_id): f for f in result.findings}
+    assert set(found) == {
+        ("D1", "UBBL-34-1"),
+        ("P1", "UBBL-42-1e"),
+        ("P2", "UBBL-42-1a"),
+    }
+    corridor = found["D1", "UBBL-34-1"]
+    assert (corridor.measured_value, corridor.status) == (1.0, "fail")
+    kitchen = found["P1", "UBBL-42-1e"]
+    assert kitchen.measured_value == pytest.approx(4.0)
+    assert kitchen.unit == "sq_metres" and kitchen.status == "fail"
+    assert found["P2", "UBBL-42-1a"].status == "pass"
+    assert (result.pass_count, result.fail_count) == (1, 2)
+
+
+def test_drawing_units_scale_measurements():
+    engine = RuleEngine(
+        [
+            _rule("LEN", "min_dimension", "corridor_width", 1200),
+            _rule("AREA", "min_dimension", "kitchen_area", 4.5).model_copy(
+                update={"unit": "sq_metres"}
+            ),
+        ],
+        [],
+    )
+
+    checks = engine.evaluate(["corridor_width", "kitchen_area"], [1.5, 5.0], "m")
+
+    assert [(c.value, c.passed) for c in checks] == [(1500.0, True), (5.0, True)]
+    with pytest.raises(ValueError, match="Unknown drawing unit"):
+        engine.evaluate(["corridor_width"], [1.0], "ft")
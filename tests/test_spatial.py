@@ -0,0 +1,174 @@
+"""Tests for the per-drawing spatial index."""
+
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from autocad_batch_commander.acad.mock_adapter import MockAutoCADAdapter
+from autocad_batch_commander.acad.synthetic import ProjectSpec, generate_drawing
+from autocad_batch_commander.models import (
+    BlockReference,
+    DimensionEntity,
+    Point3D,
+    PolylineEntity,
+    TextEntity,
+)
+from autocad_batch_commander.utils.spatial import SpatialIndex, point_in_ring
+
+
+def _room(handle: str, x: float, y: float, w: float, d: float) -> PolylineEntity:
+    corners = [(x, y), (x + w, y), (x + w, y + d), (x, y + d)]
+    return PolylineEntity(
+        handle=handle,
+        vertices=[Point3D(x=cx, y=cy) for cx, cy in corners],
+        closed=True,
+        layer="ROOM",
+    )
+
+
+def _label(handle: str, text: str, x: float, y: float) -> TextEntity:
+    return TextEntity(
+        handle=handle, text=text, layer="ROOM", position=Point3D(x=x, y=y)
+    )
+
+
+@pytest.fixture
+def plan() -> SpatialIndex:
+    return SpatialIndex.from_entities(
+        polylines=[
+            _room("R1", 0, 0, 4000, 3000),
+            _room("R2", 4000, 0, 2000, 3000),
+            PolylineEntity(
+                handle="W1",
+                vertices=[Point3D(x=0, y=-200), Point3D(x=6000, y=-200)],
+                layer="WALL",
+            ),
+        ],
+        texts=[
+            _label("T1", "BEDROOM", 2000, 1500),
+            _label("T2", "KITCHEN", 5000, 1500),
+            TextEntity(handle="T3", text="NO POSITION", layer="TEXT"),
+        ],
+        dimensions=[
+            DimensionEntity(
+                handle="D1",
+                value=900,
+                associated_points=[Point3D(x=3000, y=0), Point3D(x=3900, y=0)],
+            )
+        ],
+        blocks=[
+            BlockReference(
+                handle="B1", name="DOOR", insertion_point=Point3D(x=3000, y=0)
+            )
+        ],
+    )
+
+
+def test_items_are_indexed_by_kind(plan):
+    assert len(plan) == 7  # text without a position is left out
+    assert {i.handle for i in plan.intersecting((-1e9, -1e9, 1e9, 1e9), "text")} == {
+        "T1",
+        "T2",
+    }
+
+
+def test_containment_queries(plan):
+    assert [i.handle for i in plan.containing(2000, 1500)] == ["R1"]
+    assert plan.containing(7000, 1500) == []
+
+    kitchen = next(i for i in plan if i.handle == "R2")
+    assert [i.handle for i in plan.inside(kitchen, "text")] == ["T2"]
+
+
+def test_bbox_intersection_finds_door_on_wall_line(plan):
+    found = {i.handle for i in plan.intersecting((2900, -10, 3100, 10))}
+    assert found == {"R1", "D1", "B1"}
+
+
+def test_nearest_measures_to_outlines(plan):
+    [(distance, item)] = plan.nearest(3000, -500, kind="polyline")
+    assert item.handle == "W1"
+    assert distance == pytest.approx(300)
+
+    ranked = plan.nearest(5000, 1600, k=2, kind="text")
+    assert [i.handle for _, i in ranked] == ["T2", "T1"]
+    assert plan.nearest(5000, 1600, kind="block", max_distance=100) == []
+
+
+def test_bulged_outline_contains_arc_area():
+    # Room whose top edge is a semicircle over the rectangle.
+    room = PolylineEntity(
+        handle="R",
+        vertices=[
+            Point3D(x=0, y=0),
+            Point3D(x=2000, y=0),
+            Point3D(x=2000, y=1000),
+            Point3D(x=0, y=1000),
+        ],
+        bulges=[0.0, 0.0, 1.0, 0.0],
+        closed=True,
+    )
+    index = SpatialIndex.from_entities(polylines=[room])
+
+    assert index.containing(1000, 1900)
+    assert not index.containing(1000, 2100)
+
+
+def test_matches_brute_force_on_generated_drawing():
+    drawing = generate_drawing(ProjectSpec(entities=3000, seed=3), 0)
+    index = SpatialIndex.from_entities(
+        polylines=drawing.polylines,
+        dimensions=drawing.dimensions,
+        blocks=drawing.blocks,
+        texts=drawing.texts,
+        node_size=8,
+    )
+    items = list(index)
+    rng = random.Random(1)
+    for _ in range(25):
+        x, y = rng.uniform(0, 60000), rng.uniform(0, 60000)
+        box = (x, y, x + 5000, y + 5000)
+        expected = {
+            i.handle
+            for i in items
+            if i.bbox[0] <= box[2]
+            and box[0] <= i.bbox[2]
+            and i.bbox[1] <= box[3]
+            and box[1] <= i.bbox[3]
+        }
+        assert {i.handle for i in index.intersecting(box)} == expected
+
+        rooms = {
+            i.handle
+            for i in items
+            if i.kind == "polyline"
+            and i.entity.closed
+            and point_in_ring(x, y, index.outline(i))
+        }
+        assert {i.handle for i in index.containing(x, y)} == rooms
+
+        texts = sorted(
+            math.hypot(i.point[0] - x, i.point[1] - y)
+            for i in items
+            if i.kind == "text"
+        )
+        found = [d for d, _ in index.nearest(x, y, k=3, kind="text")]
+        assert found == pytest.approx(texts[:3])
+
+
+def test_for_drawing_reads_the_open_drawing():
+    adapter = MockAutoCADAdapter()
+    adapter.add_mock_drawing(
+        "a.dwg",
+        polylines=[_room("R1", 0, 0, 1000, 1000)],
+        texts=[_label("T1", "STORE", 500, 500)],
+    )
+    adapter.open_drawing("a.dwg")
+
+    index = SpatialIndex.for_drawing(adapter)
+
+    [room] = index.containing(500, 500)
+    assert [i.handle for i in index.inside(room)] == ["T1"]
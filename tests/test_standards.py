@@ -0,0 +1,161 @@
+"""Tests for the standards registry."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from autocad_batch_commander.config import settings
+from autocad_batch_commander.operations.rule_engine import RuleEngine
+from autocad_batch_commander.standards import StandardsRegistry
+
+
+def _rule(rule_id: str, **fields) -> dict:
+    return {
+        "id": rule_id,
+        "description": rule_id,
+        "by_law": "-",
+        "category": fields.pop("category", "corridor"),
+        "check_type": "min_dimension",
+        "parameter": fields.pop("parameter", "corridor_width"),
+        "threshold": fields.pop("threshold", 1200),
+        "unit": "mm",
+        **fields,
+    }
+
+
+def _write(path: Path, data: dict) -> None:
+    """Write *data*, making sure the mtime moves even on coarse clocks."""
+    existed = path.exists()
+    before = path.stat().st_mtime_ns if existed else 0
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+    if existed:
+        os.utime(path, ns=(before + 1_000_000, before + 1_000_000))
+
+
+def _rule_set(*rules: dict) -> dict:
+    return {
+        "source_document": "Test",
+        "source_short": "T",
+        "category": "test",
+        "rules": list(rules),
+    }
+
+
+@pytest.fixture
+def standards(tmp_path: Path) -> Path:
+    _write(tmp_path / "aia.json", {"mappings": {"WALL": "A-WALL"}})
+    _write(
+        tmp_path / "dimension_mapping.json",
+        {
+            "mappings": [
+                {"layer_patterns": ["CORR"], "rule_parameter": "corridor_width"}
+            ]
+        },
+    )
+    _write(
+        tmp_path / "rules" / "spatial.json",
+        _rule_set(
+            _rule("S-1", building_type=["residential"]),
+            _rule("S-2", category="room", parameter="kitchen_area", threshold=4.5),
+        ),
+    )
+    _write(
+        tmp_path / "rules" / "fire.json",
+        _rule_set(_rule("F-1", category="corridor", building_type=["commercial"])),
+    )
+    return tmp_path
+
+
+def test_files_are_parsed_once_and_reloaded_when_changed(standards: Path):
+    reg = StandardsRegistry(standards)
+
+    first = reg.rule_set("spatial")
+    assert reg.rule_set("spatial") is first
+    assert reg.layer_standard("AIA") is reg.layer_standard("aia")
+
+    _write(standards / "rules" / "spatial.json", _rule_set(_rule("S-9")))
+
+    reloaded = reg.rule_set("spatial")
+    assert reloaded is not first
+    assert [r.id for r in reloaded.rules] == ["S-9"]
+
+
+def test_listing_follows_directory_changes(standards: Path):
+    reg = StandardsRegistry(standards)
+    assert reg.rule_set_names() == ["fire", "spatial"]
+
+    _write(standards / "rules" / "access.json", _rule_set(_rule("A-1")))
+    stamp = (standards / "rules").stat().st_mtime_ns
+    os.utime(standards / "rules", ns=(stamp + 1_000_000, stamp + 1_000_000))
+
+    assert reg.rule_set_names() == ["access", "fire", "spatial"]
+
+
+def test_missing_files(standards: Path, tmp_path: Path):
+    reg = StandardsRegistry(standards)
+
+    with pytest.raises(FileNotFoundError, match="Rule set not found"):
+        reg.rule_set("nope")
+    with pytest.raises(FileNotFoundError, match="Standard file not found"):
+        reg.layer_standard("nope")
+    empty = StandardsRegistry(tmp_path / "absent")
+    assert empty.rule_set_names() == []
+    assert empty.dimension_mapping() == []
+
+
+def test_rule_indexes(standards: Path):
+    reg = StandardsRegistry(standards)
+
+    assert reg.rule("F-1").category == "corridor"
+    assert reg.index().rule_set_of["S-2"] == "spatial"
+    assert {r.id for r in reg.rules(category="corridor")} == {"S-1", "F-1"}
+    assert {r.id for r in reg.rules(building_type="residential")} == {"S-1", "S-2"}
+    assert [r.id for r in reg.rules(category="corridor", building_type="office")] == []
+    assert [r.id for r in reg.rules(parameter="kitchen_area")] == ["S-2"]
+    assert reg.index() is reg.index()
+
+    _write(standards / "rules" / "fire.json", _rule_set(_rule("F-2")))
+
+    assert reg.rule("F-1") is None
+    assert reg.rule("F-2") is not None
+
+
+def test_compiled_engine_is_reused_until_files_change(
+    standards: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(settings, "standards_dir", standards)
+    engine = RuleEngine.compile(["spatial"], "residential")
+    assert RuleEngine.compile(["spatial"], "residential") is engine
+    assert engine.parameter("A-CORR-1") == "corridor_width"
+
+    _write(
+        standards / "dimension_mapping.json",
+        {
+            "mappings": [
+                {"layer_patterns": ["HALL"], "rule_parameter": "corridor_width"}
+            ]
+        },
+    )
+
+    recompiled = RuleEngine.compile(["spatial"], "residential")
+    assert recompiled is not engine
+    assert recompiled.parameter("A-CORR-1") is None
+
+
+def test_rules_by_rule_set_keep_file_order(standards: Path):
+    reg = StandardsRegistry(standards)
+
+    assert [r.id for r in reg.rules(rule_set="spatial")] == ["S-1", "S-2"]
+    assert [r.id for r in reg.rules(building_type="residential")] == ["S-1", "S-2"]
+    assert [r.id for r in reg.rules(category=["room", "corridor"])] == [
+        "F-1",
+        "S-1",
+        "S-2",
+    ]
+    assert reg.rules(rule_set="spatial", category=[]) == []
+    assert reg.rules(building_type="") == reg.rules()
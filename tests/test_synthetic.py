@@ -0,0 +1,122 @@
+"""Tests for the seeded synthetic project generator."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from autocad_batch_commander.acad.dxf_adapter import DXFAdapter
+from autocad_batch_commander.acad.factory import get_acad_adapter
+from autocad_batch_commander.acad.synthetic import (
+    TITLE_BLOCK,
+    ProjectSpec,
+    generate_drawing,
+    layer_vocabulary,
+    mock_project,
+    write_dxf_project,
+)
+from autocad_batch_commander.config import settings
+from autocad_batch_commander.models import LayerStandardizeRequest
+from autocad_batch_commander.operations.executor import run_batch
+from autocad_batch_commander.operations.layer_ops import batch_standardize_layers
+
+
+def _dump(drawing) -> dict:
+    return {
+        "texts": [t.model_dump() for t in drawing.texts],
+        "dimensions": [d.model_dump() for d in drawing.dimensions],
+        "polylines": [p.model_dump() for p in drawing.polylines],
+        "blocks": [b.model_dump() for b in drawing.blocks],
+        "layers": [ly.model_dump() for ly in drawing.layers],
+    }
+
+
+def test_drawings_are_reproducible_and_independent_of_project_size():
+    small = ProjectSpec(drawings=2, entities=300, seed=7)
+    large = ProjectSpec(drawings=50, entities=300, seed=7)
+
+    assert _dump(generate_drawing(small, 1)) == _dump(generate_drawing(large, 1))
+    assert _dump(generate_drawing(small, 0)) != _dump(generate_drawing(small, 1))
+    other_seed = ProjectSpec(drawings=2, entities=300, seed=8)
+    assert _dump(generate_drawing(small, 0)) != _dump(generate_drawing(other_seed, 0))
+
+
+def test_size_mix_and_distributions():
+    drawing = generate_drawing(ProjectSpec(entities=2000, seed=1), 0)
+
+    counts = [
+        len(drawing.texts),
+        len(drawing.dimensions),
+        len(drawing.polylines),
+        len(drawing.blocks) - 1,
+    ]
+    assert sum(counts) == 2000
+    assert 700 < counts[0] < 900  # 40 % texts
+    titles = [b for b in drawing.blocks if b.name == TITLE_BLOCK]
+    assert len(titles) == 1
+    tags = [a.tag for a in drawing.block_attributes[titles[0].handle]]
+    assert tags == ["DWG_NO", "TITLE", "DATE", "REV", "DRAWN_BY", "SCALE"]
+
+    door_widths = {d.value for d in drawing.dimensions if "DOOR" in d.layer.upper()}
+    assert door_widths <= {750.0, 800.0, 850.0, 900.0, 1000.0}
+    rooms = [p for p in drawing.polylines if p.closed]
+    assert rooms and all(p.area > 0 for p in rooms)
+    handles = [t.handle for t in drawing.texts] + [b.handle for b in drawing.blocks]
+    assert len(handles) == len(set(handles))
+
+
+def test_layer_vocabulary_comes_from_standard():
+    aia = layer_vocabulary("aia")
+    legacy = generate_drawing(ProjectSpec(entities=50, standard_share=0.0), 0)
+    standard = generate_drawing(ProjectSpec(entities=50, standard_share=1.0), 0)
+
+    assert aia["WALL"] == "A-WALL"
+    assert "WALL" in {ly.name for ly in legacy.layers}
+    assert {ly.name for ly in standard.layers} == {"0", *aia.values()}
+
+
+def test_dxf_project_matches_mock_project(tmp_path: Path):
+    spec = ProjectSpec(drawings=2, entities=400, seed=3)
+    paths = write_dxf_project(spec, tmp_path / "dxf")
+    mock = mock_project(spec, tmp_path / "mock")
+
+    assert [p.name for p in paths] == ["sheet_000.dxf", "sheet_001.dxf"]
+    dxf = DXFAdapter()
+    dxf.open_drawing(str(paths[1]))
+    mock.open_drawing(str(tmp_path / "mock" / "sheet_001.dwg"))
+    for getter in ("get_text_entities", "get_dimensions", "get_polylines"):
+        assert getattr(dxf, getter)() == getattr(mock, getter)()
+    assert dxf.get_blocks() == mock.get_blocks()
+    title = next(b for b in mock.get_blocks() if b.name == TITLE_BLOCK)
+    assert dxf.get_block_attributes(title.handle) == mock.get_block_attributes(
+        title.handle
+    )
+    assert dxf.get_drawing_extents() == mock.get_drawing_extents()
+    assert sorted(ly.name for ly in dxf.get_layers()) == sorted(
+        ly.name for ly in mock.get_layers()
+    )
+
+
+def test_synthetic_project_drives_batch_operations(tmp_path: Path):
+    spec = ProjectSpec(drawings=3, entities=200, standard_share=0.0)
+    adapter = mock_project(spec, tmp_path)
+
+    result = run_batch(
+        batch_standardize_layers,
+        LayerStandardizeRequest(folder=tmp_path, standard="AIA", backup=False),
+        adapter=adapter,
+    )
+
+    assert result.files_processed == 3
+    assert result.files_modified == 3
+
+
+def test_factory_can_populate_synthetic_drawings(tmp_path: Path, monkeypatch):
+    (tmp_path / "a.dwg").write_bytes(b"fake")
+    monkeypatch.setattr(settings, "mock_synthetic_entities", 120)
+    monkeypatch.setattr(settings, "mock_synthetic_seed", 5)
+
+    adapter = get_acad_adapter(use_mock=True, folder=tmp_path)
+    adapter.open_drawing(str(tmp_path / "a.dwg"))
+
+    expected = generate_drawing(ProjectSpec(entities=120, seed=5), 0)
+    assert adapter.get_text_entities() == expected.texts
@@ -3,8 +3,18 @@
 from pathlib import Path
 
 from autocad_batch_commander.acad.mock_adapter import MockAutoCADAdapter
-from autocad_batch_commander.models import TextEntity, TextReplaceRequest
-from autocad_batch_commander.operations.text_ops import batch_find_replace
+from autocad_batch_commander.models import (
+    TermReplaceRequest,
+    TextEntity,
+    TextReplaceRequest,
+)
+from autocad_batch_commander.operations import text_ops
+from autocad_batch_commander.operations.text_ops import (
+    batch_find_replace,
+    batch_replace_terms,
+)
+from autocad_batch_commander.utils.backup import BackupStore
+from autocad_batch_commander.utils.text_replace import TermReplacer
 
 
 def _adapter_with_dwg_files(tmp_path: Path) -> MockAutoCADAdapter:
@@ -51,6 +61,24 @@ def test_case_insensitive_replace(tmp_path: Path):
     assert len(result.errors) == 0
 
 
+def test_find_replace_compiles_once_per_run(tmp_path: Path, monkeypatch):
+    adapter = _adapter_with_dwg_files(tmp_path)
+    compiled = []
+
+    def counting(*args, **kwargs):
+        compiled.append(args)
+        return TermReplacer(*args, **kwargs)
+
+    monkeypatch.setattr(text_ops, "TermReplacer", counting)
+    request = TextReplaceRequest(
+        folder=tmp_path, find_text="timber", replace_text="OAK", backup=False
+    )
+    result = batch_find_replace(adapter, request)
+
+    assert result.files_modified == 2
+    assert len(compiled) == 1
+
+
 def test_case_sensitive_replace(tmp_path: Path):
     adapter = _adapter_with_dwg_files(tmp_path)
     request = TextReplaceRequest(
@@ -108,5 +136,35 @@ def test_backup_created(tmp_path: Path):
     )
     batch_find_replace(adapter, request)
 
-    backups = list((tmp_path / ".backups").glob("*.dwg"))
-    assert len(backups) == 2  # both files backed up
+    backups = BackupStore(tmp_path / ".backups").backups()
+    # Only plan.dwg has an upper-case match; detail.dwg is never saved.
+    assert [Path(b.file).name for b in backups] == ["plan.dwg"]
+
+
+def test_backup_skipped_for_unchanged_files(tmp_path: Path):
+    adapter = _adapter_with_dwg_files(tmp_path)
+    request = TextReplaceRequest(
+        folder=tmp_path, find_text="NOT-IN-ANY-DRAWING", replace_text="X"
+    )
+    batch_find_replace(adapter, request)
+
+    # Prefetched snapshots of drawings that were never saved are dropped.
+    assert BackupStore(tmp_path / ".backups").backups() == []
+    assert list((tmp_path / ".backups").glob("objects/*/*")) == []
+
+
+def test_replace_terms_applies_whole_table(tmp_path: Path):
+    adapter = _adapter_with_dwg_files(tmp_path)
+    request = TermReplaceRequest(
+        folder=tmp_path,
+        mappings={"TIMBER": "OAK", "DOOR": "GATE", "CONCRETE": "BRICK"},
+        backup=False,
+    )
+    result = batch_replace_terms(adapter, request)
+
+    assert result.files_processed == 2
+    assert result.files_modified == 2
+    assert result.total_changes == 4
+    adapter.open_drawing(str(tmp_path / "plan.dwg"))
+    texts = [t.text for t in adapter.get_text_entities()]
+    assert texts == ["OAK GATE", "OAK FRAME", "BRICK WALL"]
@@ -0,0 +1,69 @@
+"""Tests for the single-pass multi-term replacement engine."""
+
+from __future__ import annotations
+
+import pytest
+
+from autocad_batch_commander.utils.text_replace import TermReplacer, load_term_mappings
+
+
+def test_longest_leftmost_match_wins():
+    replacer = TermReplacer({"DOOR": "DR", "DOOR FRAME": "DF", "FRAME": "FR"})
+
+    assert replacer.sub("door frame, frame, door") == ("DF, FR, DR", 3)
+
+
+def test_replacements_are_not_rescanned():
+    replacer = TermReplacer({"A": "B", "B": "C"}, case_sensitive=True)
+
+    assert replacer.sub("AB") == ("BC", 2)
+
+
+def test_overlapping_terms_via_failure_links():
+    replacer = TermReplacer({"he": "1", "she": "2", "hers": "3"}, case_sensitive=True)
+
+    assert replacer.sub("ushers") == ("u2rs", 1)
+    assert replacer.sub("hhers") == ("h3", 1)
+
+
+def test_case_sensitivity():
+    terms = {"Timber": "Oak"}
+
+    assert TermReplacer(terms).sub("TIMBER timber") == ("Oak Oak", 2)
+    assert TermReplacer(terms, case_sensitive=True).sub("TIMBER Timber") == (
+        "TIMBER Oak",
+        1,
+    )
+
+
+def test_whole_word_falls_back_to_shorter_term():
+    replacer = TermReplacer({"WC": "TOILET", "WC1": "TOILET 1"}, whole_word=True)
+
+    assert replacer.sub("WC WC1 WC12 (wc)") == ("TOILET TOILET 1 WC12 (TOILET)", 3)
+
+
+def test_regex_terms_with_backreferences():
+    replacer = TermReplacer(
+        {r"D(\d+)": r"DOOR-\1", r"(W)(\d+)": r"WIN-\2", "RM": r"\g<0>!"},
+        regex=True,
+        whole_word=True,
+    )
+
+    assert replacer.sub("D12, w3, RM, RM2") == ("DOOR-12, WIN-3, RM!, RM2", 3)
+
+
+def test_empty_table_is_rejected():
+    with pytest.raises(ValueError):
+        TermReplacer({})
+
+
+def test_load_mappings_from_csv_and_json(tmp_path):
+    csv_file = tmp_path / "terms.csv"
+    csv_file.write_text("find,replace\nTIMBER,OAK\n\nRM 1,BEDROOM 1\n")
+    json_file = tmp_path / "terms.json"
+    json_file.write_text('[{"find": "TIMBER", "replace": "OAK"}]')
+
+    assert load_term_mappings(csv_file) == {"TIMBER": "OAK", "RM 1": "BEDROOM 1"}
+    assert load_term_mappings(json_file) == {"TIMBER": "OAK"}
+    with pytest.raises(ValueError, match="Unsupported"):
+        load_term_mappings(tmp_path / "terms.txt")